@@ -5,7 +5,8 @@
 import argparse
 import sys
 
-from javacore_analyser import javacore_analyser_batch, common_utils
+from javacore_analyser import javacore_analyser_batch, cluster_comparison, collection_diff, common_utils, \
+    report_watcher
 from javacore_analyser.properties import Properties
 
 
@@ -19,6 +20,31 @@ def main():
     batch.add_argument("output", help="Destination report directory")
     common_utils.add_common_args(parser)
 
+    regenerate = subparsers.add_parser("regenerate", description="Regenerate report from its saved analysis model")
+    regenerate.add_argument("report", help="Report directory")
+    regenerate.add_argument("output", nargs="?", help="Destination report directory (default: the report directory)")
+
+    append = subparsers.add_parser("append", description="Add javacores to report generated with saved analysis model")
+    append.add_argument("report", help="Report directory")
+    append.add_argument("input", help="Input file(s) or directory to add")
+
+    manifest = subparsers.add_parser("manifest", description="Generate reports of many javacore collections")
+    manifest.add_argument("manifest", help="JSON file with the list of the reports to generate")
+    manifest.add_argument("output", help="Destination directory of the summary of the reports")
+
+    compare = subparsers.add_parser("compare", description="Compare javacore collections of several JVMs")
+    compare.add_argument("output", help="Destination report directory")
+    compare.add_argument("input", nargs="+", help="Input file(s), directory or archive of every JVM")
+
+    diff = subparsers.add_parser("diff", description="Compare javacore collections before and after a change")
+    diff.add_argument("output", help="Destination report directory")
+    diff.add_argument("before", help="Input file(s), directory or archive, or report directory with saved model")
+    diff.add_argument("after", help="Input file(s), directory or archive, or report directory with saved model")
+
+    watch = subparsers.add_parser("watch", description="Generate report while javacores are written to directory")
+    watch.add_argument("input", help="Directory to watch")
+    watch.add_argument("output", help="Destination report directory")
+
     web = subparsers.add_parser("web", description="Run web application")
     common_utils.add_web_args(web)
 
@@ -40,8 +66,32 @@ def main():
     elif app_type.lower() == "batch":
         print("Running batch application")
         javacore_analyser_batch.batch_process(args.input, args.output)
+    elif app_type.lower() == "regenerate":
+        print("Regenerating report")
+        common_utils.create_console_logging()
+        javacore_analyser_batch.regenerate_report(args.report, args.output)
+    elif app_type.lower() == "append":
+        print("Adding javacores to report")
+        common_utils.create_console_logging()
+        javacore_analyser_batch.append_to_report(javacore_analyser_batch.get_input_files(args.input), args.report)
+    elif app_type.lower() == "manifest":
+        print("Generating reports from manifest")
+        common_utils.create_console_logging()
+        javacore_analyser_batch.process_manifest(args.manifest, args.output)
+    elif app_type.lower() == "compare":
+        print("Comparing javacore collections")
+        common_utils.create_console_logging()
+        cluster_comparison.compare_collections(args.input, args.output)
+    elif app_type.lower() == "diff":
+        print("Comparing javacore collections before and after change")
+        common_utils.create_console_logging()
+        collection_diff.diff_collections(args.before, args.after, args.output)
+    elif app_type.lower() == "watch":
+        print("Running watch mode")
+        common_utils.create_console_logging()
+        report_watcher.watch(args.input, args.output)
     else:
-        print('Invalid application type. Available types: "batch" or "web"')
+        print('Invalid application type. Available types: "batch", "regenerate", "append", "manifest", "compare", "diff", "watch" or "web"')
 
 
 if __name__ == '__main__':
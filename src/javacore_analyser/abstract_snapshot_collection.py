@@ -1,5 +1,5 @@
 #
-# Copyright IBM Corp. 2024 - 2024
+# Copyright IBM Corp. 2024 - 2026
 # SPDX-License-Identifier: Apache-2.0
 #
 
@@ -71,6 +71,17 @@ class AbstractSnapshotCollection(abc.ABC):
 
     def add(self, snapshot):
         self.thread_snapshots.append(snapshot)
+        # The statistics are cached, so they are computed again with the added snapshot
+        self.reset_statistics()
+
+    def reset_statistics(self):
+        """
+        Clears the cached statistics, e.g. when the snapshots were sorted again,
+        so they are computed again.
+        """
+        self.total_cpu = 0
+        self.total_time = 0
+        self.avg_mem = 0
 
     def index_of(self, snapshot):
         for i in range(len(self.thread_snapshots)):
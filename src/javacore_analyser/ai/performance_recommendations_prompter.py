@@ -4,7 +4,7 @@
 #
 
 from javacore_analyser.ai.prompter import Prompter
-from javacore_analyser.constants import GC_PAUSE_DETAIL_THRESHOLD
+from javacore_analyser.constants import GC_PAUSE_DETAIL_THRESHOLD, GC_PAUSE_THRESHOLDS
 
 
 class PerformanceRecommendationsPrompter(Prompter):
@@ -112,13 +112,13 @@ class PerformanceRecommendationsPrompter(Prompter):
             memory_parts.append(f"Young generation (Xmn): {self.javacore_set.xmn}")
         
         # Add GC memory data if available
-        if self.javacore_set.gc_parser and self.javacore_set.gc_parser.get_collects():
-            collects = self.javacore_set.gc_parser.get_collects()
-            if collects:
-                avg_free_before = sum(int(c.free_before) for c in collects) / len(collects)
-                avg_free_after = sum(int(c.free_after) for c in collects) / len(collects)
-                memory_parts.append(f"Avg free before GC: {avg_free_before:.0f} bytes")
-                memory_parts.append(f"Avg free after GC: {avg_free_after:.0f} bytes")
+        gc_summary = self.javacore_set.gc_parser.get_summary() if self.javacore_set.gc_parser else None
+        if gc_summary:
+            memory_parts.append(f"Avg free before GC: {gc_summary['mean_free_before']:.0f} bytes")
+            memory_parts.append(f"Avg free after GC: {gc_summary['mean_free_after']:.0f} bytes")
+            memory_parts.append(f"Avg allocation rate: {gc_summary['mean_allocation_rate']:.0f} bytes/s")
+            if gc_summary["occupancy_trend"] is not None:
+                memory_parts.append(f"Old generation used after GC changes by {gc_summary['occupancy_trend']:.0f} bytes/min")
         
         return ", ".join(memory_parts) if memory_parts else "No memory data available"
 
@@ -230,20 +230,15 @@ class PerformanceRecommendationsPrompter(Prompter):
         if not self.javacore_set.gc_parser or not self.javacore_set.gc_parser.get_collects():
             return "No GC data available"
         
-        collects = self.javacore_set.gc_parser.get_collects()
-        if not collects:
-            return "No GC collections recorded"
-        
-        # Calculate GC statistics
-        total_duration = sum(c.duration for c in collects)
-        avg_duration = total_duration / len(collects)
-        max_duration = max(c.duration for c in collects)
+        # GC statistics computed once for the report, the tips and the prompts
+        gc_summary = self.javacore_set.gc_parser.get_summary()
         
         gc_info = [
-            f"Total GC collections: {len(collects)}",
-            f"Average GC duration: {avg_duration:.2f}ms",
-            f"Max GC duration: {max_duration:.2f}ms",
-            f"Total GC time: {total_duration:.2f}ms"
+            f"Total GC collections: {gc_summary['count']}",
+            f"Average GC duration: {gc_summary['mean']:.2f}ms",
+            f"Max GC duration: {gc_summary['longest']:.2f}ms",
+            f"Total GC time: {gc_summary['total']:.2f}ms",
+            f"Max share of time in GC in {gc_summary['window']}s window: {gc_summary['max_pause_share'] * 100:.1f}%"
         ]
         
         return ", ".join(gc_info)
@@ -276,26 +271,18 @@ class PerformanceRecommendationsPrompter(Prompter):
             return ", ".join(pause_details)
         else:
             # Show summary statistics for large datasets
-            pause_times = [c.duration for c in collects]
-            avg_pause = sum(pause_times) / len(pause_times)
-            max_pause = max(pause_times)
-            min_pause = min(pause_times)
-            
-            # Count pauses exceeding thresholds (1000ms and 2000ms)
-            pauses_over_1s = sum(1 for p in pause_times if p > 1000)
-            pauses_over_2s = sum(1 for p in pause_times if p > 2000)
-            
-            # Find the longest pause with timestamp
-            longest_collect = max(collects, key=lambda c: c.duration)
-            longest_pause_time = longest_collect.start_time_str
+            gc_summary = self.javacore_set.gc_parser.get_summary()
+            percentiles = gc_summary["percentiles"]
             
             pause_info = [
-                f"Total GC pauses: {len(collects)}",
-                f"Average GC pause: {avg_pause:.2f}ms",
-                f"Min GC pause: {min_pause:.2f}ms",
-                f"Max GC pause: {max_pause:.2f}ms at {longest_pause_time}",
-                f"Pauses > 1000ms: {pauses_over_1s}",
-                f"Pauses > 2000ms: {pauses_over_2s}"
+                f"Total GC pauses: {gc_summary['count']}",
+                f"Average GC pause: {gc_summary['mean']:.2f}ms",
+                f"Min GC pause: {gc_summary['shortest']:.2f}ms",
+                f"Max GC pause: {gc_summary['longest']:.2f}ms at {gc_summary['longest_start_time']}",
+                f"GC pause percentiles: p50 {percentiles[50]:.2f}ms, p95 {percentiles[95]:.2f}ms, "
+                f"p99 {percentiles[99]:.2f}ms",
+                f"Pauses > {GC_PAUSE_THRESHOLDS[0]}ms: {gc_summary['counts'][0]}",
+                f"Pauses > {GC_PAUSE_THRESHOLDS[1]}ms: {gc_summary['counts'][1]}"
             ]
             
             return ", ".join(pause_info)
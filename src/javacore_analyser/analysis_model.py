@@ -0,0 +1,150 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""
+The fully analysed JavacoreSet saved next to the report, so the report can be regenerated without parsing
+the javacores again, e.g. after changing skip_boring, use_ml or use_ai property or upgrading the tool.
+
+The model file is gzip compressed stream of two pickles: the header with the format version and the settings
+the model was analysed with, and the JavacoreSet. The header is read first, so an incompatible model is rejected
+without loading the whole file. Load only the models written by this tool, as unpickling runs code from the file.
+"""
+
+import gzip
+import logging
+import os
+import pickle
+
+from javacore_analyser.exceptions import IncompatibleModelError
+from javacore_analyser.properties import Properties
+from javacore_analyser.report_assets import get_assets_version
+
+MODEL_FILE = "analysis_model.pkl.gz"
+# Increase when the saved classes change incompatibly
+MODEL_FORMAT_VERSION = 6
+
+# The settings which change the analysis and not only the rendering of the report
+ANALYSIS_SETTINGS = ("use_ml", "use_ai", "llm_method", "llm")
+
+
+def is_model_saved():
+    return Properties.get_instance().get_property("save_model", False)
+
+
+def get_model_file(report_dir):
+    return os.path.join(report_dir, MODEL_FILE)
+
+
+def get_analysis_settings(javacore_set=None):
+    """
+    Returns the current values of the settings which change the analysis.
+    If javacore_set is given, use_ml is taken from it, as the classification may be skipped e.g. with no model.
+    """
+    properties = Properties.get_instance()
+    settings = {setting: properties.get_property(setting, False) for setting in ANALYSIS_SETTINGS}
+    if javacore_set is not None:
+        settings["use_ml"] = bool(javacore_set.use_ml)
+    return settings
+
+
+def save_model(javacore_set, report_dir):
+    """
+    Saves the analysed javacore_set to the model file in report_dir.
+    A failure is logged, but it does not fail the report generation.
+    """
+    model_file = get_model_file(report_dir)
+    header = {
+        "format_version": MODEL_FORMAT_VERSION,
+        "tool_version": get_assets_version(),
+        "settings": get_analysis_settings(javacore_set),
+    }
+    tmp_file = model_file + ".tmp"
+    try:
+        with gzip.open(tmp_file, "wb", compresslevel=6) as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(javacore_set, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, model_file)
+        logging.info(f"Saved analysis model to {model_file}")
+    except Exception as e:
+        logging.error(f"Error saving analysis model to {model_file}: {e}")
+        if os.path.isfile(tmp_file):
+            os.remove(tmp_file)
+
+
+def load_model(report_dir):
+    """
+    Loads the analysis model saved in report_dir.
+
+    Returns:
+        (header, JavacoreSet) tuple
+
+    Raises:
+        FileNotFoundError: if the report has no saved model
+        IncompatibleModelError: if the model was saved in a different format version
+    """
+    model_file = get_model_file(report_dir)
+    if not os.path.isfile(model_file):
+        raise FileNotFoundError(f"No analysis model in {report_dir}. Generate the report with save_model = True")
+    with gzip.open(model_file, "rb") as f:
+        header = pickle.load(f)
+        if header.get("format_version") != MODEL_FORMAT_VERSION:
+            raise IncompatibleModelError(model_file, header.get("format_version"), MODEL_FORMAT_VERSION)
+        javacore_set = pickle.load(f)
+    logging.info(f"Loaded analysis model from {model_file} saved by version {header.get('tool_version')}")
+    return header, javacore_set
+
+
+def _restore_plugins(javacore_set):
+    # The plugin objects are not saved with the model. They are loaded again from the plugin directory.
+    if not javacore_set.plugin_data:
+        return
+    if not Properties.get_instance().get_property("enable_plugins", False):
+        javacore_set.plugin_data = {}
+        return
+    from javacore_analyser.plugin_manager import PluginManager
+    javacore_set.plugin_manager = PluginManager()
+    javacore_set.plugin_manager.discover_plugins()
+    for name in list(javacore_set.plugin_data):
+        plugin = javacore_set.plugin_manager.get_plugin(name)
+        if plugin is None:
+            logging.warning(f"Plugin {name} not found. Its data is skipped in the regenerated report")
+            del javacore_set.plugin_data[name]
+        else:
+            javacore_set.plugin_data[name]["plugin"] = plugin
+
+
+def update_model(javacore_set, header):
+    """
+    Recomputes the stages of the analysis which inputs changed since the model was saved: the ML classification
+    when use_ml is turned on, the tips when the tool was upgraded and the AI recommendations when use_ai
+    or the LLM settings change. The stages which are only rendered (e.g. skip_boring) are not recomputed.
+
+    Returns:
+        list of the recomputed stages
+    """
+    saved_settings = header.get("settings", {})
+    settings = get_analysis_settings()
+    stages = []
+    if settings["use_ml"] and not javacore_set.use_ml:
+        from javacore_analyser.ml.classify_javacore_inference import JavacoreClassifier
+        javacore_set.use_ml = True
+        javacore_set.ml_classifier = JavacoreClassifier.get_shared()
+        javacore_set.classify_threads()
+        stages.append("use_ml")
+    elif not settings["use_ml"]:
+        javacore_set.use_ml = False
+    if header.get("tool_version") != get_assets_version():
+        javacore_set.tips = []
+        javacore_set.generate_tips()
+        stages.append("tips")
+    if not settings["use_ai"]:
+        javacore_set.ai_tips = ""
+    elif (not javacore_set.ai_tips or stages or
+          any(saved_settings.get(setting) != settings[setting] for setting in ("llm_method", "llm"))):
+        javacore_set.add_ai()
+        stages.append("use_ai")
+    _restore_plugins(javacore_set)
+    logging.info(f"Recomputed analysis stages: {', '.join(stages) if stages else 'none'}")
+    return stages
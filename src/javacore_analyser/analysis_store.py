@@ -0,0 +1,438 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""
+Optional SQLite export of the analysed data.
+
+The parsed javacores, threads, snapshots, the interned stack frames, the blockers and the GC collections are written
+to an indexed SQLite database, which can be queried later without running the analyser again, e.g.:
+
+    with AnalysisStore("analysis.db") as store:
+        for thread in store.find_threads_in_frame("java/net/SocketInputStream", start, end):
+            print(thread["name"], thread["snapshots"])
+
+The queries return sqlite3.Row objects and the iter_ methods read the rows from the cursor one by one,
+so the memory used does not grow with the size of the collection.
+The store is write-only for the analyser: the report and the tips are generated from the JavacoreSet.
+The store remembers the input files it was written from, so the database is not written again when the tool runs
+again on the same files.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+from datetime import datetime
+
+from javacore_analyser.properties import Properties
+from javacore_analyser.stack_trace_table import StackTraceTable
+
+# Increase when the schema changes. The tables of the older schema are dropped and written again
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS javacores (
+    id INTEGER PRIMARY KEY,
+    filename TEXT NOT NULL,
+    timestamp REAL,
+    number_of_cpus TEXT,
+    java_version TEXT,
+    gc_policy TEXT,
+    xmx TEXT,
+    cpu_percentage REAL,
+    load REAL
+);
+CREATE TABLE IF NOT EXISTS threads (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    thread_id TEXT,
+    thread_address TEXT,
+    hash TEXT,
+    interesting INTEGER,
+    total_cpu REAL,
+    total_time REAL,
+    cpu_percentage REAL,
+    avg_mem REAL
+);
+CREATE TABLE IF NOT EXISTS frames (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    line TEXT NOT NULL,
+    UNIQUE (kind, line)
+);
+CREATE TABLE IF NOT EXISTS stacks (
+    id INTEGER PRIMARY KEY,
+    depth INTEGER,
+    java_depth INTEGER
+);
+CREATE TABLE IF NOT EXISTS stack_frames (
+    stack_id INTEGER NOT NULL REFERENCES stacks(id),
+    position INTEGER NOT NULL,
+    frame_id INTEGER NOT NULL REFERENCES frames(id),
+    PRIMARY KEY (stack_id, position)
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    javacore_id INTEGER NOT NULL REFERENCES javacores(id),
+    thread_id INTEGER NOT NULL REFERENCES threads(id),
+    state TEXT,
+    cpu_usage REAL,
+    cpu_usage_inc REAL,
+    allocated_mem INTEGER,
+    stack_id INTEGER REFERENCES stacks(id),
+    blocker_id INTEGER REFERENCES snapshots(id),
+    classification TEXT
+);
+CREATE TABLE IF NOT EXISTS gc_collections (
+    id INTEGER PRIMARY KEY,
+    start_time REAL,
+    start_time_str TEXT,
+    duration REAL,
+    free_before INTEGER,
+    free_after INTEGER,
+    freed INTEGER,
+    nursery_free_before INTEGER,
+    nursery_free_after INTEGER,
+    nursery_total INTEGER,
+    tenure_free_before INTEGER,
+    tenure_free_after INTEGER,
+    tenure_total INTEGER
+);
+CREATE INDEX IF NOT EXISTS javacores_timestamp ON javacores (timestamp);
+CREATE INDEX IF NOT EXISTS threads_name ON threads (name);
+CREATE INDEX IF NOT EXISTS stack_frames_frame ON stack_frames (frame_id);
+CREATE INDEX IF NOT EXISTS snapshots_javacore ON snapshots (javacore_id);
+CREATE INDEX IF NOT EXISTS snapshots_thread ON snapshots (thread_id);
+CREATE INDEX IF NOT EXISTS snapshots_stack ON snapshots (stack_id);
+CREATE INDEX IF NOT EXISTS snapshots_blocker ON snapshots (blocker_id);
+CREATE INDEX IF NOT EXISTS gc_collections_start_time ON gc_collections (start_time);
+"""
+
+TABLES = ("gc_collections", "snapshots", "stack_frames", "stacks", "frames", "threads", "javacores", "meta")
+
+# The snapshots with their javacore and thread, filtered by the conditions added by the queries
+SNAPSHOTS_QUERY = """
+SELECT snapshots.*, javacores.filename, javacores.timestamp, threads.name, threads.thread_id AS java_thread_id
+FROM snapshots
+JOIN javacores ON javacores.id = snapshots.javacore_id
+JOIN threads ON threads.id = snapshots.thread_id
+"""
+
+
+def get_analysis_store_file():
+    """
+    Returns the path of the database set in analysis_store property or empty string if the store is not used.
+    """
+    return Properties.get_instance().get_property("analysis_store", "") or ""
+
+
+def to_timestamp(value):
+    """
+    Converts datetime to the POSIX timestamp used in the store. Numbers and None are returned unchanged.
+    """
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return value
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _time_conditions(column, start, end):
+    conditions = []
+    params = []
+    if start is not None:
+        conditions.append(column + " >= ?")
+        params.append(to_timestamp(start))
+    if end is not None:
+        conditions.append(column + " <= ?")
+        params.append(to_timestamp(end))
+    return conditions, params
+
+
+def _where(conditions):
+    return " WHERE " + " AND ".join(conditions) if conditions else ""
+
+
+class AnalysisStore:
+    """
+    SQLite database with the analysed data of one javacore collection.
+    """
+
+    def __init__(self, db_file):
+        self.db_file = db_file
+        directory = os.path.dirname(os.path.abspath(db_file))
+        os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(db_file)
+        self.connection.row_factory = sqlite3.Row
+        self.__create_schema()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def __create_schema(self):
+        version = None
+        try:
+            row = self.connection.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            version = int(row["value"]) if row else None
+        except sqlite3.OperationalError:
+            pass  # new database
+        if version is not None and version != SCHEMA_VERSION:
+            logging.info(f"Analysis store {self.db_file} has schema version {version}. Creating it again")
+            for table in TABLES:
+                self.connection.execute(f"DROP TABLE IF EXISTS {table}")
+        self.connection.executescript(SCHEMA)
+        self.connection.execute("INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+        self.connection.commit()
+
+    def get_meta(self, key, default=None):
+        row = self.connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else default
+
+    @staticmethod
+    def get_inputs(javacore_set):
+        """
+        Returns the description of the input files and settings the store is written from.
+        The store is reused if they did not change.
+        """
+        # The archives are extracted to a new temporary directory on every run and the files appended in watch mode
+        # are removed after they are parsed, so the files are identified by the name, the size and the checksum
+        # computed when they were parsed and are not read again
+        inputs = [javacore.get_fingerprint() for javacore in javacore_set.javacores] + \
+            [file.get_fingerprint() for file in javacore_set.gc_parser.get_files()]
+        return {"files": inputs, "use_ml": bool(javacore_set.use_ml)}
+
+    def is_current(self, javacore_set):
+        """
+        Returns True if the store was written from the same input files as the given javacore_set.
+        """
+        inputs = self.get_meta("inputs")
+        return inputs is not None and json.loads(inputs) == AnalysisStore.get_inputs(javacore_set)
+
+    def update(self, javacore_set):
+        """
+        Writes the javacore_set to the store unless it is already there.
+
+        Returns:
+            True if the store was written, False if it was reused
+        """
+        if self.is_current(javacore_set):
+            logging.info(f"Reusing analysis store {self.db_file}")
+            return False
+        self.write(javacore_set)
+        return True
+
+    def write(self, javacore_set):
+        """
+        Replaces the content of the store with the data of the javacore_set in a single transaction.
+        The javacore_set must have the snapshot collections populated and sorted.
+        """
+        logging.info(f"Writing analysis store {self.db_file}")
+        with self.connection:
+            for table in TABLES:
+                if table != "meta":
+                    self.connection.execute(f"DELETE FROM {table}")
+            javacore_ids = self.__write_javacores(javacore_set)
+            thread_ids = self.__write_threads(javacore_set)
+            stack_ids = self.__write_stacks(javacore_set)
+            self.__write_snapshots(javacore_set, javacore_ids, thread_ids, stack_ids)
+            self.__write_gc_collections(javacore_set)
+            self.connection.execute("INSERT OR REPLACE INTO meta VALUES ('inputs', ?)",
+                                    (json.dumps(AnalysisStore.get_inputs(javacore_set)),))
+            self.connection.execute("INSERT OR REPLACE INTO meta VALUES ('path', ?)", (str(javacore_set.path),))
+
+    def __write_javacores(self, javacore_set):
+        javacore_ids = {}
+        for javacore_id, javacore in enumerate(javacore_set.javacores, 1):
+            javacore_ids[id(javacore)] = javacore_id
+            try:
+                cpu_percentage = javacore.get_cpu_percentage()
+                load = javacore.get_load()
+            except (TypeError, ValueError, ZeroDivisionError):
+                cpu_percentage = load = None  # no number of cpus in the javacore
+            self.connection.execute("INSERT INTO javacores VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                    (javacore_id, javacore.basefilename(), javacore.timestamp,
+                                     javacore.number_of_cpus, javacore.java_version, javacore.gc_policy,
+                                     javacore.xmx, cpu_percentage, load))
+        return javacore_ids
+
+    def __write_threads(self, javacore_set):
+        thread_ids = {}
+        rows = []
+        for thread_id, thread in enumerate(javacore_set.threads, 1):
+            thread_ids[id(thread)] = thread_id
+            rows.append((thread_id, thread.name, thread.id, thread.thread_address, thread.get_hash(),
+                         int(thread.is_interesting()), thread.get_total_cpu(), thread.get_total_time(),
+                         thread.get_cpu_percentage_usage(), thread.get_avg_mem()))
+        self.connection.executemany("INSERT INTO threads VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        return thread_ids
+
+    def __write_stacks(self, javacore_set):
+        # Every frame and every distinct stack is written once
+        frame_ids = {}
+        stack_ids = {}
+        for thread in javacore_set.threads:
+            for snapshot in thread.thread_snapshots:
+                signature = StackTraceTable.get_signature(snapshot.stack_trace)
+                if signature in stack_ids:
+                    continue
+                stack_id = len(stack_ids) + 1
+                stack_ids[signature] = stack_id
+                stack_trace = snapshot.stack_trace
+                self.connection.execute("INSERT INTO stacks VALUES (?, ?, ?)",
+                                        (stack_id, len(signature),
+                                         stack_trace.get_java_stack_depth() if stack_trace else 0))
+                for position, el in enumerate(stack_trace or []):
+                    # the java frames are parsed with the line end
+                    key = (el.get_kind_str(), el.get_line().strip())
+                    frame_id = frame_ids.get(key)
+                    if frame_id is None:
+                        frame_id = len(frame_ids) + 1
+                        frame_ids[key] = frame_id
+                        self.connection.execute("INSERT INTO frames VALUES (?, ?, ?)", (frame_id,) + key)
+                    self.connection.execute("INSERT INTO stack_frames VALUES (?, ?, ?)",
+                                            (stack_id, position, frame_id))
+        return stack_ids
+
+    def __write_snapshots(self, javacore_set, javacore_ids, thread_ids, stack_ids):
+        # The ids follow the order of the javacores and of the threads in each javacore
+        snapshot_ids = {}
+        for javacore in javacore_set.javacores:
+            for snapshot in javacore.snapshots:
+                snapshot_ids[id(snapshot)] = len(snapshot_ids) + 1
+        rows = []
+        for javacore in javacore_set.javacores:
+            for snapshot in javacore.snapshots:
+                if snapshot.thread is None:
+                    continue
+                blocker = snapshot.get_blocker()
+                rows.append((snapshot_ids[id(snapshot)], javacore_ids[id(javacore)], thread_ids[id(snapshot.thread)],
+                             snapshot.state, snapshot.cpu_usage, snapshot.get_cpu_usage_inc(),
+                             snapshot.allocated_mem,
+                             stack_ids[StackTraceTable.get_signature(snapshot.stack_trace)],
+                             snapshot_ids.get(id(blocker)) if blocker else None,
+                             snapshot._ml_classification or None))
+        self.connection.executemany("INSERT INTO snapshots VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def __write_gc_collections(self, javacore_set):
+        rows = []
+        for collect in javacore_set.gc_parser.get_collects():
+            try:
+                start_time = collect.get_start_time().timestamp()
+            except ValueError:
+                start_time = None
+            rows.append((start_time, collect.start_time_str, collect.duration,
+                         _to_int(collect.free_before), _to_int(collect.free_after), collect.freed(),
+                         _to_int(collect.nursery_free_before), _to_int(collect.nursery_free_after),
+                         _to_int(collect.nursery_total), _to_int(collect.tenure_free_before),
+                         _to_int(collect.tenure_free_after), _to_int(collect.tenure_total)))
+        self.connection.executemany("INSERT INTO gc_collections (start_time, start_time_str, duration, free_before, "
+                                    "free_after, freed, nursery_free_before, nursery_free_after, nursery_total, "
+                                    "tenure_free_before, tenure_free_after, tenure_total) "
+                                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    # Query API
+
+    def get_javacores(self):
+        """
+        Returns the javacores ordered by time.
+        """
+        return self.connection.execute("SELECT * FROM javacores ORDER BY timestamp, id").fetchall()
+
+    def iter_threads(self, interesting_only=False):
+        """
+        Iterates over the threads ordered by CPU usage, the highest first.
+        """
+        query = "SELECT * FROM threads" + (" WHERE interesting = 1" if interesting_only else "")
+        yield from self.connection.execute(query + " ORDER BY cpu_percentage DESC, id")
+
+    def iter_snapshots(self, thread_name=None, state=None, start=None, end=None):
+        """
+        Iterates over the thread snapshots in the order of the javacores,
+        optionally only of the given thread name, in the given state and in the time window [start, end].
+        start and end are datetime or POSIX timestamp.
+        """
+        conditions, params = _time_conditions("javacores.timestamp", start, end)
+        if thread_name is not None:
+            conditions.append("threads.name = ?")
+            params.append(thread_name)
+        if state is not None:
+            conditions.append("snapshots.state = ?")
+            params.append(state)
+        yield from self.connection.execute(SNAPSHOTS_QUERY + _where(conditions) + " ORDER BY snapshots.id", params)
+
+    def get_stack(self, stack_id):
+        """
+        Returns the frames of the stack as list of (kind, line) tuples, the top frame first.
+        """
+        rows = self.connection.execute("SELECT frames.kind, frames.line FROM stack_frames "
+                                       "JOIN frames ON frames.id = stack_frames.frame_id "
+                                       "WHERE stack_frames.stack_id = ? ORDER BY stack_frames.position", (stack_id,))
+        return [(row["kind"], row["line"]) for row in rows]
+
+    def find_threads_in_frame(self, frame, start=None, end=None):
+        """
+        Returns the threads which were in the frame with the given text in the time window [start, end],
+        with the number of such snapshots and the time of the first and the last one, the most frequent first.
+        """
+        conditions, params = _time_conditions("javacores.timestamp", start, end)
+        conditions.append("snapshots.stack_id IN (SELECT stack_frames.stack_id FROM stack_frames "
+                          "JOIN frames ON frames.id = stack_frames.frame_id WHERE instr(frames.line, ?) > 0)")
+        params.append(frame)
+        query = ("SELECT threads.*, COUNT(*) AS snapshots, MIN(javacores.timestamp) AS first_seen, "
+                 "MAX(javacores.timestamp) AS last_seen FROM snapshots "
+                 "JOIN javacores ON javacores.id = snapshots.javacore_id "
+                 "JOIN threads ON threads.id = snapshots.thread_id" + _where(conditions) +
+                 " GROUP BY threads.id ORDER BY snapshots DESC, threads.id")
+        return self.connection.execute(query, params).fetchall()
+
+    def iter_blockers(self, start=None, end=None):
+        """
+        Iterates over the blocking threads with the number of distinct threads blocked by each of them
+        and the number of the blocked snapshots, the thread blocking most threads first.
+        """
+        conditions, params = _time_conditions("javacores.timestamp", start, end)
+        query = ("SELECT threads.*, COUNT(DISTINCT blocked_threads.thread_id) AS blocked_threads, "
+                 "COUNT(*) AS blocked_snapshots FROM snapshots "
+                 "JOIN snapshots AS blockers ON blockers.id = snapshots.blocker_id "
+                 "JOIN threads ON threads.id = blockers.thread_id "
+                 "JOIN threads AS blocked_threads ON blocked_threads.id = snapshots.thread_id "
+                 "JOIN javacores ON javacores.id = snapshots.javacore_id" + _where(conditions) +
+                 " GROUP BY threads.id ORDER BY blocked_threads DESC, threads.id")
+        yield from self.connection.execute(query, params)
+
+    def iter_gc_collections(self, start=None, end=None, min_duration=None):
+        """
+        Iterates over the GC collections in the time window [start, end] ordered by time,
+        optionally only the ones longer than min_duration milliseconds.
+        """
+        conditions, params = _time_conditions("start_time", start, end)
+        if min_duration is not None:
+            conditions.append("duration > ?")
+            params.append(min_duration)
+        yield from self.connection.execute("SELECT * FROM gc_collections" + _where(conditions) +
+                                           " ORDER BY start_time, id", params)
+
+    def execute(self, query, params=()):
+        """
+        Runs the given SQL query on the store, for the questions not covered by the methods above.
+        """
+        return self.connection.execute(query, params)
@@ -0,0 +1,316 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""
+Cluster comparison: the javacore collections of several JVMs running the same application (the members)
+are analysed in parallel and compared in one report, to find the member which is the outlier.
+
+Every member is analysed with JavacoreSet in its own process and summarised there: the code collections by the
+signature of their stack and the threads by their thread pool. Only the summaries are sent back and merged
+with dictionaries keyed by the signature and the pool name, so the merge is linear in the number of the snapshots.
+"""
+
+import argparse
+import hashlib
+import logging
+import multiprocessing
+import os
+import re
+import statistics
+from xml.dom.minidom import Document
+
+import importlib_resources
+from lxml import etree
+
+from javacore_analyser import common_utils
+from javacore_analyser.javacore_analyser_batch import create_output_files_structure, generate_javecore_set_data, \
+    get_input_files, init_worker_process, SUPPORTED_ARCHIVES_FORMATS
+from javacore_analyser.javacore_set import JavacoreSet
+from javacore_analyser.properties import Properties
+from javacore_analyser.report_assets import ASSETS_SHARED, get_assets_strategy, get_assets_url
+from javacore_analyser.report_publishing import finish_processing, publish_html
+from javacore_analyser.stack_trace import StackTrace
+
+# A stack or a member is the outlier if its value is OUTLIER_FACTOR times the median of the other members
+OUTLIER_FACTOR = 2
+# The stacks with lower share of the snapshots of the member are not reported as outliers
+MIN_OUTLIER_SHARE = 1.0
+# The number of the most skewed stacks in the report
+MAX_STACKS = 200
+
+# The number at the end of the thread name of the thread in the pool, e.g. "WebContainer : 5" or "pool-1-thread-7"
+POOL_THREAD_NUMBER = re.compile(r"[\s:#_.-]*\d+$")
+
+
+def get_comparison_parallelism(members_count):
+    parallelism = int(Properties.get_instance().get_property("comparison_parallelism", 0))
+    if parallelism <= 0:
+        parallelism = os.cpu_count() or 1
+    return max(1, min(parallelism, members_count))
+
+
+def get_stack_signature(stack_trace):
+    """
+    Returns the digest of the stack trace which is the same for two stack traces if and only if they are in the same
+    code collection (see StackTrace.equals): the digest of the first STACK_COMPARISON_DEPTH lines,
+    and of the length for the shorter stacks. The digest is the same in all the processes.
+    """
+    elements = stack_trace.stack_trace_elements if stack_trace else []
+    lines = [element.get_line() or "" for element in elements[:StackTrace.STACK_COMPARISON_DEPTH]]
+    length = len(elements) if len(elements) <= StackTrace.STACK_COMPARISON_DEPTH else -1
+    return hashlib.sha1("\n".join(lines + [str(length)]).encode("utf-8")).hexdigest()[:16]
+
+
+def get_pool_name(thread_name):
+    """
+    Returns the name of the thread pool of the thread: the thread name without the number of the thread.
+    """
+    return POOL_THREAD_NUMBER.sub("", thread_name.strip()) or thread_name
+
+
+def summarise_member(name, javacore_set):
+    """
+    Returns the summary of the analysed javacores of one member: the totals, the code collections by the stack
+    signature and the thread pools by the pool name.
+    """
+    snapshots = sum(len(javacore.snapshots) for javacore in javacore_set.javacores)
+    stacks = {}
+    for code_collection in javacore_set.stacks:
+        stack_trace = code_collection.get_stack_trace()
+        elements = stack_trace.stack_trace_elements[:StackTrace.STACK_COMPARISON_DEPTH] if stack_trace else []
+        frames = [(element.get_line() or "").strip() for element in elements] or [StackTrace.EMPTY_STACK]
+        stacks[get_stack_signature(stack_trace)] = {"frames": frames,
+                                                    "snapshots": len(code_collection.thread_snapshots),
+                                                    "threads": len(code_collection.get_threads()),
+                                                    "cpu": code_collection.get_total_cpu()}
+    pools = {}
+    blocked_threads = 0
+    cpu = 0
+    for thread in javacore_set.threads:
+        pool = pools.setdefault(get_pool_name(thread.name), {"threads": 0, "snapshots": 0, "blocked": 0, "cpu": 0})
+        blocked = sum(1 for snapshot in thread.thread_snapshots if snapshot.get_blocker())
+        pool["threads"] += 1
+        pool["snapshots"] += len(thread.thread_snapshots)
+        pool["blocked"] += blocked
+        pool["cpu"] += thread.get_total_cpu()
+        blocked_threads += 1 if blocked else 0
+        cpu += thread.get_total_cpu()
+    return {"name": name, "javacores": len(javacore_set.javacores),
+            "threads": len(javacore_set.threads.snapshot_collections), "snapshots": snapshots,
+            "blocked_threads": blocked_threads, "blockers": len(javacore_set.blocked_snapshots), "cpu": cpu,
+            "stacks": stacks, "pools": pools}
+
+
+def analyse_member(member):
+    logging.info(f"Analysing member {member['name']}")
+    return summarise_member(member["name"], generate_javecore_set_data(member["input"]))
+
+
+def find_outlier(values, min_value=0):
+    """
+    Returns the index of the value which is at least OUTLIER_FACTOR times the median of the other values
+    and at least min_value, or None if there is no such value.
+    """
+    if len(values) < 2:
+        return None
+    index = max(range(len(values)), key=values.__getitem__)
+    others = values[:index] + values[index + 1:]
+    value = values[index]
+    if value > 0 and value >= min_value and value >= OUTLIER_FACTOR * statistics.median(others):
+        return index
+    return None
+
+
+def merge_summaries(summaries):
+    """
+    Merges the summaries of the members into the cross-member view.
+
+    Returns:
+        the stacks sorted by the skew of their share of the snapshots of the members, most skewed first
+        (at most MAX_STACKS), and the thread pools sorted by the name. Each stack and pool has the list
+        of the values of every member and the index of the outlier member or None.
+    """
+    count = len(summaries)
+    stacks = {}
+    pools = {}
+    for index, summary in enumerate(summaries):
+        for signature, stack in summary["stacks"].items():
+            merged = stacks.get(signature)
+            if merged is None:
+                merged = stacks[signature] = {"signature": signature, "frames": stack["frames"],
+                                              "members": [None] * count}
+            merged["members"][index] = {"snapshots": stack["snapshots"], "threads": stack["threads"],
+                                        "share": 100 * stack["snapshots"] / (summary["snapshots"] or 1)}
+        for name, pool in summary["pools"].items():
+            merged = pools.get(name)
+            if merged is None:
+                merged = pools[name] = {"name": name, "members": [None] * count}
+            merged["members"][index] = pool
+    for stack in stacks.values():
+        shares = [member["share"] if member else 0 for member in stack["members"]]
+        stack["outlier"] = find_outlier(shares, MIN_OUTLIER_SHARE)
+        highest = max(range(count), key=shares.__getitem__)
+        stack["skew"] = shares[highest] - statistics.median(shares[:highest] + shares[highest + 1:] or [0])
+    for pool in pools.values():
+        pool["outlier"] = find_outlier([member["blocked"] if member else 0 for member in pool["members"]], 1)
+    sorted_stacks = sorted(stacks.values(), key=lambda stack: stack["skew"], reverse=True)[:MAX_STACKS]
+    return sorted_stacks, sorted(pools.values(), key=lambda pool: pool["name"])
+
+
+def append_text_node(doc, parent, name, value):
+    node = doc.createElement(name)
+    node.appendChild(doc.createTextNode(str(value)))
+    parent.appendChild(node)
+
+
+def _set_outlier(node, summaries, outlier):
+    if outlier is not None:
+        node.setAttribute("outlier", summaries[outlier]["name"])
+
+
+def create_comparison_xml(summaries, stacks, pools):
+    doc = Document()
+    comparison_node = doc.createElement("comparison")
+    doc.appendChild(comparison_node)
+    members_node = doc.createElement("members")
+    comparison_node.appendChild(members_node)
+    blocked_outlier = find_outlier([summary["blocked_threads"] for summary in summaries], 1)
+    for index, summary in enumerate(summaries):
+        member_node = doc.createElement("member")
+        member_node.setAttribute("blocked_outlier", str(index == blocked_outlier))
+        for name in ("name", "javacores", "threads", "snapshots", "blocked_threads", "blockers"):
+            append_text_node(doc, member_node, name, summary[name])
+        append_text_node(doc, member_node, "cpu", round(summary["cpu"], 2))
+        members_node.appendChild(member_node)
+    stacks_node = doc.createElement("stacks")
+    comparison_node.appendChild(stacks_node)
+    for stack in stacks:
+        stack_node = doc.createElement("stack")
+        stack_node.setAttribute("signature", stack["signature"])
+        _set_outlier(stack_node, summaries, stack["outlier"])
+        for frame in stack["frames"]:
+            append_text_node(doc, stack_node, "frame", frame)
+        for member in stack["members"]:
+            member_node = doc.createElement("member")
+            member_node.setAttribute("snapshots", str(member["snapshots"] if member else 0))
+            member_node.setAttribute("threads", str(member["threads"] if member else 0))
+            member_node.setAttribute("share", str(round(member["share"], 1) if member else 0))
+            stack_node.appendChild(member_node)
+        stacks_node.appendChild(stack_node)
+    pools_node = doc.createElement("pools")
+    comparison_node.appendChild(pools_node)
+    for pool in pools:
+        pool_node = doc.createElement("pool")
+        pool_node.setAttribute("name", pool["name"])
+        _set_outlier(pool_node, summaries, pool["outlier"])
+        for member in pool["members"]:
+            member_node = doc.createElement("member")
+            for name in ("threads", "snapshots", "blocked"):
+                member_node.setAttribute(name, str(member[name] if member else 0))
+            member_node.setAttribute("cpu", str(round(member["cpu"], 2) if member else 0))
+            pool_node.appendChild(member_node)
+        pools_node.appendChild(pool_node)
+    return doc
+
+
+def get_member_name(input_param, names):
+    """
+    Returns the name of the member from its input: the name of the directory or of the archive without
+    the extensions, made unique among the names of the other members.
+    """
+    name = os.path.basename(os.path.normpath(input_param.split(Properties.get_instance().get_property("separator"))[0]))
+    root, extension = os.path.splitext(name)
+    while root and extension[1:].lower() in SUPPORTED_ARCHIVES_FORMATS:
+        name = root
+        root, extension = os.path.splitext(name)
+    unique_name = name
+    i = 2
+    while unique_name in names:
+        unique_name = f"{name}_{i}"
+        i += 1
+    return unique_name
+
+
+def publish_xml_report(doc, output_dir, name, assets_strategy):
+    """
+    Writes the xml document to <name>.xml in output_dir and publishes index.html transformed from it
+    with data/xml/<name>/<name>.xsl. The document is unlinked.
+    """
+    xml_file = os.path.join(output_dir, name + ".xml")
+    with open(xml_file, "w", encoding="utf-8") as f:
+        doc.writexml(f, encoding="utf-8")
+    doc.unlink()
+    xsl_file = importlib_resources.files("javacore_analyser") / "data" / "xml" / name / (name + ".xsl")
+    xslt_transformer = etree.XSLT(etree.parse(str(xsl_file)))
+    assets_url = get_assets_url() if assets_strategy == ASSETS_SHARED else None
+    output_doc = xslt_transformer(etree.parse(xml_file), **JavacoreSet.get_assets_xslt_params(assets_url))
+    publish_html(output_doc, os.path.join(output_dir, "index.html"))
+
+
+def compare_collections(input_params, output_dir, assets_strategy=None):
+    """
+    Analyses the javacore collections of the members in parallel and generates the comparison report
+    in output_dir.
+
+    Parameters:
+    input_params (list): The inputs of the members, each in the same format as the input of the batch application.
+    output_dir (str): The directory where the comparison report will be generated.
+    assets_strategy (str): How the styles and scripts get into the report (see report_assets module).
+        If None, it is taken from the assets_strategy property.
+
+    Returns:
+    list: The summaries of the members (see summarise_member).
+    """
+    output_dir = os.path.normpath(output_dir)
+    members = []
+    for input_param in input_params:
+        name = get_member_name(input_param, {member["name"] for member in members})
+        members.append({"name": name, "input": get_input_files(input_param)})
+    if assets_strategy is None:
+        assets_strategy = get_assets_strategy(shared_allowed=False)
+    create_output_files_structure(output_dir, assets_strategy)
+    try:
+        parallelism = get_comparison_parallelism(len(members))
+        logging.info(f"Comparing {len(members)} members in {parallelism} process(es)")
+        if parallelism == 1:
+            summaries = [analyse_member(member) for member in members]
+        else:
+            with multiprocessing.Pool(parallelism, init_worker_process,
+                                      (Properties.get_instance().properties,)) as p:
+                summaries = p.map(analyse_member, members, chunksize=1)
+        stacks, pools = merge_summaries(summaries)
+        publish_xml_report(create_comparison_xml(summaries, stacks, pools), output_dir, "comparison",
+                           assets_strategy)
+        return summaries
+    finally:
+        finish_processing(output_dir)
+
+
+def run_comparison(parser, compare):
+    """
+    Parses the command line arguments with the parser extended by the common arguments, loads the properties
+    and calls compare with the arguments. Exits with code 13 if the comparison fails.
+    """
+    common_utils.add_common_args(parser)
+    args = parser.parse_args()
+    Properties.get_instance().load_properties(args)
+    common_utils.create_console_logging()
+    try:
+        compare(args)
+    except Exception as e:
+        logging.exception(e)
+        logging.fatal("Comparing the javacore collections failed")
+        exit(13)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("output", help="Name of directory where the comparison report will be generated")
+    parser.add_argument("input", nargs="+", help="Input javacore files, directory or archive of every member")
+    run_comparison(parser, lambda args: compare_collections(args.input, args.output))
+
+
+if __name__ == "__main__":
+    main()
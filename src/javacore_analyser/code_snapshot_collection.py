@@ -5,6 +5,7 @@
 
 from javacore_analyser.abstract_snapshot_collection import AbstractSnapshotCollection
 from javacore_analyser.stack_trace import StackTrace
+from javacore_analyser.stack_trace_table import STACK_ID
 from javacore_analyser.thread_snapshot import ThreadSnapshot
 
 
@@ -33,10 +34,12 @@ class CodeSnapshotCollection(AbstractSnapshotCollection):
     def is_interesting(self):  # method is to be overloaded in subclasses, ignore the static warning
         return True
 
-    def get_xml(self, doc):
+    def get_xml(self, doc, stack_trace_table=None):
         snapshot_collection_node = super().get_xml(doc)
         stack_strace = self.get_stack_trace()
-        if not stack_strace:
+        if stack_trace_table is not None:
+            snapshot_collection_node.setAttribute(STACK_ID, stack_trace_table.get_id(stack_strace))
+        elif not stack_strace:
             no_stack_node = doc.createElement('stack_trace0')
             no_stack_node.appendChild(doc.createTextNode(StackTrace.EMPTY_STACK))
             snapshot_collection_node.appendChild(no_stack_node)
@@ -0,0 +1,185 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""
+Diff of two javacore collections of the same application, e.g. collected before and after a tuning change.
+
+Both collections are summarised as in the cluster comparison (see cluster_comparison.summarise_member)
+and the summaries are joined by the stack signature and by the thread pool name with dictionaries,
+so the diff is linear in the number of the snapshots. A side can be the directory of a report generated
+with save_model property, then its saved analysis model is used instead of parsing the javacores again.
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+from xml.dom.minidom import Document
+
+from javacore_analyser.analysis_model import get_model_file, load_model
+from javacore_analyser.cluster_comparison import append_text_node, get_comparison_parallelism, publish_xml_report, \
+    run_comparison, summarise_member
+from javacore_analyser.javacore_analyser_batch import create_output_files_structure, generate_javecore_set_data, \
+    get_input_files, init_worker_process
+from javacore_analyser.properties import Properties
+from javacore_analyser.report_assets import get_assets_strategy
+from javacore_analyser.report_publishing import finish_processing
+
+NEW = "new"
+GONE = "gone"
+CHANGED = "changed"
+# The number of the stacks which changed most in the report
+MAX_STACKS = 200
+
+
+def summarise_side(side):
+    """
+    Returns the summary of one side of the diff. The side is the dict with name and input keys.
+    If the input is a report directory with saved analysis model, the model is loaded.
+    """
+    if os.path.isfile(get_model_file(side["input"])):
+        logging.info(f"Using the analysis model saved in {side['input']} as {side['name']}")
+        header, javacore_set = load_model(side["input"])
+    else:
+        logging.info(f"Analysing {side['input']} as {side['name']}")
+        javacore_set = generate_javecore_set_data(get_input_files(side["input"]))
+    return summarise_member(side["name"], javacore_set)
+
+
+def _get_status(before, after):
+    if before is None:
+        return NEW
+    if after is None:
+        return GONE
+    return CHANGED
+
+
+def diff_summaries(before, after):
+    """
+    Joins the summaries of two collections by the stack signature and by the thread pool name.
+
+    Returns:
+        the stacks sorted by the change of their share of the snapshots, largest first (at most MAX_STACKS),
+        and the thread pools sorted by the change of the number of their threads, largest first.
+        Every stack and pool has the before and after values (None if it is not in the collection),
+        the status (new, gone or changed) and the deltas.
+    """
+    stacks = []
+    for signature in before["stacks"].keys() | after["stacks"].keys():
+        stack_before = before["stacks"].get(signature)
+        stack_after = after["stacks"].get(signature)
+        share_before = 100 * stack_before["snapshots"] / (before["snapshots"] or 1) if stack_before else 0
+        share_after = 100 * stack_after["snapshots"] / (after["snapshots"] or 1) if stack_after else 0
+        stacks.append({"signature": signature, "frames": (stack_after or stack_before)["frames"],
+                       "status": _get_status(stack_before, stack_after),
+                       "before": stack_before, "after": stack_after,
+                       "share_before": share_before, "share_after": share_after,
+                       "share_delta": share_after - share_before,
+                       "cpu_delta": (stack_after["cpu"] if stack_after else 0) -
+                                    (stack_before["cpu"] if stack_before else 0)})
+    stacks.sort(key=lambda stack: (abs(stack["share_delta"]), abs(stack["cpu_delta"])), reverse=True)
+    pools = []
+    for name in before["pools"].keys() | after["pools"].keys():
+        pool_before = before["pools"].get(name)
+        pool_after = after["pools"].get(name)
+        pools.append({"name": name, "status": _get_status(pool_before, pool_after),
+                      "before": pool_before, "after": pool_after,
+                      "threads_delta": (pool_after["threads"] if pool_after else 0) -
+                                       (pool_before["threads"] if pool_before else 0),
+                      "cpu_delta": (pool_after["cpu"] if pool_after else 0) -
+                                   (pool_before["cpu"] if pool_before else 0)})
+    pools.sort(key=lambda pool: (-abs(pool["threads_delta"]), -abs(pool["cpu_delta"]), pool["name"]))
+    return stacks[:MAX_STACKS], pools
+
+
+def _append_values_node(doc, parent, name, values, keys):
+    node = doc.createElement(name)
+    for key in keys:
+        value = values[key] if values else 0
+        node.setAttribute(key, str(round(value, 2) if isinstance(value, float) else value))
+    parent.appendChild(node)
+
+
+def create_diff_xml(before, after, stacks, pools):
+    doc = Document()
+    diff_node = doc.createElement("diff")
+    doc.appendChild(diff_node)
+    for side_name, summary in (("before", before), ("after", after)):
+        _append_values_node(doc, diff_node, side_name, summary,
+                            ("name", "javacores", "threads", "snapshots", "blocked_threads", "blockers", "cpu"))
+    stacks_node = doc.createElement("stacks")
+    diff_node.appendChild(stacks_node)
+    for stack in stacks:
+        stack_node = doc.createElement("stack")
+        stack_node.setAttribute("signature", stack["signature"])
+        stack_node.setAttribute("status", stack["status"])
+        for frame in stack["frames"]:
+            append_text_node(doc, stack_node, "frame", frame)
+        for side_name in ("before", "after"):
+            _append_values_node(doc, stack_node, side_name, stack[side_name], ("snapshots", "threads", "cpu"))
+            stack_node.lastChild.setAttribute("share", str(round(stack["share_" + side_name], 1)))
+        stack_node.setAttribute("share_delta", str(round(stack["share_delta"], 1)))
+        stack_node.setAttribute("cpu_delta", str(round(stack["cpu_delta"], 2)))
+        stacks_node.appendChild(stack_node)
+    pools_node = doc.createElement("pools")
+    diff_node.appendChild(pools_node)
+    for pool in pools:
+        pool_node = doc.createElement("pool")
+        pool_node.setAttribute("name", pool["name"])
+        pool_node.setAttribute("status", pool["status"])
+        for side_name in ("before", "after"):
+            _append_values_node(doc, pool_node, side_name, pool[side_name], ("threads", "snapshots", "blocked", "cpu"))
+        pool_node.setAttribute("threads_delta", str(pool["threads_delta"]))
+        pool_node.setAttribute("cpu_delta", str(round(pool["cpu_delta"], 2)))
+        pools_node.appendChild(pool_node)
+    return doc
+
+
+def diff_collections(before_input, after_input, output_dir, assets_strategy=None):
+    """
+    Generates the diff report of two javacore collections in output_dir.
+
+    Parameters:
+    before_input (str): The input of the collection before the change, in the same format as the input of the batch
+        application, or the directory of the report generated with save_model property.
+    after_input (str): The input of the collection after the change, in the same format as before_input.
+    output_dir (str): The directory where the diff report will be generated.
+    assets_strategy (str): How the styles and scripts get into the report (see report_assets module).
+        If None, it is taken from the assets_strategy property.
+
+    Returns:
+    tuple: The stacks and the thread pools of the diff (see diff_summaries).
+    """
+    output_dir = os.path.normpath(output_dir)
+    sides = [{"name": "before", "input": before_input}, {"name": "after", "input": after_input}]
+    if assets_strategy is None:
+        assets_strategy = get_assets_strategy(shared_allowed=False)
+    create_output_files_structure(output_dir, assets_strategy)
+    try:
+        if get_comparison_parallelism(len(sides)) == 1:
+            before, after = [summarise_side(side) for side in sides]
+        else:
+            with multiprocessing.Pool(len(sides), init_worker_process,
+                                      (Properties.get_instance().properties,)) as p:
+                before, after = p.map(summarise_side, sides, chunksize=1)
+        stacks, pools = diff_summaries(before, after)
+        publish_xml_report(create_diff_xml(before, after, stacks, pools), output_dir, "diff", assets_strategy)
+        return stacks, pools
+    finally:
+        finish_processing(output_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("output", help="Name of directory where the diff report will be generated")
+    parser.add_argument("before", help="Input javacore files, directory or archive collected before the change, "
+                                       "or the directory of the report generated with save_model property")
+    parser.add_argument("after", help="Input javacore files, directory or archive collected after the change, "
+                                      "or the directory of the report generated with save_model property")
+    run_comparison(parser, lambda args: diff_collections(args.before, args.after, args.output))
+
+
+if __name__ == "__main__":
+    main()
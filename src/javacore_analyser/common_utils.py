@@ -6,10 +6,13 @@
 import logging
 import os
 import sys
+import zlib
 from pathlib import Path
 
 LOGGING_FORMAT = '%(asctime)s [thread: %(thread)d][%(levelname)s][%(filename)s:%(lineno)s] %(message)s'
 
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+
 
 def create_file_logging(logging_file_dir):
     """
@@ -22,7 +25,7 @@ def create_file_logging(logging_file_dir):
         logging_file_dir (str): The directory where the log file will be created.
 
     Returns:
-        None
+        logging.FileHandler: The handler added to the root logger
     """
     logging_file = os.path.join(logging_file_dir, "wait2-debug.log")
     Path(logging_file_dir).mkdir(parents=True, exist_ok=True)  # Sometimes the folder of logging might not exist
@@ -30,6 +33,7 @@ def create_file_logging(logging_file_dir):
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(logging.Formatter(LOGGING_FORMAT))
     logging.getLogger().addHandler(file_handler)
+    return file_handler
 
 
 def create_console_logging() -> None:
@@ -45,6 +49,24 @@ def create_console_logging() -> None:
     root_logger.addHandler(console_handler)
 
 
+def get_checksum(file, start=0, end=None, checksum=0):
+    """
+    Returns the CRC-32 checksum of the part of the file from start to end (the end of the file if None).
+    The checksum of the file which grows is computed from the checksum of its beginning passed in checksum.
+    """
+    with open(file, "rb") as f:
+        f.seek(start)
+        remaining = end - start if end is not None else None
+        while remaining is None or remaining > 0:
+            chunk = f.read(CHECKSUM_CHUNK_SIZE if remaining is None else min(CHECKSUM_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            checksum = zlib.crc32(chunk, checksum)
+            if remaining is not None:
+                remaining -= len(chunk)
+    return checksum
+
+
 def add_common_args(parser):
     parser.add_argument("--separator",
                         help='Input files separator (default ";")', required=False)
@@ -56,6 +78,41 @@ def add_common_args(parser):
     parser.add_argument("--llm", help="LLM model to use", required=False)
     parser.add_argument("--llm_max_tokens", help="LLM max tokens", required=False)
     parser.add_argument("--llm_temperature", help="LLM temperature", required=False)
+    parser.add_argument("--assets_strategy", required=False,
+                        help="How the report gets its styles and scripts: copy (default), hardlink, symlink "
+                             "or shared (web application only)")
+    parser.add_argument("--compression", required=False,
+                        help="Write compressed copies of report files: comma separated list of gzip, br")
+    parser.add_argument("--compressed_only", required=False,
+                        help="Keep only compressed copies of report files (requires gzip compression)")
+    parser.add_argument("--virtual_table_threshold", required=False,
+                        help="Render tables with more rows than this page by page in the browser (0 to disable)")
+    parser.add_argument("--search_index", required=False,
+                        help="Write the search index of report pages used by the search bar (True or False)")
+    parser.add_argument("--publish_index_last", required=False,
+                        help="Generate index.html after all other report pages (True or False)")
+    parser.add_argument("--save_model", required=False,
+                        help="Save the analysed data with the report to regenerate it later (True or False)")
+    parser.add_argument("--analysis_store", required=False,
+                        help="Path of the SQLite database to export the analysed data to for later queries")
+    parser.add_argument("--batch_parallelism", required=False,
+                        help="Manifest mode: number of processes generating the reports (1 to use this process)")
+    parser.add_argument("--comparison_parallelism", required=False,
+                        help="Compare mode: number of processes analysing the JVMs (0 for one per CPU)")
+    parser.add_argument("--gc_parallelism", required=False,
+                        help="Number of processes parsing the verbose gc files (0 for one per CPU)")
+    parser.add_argument("--gc_chart_collects", required=False,
+                        help="Maximum number of garbage collections shown in the chart (0 to show all)")
+    parser.add_argument("--har_content_limit", required=False,
+                        help="Maximum number of characters of HTTP request and response content kept (0 to keep all)")
+    parser.add_argument("--jvm_time_zone", required=False,
+                        help="UTC offset of the time zone of the JVM, e.g. +01:00, used to correlate the HTTP calls")
+    parser.add_argument("--watch_interval", required=False,
+                        help="Watch mode: seconds between scans of the directory when inotify is not available")
+    parser.add_argument("--watch_settle_time", required=False,
+                        help="Watch mode: seconds the file size must not change before the file is analysed")
+    parser.add_argument("--watch_batch_size", required=False,
+                        help="Watch mode: maximum number of javacores added to the report in one update")
     parser.add_argument("--config_file", required=False, help="Configuration file", default="config.ini")
 
 
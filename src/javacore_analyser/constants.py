@@ -47,3 +47,14 @@ END_OF_TEXT = '<|end_of_text|>'
 # When number of GC pauses is below this threshold, individual pause times are displayed
 # When above, summary statistics are shown instead
 GC_PAUSE_DETAIL_THRESHOLD = 100
+
+# GC analytics: the pauses longer than these thresholds in milliseconds are counted (see LongGcPauseTip)
+GC_PAUSE_THRESHOLDS = (1000, 2000)
+# GC analytics: the length in seconds of the time windows for the GC time share and the allocation rate
+GC_ANALYTICS_WINDOW = 60
+
+# Time correlation: the HTTP calls at least this long in milliseconds are slow (see TimeCorrelationTip)
+SLOW_HTTP_CALL_THRESHOLD = 1000
+# Time correlation: the javacore is correlated with the HTTP call if it was taken at most this many seconds
+# before or after the call
+JAVACORE_CORRELATION_DISTANCE = 60
@@ -25,8 +25,90 @@ function expand_it(whichEl, link) {
     whichEl.style.display = (whichEl.style.display == "none") ? "" : "none";
 }
 
+// The headers, cookies and content of the HTTP calls are not in the page. They are in the data file of their HAR file
+// in http_calls directory of the report (see har_file.py), loaded when the details of one of its calls are shown.
+const httpCallDetails = (function () {
+
+    // data registered by the data files: HAR file id -> list of [request headers, request cookies, request content,
+    // response headers, response cookies, response content]
+    const data = {};
+    // HAR file id -> the elements waiting for the data file
+    const pending = {};
+
+    function addSection(container, title, text, className) {
+        if (!text) {
+            return;
+        }
+        const section = document.createElement("div");
+        section.className = "http-detail-section";
+        const titleElement = document.createElement("strong");
+        titleElement.textContent = title;
+        const pre = document.createElement("pre");
+        pre.className = className;
+        pre.textContent = text;
+        section.append(titleElement, pre);
+        container.appendChild(section);
+    }
+
+    function render(container) {
+        if (container.dataset.loaded) {
+            return;
+        }
+        const call = data[container.dataset.file][container.dataset.call];
+        container.textContent = "";
+        [["Request Details", 0], ["Response Details", 3]].forEach(function ([title, offset]) {
+            const header = document.createElement("h4");
+            header.textContent = title;
+            container.appendChild(header);
+            addSection(container, "Headers:", call[offset], "http-detail-pre");
+            addSection(container, "Cookies:", call[offset + 1], "http-detail-pre");
+            addSection(container, "Content:", call[offset + 2], "http-detail-pre scrollable");
+        });
+        container.dataset.loaded = "true";
+    }
+
+    function register(fileId, calls) {
+        data[fileId] = calls;
+        (pending[fileId] || []).forEach(render);
+        delete pending[fileId];
+    }
+
+    function show(detailsElement) {
+        const container = detailsElement.querySelector(".http-call-bodies");
+        if (!container || container.dataset.loaded) {
+            return;
+        }
+        const fileId = container.dataset.file;
+        if (data[fileId]) {
+            render(container);
+            return;
+        }
+        if (!pending[fileId]) {
+            pending[fileId] = [];
+            const script = document.createElement("script");
+            script.src = "http_calls/" + fileId + ".js";
+            script.onerror = function () {
+                (pending[fileId] || []).forEach(function (element) {
+                    element.textContent = "The details of the HTTP call are not available";
+                });
+                delete pending[fileId];
+            };
+            document.body.appendChild(script);
+        }
+        pending[fileId].push(container);
+    }
+
+    return {
+        register: register,
+        show: show
+    };
+})();
+
 function expand_http_details(whichEl, link) {
     whichEl.style.display = (whichEl.style.display == "none") ? "" : "none";
+    if (whichEl.style.display != "none") {
+        httpCallDetails.show(whichEl);
+    }
     if (link) {
         if (link.innerHTML) {
            if (whichEl.style.display == "none") {
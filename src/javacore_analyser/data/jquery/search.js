@@ -10,7 +10,7 @@
 $(function() {
 
   // the input field
-  const $input = $("input[type='search']");
+  const $input = $("#search-input");
   // search button
   const $searchBtn = $("button[data-search='search']");
   // clear button
@@ -31,6 +31,111 @@ $(function() {
   let currentIndex = 0;
   // the counter display element
   const $counter = $("#search-counter");
+  // the search units of the prebuilt index (see search_index.py), loaded on the first search
+  let units = null;
+  // the elements highlighted by the last search
+  let $marked = $();
+  // the rows rendered by virtual-table.js, which are not in the index
+  const virtualRows = ".virtual_table tbody";
+
+  /**
+   * Returns the search units of the page by their numbers or null if the page has no prebuilt index.
+   */
+  function getUnits() {
+    if (units === null && window.searchIndex) {
+      units = new Array(window.searchIndex.units);
+      document.querySelectorAll("[data-si]").forEach(function(unit) {
+        units[Number(unit.getAttribute("data-si"))] = unit;
+      });
+    }
+    return units;
+  }
+
+  /**
+   * Returns the numbers of the units which tokens contain all the tokens of the word.
+   * Returns null if the word has no tokens, so every unit is a candidate.
+   */
+  function findCandidates(word) {
+    const index = window.searchIndex;
+    const wordTokens = word.toLowerCase().match(/[\p{L}\p{N}_]+/gu);
+    if (!wordTokens) return null;
+    let candidates = null;
+    wordTokens.forEach(function(wordToken) {
+      const found = new Set();
+      // the word can be a part of the token, e.g. "Dump" matches "triggerdumpsimpl"
+      index.tokens.forEach(function(token, i) {
+        if (token.includes(wordToken)) {
+          let unit = 0;
+          index.postings[i].forEach(function(delta) {
+            unit += delta;
+            found.add(unit);
+          });
+        }
+      });
+      candidates = (candidates === null) ? found : new Set([...candidates].filter(function(unit) {
+        return found.has(unit);
+      }));
+    });
+    return candidates;
+  }
+
+  /**
+   * Returns the units containing any of the words.
+   */
+  function findUnits(words) {
+    const allUnits = getUnits();
+    const matching = new Set();
+    words.forEach(function(word) {
+      const candidates = findCandidates(word);
+      const numbers = (candidates === null) ? allUnits.keys() : candidates;
+      for (const number of numbers) {
+        const unit = allUnits[number];
+        // the index finds the tokens, the exact match is checked on the text
+        if (unit && containsAny(unit, unit, [word])) {
+          matching.add(unit);
+        }
+      }
+    });
+    return matching;
+  }
+
+  /**
+   * Returns the text of the node without the text of the units nested in the unit.
+   */
+  function unitText(node, unit) {
+    if (node.nodeType === Node.TEXT_NODE) return node.nodeValue;
+    if (!isDomNode(node) || (node !== unit && node.hasAttribute('data-si'))) return "";
+    if (node.tagName === 'SCRIPT' || node.tagName === 'STYLE' || node.matches(virtualRows)) return "";
+    let text = "";
+    for (let i = 0; i < node.childNodes.length; ++i) {
+      text += unitText(node.childNodes[i], unit);
+    }
+    return text;
+  }
+
+  function containsAny(node, unit, words) {
+    const text = unitText(node, unit).toUpperCase();
+    return words.some(function(word) { return text.includes(word.toUpperCase()); });
+  }
+
+  /**
+   * Expands the matching unit, its ancestors and its matching elements, the same way as searchInNode expands
+   * the matching nodes.
+   */
+  function expandUnit(unit, words) {
+    for (let node = unit.parentElement; node; node = node.parentElement) {
+      expandNode(node);
+    }
+    (function expandInUnit(node) {
+      if (!isDomNode(node) || (node !== unit && node.hasAttribute('data-si'))) return;
+      if (containsAny(node, unit, words)) {
+        expandNode(node);
+        for (let i = 0; i < node.childNodes.length; ++i) {
+          expandInUnit(node.childNodes[i]);
+        }
+      }
+    })(unit);
+  }
 
   /**
    * Updates the search counter display
@@ -80,19 +185,23 @@ $(function() {
     }
   }
 
+  function expandNode(node) {
+    if (!isDomNode(node)) return;
+    if (!node.classList.contains('show-all')) {
+      node.classList.add('show-all');
+      for (let i = 0; i < node.childNodes.length; ++i) {
+        processChild(node.childNodes[i]);
+      }
+    }
+    if (node.getAttribute('style') && node.style.display === "none") {
+      node.style.display = "";
+    }
+  }
+
   function searchInNode(node, searchTerm) {
     if (!isDomNode(node)) return;
     if (node.textContent.toUpperCase().match(searchTerm.toUpperCase())) {
-      // expand the node here
-      if (!node.classList.contains('show-all')) {
-        node.classList.add('show-all');
-        for (let i = 0; i < node.childNodes.length; ++i) {
-          processChild(node.childNodes[i]);
-        }
-      }
-      if (node.getAttribute('style') && node.style.display === "none") {
-        node.style.display = "";
-      }
+      expandNode(node);
     }
     for (let i = 0; i < node.childNodes.length; ++i) {
       searchInNode(node.childNodes[i], searchTerm);
@@ -116,16 +225,50 @@ $(function() {
     }
   });
 
+  function showResults() {
+    $results = $content.find("mark");
+    currentIndex = 0;
+    jumpTo();
+  }
+
   function highlight(searchTerm) {
-    $content.unmark({
+    $marked.unmark({
       done: function() {
+        $marked = $content;
         $content.mark(searchTerm, {
           separateWordSearch: true,
-          done: function() {
-            $results = $content.find("mark");
-            currentIndex = 0;
-            jumpTo();
-          }
+          done: showResults
+        });
+      }
+    });
+  }
+
+  /**
+   * Highlights the search term only in the text of the matching units and in the rows of the virtualized tables,
+   * which are not in the index.
+   */
+  function highlightUnits(searchTerm, matchingUnits) {
+    $marked.unmark({
+      done: function() {
+        const contexts = matchingUnits.concat($(virtualRows).get());
+        $marked = $(contexts);
+        let pending = contexts.length;
+        if (pending === 0) {
+          showResults();
+          return;
+        }
+        contexts.forEach(function(context) {
+          const nested = '[data-si="' + context.getAttribute('data-si') + '"] [data-si]';
+          $(context).mark(searchTerm, {
+            separateWordSearch: true,
+            // the nested units are highlighted separately when they match
+            exclude: context.hasAttribute('data-si') ? [nested, nested + ' *', virtualRows, virtualRows + ' *'] : [],
+            done: function() {
+              if (--pending === 0) {
+                showResults();
+              }
+            }
+          });
         });
       }
     });
@@ -137,15 +280,34 @@ $(function() {
 
   function performSearch() {
     const searchTerm = document.getElementById('search-input').value;
-    search(searchTerm);
-    highlight(searchTerm);
+    // Rows of virtualized tables are not in the document, so the tables are filtered to the matching rows
+    if (typeof virtualTables !== 'undefined') {
+      virtualTables.setFilter(searchTerm);
+    }
+    // the words are searched separately, as the highlighting does
+    const words = searchTerm.split(/\s+/).filter(Boolean);
+    if (getUnits() === null || words.length === 0) {
+      search(searchTerm);
+      highlight(searchTerm);
+      return;
+    }
+    console.log("searching for " + searchTerm + " in the index");
+    const matchingUnits = findUnits(words);
+    matchingUnits.forEach(function(unit) {
+      expandUnit(unit, words);
+    });
+    highlightUnits(searchTerm, [...matchingUnits]);
   }
 
   /**
    * Clears the search
    */
   $clearBtn.on("click", function() {
-    $content.unmark();
+    $marked.unmark();
+    $marked = $();
+    if (typeof virtualTables !== 'undefined') {
+      virtualTables.setFilter("");
+    }
     $input.val("").focus();
     $counter.text("");
   });
@@ -0,0 +1,380 @@
+/*
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+*/
+
+// 'use strict' opts this file into strict mode: undeclared variables, duplicate
+// parameter names, and other silent JavaScript mistakes become hard errors.
+'use strict';
+
+/*
+ * Virtualized tables for the reports with too many rows to render them all.
+ * The rows are loaded from the data files in the tables directory of the report (see virtual_tables.py).
+ * Only the current page of rows is in the DOM. Sorting and filtering are done on the data arrays.
+ */
+const virtualTables = (function () {
+
+    const PAGE_SIZE = 100;
+    const DISPLAYED_STACK_DEPTH = 50;
+
+    // data registered by the data files: table name -> {meta, rows}
+    const data = {};
+    // initialized tables
+    const tables = [];
+
+    // Indexes of the columns in the rows of all_threads data file
+    const T_NAME = 0, T_HASH = 1, T_DRILL_DOWN = 2, T_ADDRESS = 3, T_CPU = 4, T_CPU_PERCENTAGE = 5, T_MEMORY = 6,
+        T_STACK_DEPTH = 7, T_BLOCKING = 8, T_BLOCKER = 9, T_CLASSIFICATION = 10, T_SNAPSHOTS = 11;
+    // Indexes of the columns in the rows of all_code data file
+    const C_STACK = 0, C_CPU = 1, C_CPU_PERCENTAGE = 2, C_MEMORY = 3, C_THREADS = 4;
+
+    const ML_CLASSES = {
+        'Computing': 'ml-computing',
+        'Display Graphics': 'ml-display-graphics',
+        'Java Internal': 'ml-java-internal',
+        'Liberty Internal': 'ml-liberty-internal',
+        'Read From Database': 'ml-read-database',
+        'Read From Disk': 'ml-read-disk',
+        'Read From Network': 'ml-read-network',
+        'Save To Disk': 'ml-save-disk',
+        'Wait For Condition': 'ml-wait-condition',
+        'Wait For Connection': 'ml-wait-connection',
+        'Write To Database': 'ml-write-database',
+        'Write To Network': 'ml-write-network'
+    };
+
+    function register(name, tableData) {
+        data[name] = tableData;
+    }
+
+    function element(tag, className, text) {
+        const el = document.createElement(tag);
+        if (className) el.className = className;
+        if (text !== undefined) el.textContent = text;
+        return el;
+    }
+
+    function getStack(index) {
+        return data['stack_traces'].rows[index];
+    }
+
+    function getStackText(index) {
+        return getStack(index)[1].map(function (line) { return line[1]; }).join('\n');
+    }
+
+    function threadLink(thread) {
+        // thread is [id, hash, name]
+        const a = element('a', null, thread[0]);
+        a.target = '_blank';
+        a.href = 'threads/thread_' + thread[1] + '.html';
+        a.title = thread[2];
+        return a;
+    }
+
+    function appendThreadLinks(td, threads) {
+        threads.forEach(function (thread) {
+            td.appendChild(threadLink(thread));
+            td.appendChild(document.createTextNode('; '));
+        });
+    }
+
+    function numberCell(meta, value, digits, warning) {
+        const td = element('td');
+        if (meta.javacore_count === 1) {
+            td.textContent = 'N/A';
+        } else if (value >= 0) {
+            td.textContent = value.toFixed(digits);
+        } else {
+            const div = element('div', 'warning', '[!]');
+            div.appendChild(element('span', 'warningtooltip', warning));
+            td.appendChild(div);
+        }
+        return td;
+    }
+
+    function expandStackHandler(event) {
+        const link = event.target;
+        const par = link.parentNode.parentNode.querySelector('p');
+        if (par.classList.contains('show-all')) {
+            par.classList.remove('show-all');
+            link.textContent = '[+] Expand';
+        } else {
+            par.classList.add('show-all');
+            link.textContent = '[-] Collapse';
+        }
+    }
+
+    // Same markup as the stack traces rendered by all_threads.xsl
+    function stackDiv(stackIndex) {
+        const div = element('div');
+        const stack = getStack(stackIndex);
+        if (stack[0] === 0) {
+            div.textContent = 'No Stack';
+            return div;
+        }
+        const toggle = element('div', 'toggle_expand');
+        const show = element('a', 'show', '[+] Expand');
+        show.href = 'javaScript:;';
+        show.addEventListener('click', expandStackHandler);
+        toggle.appendChild(show);
+        div.appendChild(toggle);
+        const p = element('p', 'stacktrace');
+        stack[1].forEach(function (line) {
+            p.appendChild(element('span', line[0], line[1]));
+            p.appendChild(element('br'));
+        });
+        if (stack[0] > DISPLAYED_STACK_DEPTH) {
+            p.appendChild(element('span', null, '...'));
+            p.appendChild(element('br'));
+        }
+        div.appendChild(p);
+        return div;
+    }
+
+    function threadDetails(meta, row) {
+        const div = element('div', null, 'java/lang/Thread:' + row[T_ADDRESS]);
+        row[T_SNAPSHOTS].forEach(function (snapshot) {
+            div.appendChild(element('br'));
+            div.appendChild(element('strong', null, 'Timestamp: ' + (meta.timestamps[snapshot[0]] || '')));
+            div.appendChild(stackDiv(snapshot[1]));
+        });
+        return div;
+    }
+
+    function renderThreadRow(meta, row) {
+        const tr = element('tr');
+        const nameTd = element('td', 'left');
+        const nameLink = element('a', 'expandit', row[T_NAME]);
+        nameLink.href = 'javaScript:;';
+        nameLink.addEventListener('click', function () {
+            // the stack traces are rendered when they are shown for the first time
+            let details = nameTd.querySelector('.virtual_table_details');
+            if (details) {
+                details.style.display = (details.style.display === 'none') ? '' : 'none';
+            } else {
+                details = threadDetails(meta, row);
+                details.classList.add('virtual_table_details');
+                nameTd.appendChild(details);
+            }
+        });
+        nameTd.appendChild(nameLink);
+        if (row[T_DRILL_DOWN]) {
+            const more = element('a', 'right', 'More...');
+            more.target = '_blank';
+            more.href = 'threads/thread_' + row[T_HASH] + '.html';
+            nameTd.appendChild(more);
+            nameTd.appendChild(element('br'));
+        }
+        tr.appendChild(nameTd);
+        tr.appendChild(numberCell(meta, row[T_CPU], 2, 'Error computing CPU usage, javacores may be corrupted'));
+        tr.appendChild(numberCell(meta, row[T_CPU_PERCENTAGE], 1,
+            'Error computing CPU percentage, javacores may be corrupted'));
+        tr.appendChild(element('td', null, (row[T_MEMORY] / 1024 / 1024).toFixed(2)));
+        tr.appendChild(element('td', null, row[T_STACK_DEPTH].toFixed(1)));
+        const blockingTd = element('td', 'left');
+        if (row[T_BLOCKING].length) {
+            blockingTd.appendChild(document.createTextNode('blocking: '));
+            appendThreadLinks(blockingTd, row[T_BLOCKING]);
+        }
+        if (row[T_BLOCKER].length) {
+            blockingTd.appendChild(document.createTextNode('blocked by: '));
+            appendThreadLinks(blockingTd, row[T_BLOCKER]);
+        }
+        tr.appendChild(blockingTd);
+        if (meta.use_ml) {
+            const mlTd = element('td');
+            if (!row[T_CLASSIFICATION].length) {
+                mlTd.textContent = 'N/A';
+            }
+            row[T_CLASSIFICATION].forEach(function (entry, i) {
+                if (i > 0) mlTd.appendChild(element('br'));
+                mlTd.appendChild(element('span', 'ml-badge ' + (ML_CLASSES[entry[0]] || 'ml-unknown'),
+                    entry[0] + ' (' + entry[1] + ')'));
+            });
+            tr.appendChild(mlTd);
+        }
+        return tr;
+    }
+
+    function renderCodeRow(meta, row) {
+        const tr = element('tr');
+        const stackTd = element('td', 'left');
+        getStack(row[C_STACK])[1].slice(0, meta.stack_comparison_depth).forEach(function (line) {
+            stackTd.appendChild(document.createTextNode(line[1]));
+            stackTd.appendChild(element('br'));
+        });
+        if (getStack(row[C_STACK])[0] === 0) {
+            stackTd.textContent = 'No stack';
+        }
+        tr.appendChild(stackTd);
+        tr.appendChild(numberCell(meta, row[C_CPU], 2, 'Error computing CPU usage, javacores may be corrupted'));
+        tr.appendChild(numberCell(meta, row[C_CPU_PERCENTAGE], 1,
+            'Error computing CPU percentage, javacores may be corrupted'));
+        tr.appendChild(element('td', null, (row[C_MEMORY] / 1024 / 1024).toFixed(2)));
+        const threadsTd = element('td', 'left');
+        appendThreadLinks(threadsTd, row[C_THREADS]);
+        tr.appendChild(threadsTd);
+        return tr;
+    }
+
+    // Table definitions: the sort key of each sortable column, the text used by the filter and the row renderer
+    const DEFINITIONS = {
+        'all_threads': {
+            sortKeys: [
+                function (row) { return row[T_NAME].toLowerCase(); },
+                function (row) { return row[T_CPU]; },
+                function (row) { return row[T_CPU_PERCENTAGE]; },
+                function (row) { return row[T_MEMORY]; },
+                function (row) { return row[T_STACK_DEPTH]; }
+            ],
+            initialSort: {column: 1, descending: true},
+            searchText: function (row) {
+                const stacks = new Set(row[T_SNAPSHOTS].map(function (snapshot) { return snapshot[1]; }));
+                const texts = [row[T_NAME], row[T_ADDRESS]];
+                row[T_BLOCKING].concat(row[T_BLOCKER]).forEach(function (thread) { texts.push(thread[0]); });
+                row[T_CLASSIFICATION].forEach(function (entry) { texts.push(entry[0]); });
+                stacks.forEach(function (stack) { texts.push(getStackText(stack)); });
+                return texts.join('\n');
+            },
+            render: renderThreadRow
+        },
+        'all_code': {
+            sortKeys: [
+                function (row) { return getStackText(row[C_STACK]).toLowerCase(); },
+                function (row) { return row[C_CPU]; },
+                function (row) { return row[C_CPU_PERCENTAGE]; },
+                function (row) { return row[C_MEMORY]; }
+            ],
+            initialSort: {column: 2, descending: true},
+            searchText: function (row) {
+                const texts = [getStackText(row[C_STACK])];
+                row[C_THREADS].forEach(function (thread) { texts.push(thread[0], thread[2]); });
+                return texts.join('\n');
+            },
+            render: renderCodeRow
+        }
+    };
+
+    function VirtualTable(container) {
+        this.name = container.getAttribute('data-table');
+        this.definition = DEFINITIONS[this.name];
+        this.tableData = data[this.name];
+        this.meta = this.tableData.meta;
+        this.rows = this.tableData.rows;
+        this.searchTexts = null; // computed on the first filtering
+        this.view = this.rows.slice();
+        this.page = 0;
+        this.filterText = '';
+        this.sort = Object.assign({}, this.definition.initialSort);
+        this.tbody = container.querySelector('tbody');
+        this.info = container.querySelector('.virtual_table_info');
+        this.filterInput = container.querySelector('.virtual_table_filter');
+        this.headers = container.querySelectorAll('thead th');
+
+        const self = this;
+        this.headers.forEach(function (th, column) {
+            if (!th.hasAttribute('data-sort') || !self.definition.sortKeys[column]) return;
+            th.classList.add('tablesorter-header');
+            th.style.cursor = 'pointer';
+            th.addEventListener('click', function () {
+                if (self.sort.column === column) {
+                    self.sort.descending = !self.sort.descending;
+                } else {
+                    self.sort = {column: column, descending: th.getAttribute('data-sort') === 'desc'};
+                }
+                self.update();
+            });
+        });
+        container.querySelector('.virtual_table_prev').addEventListener('click', function () {
+            self.showPage(self.page - 1);
+        });
+        container.querySelector('.virtual_table_next').addEventListener('click', function () {
+            self.showPage(self.page + 1);
+        });
+        this.filterInput.addEventListener('keyup', function (event) {
+            if (event.key === 'Enter' || self.filterInput.value === '') {
+                self.setFilter(self.filterInput.value);
+            }
+        });
+        this.filterInput.addEventListener('search', function () {
+            self.setFilter(self.filterInput.value);
+        });
+        this.update();
+    }
+
+    VirtualTable.prototype.setFilter = function (text) {
+        this.filterText = text.toUpperCase();
+        this.filterInput.value = text;
+        this.update();
+    };
+
+    VirtualTable.prototype.update = function () {
+        const self = this;
+        let view = this.rows;
+        if (this.filterText) {
+            if (!this.searchTexts) {
+                this.searchTexts = new Map();
+                this.rows.forEach(function (row) {
+                    self.searchTexts.set(row, self.definition.searchText(row).toUpperCase());
+                });
+            }
+            view = view.filter(function (row) { return self.searchTexts.get(row).includes(self.filterText); });
+        }
+        const key = this.definition.sortKeys[this.sort.column];
+        const direction = this.sort.descending ? -1 : 1;
+        const keys = new Map(view.map(function (row) { return [row, key(row)]; }));
+        this.view = view.slice().sort(function (a, b) {
+            const ka = keys.get(a), kb = keys.get(b);
+            return ka < kb ? -direction : (ka > kb ? direction : 0);
+        });
+        this.headers.forEach(function (th, column) {
+            th.classList.remove('tablesorter-headerAsc', 'tablesorter-headerDesc');
+            if (column === self.sort.column) {
+                th.classList.add(self.sort.descending ? 'tablesorter-headerDesc' : 'tablesorter-headerAsc');
+            }
+        });
+        this.showPage(0);
+    };
+
+    VirtualTable.prototype.showPage = function (page) {
+        const pages = Math.max(1, Math.ceil(this.view.length / PAGE_SIZE));
+        this.page = Math.min(Math.max(page, 0), pages - 1);
+        const start = this.page * PAGE_SIZE;
+        const end = Math.min(start + PAGE_SIZE, this.view.length);
+        const fragment = document.createDocumentFragment();
+        for (let i = start; i < end; i++) {
+            const tr = this.definition.render(this.meta, this.view[i]);
+            tr.className = (i - start) % 2 === 0 ? 'odd' : 'even';
+            fragment.appendChild(tr);
+        }
+        this.tbody.textContent = '';
+        this.tbody.appendChild(fragment);
+        let info = 'Rows ' + (this.view.length ? start + 1 : 0) + '-' + end + ' of ' + this.view.length;
+        if (this.view.length !== this.rows.length) {
+            info += ' (filtered from ' + this.rows.length + ')';
+        }
+        this.info.textContent = info + ', page ' + (this.page + 1) + ' of ' + pages;
+    };
+
+    // Sets the filter of all the virtualized tables. Used by the search bar.
+    function setFilter(text) {
+        tables.forEach(function (table) { table.setFilter(text); });
+    }
+
+    $(function () {
+        document.querySelectorAll('.virtual_table').forEach(function (container) {
+            const name = container.getAttribute('data-table');
+            if (!data[name] || !data['stack_traces']) {
+                console.log('Missing data file of the table ' + name);
+                return;
+            }
+            tables.push(new VirtualTable(container));
+        });
+    });
+
+    return {
+        register: register,
+        setFilter: setFilter,
+        tables: tables
+    };
+})();
@@ -0,0 +1,160 @@
+<?xml version="1.0" encoding="UTF-8"?>
+
+<!--
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+-->
+
+<xsl:stylesheet version="1.0" xmlns:xsl="http://www.w3.org/1999/XSL/Transform">
+
+    <!-- Location of the styles and scripts. Overridden when the assets are served from a shared url -->
+    <xsl:param name="assets_dir" select="'data'"/>
+
+    <xsl:template match="comparison">
+        <html>
+            <head>
+                <meta charset="UTF-8"/>
+                <title>Javacore Analyser Cluster Comparison</title>
+                <link rel="stylesheet" href="{$assets_dir}/style.css"/>
+                <link rel="stylesheet" href="{$assets_dir}/jquery/jq.css"/>
+                <link rel="stylesheet" href="{$assets_dir}/jquery/theme.blue.css"/>
+                <script type="text/javascript" src="{$assets_dir}/jquery/jquery.min.js"> _ </script>
+                <script type="text/javascript" src="{$assets_dir}/jquery/jquery.tablesorter.min.js"> _ </script>
+                <script type="text/javascript" src="{$assets_dir}/jquery/jquery.tablesorter.widgets.min.js"> _ </script>
+                <script type="text/javascript">
+                    $(function(){ $('.tablesorter').tablesorter({ theme: 'blue', widgets: ['zebra'] }); });
+                </script>
+            </head>
+            <body id="doc_body">
+                <div class="content">
+                    <h1>Javacore Analyser Cluster Comparison</h1>
+                    <xsl:call-template name="members"/>
+                    <xsl:call-template name="stacks"/>
+                    <xsl:call-template name="pools"/>
+                </div>
+            </body>
+        </html>
+    </xsl:template>
+
+    <xsl:template name="outlier_mark">
+        <xsl:param name="tooltip"/>
+        <div class="warning">[!]
+            <span class="warningtooltip"><xsl:value-of select="$tooltip"/></span>
+        </div>
+    </xsl:template>
+
+    <xsl:template name="member_headers">
+        <xsl:for-each select="/comparison/members/member">
+            <th><xsl:value-of select="name"/></th>
+        </xsl:for-each>
+    </xsl:template>
+
+    <xsl:template name="members">
+        <h3>Members</h3>
+        <table id="members_table" class="tablesorter">
+            <thead>
+                <tr>
+                    <th class="left">Member</th>
+                    <th>Javacores</th>
+                    <th>Threads</th>
+                    <th>Thread snapshots</th>
+                    <th>Blocked threads</th>
+                    <th>Blocking threads</th>
+                    <th>Total CPU usage (s)</th>
+                </tr>
+            </thead>
+            <tbody>
+                <xsl:for-each select="members/member">
+                    <tr>
+                        <td class="left"><xsl:value-of select="name"/></td>
+                        <td><xsl:value-of select="javacores"/></td>
+                        <td><xsl:value-of select="threads"/></td>
+                        <td><xsl:value-of select="snapshots"/></td>
+                        <td>
+                            <xsl:value-of select="blocked_threads"/>
+                            <xsl:if test="@blocked_outlier = 'True'">
+                                <xsl:call-template name="outlier_mark">
+                                    <xsl:with-param name="tooltip">Much more blocked threads than on other members</xsl:with-param>
+                                </xsl:call-template>
+                            </xsl:if>
+                        </td>
+                        <td><xsl:value-of select="blockers"/></td>
+                        <td><xsl:value-of select='format-number(cpu, "0.00")'/></td>
+                    </tr>
+                </xsl:for-each>
+            </tbody>
+        </table>
+    </xsl:template>
+
+    <xsl:template name="stacks">
+        <h3>Stacks</h3>
+        <p>
+            The percentage of the thread snapshots of every member with the stack, for the stacks which differ most
+            between the members. The stacks are the same if their top lines are the same, as in the All Code table
+            of the report.
+        </p>
+        <table id="stacks_table" class="tablesorter">
+            <thead>
+                <tr>
+                    <th class="left">Stack</th>
+                    <th>Outlier</th>
+                    <xsl:call-template name="member_headers"/>
+                </tr>
+            </thead>
+            <tbody>
+                <xsl:for-each select="stacks/stack">
+                    <tr>
+                        <td class="left">
+                            <xsl:for-each select="frame">
+                                <div><xsl:value-of select="."/></div>
+                            </xsl:for-each>
+                        </td>
+                        <td><xsl:value-of select="@outlier"/></td>
+                        <xsl:for-each select="member">
+                            <td>
+                                <xsl:attribute name="title">
+                                    <xsl:value-of select="concat(@snapshots, ' snapshots of ', @threads, ' threads')"/>
+                                </xsl:attribute>
+                                <xsl:value-of select='format-number(@share, "0.0")'/>
+                            </td>
+                        </xsl:for-each>
+                    </tr>
+                </xsl:for-each>
+            </tbody>
+        </table>
+    </xsl:template>
+
+    <xsl:template name="pools">
+        <h3>Thread pools</h3>
+        <p>
+            The threads grouped by the name without the thread number. Every cell shows the number of the threads
+            of the pool and the number of their snapshots in which they were blocked.
+        </p>
+        <table id="pools_table" class="tablesorter">
+            <thead>
+                <tr>
+                    <th class="left">Thread pool</th>
+                    <th>Outlier</th>
+                    <xsl:call-template name="member_headers"/>
+                </tr>
+            </thead>
+            <tbody>
+                <xsl:for-each select="pools/pool">
+                    <tr>
+                        <td class="left"><xsl:value-of select="@name"/></td>
+                        <td><xsl:value-of select="@outlier"/></td>
+                        <xsl:for-each select="member">
+                            <td>
+                                <xsl:attribute name="title">
+                                    <xsl:value-of select="concat('CPU usage: ', @cpu, ' s')"/>
+                                </xsl:attribute>
+                                <xsl:value-of select="concat(@threads, ' (', @blocked, ' blocked)')"/>
+                            </td>
+                        </xsl:for-each>
+                    </tr>
+                </xsl:for-each>
+            </tbody>
+        </table>
+    </xsl:template>
+
+</xsl:stylesheet>
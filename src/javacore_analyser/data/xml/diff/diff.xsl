@@ -0,0 +1,149 @@
+<?xml version="1.0" encoding="UTF-8"?>
+
+<!--
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+-->
+
+<xsl:stylesheet version="1.0" xmlns:xsl="http://www.w3.org/1999/XSL/Transform">
+
+    <!-- Location of the styles and scripts. Overridden when the assets are served from a shared url -->
+    <xsl:param name="assets_dir" select="'data'"/>
+
+    <xsl:template match="diff">
+        <html>
+            <head>
+                <meta charset="UTF-8"/>
+                <title>Javacore Analyser Diff</title>
+                <link rel="stylesheet" href="{$assets_dir}/style.css"/>
+                <link rel="stylesheet" href="{$assets_dir}/jquery/jq.css"/>
+                <link rel="stylesheet" href="{$assets_dir}/jquery/theme.blue.css"/>
+                <script type="text/javascript" src="{$assets_dir}/jquery/jquery.min.js"> _ </script>
+                <script type="text/javascript" src="{$assets_dir}/jquery/jquery.tablesorter.min.js"> _ </script>
+                <script type="text/javascript" src="{$assets_dir}/jquery/jquery.tablesorter.widgets.min.js"> _ </script>
+                <script type="text/javascript">
+                    $(function(){ $('.tablesorter').tablesorter({ theme: 'blue', widgets: ['zebra'] }); });
+                </script>
+            </head>
+            <body id="doc_body">
+                <div class="content">
+                    <h1>Javacore Analyser Diff</h1>
+                    <xsl:call-template name="collections"/>
+                    <xsl:call-template name="stacks"/>
+                    <xsl:call-template name="pools"/>
+                </div>
+            </body>
+        </html>
+    </xsl:template>
+
+    <xsl:template name="collections">
+        <h3>Collections</h3>
+        <table id="collections_table" class="tablesorter">
+            <thead>
+                <tr>
+                    <th class="left">Collection</th>
+                    <th>Javacores</th>
+                    <th>Threads</th>
+                    <th>Thread snapshots</th>
+                    <th>Blocked threads</th>
+                    <th>Blocking threads</th>
+                    <th>Total CPU usage (s)</th>
+                </tr>
+            </thead>
+            <tbody>
+                <xsl:for-each select="before | after">
+                    <tr>
+                        <td class="left"><xsl:value-of select="local-name()"/></td>
+                        <td><xsl:value-of select="@javacores"/></td>
+                        <td><xsl:value-of select="@threads"/></td>
+                        <td><xsl:value-of select="@snapshots"/></td>
+                        <td><xsl:value-of select="@blocked_threads"/></td>
+                        <td><xsl:value-of select="@blockers"/></td>
+                        <td><xsl:value-of select='format-number(@cpu, "0.00")'/></td>
+                    </tr>
+                </xsl:for-each>
+            </tbody>
+        </table>
+    </xsl:template>
+
+    <xsl:template name="stacks">
+        <h3>Stacks</h3>
+        <p>
+            The percentage of the thread snapshots of each collection with the stack, for the stacks which changed most.
+            The stacks are the same if their top lines are the same, as in the All Code table of the report.
+        </p>
+        <table id="stacks_table" class="tablesorter">
+            <thead>
+                <tr>
+                    <th class="left">Stack</th>
+                    <th>Status</th>
+                    <th>Before (%)</th>
+                    <th>After (%)</th>
+                    <th>Change (%)</th>
+                    <th>CPU usage change (s)</th>
+                </tr>
+            </thead>
+            <tbody>
+                <xsl:for-each select="stacks/stack">
+                    <tr>
+                        <td class="left">
+                            <xsl:for-each select="frame">
+                                <div><xsl:value-of select="."/></div>
+                            </xsl:for-each>
+                        </td>
+                        <td><xsl:value-of select="@status"/></td>
+                        <xsl:for-each select="before | after">
+                            <td>
+                                <xsl:attribute name="title">
+                                    <xsl:value-of select="concat(@snapshots, ' snapshots of ', @threads, ' threads')"/>
+                                </xsl:attribute>
+                                <xsl:value-of select='format-number(@share, "0.0")'/>
+                            </td>
+                        </xsl:for-each>
+                        <td><xsl:value-of select='format-number(@share_delta, "+0.0;-0.0")'/></td>
+                        <td><xsl:value-of select='format-number(@cpu_delta, "+0.00;-0.00")'/></td>
+                    </tr>
+                </xsl:for-each>
+            </tbody>
+        </table>
+    </xsl:template>
+
+    <xsl:template name="pools">
+        <h3>Thread pools</h3>
+        <p>
+            The threads grouped by the name without the thread number. Every cell shows the number of the threads
+            of the pool and the number of their snapshots in which they were blocked.
+        </p>
+        <table id="pools_table" class="tablesorter">
+            <thead>
+                <tr>
+                    <th class="left">Thread pool</th>
+                    <th>Status</th>
+                    <th>Before</th>
+                    <th>After</th>
+                    <th>Threads change</th>
+                    <th>CPU usage change (s)</th>
+                </tr>
+            </thead>
+            <tbody>
+                <xsl:for-each select="pools/pool">
+                    <tr>
+                        <td class="left"><xsl:value-of select="@name"/></td>
+                        <td><xsl:value-of select="@status"/></td>
+                        <xsl:for-each select="before | after">
+                            <td>
+                                <xsl:attribute name="title">
+                                    <xsl:value-of select="concat('CPU usage: ', @cpu, ' s')"/>
+                                </xsl:attribute>
+                                <xsl:value-of select="concat(@threads, ' (', @blocked, ' blocked)')"/>
+                            </td>
+                        </xsl:for-each>
+                        <td><xsl:value-of select="@threads_delta"/></td>
+                        <td><xsl:value-of select='format-number(@cpu_delta, "+0.00;-0.00")'/></td>
+                    </tr>
+                </xsl:for-each>
+            </tbody>
+        </table>
+    </xsl:template>
+
+</xsl:stylesheet>
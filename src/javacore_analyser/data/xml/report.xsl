@@ -9,6 +9,15 @@
 
     <xsl:variable name="displayed_stack_depth" select="50" />
 
+    <!-- Location of the styles and scripts. Overridden when the assets are served from a shared url -->
+    <xsl:param name="assets_dir" select="'data'"/>
+
+    <!-- Location of the prebuilt search index of the page. Empty if the page is searched without the index -->
+    <xsl:param name="search_index" select="''"/>
+
+    <!-- Unique stack traces are stored once in doc/stack_traces and referenced by the stack_id attribute -->
+    <xsl:key name="stack_trace" match="stack_traces/stack_trace" use="@id"/>
+
     <!-- Import section templates -->
     <xsl:include href="sections/header.xsl"/>
     <xsl:include href="sections/input_files.xsl"/>
@@ -32,7 +41,7 @@
                 <xsl:call-template name="body_content"/>
             </body>
             <script>loadChartGC();loadChartCPUUsage();loadChartThreadClassifications();</script>
-            <script type="text/javascript" src="data/expand.js"> _ <!-- underscore character is required to prevent converting to <script /> which does not work --> </script>
+            <script type="text/javascript" src="{$assets_dir}/expand.js"> _ <!-- underscore character is required to prevent converting to <script /> which does not work --> </script>
         </html>
         <xsl:call-template name="expand_it"/>
     </xsl:template>
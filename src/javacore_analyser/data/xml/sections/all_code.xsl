@@ -7,6 +7,9 @@
 
 <xsl:stylesheet version="1.0" xmlns:xsl="http://www.w3.org/1999/XSL/Transform">
 
+    <!-- Number of the top lines of the stack shown for the code, set from StackTrace.STACK_COMPARISON_DEPTH -->
+    <xsl:param name="stack_comparison_depth"/>
+
     <xsl:template name="all_code">
         <h3><a  id="toggle_all_code_collection" href="javascript:expand_it(all_code_collection,toggle_all_code_collection)" class="expandit">All Code</a></h3>
         <div id="all_code_collection" style="display:none;" >
@@ -44,80 +47,112 @@
                     </li>
                 </ul>
             </div>
-            <table id="allCodeTable" class="tablesorter">
-                <thead>
-                    <tr>
-                        <th  class="sixty">stack</th>
-                        <th>Total CPU usage (s)</th>
-                        <th>% CPU usage</th>
-                        <th>Average memory allocated since last GC (MB)</th>
-                        <th>Threads</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    <xsl:for-each select="doc/CodeSnapshotCollection/all_snapshot_collection/snapshot_collection">
-                        <tr>
-                            <td class="left">
-                                <xsl:for-each select="*[starts-with(name(), 'stack_trace')]">
-                                    <xsl:value-of select="current()"/><br/>
-                                </xsl:for-each>
-                            </td>
-                            <td>
-                                <xsl:choose>
-                                    <xsl:when test="//javacore_count = 1">
-                                        N/A
-                                    </xsl:when>
-                                    <xsl:otherwise>
+            <xsl:choose>
+                <xsl:when test="doc/@virtual_all_code='True'">
+                    <!-- Too many rows to render them all. virtual-table.js renders them page by page from the data file -->
+                    <div class="virtual_table" data-table="all_code">
+                        <div class="virtual_table_toolbar">
+                            Filter: <input class="virtual_table_filter" type="text"/>
+                            <button class="virtual_table_prev">Prev</button>
+                            <button class="virtual_table_next">Next</button>
+                            <span class="virtual_table_info"></span>
+                        </div>
+                        <table class="tablesorter-blue">
+                            <thead>
+                                <tr>
+                                    <th class="sixty" data-sort="asc">stack</th>
+                                    <th data-sort="desc">Total CPU usage (s)</th>
+                                    <th data-sort="desc">% CPU usage</th>
+                                    <th data-sort="desc">Average memory allocated since last GC (MB)</th>
+                                    <th>Threads</th>
+                                </tr>
+                            </thead>
+                            <tbody></tbody>
+                        </table>
+                    </div>
+                    <!-- The stack traces are shared with All Threads table, so they are loaded once -->
+                    <xsl:if test="not(doc/@virtual_all_threads='True')">
+                        <script type="text/javascript" src="tables/stack_traces.js"> _ </script>
+                    </xsl:if>
+                    <script type="text/javascript" src="tables/all_code.js"> _ </script>
+                </xsl:when>
+                <xsl:otherwise>
+                    <table id="allCodeTable" class="tablesorter">
+                        <thead>
+                            <tr>
+                                <th  class="sixty">stack</th>
+                                <th>Total CPU usage (s)</th>
+                                <th>% CPU usage</th>
+                                <th>Average memory allocated since last GC (MB)</th>
+                                <th>Threads</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+                            <xsl:for-each select="doc/CodeSnapshotCollection/all_snapshot_collection/snapshot_collection">
+                                <tr>
+                                    <td class="left">
+                                        <xsl:for-each select="key('stack_trace', @stack_id)/line[not(@order &gt;= $stack_comparison_depth)]">
+                                            <xsl:value-of select="current()"/><br/>
+                                        </xsl:for-each>
+                                    </td>
+                                    <td>
                                         <xsl:choose>
-                                            <xsl:when test="total_cpu_usage >= 0">
-                                                <xsl:value-of select='format-number(total_cpu_usage, "0.00")'/>
+                                            <xsl:when test="//javacore_count = 1">
+                                                N/A
                                             </xsl:when>
                                             <xsl:otherwise>
-                                                <div class="warning">[!]
-                                                    <span class="warningtooltip">Error computing CPU usage, javacores may be corrupted</span>
-                                                </div>
+                                                <xsl:choose>
+                                                    <xsl:when test="total_cpu_usage >= 0">
+                                                        <xsl:value-of select='format-number(total_cpu_usage, "0.00")'/>
+                                                    </xsl:when>
+                                                    <xsl:otherwise>
+                                                        <div class="warning">[!]
+                                                            <span class="warningtooltip">Error computing CPU usage, javacores may be corrupted</span>
+                                                        </div>
+                                                    </xsl:otherwise>
+                                                </xsl:choose>
                                             </xsl:otherwise>
                                         </xsl:choose>
-                                    </xsl:otherwise>
-                                </xsl:choose>
-                            </td>
-                            <td>
-                                <xsl:choose>
-                                    <xsl:when test="//javacore_count = 1">
-                                        N/A
-                                    </xsl:when>
-                                    <xsl:otherwise>
+                                    </td>
+                                    <td>
                                         <xsl:choose>
-                                            <xsl:when test="cpu_percentage >= 0">
-                                                <xsl:value-of select='format-number(cpu_percentage, "0.0")'/>
+                                            <xsl:when test="//javacore_count = 1">
+                                                N/A
                                             </xsl:when>
                                             <xsl:otherwise>
-                                                <div class="warning">[!]
-                                                    <span class="warningtooltip">Error computing CPU percentage, javacores may be corrupted</span>
-                                                </div>
+                                                <xsl:choose>
+                                                    <xsl:when test="cpu_percentage >= 0">
+                                                        <xsl:value-of select='format-number(cpu_percentage, "0.0")'/>
+                                                    </xsl:when>
+                                                    <xsl:otherwise>
+                                                        <div class="warning">[!]
+                                                            <span class="warningtooltip">Error computing CPU percentage, javacores may be corrupted</span>
+                                                        </div>
+                                                    </xsl:otherwise>
+                                                </xsl:choose>
                                             </xsl:otherwise>
                                         </xsl:choose>
-                                    </xsl:otherwise>
-                                </xsl:choose>
-                            </td>
-                            <td><xsl:value-of select='format-number(average_memory div 1024 div 1024, "0.00")'/></td>
-                            <td  class="left">
-                                <xsl:for-each select="threads/thread">
-                                            <a target="_blank">
-                                                <xsl:attribute name="href">
-                                                    <xsl:value-of select="concat('threads/thread_', @hash, '.html')"/>
-                                                </xsl:attribute>
-                                                <xsl:attribute name="title">
-                                                    <xsl:value-of select="@name" />
-                                                </xsl:attribute>
-                                                <xsl:value-of select="@id" />
-                                            </a>;
-                                </xsl:for-each>
-                            </td>
-                        </tr>
-                    </xsl:for-each>
-                </tbody>
-            </table>
+                                    </td>
+                                    <td><xsl:value-of select='format-number(average_memory div 1024 div 1024, "0.00")'/></td>
+                                    <td  class="left">
+                                        <xsl:for-each select="threads/thread">
+                                                    <a target="_blank">
+                                                        <xsl:attribute name="href">
+                                                            <xsl:value-of select="concat('threads/thread_', @hash, '.html')"/>
+                                                        </xsl:attribute>
+                                                        <xsl:attribute name="title">
+                                                            <xsl:value-of select="@name" />
+                                                        </xsl:attribute>
+                                                        <xsl:value-of select="@id" />
+                                                    </a>;
+                                        </xsl:for-each>
+                                    </td>
+                                </tr>
+                            </xsl:for-each>
+                        </tbody>
+                    </table>
+                </xsl:otherwise>
+            </xsl:choose>
         </div>
     </xsl:template>
 
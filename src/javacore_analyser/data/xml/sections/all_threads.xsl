@@ -63,199 +63,234 @@
                     </xsl:choose>
                 </ul>
             </div>
-            <table id="all_threads_table" class="tablesorter">
-                <thead>
-                    <tr>
-                        <th class="sixty">Thread name</th>
-                        <th>Total CPU usage (s)</th>
-                        <th>% CPU usage</th>
-                        <th>Average memory allocated since last GC (MB)</th>
-                        <th>Average stack depth</th>
-                        <th>Blocking information</th>
-                        <xsl:choose>
-                            <xsl:when test="//@use_ml='True'">
-                                <th>Classification</th>
-                            </xsl:when>
-                        </xsl:choose>
-                    </tr>
-                </thead>
-                <tbody>
-                    <xsl:for-each select="doc/Thread/all_snapshot_collection/snapshot_collection">
-                        <xsl:variable name="i" select="position()" />
-                        <tr>
-                            <td class="left">
-                                <a>
-                                    <xsl:attribute name="id"><xsl:value-of select="concat('toggle_thread_name',$i)"/></xsl:attribute>
-                                    <xsl:attribute name="href"><xsl:value-of select="concat('javascript:expand_stack(stack',$i,',toggle_thread_name',$i,')')"/></xsl:attribute>
-                                    <xsl:attribute name="class">expandit</xsl:attribute>
-                                    <xsl:value-of select="thread_name"/>
-                                </a>
+            <xsl:choose>
+                <xsl:when test="doc/@virtual_all_threads='True'">
+                    <!-- Too many rows to render them all. virtual-table.js renders them page by page from the data file -->
+                    <div class="virtual_table" data-table="all_threads">
+                        <div class="virtual_table_toolbar">
+                            Filter: <input class="virtual_table_filter" type="text"/>
+                            <button class="virtual_table_prev">Prev</button>
+                            <button class="virtual_table_next">Next</button>
+                            <span class="virtual_table_info"></span>
+                        </div>
+                        <table class="tablesorter-blue">
+                            <thead>
+                                <tr>
+                                    <th class="sixty" data-sort="asc">Thread name</th>
+                                    <th data-sort="desc">Total CPU usage (s)</th>
+                                    <th data-sort="desc">% CPU usage</th>
+                                    <th data-sort="desc">Average memory allocated since last GC (MB)</th>
+                                    <th data-sort="desc">Average stack depth</th>
+                                    <th>Blocking information</th>
+                                    <xsl:choose>
+                                        <xsl:when test="//@use_ml='True'">
+                                            <th>Classification</th>
+                                        </xsl:when>
+                                    </xsl:choose>
+                                </tr>
+                            </thead>
+                            <tbody></tbody>
+                        </table>
+                    </div>
+                    <script type="text/javascript" src="tables/stack_traces.js"> _ </script>
+                    <script type="text/javascript" src="tables/all_threads.js"> _ </script>
+                </xsl:when>
+                <xsl:otherwise>
+                    <table id="all_threads_table" class="tablesorter">
+                        <thead>
+                            <tr>
+                                <th class="sixty">Thread name</th>
+                                <th>Total CPU usage (s)</th>
+                                <th>% CPU usage</th>
+                                <th>Average memory allocated since last GC (MB)</th>
+                                <th>Average stack depth</th>
+                                <th>Blocking information</th>
                                 <xsl:choose>
-                                        <xsl:when test="@has_drill_down='True'">
-                                        <a class="right" target="_blank">
-                                            <xsl:attribute name="href">
-                                                <xsl:value-of select="concat('threads/thread_', thread_hash, '.html')"/>
-                                            </xsl:attribute>
-                                            More...
-                                        </a>
-                                        <br/>
+                                    <xsl:when test="//@use_ml='True'">
+                                        <th>Classification</th>
                                     </xsl:when>
                                 </xsl:choose>
-                                <div  style="display:none;" >
-                                    <xsl:attribute name="id"><xsl:value-of select="concat('stack',$i)"/></xsl:attribute>
-                                    java/lang/Thread:<xsl:value-of select="thread_address"/>
-                                    <xsl:for-each select="*[starts-with(name(), 'stack')]">
-                                            <br /><strong>Timestamp: <xsl:value-of select="timestamp"/></strong>
-                                        <div>
-                                            <xsl:choose>
-                                                <xsl:when test="stack_depth &gt; 0">
-                                                    <div class="toggle_expand">
-                                                        <a href="javaScript:;" class="show">[+] Expand</a> <!-- "show" class is used in expand.js -->
-                                                    </div>
-                                                    <p class="stacktrace">
-                                                        <xsl:for-each select="*[starts-with(name(), 'line')]">
-                                                            <xsl:choose>
-                                                                <xsl:when test="@order &lt; $displayed_stack_depth">
-                                                                    <span>
-                                                                        <xsl:attribute name="class">
-                                                                            <xsl:value-of select="@kind"/>
-                                                                        </xsl:attribute>
-                                                                        <xsl:value-of select="current()"/>
-                                                                    </span>
-                                                                    <br/>
-                                                                </xsl:when>
-                                                            </xsl:choose>
-                                                        </xsl:for-each>
+                            </tr>
+                        </thead>
+                        <tbody>
+                            <xsl:for-each select="doc/Thread/all_snapshot_collection/snapshot_collection">
+                                <xsl:variable name="i" select="position()" />
+                                <tr>
+                                    <td class="left">
+                                        <a>
+                                            <xsl:attribute name="id"><xsl:value-of select="concat('toggle_thread_name',$i)"/></xsl:attribute>
+                                            <xsl:attribute name="href"><xsl:value-of select="concat('javascript:expand_stack(stack',$i,',toggle_thread_name',$i,')')"/></xsl:attribute>
+                                            <xsl:attribute name="class">expandit</xsl:attribute>
+                                            <xsl:value-of select="thread_name"/>
+                                        </a>
+                                        <xsl:choose>
+                                                <xsl:when test="@has_drill_down='True'">
+                                                <a class="right" target="_blank">
+                                                    <xsl:attribute name="href">
+                                                        <xsl:value-of select="concat('threads/thread_', thread_hash, '.html')"/>
+                                                    </xsl:attribute>
+                                                    More...
+                                                </a>
+                                                <br/>
+                                            </xsl:when>
+                                        </xsl:choose>
+                                        <div  style="display:none;" >
+                                            <xsl:attribute name="id"><xsl:value-of select="concat('stack',$i)"/></xsl:attribute>
+                                            java/lang/Thread:<xsl:value-of select="thread_address"/>
+                                            <xsl:for-each select="*[starts-with(name(), 'stack')]">
+                                                    <br /><strong>Timestamp: <xsl:value-of select="timestamp"/></strong>
+                                                <div>
+                                                    <xsl:choose>
+                                                        <xsl:when test="stack_depth &gt; 0">
+                                                            <div class="toggle_expand">
+                                                                <a href="javaScript:;" class="show">[+] Expand</a> <!-- "show" class is used in expand.js -->
+                                                            </div>
+                                                            <p class="stacktrace">
+                                                                <xsl:for-each select="key('stack_trace', @stack_id)/line">
+                                                                    <xsl:choose>
+                                                                        <xsl:when test="@order &lt; $displayed_stack_depth">
+                                                                            <span>
+                                                                                <xsl:attribute name="class">
+                                                                                    <xsl:value-of select="@kind"/>
+                                                                                </xsl:attribute>
+                                                                                <xsl:value-of select="current()"/>
+                                                                            </span>
+                                                                            <br/>
+                                                                        </xsl:when>
+                                                                    </xsl:choose>
+                                                                </xsl:for-each>
 
-                                                        <xsl:choose>
-                                                            <xsl:when test="stack_depth &gt; $displayed_stack_depth">
-                                                                <span>
-                                                                    ...
-                                                                </span>
-                                                                <br/>
-                                                            </xsl:when>
-                                                        </xsl:choose>
-                                                    </p>
-                                                </xsl:when>
-                                                <xsl:otherwise>
-                                                    No Stack
-                                                </xsl:otherwise>
-                                            </xsl:choose>
+                                                                <xsl:choose>
+                                                                    <xsl:when test="stack_depth &gt; $displayed_stack_depth">
+                                                                        <span>
+                                                                            ...
+                                                                        </span>
+                                                                        <br/>
+                                                                    </xsl:when>
+                                                                </xsl:choose>
+                                                            </p>
+                                                        </xsl:when>
+                                                        <xsl:otherwise>
+                                                            No Stack
+                                                        </xsl:otherwise>
+                                                    </xsl:choose>
+                                                </div>
+                                            </xsl:for-each>
                                         </div>
-                                    </xsl:for-each>
-                                </div>
-                            </td>
-                            <td>
-                                <xsl:choose>
-                                <xsl:when test="//javacore_count = 1">
-                                    N/A
-                                </xsl:when>
-                                    <xsl:otherwise>
-                                            <xsl:choose>
-                                                <xsl:when test="total_cpu_usage &gt;= 0">
-                                                    <xsl:value-of select='format-number(total_cpu_usage, "0.00")'/>
-                                                </xsl:when>
-                                                <xsl:otherwise>
-                                                    <div class="warning">[!]
-                                                        <span class="warningtooltip">Error computing CPU usage, javacores may be corrupted</span>
-                                                    </div>
-                                                </xsl:otherwise>
-                                            </xsl:choose>
-                                    </xsl:otherwise>
-                                </xsl:choose>
-                            </td>
-                            <td>
-                                <xsl:choose>
-                                    <xsl:when test="//javacore_count = 1">
-                                        N/A
-                                    </xsl:when>
-                                    <xsl:otherwise>
+                                    </td>
+                                    <td>
                                         <xsl:choose>
-                                            <xsl:when test="cpu_percentage &gt;= 0">
-                                                <xsl:value-of select='format-number(cpu_percentage, "0.0")'/>
-                                            </xsl:when>
+                                        <xsl:when test="//javacore_count = 1">
+                                            N/A
+                                        </xsl:when>
                                             <xsl:otherwise>
-                                                <div class="warning">[!]
-                                                    <span class="warningtooltip">Error computing CPU percentage, javacores may be corrupted</span>
-                                                </div>
+                                                    <xsl:choose>
+                                                        <xsl:when test="total_cpu_usage &gt;= 0">
+                                                            <xsl:value-of select='format-number(total_cpu_usage, "0.00")'/>
+                                                        </xsl:when>
+                                                        <xsl:otherwise>
+                                                            <div class="warning">[!]
+                                                                <span class="warningtooltip">Error computing CPU usage, javacores may be corrupted</span>
+                                                            </div>
+                                                        </xsl:otherwise>
+                                                    </xsl:choose>
                                             </xsl:otherwise>
                                         </xsl:choose>
-                                    </xsl:otherwise>
-                                </xsl:choose>
-                            </td>
-                            <td><xsl:value-of select='format-number(average_memory div 1024 div 1024, "0.00")'/></td>
-                            <td><xsl:value-of select='format-number(average_stack_depth, "0.0")'/></td>
-                            <td   class="left">
-                                <xsl:choose>
-                                    <xsl:when test="blocking/thread">
-                                        blocking:
-                                        <xsl:for-each select="blocking/thread">
-                                            <a target="_blank">
-                                                <xsl:attribute name="href">
-                                                    <xsl:value-of select="concat('threads/thread_', @hash, '.html')"/>
-                                                </xsl:attribute>
-                                                <xsl:attribute name="title">
-                                                    <xsl:value-of select="@name" />
-                                                </xsl:attribute>
-                                                <xsl:value-of select="@id" />
-                                            </a>;
-
-                                        </xsl:for-each>
-                                    </xsl:when>
-                                    </xsl:choose>
-                                <xsl:choose>
-                                    <xsl:when test="blocker/thread">
-                                        blocked by:
-                                        <xsl:for-each select="blocker/thread">
-                                            <a target="_blank">
-                                                <xsl:attribute name="href">
-                                                    <xsl:value-of select="concat('threads/thread_', @hash, '.html')"/>
-                                                </xsl:attribute>
-                                                <xsl:attribute name="title">
-                                                    <xsl:value-of select="@name" />
-                                                </xsl:attribute>
-                                                <xsl:value-of select="@id" />
-                                            </a>;
-                                        </xsl:for-each>
-                                    </xsl:when>
-                                    </xsl:choose>
-                            </td>
-                            <xsl:choose>
-                                <xsl:when test="//@use_ml='True'">
+                                    </td>
                                     <td>
-                                        <!-- Display classification as 'Category (count)' entries, sorted by occurrence count -->
                                         <xsl:choose>
-                                            <xsl:when test="count(ml_classification/classification_entry) = 0">N/A</xsl:when>
+                                            <xsl:when test="//javacore_count = 1">
+                                                N/A
+                                            </xsl:when>
                                             <xsl:otherwise>
-                                                <xsl:for-each select="ml_classification/classification_entry">
-                                                    <span class="ml-badge">
-                                                        <xsl:attribute name="class">ml-badge <xsl:choose>
-                                                            <xsl:when test="@value='Computing'">ml-computing</xsl:when>
-                                                            <xsl:when test="@value='Display Graphics'">ml-display-graphics</xsl:when>
-                                                            <xsl:when test="@value='Java Internal'">ml-java-internal</xsl:when>
-                                                            <xsl:when test="@value='Liberty Internal'">ml-liberty-internal</xsl:when>
-                                                            <xsl:when test="@value='Read From Database'">ml-read-database</xsl:when>
-                                                            <xsl:when test="@value='Read From Disk'">ml-read-disk</xsl:when>
-                                                            <xsl:when test="@value='Read From Network'">ml-read-network</xsl:when>
-                                                            <xsl:when test="@value='Save To Disk'">ml-save-disk</xsl:when>
-                                                            <xsl:when test="@value='Wait For Condition'">ml-wait-condition</xsl:when>
-                                                            <xsl:when test="@value='Wait For Connection'">ml-wait-connection</xsl:when>
-                                                            <xsl:when test="@value='Write To Database'">ml-write-database</xsl:when>
-                                                            <xsl:when test="@value='Write To Network'">ml-write-network</xsl:when>
-                                                            <xsl:otherwise>ml-unknown</xsl:otherwise>
-                                                        </xsl:choose></xsl:attribute>
-                                                        <xsl:value-of select="@value" /> (<xsl:value-of select="@occurrences" />)
-                                                    </span><xsl:if test="position() != last()"><br/></xsl:if>
-                                                </xsl:for-each>
+                                                <xsl:choose>
+                                                    <xsl:when test="cpu_percentage &gt;= 0">
+                                                        <xsl:value-of select='format-number(cpu_percentage, "0.0")'/>
+                                                    </xsl:when>
+                                                    <xsl:otherwise>
+                                                        <div class="warning">[!]
+                                                            <span class="warningtooltip">Error computing CPU percentage, javacores may be corrupted</span>
+                                                        </div>
+                                                    </xsl:otherwise>
+                                                </xsl:choose>
                                             </xsl:otherwise>
                                         </xsl:choose>
                                     </td>
-                                </xsl:when>
-                            </xsl:choose>
-                        </tr>
-                    </xsl:for-each>
-                </tbody>
-            </table>
+                                    <td><xsl:value-of select='format-number(average_memory div 1024 div 1024, "0.00")'/></td>
+                                    <td><xsl:value-of select='format-number(average_stack_depth, "0.0")'/></td>
+                                    <td   class="left">
+                                        <xsl:choose>
+                                            <xsl:when test="blocking/thread">
+                                                blocking:
+                                                <xsl:for-each select="blocking/thread">
+                                                    <a target="_blank">
+                                                        <xsl:attribute name="href">
+                                                            <xsl:value-of select="concat('threads/thread_', @hash, '.html')"/>
+                                                        </xsl:attribute>
+                                                        <xsl:attribute name="title">
+                                                            <xsl:value-of select="@name" />
+                                                        </xsl:attribute>
+                                                        <xsl:value-of select="@id" />
+                                                    </a>;
+
+                                                </xsl:for-each>
+                                            </xsl:when>
+                                            </xsl:choose>
+                                        <xsl:choose>
+                                            <xsl:when test="blocker/thread">
+                                                blocked by:
+                                                <xsl:for-each select="blocker/thread">
+                                                    <a target="_blank">
+                                                        <xsl:attribute name="href">
+                                                            <xsl:value-of select="concat('threads/thread_', @hash, '.html')"/>
+                                                        </xsl:attribute>
+                                                        <xsl:attribute name="title">
+                                                            <xsl:value-of select="@name" />
+                                                        </xsl:attribute>
+                                                        <xsl:value-of select="@id" />
+                                                    </a>;
+                                                </xsl:for-each>
+                                            </xsl:when>
+                                            </xsl:choose>
+                                    </td>
+                                    <xsl:choose>
+                                        <xsl:when test="//@use_ml='True'">
+                                            <td>
+                                                <!-- Display classification as 'Category (count)' entries, sorted by occurrence count -->
+                                                <xsl:choose>
+                                                    <xsl:when test="count(ml_classification/classification_entry) = 0">N/A</xsl:when>
+                                                    <xsl:otherwise>
+                                                        <xsl:for-each select="ml_classification/classification_entry">
+                                                            <span class="ml-badge">
+                                                                <xsl:attribute name="class">ml-badge <xsl:choose>
+                                                                    <xsl:when test="@value='Computing'">ml-computing</xsl:when>
+                                                                    <xsl:when test="@value='Display Graphics'">ml-display-graphics</xsl:when>
+                                                                    <xsl:when test="@value='Java Internal'">ml-java-internal</xsl:when>
+                                                                    <xsl:when test="@value='Liberty Internal'">ml-liberty-internal</xsl:when>
+                                                                    <xsl:when test="@value='Read From Database'">ml-read-database</xsl:when>
+                                                                    <xsl:when test="@value='Read From Disk'">ml-read-disk</xsl:when>
+                                                                    <xsl:when test="@value='Read From Network'">ml-read-network</xsl:when>
+                                                                    <xsl:when test="@value='Save To Disk'">ml-save-disk</xsl:when>
+                                                                    <xsl:when test="@value='Wait For Condition'">ml-wait-condition</xsl:when>
+                                                                    <xsl:when test="@value='Wait For Connection'">ml-wait-connection</xsl:when>
+                                                                    <xsl:when test="@value='Write To Database'">ml-write-database</xsl:when>
+                                                                    <xsl:when test="@value='Write To Network'">ml-write-network</xsl:when>
+                                                                    <xsl:otherwise>ml-unknown</xsl:otherwise>
+                                                                </xsl:choose></xsl:attribute>
+                                                                <xsl:value-of select="@value" /> (<xsl:value-of select="@occurrences" />)
+                                                            </span><xsl:if test="position() != last()"><br/></xsl:if>
+                                                        </xsl:for-each>
+                                                    </xsl:otherwise>
+                                                </xsl:choose>
+                                            </td>
+                                        </xsl:when>
+                                    </xsl:choose>
+                                </tr>
+                            </xsl:for-each>
+                        </tbody>
+                    </table>
+                </xsl:otherwise>
+            </xsl:choose>
         </div>
     </xsl:template>
 
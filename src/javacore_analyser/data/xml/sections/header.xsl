@@ -8,21 +8,25 @@
 <xsl:stylesheet version="1.0" xmlns:xsl="http://www.w3.org/1999/XSL/Transform">
 
     <xsl:template name="header">
-        <link rel="stylesheet" href="data/style.css" />
-        <link rel="stylesheet" href="data/jquery/theme.default.min.css" />
-        <link rel="stylesheet" href="data/jquery/jq.css" />
-        <link rel="stylesheet" href="data/jquery/theme.blue.css" />
-        <script type="text/javascript" src="data/jquery/jquery.min.js" > _ </script>
-        <script type="text/javascript" src="data/jquery/jquery.tablesorter.min.js" > _ </script>
-        <script type="text/javascript" src="data/jquery/jquery.tablesorter.widgets.min.js" > _ </script>
-        <script type="text/javascript" src="data/jquery/chart.umd.min.js"> _ </script>
-        <script type="text/javascript" src="data/jquery/chartjs-adapter-date-fns.bundle.min.js"> _ </script>
-        <script type="text/javascript" src="data/jquery/hammer.min.js"> _ </script>
-        <script type="text/javascript" src="data/jquery/chartjs-plugin-zoom.min.js"> _ </script>
-        <script type="text/javascript" src="data/jquery/wait2scripts.js"> _ </script>
-        <script src="data/jquery/jquery.mark.min.js"> _ </script>
-        <script type="text/javascript" src="data/jquery/search.js"> _ </script>
-        <script type="text/javascript" src="data/jquery/tablesorter-init.js"> _ </script>
+        <link rel="stylesheet" href="{$assets_dir}/style.css" />
+        <link rel="stylesheet" href="{$assets_dir}/jquery/theme.default.min.css" />
+        <link rel="stylesheet" href="{$assets_dir}/jquery/jq.css" />
+        <link rel="stylesheet" href="{$assets_dir}/jquery/theme.blue.css" />
+        <script type="text/javascript" src="{$assets_dir}/jquery/jquery.min.js" > _ </script>
+        <script type="text/javascript" src="{$assets_dir}/jquery/jquery.tablesorter.min.js" > _ </script>
+        <script type="text/javascript" src="{$assets_dir}/jquery/jquery.tablesorter.widgets.min.js" > _ </script>
+        <script type="text/javascript" src="{$assets_dir}/jquery/chart.umd.min.js"> _ </script>
+        <script type="text/javascript" src="{$assets_dir}/jquery/chartjs-adapter-date-fns.bundle.min.js"> _ </script>
+        <script type="text/javascript" src="{$assets_dir}/jquery/hammer.min.js"> _ </script>
+        <script type="text/javascript" src="{$assets_dir}/jquery/chartjs-plugin-zoom.min.js"> _ </script>
+        <script type="text/javascript" src="{$assets_dir}/jquery/wait2scripts.js"> _ </script>
+        <script src="{$assets_dir}/jquery/jquery.mark.min.js"> _ </script>
+        <script type="text/javascript" src="{$assets_dir}/jquery/search.js"> _ </script>
+        <xsl:if test="$search_index != ''">
+            <script type="text/javascript" src="{$search_index}"> _ </script>
+        </xsl:if>
+        <script type="text/javascript" src="{$assets_dir}/jquery/tablesorter-init.js"> _ </script>
+        <script type="text/javascript" src="{$assets_dir}/jquery/virtual-table.js"> _ </script>
     </xsl:template>
 
 </xsl:stylesheet>
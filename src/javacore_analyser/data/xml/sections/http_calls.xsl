@@ -8,6 +8,9 @@
 <xsl:stylesheet version="1.0" xmlns:xsl="http://www.w3.org/1999/XSL/Transform">
 
     <xsl:template name="http_calls">
+        <!-- The correlation columns are shown when there is the verbose gc or javacore data from the time of the calls -->
+        <xsl:variable name="gc_correlation" select="boolean(doc/har_files/har_file/http_call/@gc_pauses)"/>
+        <xsl:variable name="javacore_correlation" select="boolean(doc/har_files/har_file/http_call/@javacore)"/>
         <xsl:choose>
             <xsl:when test="doc/har_files">
                 <h3><a  id="toggle_http_calls" href="javascript:expand_it(http_calls,toggle_http_calls)" class="expandit">HTTP calls</a></h3>
@@ -37,6 +40,21 @@
                             <li><strong>Size</strong>
                                 is size of the response body, in bytes.
                             </li>
+                            <xsl:if test="$gc_correlation">
+                                <li><strong>GC pauses</strong>
+                                    is the time of the call spent in garbage collection pauses, in milliseconds.
+                                    Hover over it to see the number of the pauses.
+                                </li>
+                            </xsl:if>
+                            <xsl:if test="$javacore_correlation">
+                                <li><strong>Nearest javacore</strong>
+                                    is the javacore taken during the call or closest to it, and the number of
+                                    the blocked threads in it. Hover over it to see its distance from the call.
+                                    The times of the calls are compared with the local times of the javacores
+                                    and the verbose GC logs, so the browser and the JVM should be in the same
+                                    time zone.
+                                </li>
+                            </xsl:if>
                         </ul>
                     </div>
                     <table id="HttpCallTable" class="tablesorter">
@@ -48,6 +66,12 @@
                                 <th class="http-medium">Start Time</th>
                                 <th class="http-small">Duration</th>
                                 <th class="http-small">Size</th>
+                                <xsl:if test="$gc_correlation">
+                                    <th class="http-small">GC pauses</th>
+                                </xsl:if>
+                                <xsl:if test="$javacore_correlation">
+                                    <th class="http-medium">Nearest javacore</th>
+                                </xsl:if>
                             </tr>
                         </thead>
                         <tbody>
@@ -199,57 +223,8 @@
                                                     </tbody>
                                                 </table>
 
-                                                <h4>Request Details</h4>
-                                                <xsl:if test="string-length(@request_headers) > 0">
-                                                    <div class="http-detail-section">
-                                                        <strong>Headers:</strong>
-                                                        <pre class="http-detail-pre">
-                                                            <xsl:value-of select="@request_headers"/>
-                                                        </pre>
-                                                    </div>
-                                                </xsl:if>
-                                                <xsl:if test="string-length(@request_cookies) > 0">
-                                                    <div class="http-detail-section">
-                                                        <strong>Cookies:</strong>
-                                                        <pre class="http-detail-pre">
-                                                            <xsl:value-of select="@request_cookies"/>
-                                                        </pre>
-                                                    </div>
-                                                </xsl:if>
-                                                <xsl:if test="string-length(@request_content) > 0">
-                                                    <div class="http-detail-section">
-                                                        <strong>Content:</strong>
-                                                        <pre class="http-detail-pre scrollable">
-                                                            <xsl:value-of select="@request_content"/>
-                                                        </pre>
-                                                    </div>
-                                                </xsl:if>
-                                                
-                                                <h4>Response Details</h4>
-                                                <xsl:if test="string-length(@response_headers) > 0">
-                                                    <div class="http-detail-section">
-                                                        <strong>Headers:</strong>
-                                                        <pre class="http-detail-pre">
-                                                            <xsl:value-of select="@response_headers"/>
-                                                        </pre>
-                                                    </div>
-                                                </xsl:if>
-                                                <xsl:if test="string-length(@response_cookies) > 0">
-                                                    <div class="http-detail-section">
-                                                        <strong>Cookies:</strong>
-                                                        <pre class="http-detail-pre">
-                                                            <xsl:value-of select="@response_cookies"/>
-                                                        </pre>
-                                                    </div>
-                                                </xsl:if>
-                                                <xsl:if test="string-length(@response_content) > 0">
-                                                    <div class="http-detail-section">
-                                                        <strong>Content:</strong>
-                                                        <pre class="http-detail-pre scrollable">
-                                                            <xsl:value-of select="@response_content"/>
-                                                        </pre>
-                                                    </div>
-                                                </xsl:if>
+                                                <!-- The headers, cookies and content are loaded from the data file of the HAR file by expand.js -->
+                                                <div class="http-call-bodies" data-file="{../@id}" data-call="{@id}">Loading...</div>
                                             </div>
                                         </div>
                                     </td>
@@ -269,6 +244,27 @@
                                         </div>
                                     </td>
                                     <td><xsl:value-of select="@size"/></td>
+                                    <xsl:if test="$gc_correlation">
+                                        <td>
+                                            <xsl:if test="@gc_pauses">
+                                                <xsl:attribute name="title">
+                                                    <xsl:value-of select="concat(@gc_pauses, ' GC pauses')"/>
+                                                </xsl:attribute>
+                                                <xsl:value-of select="@gc_pause_time"/>
+                                            </xsl:if>
+                                        </td>
+                                    </xsl:if>
+                                    <xsl:if test="$javacore_correlation">
+                                        <td>
+                                            <xsl:if test="@javacore">
+                                                <xsl:attribute name="title">
+                                                    <xsl:value-of select="concat(@javacore_distance, ' s from the call')"/>
+                                                </xsl:attribute>
+                                                <a href="javacores/{@javacore_id}.html"><xsl:value-of select="@javacore"/></a>
+                                                <xsl:value-of select="concat(' (', @blocked_threads, ' blocked)')"/>
+                                            </xsl:if>
+                                        </td>
+                                    </xsl:if>
                                 </tr>
                             </xsl:for-each>
                         </tbody>
@@ -86,7 +86,35 @@
                                     expressed in bytes.
                                 </li>
                         </ul>
+                            If there are too many garbage collections to show, the time is divided into intervals
+                            and the chart shows only the collections with the highest and the lowest heap usage
+                            and the longest pause in each interval. The pause statistics are computed from
+                            all the collections.
                     </div>
+                    <xsl:for-each select="doc/gc-collections[@count]">
+                        <div class="margined">
+                            Garbage collections: <xsl:value-of select="@count"/>,
+                            total pause time: <xsl:value-of select='format-number(@total-pause, "0")'/> ms,
+                            pause time percentiles 50th: <xsl:value-of select='format-number(@p50-pause, "0.0")'/> ms,
+                            95th: <xsl:value-of select='format-number(@p95-pause, "0.0")'/> ms,
+                            99th: <xsl:value-of select='format-number(@p99-pause, "0.0")'/> ms,
+                            longest pause: <xsl:value-of select='format-number(@longest-pause, "0.0")'/> ms
+                            at <xsl:value-of select="@longest-pause-time"/>.
+                            <br/>
+                            The highest share of time spent in garbage collections in <xsl:value-of select="@window"/>
+                            second intervals: <xsl:value-of select='format-number(@max-pause-share, "0.0%")'/>,
+                            average allocation rate:
+                            <xsl:value-of select='format-number(@allocation-rate div 1048576, "0.00")'/> MB/s.
+                            <xsl:if test="@occupancy-trend">
+                                The old generation (tenure) used after garbage collections changes by
+                                <xsl:value-of select='format-number(@occupancy-trend div 1048576, "0.00")'/> MB per
+                                minute.
+                            </xsl:if>
+                            <xsl:if test="@charted &lt; @count">
+                                The chart shows <xsl:value-of select="@charted"/> of them.
+                            </xsl:if>
+                        </div>
+                    </xsl:for-each>
                     <div id="systemresources_myChartGC" class="chart-container hide" style="overflow-x:auto;">
                         <canvas id="myChartGC" height="200" width="1400"></canvas>
                     </div>
@@ -6,24 +6,34 @@
 -->
 
 <xsl:stylesheet version="2.0" xmlns:xsl="http://www.w3.org/1999/XSL/Transform">
+    <!-- Unique stack traces are stored once in doc/stack_traces and referenced by the stack_id attribute -->
+    <xsl:key name="stack_trace" match="stack_traces/stack_trace" use="@id"/>
+    <!-- Location of the styles and scripts. Overridden when the assets are served from a shared url.
+         The braces are doubled because the file is a python format string template -->
+    <xsl:param name="assets_dir" select="'../data'"/>
+    <!-- Location of the prebuilt search index of the page. Empty if the page is searched without the index -->
+    <xsl:param name="search_index" select="''"/>
     <xsl:template match="text()"/> <!-- these are not the threads you're looking for -->
     <xsl:template match="/index/doc/Thread/all_snapshot_collection/snapshot_collection[thread_hash='{id}']">
         <html height="100%">
             <head>
-                <link rel="stylesheet" href="../data/style.css"/>
-                <link rel="stylesheet" href="../data/jquery/jq.css" />
-                <link rel="stylesheet" href="../data/jquery/theme.blue.css" />
-                <link rel="stylesheet" href="../data/jquery/theme.default.min.css" />
-                <script type="text/javascript" src="../data/jquery/jquery.min.js"> _ </script>
-                <script type="text/javascript" src="../data/jquery/jquery.tablesorter.min.js"> _ </script>
-                <script type="text/javascript" src="../data/jquery/jquery.tablesorter.widgets.min.js"> _ </script>
-                <script type="text/javascript" src="../data/jquery/chart.umd.min.js"> _ </script>
-                <script type="text/javascript" src="../data/jquery/chartjs-adapter-date-fns.bundle.min.js"> _ </script>
-                <script type="text/javascript" src="../data/jquery/hammer.min.js"> _ </script>
-                <script type="text/javascript" src="../data/jquery/chartjs-plugin-zoom.min.js"> _ </script>
-                <script type="text/javascript" src="../data/jquery/wait2scripts.js"> _ </script>
-                <script src="../data/jquery/jquery.mark.min.js"> _ </script>
-                <script type="text/javascript" src="../data/jquery/search.js"> _ </script>
+                <link rel="stylesheet" href="{{$assets_dir}}/style.css"/>
+                <link rel="stylesheet" href="{{$assets_dir}}/jquery/jq.css" />
+                <link rel="stylesheet" href="{{$assets_dir}}/jquery/theme.blue.css" />
+                <link rel="stylesheet" href="{{$assets_dir}}/jquery/theme.default.min.css" />
+                <script type="text/javascript" src="{{$assets_dir}}/jquery/jquery.min.js"> _ </script>
+                <script type="text/javascript" src="{{$assets_dir}}/jquery/jquery.tablesorter.min.js"> _ </script>
+                <script type="text/javascript" src="{{$assets_dir}}/jquery/jquery.tablesorter.widgets.min.js"> _ </script>
+                <script type="text/javascript" src="{{$assets_dir}}/jquery/chart.umd.min.js"> _ </script>
+                <script type="text/javascript" src="{{$assets_dir}}/jquery/chartjs-adapter-date-fns.bundle.min.js"> _ </script>
+                <script type="text/javascript" src="{{$assets_dir}}/jquery/hammer.min.js"> _ </script>
+                <script type="text/javascript" src="{{$assets_dir}}/jquery/chartjs-plugin-zoom.min.js"> _ </script>
+                <script type="text/javascript" src="{{$assets_dir}}/jquery/wait2scripts.js"> _ </script>
+                <script src="{{$assets_dir}}/jquery/jquery.mark.min.js"> _ </script>
+                <script type="text/javascript" src="{{$assets_dir}}/jquery/search.js"> _ </script>
+                <xsl:if test="$search_index != ''">
+                    <script type="text/javascript" src="{{$search_index}}"> _ </script>
+                </xsl:if>
             </head>
             <body id="doc_body" height="100%">
                 <div class="searchbar">
@@ -114,7 +124,7 @@
                                                         <a href="javaScript:;" class="show">[+] Expand</a>
                                                     </div>
                                                     <p class="stacktrace">
-                                                        <xsl:for-each select="*[starts-with(name(), 'line')]">
+                                                        <xsl:for-each select="key('stack_trace', @stack_id)/line">
                                                             <span>
                                                                 <xsl:attribute name="class"><xsl:value-of select="@kind"/></xsl:attribute>
                                                                 <xsl:value-of select="current()"/>
@@ -240,7 +250,7 @@
                 </div>
             </body>
             <script>loadChart();</script>
-            <script type="text/javascript" src="../data/expand.js"> _ <!-- underscore character is required to prevent converting to <script /> which does not work --> </script>
+            <script type="text/javascript" src="{{$assets_dir}}/expand.js"> _ <!-- underscore character is required to prevent converting to <script /> which does not work --> </script>
         </html>
         <xsl:call-template name="expand_it"/>
     </xsl:template>
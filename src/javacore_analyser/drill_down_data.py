@@ -0,0 +1,76 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""
+Data files of the drill-down pages.
+
+Each page gets its own xml file with only its data: the thread or the snapshots of the javacore, the stack traces
+they reference and the few global values used by the page, so the pages do not parse the data of all the threads
+in report.xml. Each file has its own table of stack traces.
+The files have the same structure as report.xml, so the same xsl files render them.
+"""
+
+from xml.dom.minidom import Document
+
+from javacore_analyser.stack_trace_table import StackTraceTable
+
+
+def _create_doc(javacore_set):
+    doc = Document()
+    index_node = doc.createElement("index")
+    doc.appendChild(index_node)
+    doc_node = doc.createElement("doc")
+    index_node.appendChild(doc_node)
+    doc_node.setAttribute("use_ml", str(javacore_set.use_ml))
+    javacore_count_node = doc.createElement("javacore_count")
+    javacore_count_node.appendChild(doc.createTextNode(str(len(javacore_set.javacores))))
+    doc_node.appendChild(javacore_count_node)
+    thread_node = doc.createElement("Thread")
+    doc_node.appendChild(thread_node)
+    all_threads_node = doc.createElement("all_snapshot_collection")
+    thread_node.appendChild(all_threads_node)
+    return doc, doc_node, all_threads_node
+
+
+def _write_doc(doc, doc_node, stack_trace_table, file):
+    doc_node.appendChild(stack_trace_table.get_xml(doc))
+    with open(file, "w", encoding="utf-8") as stream:
+        doc.writexml(stream, encoding="utf-8")
+    doc.unlink()
+
+
+def write_thread_data(javacore_set, thread, file):
+    """
+    Writes the data of the drill-down page of the thread to the file.
+    """
+    doc, doc_node, all_threads_node = _create_doc(javacore_set)
+    stack_trace_table = StackTraceTable()
+    all_threads_node.appendChild(thread.get_xml(doc, stack_trace_table))
+    _write_doc(doc, doc_node, stack_trace_table, file)
+
+
+def write_javacore_data(javacore_set, javacore, file):
+    """
+    Writes the data of the drill-down page of the javacore to the file: for every thread of the javacore,
+    the thread name and hash followed by the snapshot from this javacore, in the order of the threads in report.xml.
+    """
+    doc, doc_node, all_threads_node = _create_doc(javacore_set)
+    stack_trace_table = StackTraceTable()
+    thread_order = {thread: i for i, thread in enumerate(javacore_set.threads)}
+    snapshots = sorted(javacore.snapshots, key=lambda s: thread_order.get(s.thread, len(thread_order)))
+    for snapshot in snapshots:
+        thread = snapshot.thread
+        snapshot_collection_node = doc.createElement("snapshot_collection")
+        all_threads_node.appendChild(snapshot_collection_node)
+        for name, value in (("thread_name", thread.name + " (" + str(thread.id) + ")"),
+                            ("thread_hash", thread.get_hash())):
+            node = doc.createElement(name)
+            node.appendChild(doc.createTextNode(value))
+            snapshot_collection_node.appendChild(node)
+        stack_node = doc.createElement("stack")
+        stack_node.setAttribute("order", str(thread.index_of(snapshot)))
+        snapshot.get_xml(doc, stack_node, stack_trace_table)
+        snapshot_collection_node.appendChild(stack_node)
+    _write_doc(doc, doc_node, stack_trace_table, file)
@@ -26,4 +26,28 @@ class InvalidLLMMethodError(ValueError):
         message = f"Invalid LLM method: '{llm_method}'. Supported methods are: {', '.join(self.supported_methods)}"
         super().__init__(message)
 
+
+class IncompatibleModelError(ValueError):
+    """
+    Exception raised when the saved analysis model cannot be used to regenerate the report.
+
+    This exception is raised when the model file was written in a different format version,
+    so the report must be generated again from the javacores.
+    """
+
+    def __init__(self, model_file: str, format_version, supported_version):
+        """
+        Initialize the IncompatibleModelError.
+
+        Args:
+            model_file: The path of the model file
+            format_version: The format version of the model file
+            supported_version: The format version supported by this version of the tool
+        """
+        self.model_file = model_file
+        self.format_version = format_version
+        message = (f"The analysis model {model_file} has format version {format_version}, but only version "
+                   f"{supported_version} is supported. Generate the report from the javacores again")
+        super().__init__(message)
+
 # Made with Bob
@@ -0,0 +1,100 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""
+GC analytics: the statistics of the garbage collections used by the tips, the AI prompts and the report.
+
+The statistics are computed once per analysis (see VerboseGcParser.get_summary) with NumPy from the columns
+of GcTimeline, without looping over the collects.
+"""
+
+import numpy as np
+
+from javacore_analyser.constants import GC_ANALYTICS_WINDOW, GC_PAUSE_THRESHOLDS
+
+PERCENTILES = (50, 95, 99)
+MS_PER_MINUTE = 60 * 1000
+
+
+def get_pause_statistics(timeline, thresholds=GC_PAUSE_THRESHOLDS):
+    """
+    Returns the number of the collects longer than each of the thresholds in milliseconds, the longest duration and
+    the start time of the longest collect, the number of the collects, the total, mean and shortest duration and
+    the percentiles of the durations, or None if there are no collects.
+    """
+    if not len(timeline):
+        return None
+    durations = timeline.durations
+    longest = int(np.argmax(durations))
+    return {"counts": [int(np.count_nonzero(durations > threshold)) for threshold in thresholds],
+            "longest": float(durations[longest]),
+            "longest_start_time": str(np.datetime_as_string(timeline.timestamps[longest], unit="ms")),
+            "count": len(timeline), "total": float(durations.sum()), "mean": float(durations.mean()),
+            "shortest": float(durations.min()),
+            "percentiles": dict(zip(PERCENTILES, (float(value) for value in np.percentile(durations, PERCENTILES))))}
+
+
+def get_window_statistics(timeline, window=GC_ANALYTICS_WINDOW):
+    """
+    Divides the time of the collects into windows of the given number of seconds and returns for every window
+    its start, the share of the time spent in the collects, the bytes reclaimed by the collects and the bytes allocated
+    since the previous collect per second. The allocated bytes are the drop of the free heap between the end of
+    the previous collect and the start of the collect.
+    """
+    valid = ~np.isnat(timeline.timestamps)
+    starts = timeline.timestamps[valid].astype(np.int64)
+    if not len(starts):
+        return {"start": np.array([], dtype="datetime64[ms]"), "pause_share": np.array([]),
+                "reclaimed": np.array([]), "allocation_rate": np.array([])}
+    durations = timeline.durations[valid]
+    free_before = timeline.free_before[valid]
+    free_after = timeline.free_after[valid]
+    window_ms = window * 1000
+    first = starts.min()
+    indexes = (starts - first) // window_ms
+    count = int(indexes.max()) + 1
+    lengths = np.full(count, window_ms, dtype=np.float64)
+    lengths[-1] = max(1.0, float((starts + durations).max() - first - (count - 1) * window_ms))
+    allocated = np.clip(np.r_[0, free_after[:-1] - free_before[1:]], 0, None)
+    return {"start": (first + np.arange(count) * window_ms).astype("datetime64[ms]"),
+            "pause_share": np.bincount(indexes, weights=durations, minlength=count) / lengths,
+            "reclaimed": np.bincount(indexes, weights=np.clip(free_after - free_before, 0, None), minlength=count),
+            "allocation_rate": np.bincount(indexes, weights=allocated, minlength=count) / lengths * 1000}
+
+
+def get_occupancy_trend(timeline):
+    """
+    Returns the change of the old generation (tenure) occupancy after the collects in bytes per minute (the slope
+    of the linear fit), or None if the tenure size is not logged or the collects are not spread in time.
+    The old generation which keeps growing after the collects can mean a memory leak.
+    """
+    valid = (timeline.tenure_total > 0) & ~np.isnat(timeline.timestamps)
+    if np.count_nonzero(valid) < 2:
+        return None
+    minutes = timeline.timestamps[valid].astype(np.int64) / MS_PER_MINUTE
+    if np.ptp(minutes) == 0:
+        return None
+    used_after = (timeline.tenure_total - timeline.tenure_free_after)[valid].astype(np.float64)
+    return float(np.polyfit(minutes - minutes.min(), used_after, 1)[0])
+
+
+def summarise(timeline, window=GC_ANALYTICS_WINDOW):
+    """
+    Returns the summary of the collects, or None if there are no collects: the pause statistics
+    (see get_pause_statistics), the window statistics (see get_window_statistics) with their maximum GC time share
+    and mean allocation rate, the mean free heap before and after the collects and the old generation occupancy trend.
+    """
+    summary = get_pause_statistics(timeline)
+    if summary is None:
+        return None
+    windows = get_window_statistics(timeline, window)
+    summary.update({"window": window, "windows": windows,
+                    "max_pause_share": float(windows["pause_share"].max()) if len(windows["start"]) else 0.0,
+                    "mean_allocation_rate": float(windows["allocation_rate"].mean()) if len(windows["start"]) else 0.0,
+                    "reclaimed": float(windows["reclaimed"].sum()),
+                    "mean_free_before": float(timeline.free_before.mean()),
+                    "mean_free_after": float(timeline.free_after.mean()),
+                    "occupancy_trend": get_occupancy_trend(timeline)})
+    return summary
@@ -3,9 +3,136 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 import json
+import logging
 import os
+import re
+import shutil
 
-from haralyzer import HarParser
+from haralyzer.assets import HarEntry
+
+from javacore_analyser.properties import Properties
+from javacore_analyser.report_compression import compress_report_file
+from javacore_analyser.xml_sanitizer import remove_invalid_xml_characters
+
+# The number of characters read from the HAR file at once
+CHUNK_SIZE = 1024 * 1024
+# The page of the entries without pageref, as in haralyzer
+UNKNOWN_PAGE = "unknown"
+# The directory of the report with the data files of the details of the HTTP calls
+HTTP_CALLS_DIR = "http_calls"
+
+
+def get_content_limit():
+    return int(Properties.get_instance().get_property("har_content_limit", 65536))
+
+
+def write_http_call_details(har_files, output_dir):
+    """
+    Writes the details of the HTTP calls of each HAR file to <output_dir>/http_calls/<file id>.js, where the file id
+    is the index of the HAR file in har_files, as in report.xml.
+
+    The headers, cookies and content of the calls are much larger than the rest of the report, so they are not
+    in report.xml. The HTTP calls section loads the data file of a HAR file when the details of one of its calls
+    are shown first time. The data files are javascript for the same reason as the data files of the virtual tables.
+    """
+    details_dir = os.path.join(output_dir, HTTP_CALLS_DIR)
+    if os.path.isdir(details_dir):
+        shutil.rmtree(details_dir)  # data files left by the previous report generated in the same directory
+    if not har_files:
+        return
+    os.makedirs(details_dir)
+    for file_id, har_file in enumerate(har_files):
+        file = os.path.join(details_dir, str(file_id) + ".js")
+        with open(file, "w", encoding="utf-8") as f:
+            f.write("httpCallDetails.register(" + str(file_id) + ", ")
+            json.dump([http_call.get_details() for http_call in har_file.http_calls], f, separators=(",", ":"))
+            f.write(");\n")
+        compress_report_file(file)
+        logging.info(f"Written details of HTTP calls of {os.path.basename(har_file.path)} to {file}")
+
+
+class JsonStreamReader:
+    """
+    Reads a JSON document from a text file incrementally, one value at a time.
+
+    The objects and arrays are walked with iterate_object and iterate_array, the other values are decoded with
+    decode_value. Only the value being decoded and the unread part of the current chunk are kept in memory,
+    so a HAR file can be read one entry at a time however large it is.
+    """
+
+    WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+    def __init__(self, file):
+        self.file = file
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder(strict=False)
+
+    def __fill(self, size=0):
+        data = self.file.read(max(size, CHUNK_SIZE))
+        if not data:
+            self.eof = True
+        self.buffer = self.buffer[self.position:] + data
+        self.position = 0
+
+    def __peek(self):
+        """Skips the whitespace and returns the next character, or empty string at the end of the file."""
+        while True:
+            self.position = JsonStreamReader.WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer) or self.eof:
+                return self.buffer[self.position:self.position + 1]
+            self.__fill()
+
+    def __expect(self, characters):
+        character = self.__peek()
+        if not character or character not in characters:
+            raise ValueError(f"Expected one of '{characters}' but found '{character}' in {self.file.name}")
+        self.position += 1
+        return character
+
+    def decode_value(self):
+        self.__peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+                # A number at the end of the buffer can continue in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.position = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            # The value does not fit into the buffer. Doubling the read keeps decoding of large values linear
+            self.__fill(len(self.buffer) - self.position)
+
+    def iterate_object(self):
+        """
+        Yields the keys of the object. The caller must read the value of each key before taking the next one.
+        """
+        self.__expect("{")
+        if self.__peek() == "}":
+            self.position += 1
+            return
+        while True:
+            key = self.decode_value()
+            self.__expect(":")
+            yield key
+            if self.__expect(",}") == "}":
+                return
+
+    def iterate_array(self):
+        """
+        Yields once for each element of the array. The caller must read the element before taking the next one.
+        """
+        self.__expect("[")
+        if self.__peek() == "]":
+            self.position += 1
+            return
+        while True:
+            yield
+            if self.__expect(",]") == "]":
+                return
 
 
 class HarFile:
@@ -13,12 +140,16 @@ class HarFile:
     Represents a HAR (HTTP Archive) file and provides methods to parse and convert it to XML format.
     
     HAR files contain recorded HTTP transactions including requests, responses, headers, cookies,
-    and timing information. This class uses the haralyzer library to parse HAR files and extracts
-    HTTP call data for analysis and reporting.
+    and timing information. The file is read with JsonStreamReader one entry at a time and every entry
+    is converted to a compact HttpCall record right away, so the whole archive, including the embedded
+    scripts and API payloads, is never in memory. The entries are grouped by page and ordered by start time
+    as in haralyzer library.
     
     Attributes:
         path (str): The file path to the HAR file
-        har (HarParser): The parsed HAR file object from haralyzer library
+        hostname (str): The Host header of the first request of the first page, "unknown" if there are no pages
+        browser (str): The browser which recorded the file, "unknown" if not known
+        http_calls (list): The HttpCall records of the entries
     """
 
     def __init__(self, path):
@@ -30,56 +161,82 @@ class HarFile:
 
         """
         self.path = path
+        self.hostname = "unknown"
+        self.browser = "unknown"
+        self.http_calls = []
+        page_ids = []
+        page_calls = {}  # page id -> list of (start time, HttpCall)
+        content_limit = get_content_limit()
         with open(path, 'r', encoding='utf-8') as file:
-            self.har = HarParser(json.load(file, strict=False))
+            reader = JsonStreamReader(file)
+            log_found = False
+            for key in reader.iterate_object():
+                if key != "log":
+                    reader.decode_value()
+                    continue
+                log_found = True
+                for log_key in reader.iterate_object():
+                    if log_key == "entries":
+                        for _ in reader.iterate_array():
+                            entry = HarEntry(reader.decode_value())
+                            page_calls.setdefault(entry.raw_entry.get("pageref", UNKNOWN_PAGE), []).append(
+                                (entry.startTime, HttpCall(entry, content_limit)))
+                    elif log_key == "pages":
+                        page_ids = [page["id"] for page in reader.decode_value()]
+                    elif log_key == "browser":
+                        self.browser = str(reader.decode_value())
+                    else:
+                        reader.decode_value()
+            if not log_found:
+                raise ValueError(f"{path} is not a HAR file")
+        for calls in page_calls.values():
+            # Make sure the entries are sorted chronologically
+            if all(start_time for start_time, call in calls):
+                calls.sort(key=lambda item: item[0])
+        valid_page_ids = [page_id for page_id in page_ids if page_id != UNKNOWN_PAGE]
+        # Handle cases where HAR file has no valid pages (issue #271)
+        if valid_page_ids and page_calls.get(valid_page_ids[0]):
+            self.hostname = str(page_calls[valid_page_ids[0]][0][1].host)
+        pages = ([UNKNOWN_PAGE] if UNKNOWN_PAGE in page_calls else []) + page_ids
+        for page_id in pages:
+            self.http_calls.extend(call for start_time, call in page_calls.get(page_id, ()))
 
-    def get_xml(self, doc):
+    def get_xml(self, doc, file_id=0):
         """
         Convert the HAR file data to an XML representation.
         
         Creates an XML element containing all HTTP calls from the HAR file, including
-        metadata such as filename, hostname, and browser information.
+        metadata such as filename, hostname, and browser information. The details of the calls
+        are not included (see write_http_call_details).
         
         Args:
             doc (xml.dom.minidom.Document): The XML document to create elements in
+            file_id (int): The id of the HAR file in the report
             
         Returns:
             xml.dom.minidom.Element: An XML element representing the HAR file with all HTTP calls
         """
         har_file_node = doc.createElement("har_file")
+        har_file_node.setAttribute("id", str(file_id))
         har_file_node.setAttribute("filename", os.path.basename(self.path))
-        
-        # Handle cases where HAR file has no valid pages or missing browser info (issue #271)
-        try:
-            hostname = str(self.har.hostname)
-        except (IndexError, AttributeError, KeyError):
-            hostname = "unknown"
-        har_file_node.setAttribute("hostname", hostname)
-        
-        try:
-            browser = str(self.har.browser)
-        except (IndexError, AttributeError, KeyError):
-            browser = "unknown"
-        har_file_node.setAttribute("browser", browser)
-        for page in self.har.pages:
-            for entry in page.entries:
-                http_call = HttpCall(entry)
-                har_file_node.appendChild(http_call.get_xml(doc))
+        har_file_node.setAttribute("hostname", self.hostname)
+        har_file_node.setAttribute("browser", self.browser)
+        for call_id, http_call in enumerate(self.http_calls):
+            har_file_node.appendChild(http_call.get_xml(doc, call_id))
         return har_file_node
 
 
 class HttpCall:
-    INVALID_UTF_CHARACTERS = tuple(chr(code_point) for code_point in range(0x20)
-                                   if code_point not in (0x09, 0x0A, 0x0D))
-
     """
     Represents a single HTTP call extracted from a HAR file entry.
     
     This class extracts and stores detailed information about an HTTP request/response pair,
     including method, status, timing, headers, cookies, and content (for text-based data).
     
+    Only these strings are kept, not the HAR entry, and the text content of the bodies is cut
+    to the content limit (har_content_limit property).
+
     Attributes:
-        call: The HAR entry object from haralyzer
         url (str): The URL of the HTTP call
         method (str): The HTTP method (GET, POST, etc.)
         status (str): The HTTP status code
@@ -101,22 +258,25 @@ class HttpCall:
         response_headers (str): Formatted response headers
         response_cookies (str): Formatted response cookies
         response_content (str): Response body content (if text-based)
+        host (str): The Host header of the request, None if there is no such header
     """
 
-    def __init__(self, call):
+    def __init__(self, call, content_limit=0):
         """
         Initialize an HttpCall object from a HAR entry.
         
         Args:
             call: A HAR entry object from haralyzer containing request/response data
+            content_limit (int): The maximum number of characters of the request and response content kept,
+                0 to keep the whole content
         """
-        self.call = call
-        self.url = HttpCall.__sanitize_xml_attribute_value(call.url)
-        self.method = HttpCall.__sanitize_xml_attribute_value(str(call.request.method) if hasattr(call.request, 'method') else 'GET')
-        self.status = HttpCall.__sanitize_xml_attribute_value(str(call.status))
-        self.start_time = HttpCall.__sanitize_xml_attribute_value(str(call.startTime))
-        self.duration = HttpCall.__sanitize_xml_attribute_value(str(self.get_total_time()))
-        self.timings = HttpCall.__sanitize_xml_attribute_value(str(call.timings))
+        self.content_limit = content_limit
+        self.url = remove_invalid_xml_characters(call.url)
+        self.method = remove_invalid_xml_characters(str(call.request.method) if hasattr(call.request, 'method') else 'GET')
+        self.status = remove_invalid_xml_characters(str(call.status))
+        self.start_time = remove_invalid_xml_characters(str(call.startTime))
+        self.duration = remove_invalid_xml_characters(str(HttpCall.get_total_time(call.timings)))
+        self.timings = remove_invalid_xml_characters(str(call.timings))
         self.timing_blocked = str(call.timings.get('blocked', -1))
         self.timing_dns = str(call.timings.get('dns', -1))
         self.timing_connect = str(call.timings.get('connect', -1))
@@ -124,8 +284,8 @@ class HttpCall:
         self.timing_send = str(call.timings.get('send', -1))
         self.timing_wait = str(call.timings.get('wait', -1))
         self.timing_receive = str(call.timings.get('receive', -1))
-        self.size = HttpCall.__sanitize_xml_attribute_value(str(call.response.bodySize))
-        self.success = HttpCall.__sanitize_xml_attribute_value(str(self._calculate_success()))
+        self.size = remove_invalid_xml_characters(str(call.response.bodySize))
+        self.success = remove_invalid_xml_characters(str(self._calculate_success()))
         
         # Request data
         self.request_headers = self.get_headers(call.request.headers) if hasattr(call.request, 'headers') else ''
@@ -136,24 +296,37 @@ class HttpCall:
         self.response_headers = self.get_headers(call.response.headers) if hasattr(call.response, 'headers') else ''
         self.response_cookies = self.get_cookies(call.response.cookies) if hasattr(call.response, 'cookies') else ''
         self.response_content = self.get_response_content(call.response)
-    
-    def get_total_time(self):
+        self.host = HttpCall.get_host(call.request.headers) if hasattr(call.request, 'headers') else None
+
+    @staticmethod
+    def get_total_time(timings):
         """
         Calculate the total time taken for the HTTP call.
         
         Sums all positive timing values from the HAR entry's timings object.
+
+        Args:
+            timings (dict): The timings object of the HAR entry
         
         Returns:
             int: Total time in milliseconds
         """
         total = 0
-        if len(self.call.timings) > 0:
-            for key in self.call.timings.keys():
-                time = int(self.call.timings[key])
+        if len(timings) > 0:
+            for key in timings.keys():
+                time = int(timings[key])
                 if time > 0:
                     total += time
         return total
 
+    @staticmethod
+    def get_host(headers):
+        """Return the value of the Host header, None if there is no such header"""
+        for header in headers or ():
+            if isinstance(header, dict) and header.get('name') == 'Host':
+                return header.get('value')
+        return None
+
     def _calculate_success(self):
         """
         Determine if the HTTP call was successful based on status code.
@@ -172,8 +345,8 @@ class HttpCall:
         header_lines = []
         for header in headers:
             if isinstance(header, dict) and 'name' in header and 'value' in header:
-                header_name = HttpCall.__sanitize_xml_attribute_value(str(header['name']))
-                header_value = HttpCall.__sanitize_xml_attribute_value(str(header['value']))
+                header_name = remove_invalid_xml_characters(str(header['name']))
+                header_value = remove_invalid_xml_characters(str(header['value']))
                 header_lines.append(f"{header_name}: {header_value}")
         return '\n'.join(header_lines)
 
@@ -184,8 +357,8 @@ class HttpCall:
         cookie_lines = []
         for cookie in cookies:
             if isinstance(cookie, dict) and 'name' in cookie and 'value' in cookie:
-                cookie_name = HttpCall.__sanitize_xml_attribute_value(str(cookie['name']))
-                cookie_value = HttpCall.__sanitize_xml_attribute_value(str(cookie['value']))
+                cookie_name = remove_invalid_xml_characters(str(cookie['name']))
+                cookie_value = remove_invalid_xml_characters(str(cookie['value']))
                 cookie_lines.append(f"{cookie_name}={cookie_value}")
         return '\n'.join(cookie_lines)
 
@@ -207,7 +380,7 @@ class HttpCall:
         mime_type = post_data.get('mimeType', '')
         if mime_type and self.is_text_mime_type(mime_type):
             text = post_data.get('text', '')
-            return HttpCall.__sanitize_xml_attribute_value(str(text)) if text else ''
+            return remove_invalid_xml_characters(self.__limit_content(str(text))) if text else ''
         
         return ''
 
@@ -229,10 +402,16 @@ class HttpCall:
         mime_type = content.get('mimeType', '')
         if mime_type and self.is_text_mime_type(mime_type):
             text = content.get('text', '')
-            return HttpCall.__sanitize_xml_attribute_value(str(text)) if text else ''
+            return remove_invalid_xml_characters(self.__limit_content(str(text))) if text else ''
         
         return ''
 
+    def __limit_content(self, text):
+        """Cut the text to the content limit"""
+        if 0 < self.content_limit < len(text):
+            return text[:self.content_limit] + f"... ({len(text) - self.content_limit} more characters)"
+        return text
+
     def is_text_mime_type(self, mime_type):
         """Check if MIME type represents text content"""
         text_types = [
@@ -241,28 +420,30 @@ class HttpCall:
         ]
         return any(mime_type.startswith(t) for t in text_types)
 
-    @staticmethod
-    def __sanitize_xml_attribute_value(value):
-        """Remove characters that are invalid in XML attribute values."""
-        sanitized_value = value
-        for invalid_character in HttpCall.INVALID_UTF_CHARACTERS:
-            sanitized_value = sanitized_value.replace(invalid_character, '')
-        return sanitized_value
-
-    def get_xml(self, doc):
+    def get_details(self):
+        """
+        Returns the details of the HTTP call shown on demand in the report: the request headers, cookies and content
+        and the response headers, cookies and content.
+        """
+        return [self.request_headers, self.request_cookies, self.request_content,
+                self.response_headers, self.response_cookies, self.response_content]
+
+    def get_xml(self, doc, call_id=0):
         """
         Convert the HTTP call data to an XML representation.
         
-        Creates an XML element with all HTTP call attributes including URL, method,
-        status, timing, headers, cookies, and content.
+        Creates an XML element with the HTTP call attributes including URL, method,
+        status and timing. The headers, cookies and content are not included (see get_details).
         
         Args:
             doc (xml.dom.minidom.Document): The XML document to create elements in
+            call_id (int): The index of the call in the HAR file
             
         Returns:
             xml.dom.minidom.Element: An XML element representing the HTTP call
         """
         http_call_node = doc.createElement("http_call")
+        http_call_node.setAttribute("id", str(call_id))
         http_call_node.setAttribute("url", self.url)
         http_call_node.setAttribute("method", self.method)
         http_call_node.setAttribute("status", self.status)
@@ -278,10 +459,4 @@ class HttpCall:
         http_call_node.setAttribute("timing_receive", self.timing_receive)
         http_call_node.setAttribute("size", self.size)
         http_call_node.setAttribute("success", self.success)
-        http_call_node.setAttribute("request_headers", self.request_headers)
-        http_call_node.setAttribute("request_cookies", self.request_cookies)
-        http_call_node.setAttribute("request_content", self.request_content)
-        http_call_node.setAttribute("response_headers", self.response_headers)
-        http_call_node.setAttribute("response_cookies", self.response_cookies)
-        http_call_node.setAttribute("response_content", self.response_content)
         return http_call_node
@@ -2,6 +2,8 @@
 # Copyright IBM Corp. 2024 - 2026
 # SPDX-License-Identifier: Apache-2.0
 #
+import hashlib
+
 from javacore_analyser.abstract_snapshot_collection import AbstractSnapshotCollection
 from javacore_analyser.properties import Properties
 from javacore_analyser.stack_trace import StackTrace
@@ -13,6 +15,8 @@ class Thread(AbstractSnapshotCollection):
         super().__init__()
         self.thread_address = ""
         self._snapshot_classification = None
+        # The digest of the thread name and id, computed once. It names the page of the thread
+        self._hash = None
 
     def create(self, thread_snapshot):
         super().create(thread_snapshot)
@@ -27,11 +31,13 @@ class Thread(AbstractSnapshotCollection):
         return False
 
     def get_hash(self):
-        id_str = self.name + str(self.id)
-        hashcode = abs(hash(id_str))
-        return str(hashcode)
+        if self._hash is None:
+            id_str = self.name + str(self.id)
+            # The digest is the same in all the processes, unlike hash() of the string
+            self._hash = hashlib.sha1(id_str.encode("utf-8")).hexdigest()[:16]
+        return self._hash
 
-    def get_xml(self, doc):
+    def get_xml(self, doc, stack_trace_table=None):
         thread_node = super().get_xml(doc)
 
         thread_node.setAttribute("has_drill_down",
@@ -67,7 +73,7 @@ class Thread(AbstractSnapshotCollection):
         for s in self.thread_snapshots:
             stack_trace_node = doc.createElement("stack")
             stack_trace_node.setAttribute("order", str(i))
-            s.get_xml(doc, stack_trace_node)
+            s.get_xml(doc, stack_trace_node, stack_trace_table)
             thread_node.appendChild(stack_trace_node)
             i = i + 1
 
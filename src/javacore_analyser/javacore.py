@@ -9,8 +9,10 @@ import logging
 import os.path
 import re
 
+from javacore_analyser.common_utils import get_checksum
 from javacore_analyser.constants import *
 from javacore_analyser.thread_snapshot import ThreadSnapshot
+from javacore_analyser.xml_sanitizer import has_invalid_javacore_bytes
 
 
 class CorruptedJavacoreException(Exception):
@@ -29,6 +31,9 @@ class Javacore:
         self.timestamp = None
         self.filename = None
         self.file_reader = None
+        # The size and the checksum of the file when it was parsed, as the file can be removed later
+        self.file_size = None
+        self.checksum = None
         self.snapshots = []
         self.siginfo = None
         self.__total_cpu = -1
@@ -52,6 +57,12 @@ class Javacore:
         self.curr_line = ""
         self.line_num = 0
 
+    def __getstate__(self):
+        # The reader is used only while the javacore is parsed, so it is not saved with the analysis model
+        state = self.__dict__.copy()
+        state["file_reader"] = None
+        return state
+
     @staticmethod
     def create(filename, javacore_set):
         javacore = Javacore()
@@ -60,7 +71,23 @@ class Javacore:
         javacore.parse()
         return javacore
 
+    @staticmethod
+    def read_datetime(filename):
+        """
+        Returns the time the javacore was generated at, reading only the header of the file.
+        """
+        javacore = Javacore()
+        javacore.filename = filename
+        javacore.file_reader = codecs.open(filename, encoding=javacore.get_encoding(), errors='strict')
+        try:
+            javacore._parse_datetime()
+        finally:
+            javacore.file_reader.close()
+        return javacore.datetime
+
     def parse(self):
+        self.file_size = os.path.getsize(self.filename)
+        self.checksum = get_checksum(self.filename, 0, self.file_size)
         try:
             self.file_reader = codecs.open(self.filename, encoding=self.get_encoding(), errors='strict')
             self._parse_siginfo()
@@ -250,10 +277,9 @@ class Javacore:
 
     def encode(self, string):
         bts = str.encode(string, self.get_encoding(), 'ignore')
-        for i in range(0, len(bts)):
-            # fix for 'XML Syntax error PCDATA invalid char#405'
-            if bts[i] < 32 and bts[i] != 9 and bts[i] != 10 and bts[i] != 13 and bts[i] != 1:
-                raise CorruptedJavacoreException("Javacore " + self.filename + " is corrupted in line " + string)
+        # fix for 'XML Syntax error PCDATA invalid char#405'
+        if has_invalid_javacore_bytes(bts):
+            raise CorruptedJavacoreException("Javacore " + self.filename + " is corrupted in line " + string)
         string = bts.decode('utf-8', 'ignore')
         return string
 
@@ -281,6 +307,12 @@ class Javacore:
     def basefilename(self):
         return os.path.basename(self.filename)
 
+    def get_fingerprint(self):
+        """
+        Returns the name, the size and the checksum of the file when it was parsed.
+        """
+        return [self.basefilename(), self.file_size, self.checksum]
+
     def basefilename_without_extension(self):
         return os.path.splitext(self.basefilename())[0]
 
@@ -5,23 +5,30 @@
 
 import argparse
 import fnmatch
+import html
+import json
 import locale
 import logging
+import multiprocessing
 import os.path
 import shutil
 import sys
 import tarfile
 import tempfile
+import time
 import traceback
 import zipfile
 
 import importlib_resources
 import py7zr
-from importlib_resources.abc import Traversable
 
 from javacore_analyser import common_utils
+from javacore_analyser.analysis_model import is_model_saved, load_model, save_model, update_model
 from javacore_analyser.javacore_set import JavacoreSet
 from javacore_analyser.properties import Properties
+from javacore_analyser.report_assets import ASSETS_COPY, ASSETS_SHARED, get_assets_strategy, get_assets_url, \
+    materialise_assets
+from javacore_analyser.report_publishing import finish_processing, get_processing_page, start_processing
 
 SUPPORTED_ARCHIVES_FORMATS = {"zip", "tar", "gz", "tgz", "bz2", "lzma", "7z"}
 
@@ -122,6 +129,18 @@ def batch_process(input_param, output_param):
     output_param = os.path.normpath(output_param)
     # Needs to be created once output file structure is ready.
     common_utils.create_file_logging(output_param)
+    try:
+        files = get_input_files(input_param)
+        process_javacores_and_generate_report_data(files, output_param)
+    except Exception as ex:
+        logging.exception(ex)
+        logging.error("Processing was not successful. Correct the problem and try again.")
+
+
+def get_input_files(input_param):
+    """
+    Returns the list of the input files from the input parameter of the batch application.
+    """
     # Check whether as input we got list of files or single file
     # Semicolon is separation mark for list of input files
     files_separator = Properties.get_instance().get_property("separator")
@@ -130,12 +149,24 @@ def batch_process(input_param, output_param):
         files = input_param.split(files_separator)
     else:
         files = [input_param]
-    try:
-        files = [os.path.normpath(file) for file in files]
-        process_javacores_and_generate_report_data(files, output_param)
-    except Exception as ex:
-        logging.exception(ex)
-        logging.error("Processing was not successful. Correct the problem and try again.")
+    return [os.path.normpath(file) for file in files]
+
+
+def copy_input_files(files, output_dir):
+    """
+    Copies the input files to output_dir. The directories are copied with their content
+    and the archives are extracted.
+    """
+    for file in files:
+        if os.path.isdir(file):
+            shutil.copytree(file, output_dir, dirs_exist_ok=True)
+        else:
+            filename, extension = os.path.splitext(file)
+            extension = extension[1:]  # trim trailing "."
+            if extension.lower() in SUPPORTED_ARCHIVES_FORMATS:
+                extract_archive(file, output_dir)  # Extract archive to temp dir
+            else:
+                shutil.copy2(file, output_dir)
 
 
 # Assisted by WCA@IBM
@@ -154,28 +185,22 @@ def generate_javecore_set_data(files):
     try:
         # Location when we store extracted archive or copied javacores files
         javacores_temp_dir_name = javacores_temp_dir.name
-        for file in files:
-            if os.path.isdir(file):
-                shutil.copytree(file, javacores_temp_dir_name, dirs_exist_ok=True)
-            else:
-                filename, extension = os.path.splitext(file)
-                extension = extension[1:]  # trim trailing "."
-                if extension.lower() in SUPPORTED_ARCHIVES_FORMATS:
-                    extract_archive(file, javacores_temp_dir_name)  # Extract archive to temp dir
-                else:
-                    shutil.copy2(file, javacores_temp_dir_name)
+        copy_input_files(files, javacores_temp_dir_name)
         return JavacoreSet.process_javacores(javacores_temp_dir_name)
     finally:
         javacores_temp_dir.cleanup()
 
 
 # Assisted by watsonx Code Assistant 
-def create_output_files_structure(output_dir):
+def create_output_files_structure(output_dir, assets_strategy=ASSETS_COPY):
     """
-    Creates the output report directory structure and copies necessary files.
+    Creates the output report directory structure and puts the assets needed by the report pages into it.
+    The report is marked as being processed until process_javacores_and_generate_report_data finishes.
 
     Args:
         output_dir (str): The output directory path.
+        assets_strategy (str): How the assets get into the report: copy, hardlink, symlink or shared.
+            For shared, no data directory is created because the assets are served by the web application.
 
     Returns:
         None
@@ -189,12 +214,9 @@ def create_output_files_structure(output_dir):
         shutil.rmtree(data_output_dir, ignore_errors=True)
     logging.info("Data dir: " + data_output_dir)
 
-    style_css_resource: Traversable = importlib_resources.files("javacore_analyser") / "data" / "style.css"
-    data_dir = os.path.dirname(str(style_css_resource))
-    os.mkdir(data_output_dir)
-    shutil.copytree(data_dir, data_output_dir, dirs_exist_ok=True)
-    shutil.copy2(os.path.join(data_output_dir, "html", "processing_data.html"),
-                 os.path.join(output_dir, "index.html"))
+    materialise_assets(data_output_dir, assets_strategy)
+    start_processing(output_dir)
+    shutil.copy2(get_processing_page(), os.path.join(output_dir, "index.html"))
 
 
 # Assisted by watsonx Code Assistant 
@@ -219,25 +241,276 @@ def generate_error_page(output_dir, exception):
 
 # Assisted by WCA@IBM
 # Latest GenAI contribution: ibm/granite-8b-code-instruct
-def process_javacores_and_generate_report_data(input_files, output_dir):
+def process_javacores_and_generate_report_data(input_files, output_dir, assets_strategy=None):
     """
     Processes Java core dump files and generates report data.
 
     Parameters:
     input_files (list): A list of paths to Java core dump files.
     output_dir (str): The directory where the generated report data will be saved.
+    assets_strategy (str): How the styles and scripts get into the report (see report_assets module).
+        If None, it is taken from the assets_strategy property.
 
     Returns:
-    None
+    JavacoreSet: The analysed javacores, or None if processing failed
     """
     try:
-        create_output_files_structure(output_dir)
+        if assets_strategy is None:
+            assets_strategy = get_assets_strategy(shared_allowed=False)
+        create_output_files_structure(output_dir, assets_strategy)
         javacore_set = generate_javecore_set_data(input_files)
-        javacore_set.generate_report_files(output_dir)
+        if is_model_saved():
+            save_model(javacore_set, output_dir)
+        assets_url = get_assets_url() if assets_strategy == ASSETS_SHARED else None
+        javacore_set.generate_report_files(output_dir, assets_url)
+        return javacore_set
     except Exception as ex:
         logging.exception(ex)
         logging.error("Processing was not successful. Correct the problem and try again.")
         generate_error_page(output_dir, ex)
+        return None
+    finally:
+        finish_processing(output_dir)
+
+
+def regenerate_report(report_dir, output_dir=None, assets_strategy=None):
+    """
+    Regenerates the report from the analysis model saved with the report, without parsing the javacores again.
+    Only the analysis stages which inputs changed are recomputed (see analysis_model.update_model).
+
+    Parameters:
+    report_dir (str): The directory of the report generated with save_model property.
+    output_dir (str): The directory where the regenerated report will be saved. If None, the report is regenerated
+        in report_dir.
+    assets_strategy (str): How the styles and scripts get into the report (see report_assets module).
+        If None, it is taken from the assets_strategy property.
+
+    Returns:
+    None
+    """
+    output_dir = os.path.normpath(output_dir or report_dir)
+    header, javacore_set = load_model(report_dir)
+    stages = update_model(javacore_set, header)
+    if assets_strategy is None:
+        assets_strategy = get_assets_strategy(shared_allowed=False)
+    try:
+        create_output_files_structure(output_dir, assets_strategy)
+        if stages or output_dir != os.path.normpath(report_dir):
+            save_model(javacore_set, output_dir)
+        assets_url = get_assets_url() if assets_strategy == ASSETS_SHARED else None
+        javacore_set.generate_report_files(output_dir, assets_url)
+    finally:
+        finish_processing(output_dir)
+
+
+def regenerate_main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("report", help="Directory of the report generated with save_model property")
+    parser.add_argument("output", nargs="?", help="Name of directory where report will be regenerated. "
+                                                  "By default the report is regenerated in place")
+    common_utils.add_common_args(parser)
+    args = parser.parse_args()
+    Properties.get_instance().load_properties(args)
+    common_utils.create_console_logging()
+    try:
+        regenerate_report(args.report, args.output)
+    except Exception as e:
+        logging.exception(e)
+        logging.fatal("Regenerating the report failed")
+        exit(13)
+
+
+def append_to_report(input_files, report_dir, assets_strategy=None):
+    """
+    Adds the javacores and verbose gc files to the report generated with save_model property and updates
+    the report in place. Only the new javacores are parsed and only the pages which changed are generated again
+    (see JavacoreSet.append). The updated analysis model is saved with the report.
+
+    Parameters:
+    input_files (list): The javacores, verbose gc files, directories or archives to add.
+    report_dir (str): The directory of the report generated with save_model property.
+    assets_strategy (str): How the styles and scripts get into the report (see report_assets module).
+        If None, it is taken from the assets_strategy property.
+
+    Returns:
+    None
+    """
+    report_dir = os.path.normpath(report_dir)
+    header, javacore_set = load_model(report_dir)
+    stages = update_model(javacore_set, header)
+    if assets_strategy is None:
+        assets_strategy = get_assets_strategy(shared_allowed=False)
+    start_processing(report_dir)
+    javacores_temp_dir = tempfile.TemporaryDirectory()
+    try:
+        copy_input_files(input_files, javacores_temp_dir.name)
+        changed = javacore_set.append(javacores_temp_dir.name)
+        save_model(javacore_set, report_dir)
+        assets_url = get_assets_url() if assets_strategy == ASSETS_SHARED else None
+        # The pages generated with the previous settings are not kept
+        javacore_set.generate_report_files(report_dir, assets_url, None if stages else changed)
+    finally:
+        javacores_temp_dir.cleanup()
+        finish_processing(report_dir)
+
+
+def append_main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("report", help="Directory of the report generated with save_model property")
+    parser.add_argument("input", help="Input javacore file(s) or directory with javacores to add to the report. "
+                                      "The javacores can be packed into one of the supported archive formats: "
+                                      "zip, tar, gz, bz2, lzma, 7z. The verbose GC logs can be added as well")
+    common_utils.add_common_args(parser)
+    args = parser.parse_args()
+    Properties.get_instance().load_properties(args)
+    common_utils.create_console_logging()
+    try:
+        append_to_report(get_input_files(args.input), args.report)
+    except Exception as e:
+        logging.exception(e)
+        logging.fatal("Adding the javacores to the report failed")
+        exit(13)
+
+
+def get_batch_parallelism():
+    return max(1, int(Properties.get_instance().get_property("batch_parallelism", 1)))
+
+
+def read_manifest(manifest_file):
+    """
+    Reads the manifest of the javacore collections to process in one run. The manifest is a JSON list
+    of the reports to generate, e.g.:
+    [{"name": "jvm1", "input": "cluster/jvm1", "output": "reports/jvm1"}, ...]
+    The input has the same format as the input of the batch application. The relative paths are relative to
+    the directory of the manifest. The name is optional, the name of the output directory is used by default.
+
+    Parameters:
+    manifest_file (str): The path of the manifest file.
+
+    Returns:
+    list: The reports to generate as dicts with name, input (list of files) and output keys.
+    """
+    with open(manifest_file, encoding="utf-8") as f:
+        entries = json.load(f)
+    if not isinstance(entries, list):
+        raise ValueError(f"Manifest {manifest_file} must contain a list of reports")
+    base_dir = os.path.dirname(os.path.abspath(manifest_file))
+    reports = []
+    outputs = set()
+    for i, entry in enumerate(entries):
+        if not isinstance(entry, dict) or not entry.get("input") or not entry.get("output"):
+            raise ValueError(f"Report {i + 1} in manifest {manifest_file} must have input and output")
+        output = os.path.normpath(os.path.join(base_dir, entry["output"]))
+        if output in outputs:
+            raise ValueError(f"Report directory {output} is used more than once in manifest {manifest_file}")
+        outputs.add(output)
+        reports.append({"name": entry.get("name") or os.path.basename(output),
+                        "input": [os.path.join(base_dir, file) for file in get_input_files(entry["input"])],
+                        "output": output})
+    return reports
+
+
+def process_manifest_report(report):
+    """
+    Generates one report of the manifest. The log of the report is written to its directory.
+
+    Parameters:
+    report (dict): The report from read_manifest.
+
+    Returns:
+    dict: The summary of the report: its name, output, status, duration and the numbers of the javacores,
+        threads, blocking threads and tips.
+    """
+    logging.info(f"Generating report {report['name']} in {report['output']}")
+    start = time.perf_counter()
+    file_handler = common_utils.create_file_logging(report["output"])
+    try:
+        javacore_set = process_javacores_and_generate_report_data(report["input"], report["output"])
+    finally:
+        logging.getLogger().removeHandler(file_handler)
+        file_handler.close()
+    summary = {"name": report["name"], "output": report["output"], "status": "ok" if javacore_set else "failed",
+               "duration": round(time.perf_counter() - start, 1),
+               "javacores": None, "threads": None, "blocking_threads": None, "tips": None}
+    if javacore_set:
+        summary.update(javacores=len(javacore_set.javacores),
+                       threads=len(javacore_set.threads.snapshot_collections),
+                       blocking_threads=len(javacore_set.blocked_snapshots),
+                       tips=len(javacore_set.tips))
+    logging.info(f"Report {report['name']} generated with status {summary['status']} in {summary['duration']}s")
+    return summary
+
+
+def init_worker_process(properties):
+    # The worker process may be started without the properties of the main process (spawn start method)
+    Properties.get_instance().properties = properties
+    common_utils.create_console_logging()
+
+
+def generate_manifest_summary(summaries, summary_dir):
+    """
+    Writes the summary of the reports of the manifest to summary_dir: index.html with the links to the reports
+    and summary.json with the same data.
+    """
+    os.makedirs(summary_dir, exist_ok=True)
+    with open(os.path.join(summary_dir, "summary.json"), "w", encoding="utf-8") as f:
+        json.dump(summaries, f, indent=2)
+    rows = []
+    for summary in summaries:
+        link = os.path.relpath(os.path.join(summary["output"], "index.html"), summary_dir).replace(os.sep, "/")
+        cells = [summary[key] for key in ("status", "javacores", "threads", "blocking_threads", "tips", "duration")]
+        rows.append(f'<tr><td><a href="{html.escape(link)}">{html.escape(summary["name"])}</a></td>' +
+                    "".join("<td>" + ("-" if cell is None else html.escape(str(cell))) + "</td>" for cell in cells) +
+                    "</tr>")
+    summary_page_text = importlib_resources.read_text("javacore_analyser", "data/html/summary.html")
+    with open(os.path.join(summary_dir, "index.html"), "w", encoding="utf-8") as f:
+        f.write(summary_page_text.format(rows="\n".join(rows)))
+
+
+def process_manifest(manifest_file, summary_dir):
+    """
+    Generates all the reports of the manifest (see read_manifest) in one run and the summary of the reports
+    in summary_dir. With batch_parallelism property greater than 1, the reports are generated by a pool
+    of processes. The ML model and the LLM are loaded once per process and reused for all its reports.
+
+    Parameters:
+    manifest_file (str): The path of the manifest file.
+    summary_dir (str): The directory where the summary of the reports will be generated.
+
+    Returns:
+    list: The summaries of the reports (see process_manifest_report) in the order of the manifest.
+    """
+    reports = read_manifest(manifest_file)
+    parallelism = min(get_batch_parallelism(), len(reports))
+    logging.info(f"Generating {len(reports)} reports from {manifest_file} in {max(1, parallelism)} process(es)")
+    if parallelism <= 1:
+        summaries = [process_manifest_report(report) for report in reports]
+    else:
+        with multiprocessing.Pool(parallelism, init_worker_process, (Properties.get_instance().properties,)) as p:
+            summaries = p.map(process_manifest_report, reports, chunksize=1)
+    generate_manifest_summary(summaries, os.path.normpath(summary_dir))
+    return summaries
+
+
+def manifest_main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("manifest", help="JSON file with the list of the reports to generate, e.g. "
+                                         '[{"name": "jvm1", "input": "cluster/jvm1", "output": "reports/jvm1"}]')
+    parser.add_argument("output", help="Name of directory where the summary of the reports will be generated")
+    common_utils.add_common_args(parser)
+    args = parser.parse_args()
+    Properties.get_instance().load_properties(args)
+    common_utils.create_console_logging()
+    try:
+        summaries = process_manifest(args.manifest, args.output)
+    except Exception as e:
+        logging.exception(e)
+        logging.fatal("Processing the manifest failed")
+        exit(13)
+    failed = [summary["name"] for summary in summaries if summary["status"] != "ok"]
+    if failed:
+        logging.fatal(f"Generating reports failed: {', '.join(failed)}")
+        exit(13)
 
 
 if __name__ == "__main__":
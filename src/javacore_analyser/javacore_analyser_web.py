@@ -1,10 +1,12 @@
 #
-# Copyright IBM Corp. 2024 - 2025
+# Copyright IBM Corp. 2024 - 2026
 # SPDX-License-Identifier: Apache-2.0
 #
 import argparse
+import gzip
 import locale
 import logging
+import mimetypes
 import os
 import re
 import shutil
@@ -14,14 +16,20 @@ import threading
 import time
 from pathlib import Path
 
-from flask import Flask, render_template, request, send_from_directory, redirect
+from flask import Flask, render_template, request, send_from_directory, redirect, abort, Response
 from waitress import serve
+from werkzeug.security import safe_join
 
 import javacore_analyser.javacore_analyser_batch
 from javacore_analyser import common_utils
+from javacore_analyser.analysis_model import get_model_file
 from javacore_analyser.common_utils import create_console_logging, create_file_logging
 from javacore_analyser.constants import TEMP_DIR
 from javacore_analyser.properties import Properties
+from javacore_analyser.report_assets import ASSETS_URL_PREFIX, REPORT_ASSETS, get_assets_strategy, \
+    get_package_data_dir
+from javacore_analyser.report_compression import GZIP, SIDECAR_EXTENSIONS, find_sidecar
+from javacore_analyser.report_publishing import get_processing_page, is_processing
 
 """
 To run the application from cmd type:
@@ -30,6 +38,7 @@ flask --app javacore_analyser_web run
 """
 app = Flask(__name__, static_folder='data')
 reports_dir = 'reports' # This is default value. It will be changed in the constructor
+ASSETS_MAX_AGE = 365 * 24 * 60 * 60  # One year
 
 
 # Assisted by watsonx Code Assistant
@@ -50,9 +59,44 @@ def index():
 
 @app.route('/reports/<path:path>')
 def dir_listing(path):
+    """
+    Serves the report file. If the report was generated with compression, the precompressed sidecar
+    (e.g. index.html.gz) is served with Content-Encoding header when the browser accepts the encoding.
+    The pages of the report which is being generated are served as the processing page until they are published.
+    """
+    file = safe_join(reports_dir, path)
+    if file is None:
+        abort(404)
+    if (file.endswith(".html") and not os.path.isfile(file) and not os.path.isfile(file + SIDECAR_EXTENSIONS[GZIP])
+            and is_processing(safe_join(reports_dir, path.split("/")[0]))):
+        processing_page = get_processing_page()
+        return send_from_directory(os.path.dirname(processing_page), os.path.basename(processing_page), max_age=0)
+    mimetype = mimetypes.guess_type(file)[0] or "application/octet-stream"
+    accepted_encodings = [encoding for encoding in SIDECAR_EXTENSIONS if request.accept_encodings[encoding]]
+    sidecar, encoding = find_sidecar(file, accepted_encodings)
+    if sidecar:
+        response = send_from_directory(reports_dir, path + SIDECAR_EXTENSIONS[encoding], mimetype=mimetype)
+        response.headers["Content-Encoding"] = encoding
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
+    if not os.path.isfile(file) and os.path.isfile(file + SIDECAR_EXTENSIONS[GZIP]):
+        # Report generated with compressed_only option and the browser does not accept gzip
+        with open(file + SIDECAR_EXTENSIONS[GZIP], "rb") as f:
+            return Response(gzip.decompress(f.read()), mimetype=mimetype)
     return send_from_directory(reports_dir, path)
 
 
+@app.route(ASSETS_URL_PREFIX + '/<version>/<path:path>')
+def assets(version, path):
+    """
+    Serves the styles and scripts of the reports generated with the shared assets strategy.
+    The version in the url changes with every release, so the browser can cache the files for a long time.
+    """
+    if path not in REPORT_ASSETS:
+        abort(404)
+    return send_from_directory(get_package_data_dir(), path, max_age=ASSETS_MAX_AGE)
+
+
 @app.route('/zip/<path:path>')
 # Assisted by watsonx Code Assistant 
 def compress(path):
@@ -125,7 +169,8 @@ def upload_file():
         report_output_dir = os.path.join(reports_dir, report_name)
         processing_thread = threading.Thread(
             target=javacore_analyser.javacore_analyser_batch.process_javacores_and_generate_report_data,
-            name="Processing javacore data", args=(input_files, report_output_dir)
+            name="Processing javacore data",
+            args=(input_files, report_output_dir, get_assets_strategy(shared_allowed=True))
         )
         processing_thread.start()
 
@@ -135,6 +180,43 @@ def upload_file():
         shutil.rmtree(javacores_temp_dir_name, ignore_errors=True)
 
 
+@app.route('/append/<report_name>', methods=['POST'])
+def append_files(report_name):
+    """
+    Adds the uploaded javacores and verbose gc files to the report generated with the saved analysis model.
+    Only the pages which changed are generated again, the other pages of the report are served meanwhile.
+    """
+    report_output_dir = safe_join(reports_dir, report_name)
+    if report_output_dir is None or not os.path.isdir(report_output_dir):
+        abort(404)
+    if not os.path.isfile(get_model_file(report_output_dir)):
+        return "The report has no saved analysis model. Generate it with save_model = True to add javacores.", 400
+    if is_processing(report_output_dir):
+        return "The report is being generated. Try again later.", 409
+
+    javacores_temp_dir_name = tempfile.mkdtemp(prefix=report_name + "_", dir=os.path.join(reports_dir, TEMP_DIR))
+    input_files = []
+    for file in request.files.getlist("files"):
+        file_name = safe_join(javacores_temp_dir_name, os.path.basename(file.filename))
+        if file_name is None:
+            continue
+        file.save(file_name)
+        input_files.append(file_name)
+
+    def append_and_cleanup():
+        try:
+            javacore_analyser.javacore_analyser_batch.append_to_report(input_files, report_output_dir,
+                                                                       get_assets_strategy(shared_allowed=True))
+        except Exception as ex:
+            logging.exception(ex)
+            logging.error(f"Adding javacores to report {report_name} was not successful")
+        finally:
+            shutil.rmtree(javacores_temp_dir_name, ignore_errors=True)
+
+    threading.Thread(target=append_and_cleanup, name="Appending javacore data").start()
+    return redirect("/reports/" + report_name + "/index.html")
+
+
 def main():
     parser = argparse.ArgumentParser()
     common_utils.add_web_args(parser)
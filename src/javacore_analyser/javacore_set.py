@@ -4,16 +4,18 @@
 #
 
 import fnmatch
+import io
 import logging
 import os
 import shutil
 import tempfile
+import threading
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from multiprocessing.dummy import Pool  # Keep for HTML generation compatibility
 from pathlib import Path
 from typing import Optional
-from xml.dom.minidom import parseString
+from xml.dom.minidom import Document, parseString
 
 import importlib_resources
 from lxml import etree
@@ -21,20 +23,37 @@ from lxml.etree import XMLSyntaxError
 from tqdm import tqdm
 
 from javacore_analyser import tips
+from javacore_analyser.analysis_store import AnalysisStore, get_analysis_store_file
 from javacore_analyser.ai.performance_recommendations_prompter import PerformanceRecommendationsPrompter
 from javacore_analyser.code_snapshot_collection import CodeSnapshotCollection
+from javacore_analyser.drill_down_data import write_javacore_data, write_thread_data
 from javacore_analyser.constants import *
 from javacore_analyser.exceptions import InvalidLLMMethodError
-from javacore_analyser.har_file import HarFile
+from javacore_analyser.har_file import HarFile, write_http_call_details
 from javacore_analyser.java_thread import Thread
 from javacore_analyser.javacore import Javacore
 from javacore_analyser.plugin_manager import PluginManager
 from javacore_analyser.properties import Properties
+from javacore_analyser.report_publishing import is_index_published_last, publish_html, remove_stale_pages
+from javacore_analyser.search_index import clear_search_index, get_search_index_url, is_search_index_enabled, \
+    write_search_index
 from javacore_analyser.snapshot_collection import SnapshotCollection
 from javacore_analyser.snapshot_collection_collection import SnapshotCollectionCollection
+from javacore_analyser.stack_trace import StackTrace
+from javacore_analyser.stack_trace_table import StackTraceTable
+from javacore_analyser.time_correlation import TimeCorrelation
 from javacore_analyser.verbose_gc import VerboseGcParser
+from javacore_analyser.virtual_tables import get_virtual_tables, write_virtual_tables
 from javacore_analyser.ml.classify_javacore_inference import JavacoreClassifier
 
+# Placeholder of the threads and code collections in the report xml, which are written to the file one by one
+STREAMED_SECTIONS_NODE = "streamed_sections"
+
+# The LLM backends are created once per process and reused for the next javacore sets, as loading the model
+# takes much longer than generating the recommendations. The lock serialises the use of the shared backends.
+_llms = {}
+_llm_lock = threading.Lock()
+
 
 class FileResolver(etree.Resolver):
     """
@@ -85,28 +104,38 @@ class FileResolver(etree.Resolver):
         return None
 
 
-def _create_xml_xsl_for_collection(tmp_dir, templates_dir, xml_xsl_filename, collection, output_file_prefix):
+def _get_file_name(element, output_file_prefix, extension):
+    filename = output_file_prefix + "_" + str(element.get_id()) + extension
+    if filename.startswith("_"):
+        filename = filename[1:]
+    return filename
+
+
+def _create_xml_xsl_for_collection(tmp_dir, templates_dir, xml_xsl_filename, collection, output_file_prefix,
+                                   write_data):
+    """
+    Creates the xsl and xml file of every element of the collection which has the drill-down page.
+    The xsl file is created from the template and write_data is called with the element and the path of its xml file
+    to write the data of the page.
+    """
     logging.info("Creating xmls and xsls in " + tmp_dir)
     os.mkdir(tmp_dir)
-    extensions = [".xsl", ".xml"]
-    for extension in tqdm(extensions, desc="Creating xml/xsl files", unit=" file"):
-        file_full_path = os.path.normpath(os.path.join(templates_dir, xml_xsl_filename + extension))
-        if not file_full_path.startswith(templates_dir):
-            raise Exception("Security exception: Uncontrolled data used in path expression")
-        file_content: str = Path(file_full_path).read_text()
-        for element in collection:
-            element_id = element.get_id()
-            filename = output_file_prefix + "_" + str(element_id) + extension
-            if filename.startswith("_"):
-                filename = filename[1:]
-            if element.is_interesting() or not Properties.get_instance().skip_boring():
-                file = os.path.join(tmp_dir, filename)
-                logging.debug("Writing file " + file)
-                f = open(file, "w")
-                f.write(file_content.format(id=element_id))
-                f.close()
-            else:
-                logging.debug("Skipping boring file: " + filename)
+    file_full_path = os.path.normpath(os.path.join(templates_dir, xml_xsl_filename + ".xsl"))
+    if not file_full_path.startswith(templates_dir):
+        raise Exception("Security exception: Uncontrolled data used in path expression")
+    file_content: str = Path(file_full_path).read_text()
+    for element in tqdm(collection, desc="Creating xml/xsl files", unit=" file"):
+        element_id = element.get_id()
+        filename = _get_file_name(element, output_file_prefix, ".xsl")
+        if element.is_interesting() or not Properties.get_instance().skip_boring():
+            file = os.path.join(tmp_dir, filename)
+            logging.debug("Writing file " + file)
+            f = open(file, "w")
+            f.write(file_content.format(id=element_id))
+            f.close()
+            write_data(element, os.path.join(tmp_dir, _get_file_name(element, output_file_prefix, ".xml")))
+        else:
+            logging.debug("Skipping boring file: " + filename)
 
 
 class JavacoreSet:
@@ -138,8 +167,10 @@ class JavacoreSet:
         # TODO this list is redundant with the data stored in Thread Snapshot. Should be removed in the future.
         self.blocked_snapshots = []
         self.tips = []
+        self.tips_by_class = {}  # The tips generated by every tip class, to generate again only some of them
         self.gc_parser = VerboseGcParser()
         self.har_files = []
+        self.__time_correlation = None  # (inputs, TimeCorrelation), see get_time_correlation
         
         # Plugin system attributes
         self.plugin_data = {}  # Store plugin results
@@ -149,7 +180,22 @@ class JavacoreSet:
         self.ml_classifier = None
         self.use_ml = Properties.get_instance().get_property("use_ml", False)
         if self.use_ml:
-            self.ml_classifier = JavacoreClassifier()     
+            self.ml_classifier = JavacoreClassifier.get_shared()
+
+    def __getstate__(self):
+        """
+        Returns the state saved with the analysis model (see analysis_model module).
+        The ML classifier, the plugins and the report xml are recreated when the report is regenerated.
+        """
+        state = self.__dict__.copy()
+        state["ml_classifier"] = None
+        state["plugin_manager"] = None
+        state["doc"] = None
+        state["report_xml_file"] = None
+        state["_JavacoreSet__time_correlation"] = None
+        state["plugin_data"] = {name: {"data": plugin_info["data"], "files": plugin_info["files"]}
+                                for name, plugin_info in self.plugin_data.items()}
+        return state
 
     # Assisted by WCA@IBM
     # Latest GenAI contribution: ibm/granite-8b-code-instruct
@@ -174,18 +220,24 @@ class JavacoreSet:
         jset.print_blockers()
         jset.print_thread_states()
         jset.generate_tips()
+        jset.export_analysis_store()
         if Properties.get_instance().get_property("use_ai", False):
             jset.add_ai()
         return jset
 
     # Assisted by WCA@IBM
     # Latest GenAI contribution: ibm/granite-8b-code-instruct
-    def generate_report_files(self, output_dir):
+    def generate_report_files(self, output_dir, assets_url=None, changed=None):
         """
         Generate report files in HTML format.
 
         Parameters:
         - output_dir (str): The directory where the generated report files will be saved.
+        - assets_url (str): The url of the shared styles and scripts. If None, the pages use the data dir
+          of the report.
+        - changed (set): The threads and javacores which drill-down pages changed since the report was generated
+          in output_dir (see append). Only their pages and index.html are generated again. If None, all the pages
+          are generated.
 
         Returns:
         - None
@@ -194,50 +246,63 @@ class JavacoreSet:
         temp_dir_name = temp_dir.name
         logging.info("Created temp dir: " + temp_dir_name)
         self.__create_report_xml(temp_dir_name + "/report.xml")
-        placeholder_filename = os.path.join(output_dir, "data", "html", "processing_data.html")
-        self.__generate_placeholder_htmls(placeholder_filename,
-                                          os.path.join(output_dir, "threads"),
-                                          self.threads, "thread")
-        self.__generate_placeholder_htmls(placeholder_filename,
-                                          os.path.join(output_dir, "javacores"),
-                                          self.javacores, "")
-        self.__create_index_html(temp_dir_name, output_dir, self.plugin_data)
-        self.__generate_htmls_for_threads(output_dir, temp_dir_name)
-        self.__generate_htmls_for_javacores(output_dir, temp_dir_name)
-
-    @staticmethod
-    def __generate_placeholder_htmls(placeholder_file, directory, collection, file_prefix):
-        logging.info(f"Generating placeholder htmls in {directory}")
-        if os.path.exists(directory):
-            shutil.rmtree(directory)
-        os.mkdir(directory)
-
-        for element in tqdm(collection, desc="Generating placeholder htmls", unit=" file"):
-            if element.is_interesting() or not Properties.get_instance().skip_boring():
-                filename = file_prefix + "_" + element.get_id() + ".html"
-                if filename.startswith("_"):
-                    filename = filename[1:]
-                file_path = os.path.join(directory, filename)
-                shutil.copy2(placeholder_file, file_path)
-        logging.info("Finished generating placeholder htmls")
+        write_virtual_tables(self, output_dir)
+        write_http_call_details(self.har_files, output_dir)
+        if changed is None:
+            clear_search_index(output_dir)
+        # The pages are published atomically. The web application serves the processing page
+        # for the drill-down pages which are not generated yet.
+        if is_index_published_last():
+            # The report becomes visible only when it is complete
+            self.__generate_htmls_for_threads(output_dir, temp_dir_name, assets_url, changed)
+            self.__generate_htmls_for_javacores(output_dir, temp_dir_name, assets_url, changed)
+            self.__create_index_html(temp_dir_name, output_dir, self.plugin_data, assets_url)
+        else:
+            self.__create_index_html(temp_dir_name, output_dir, self.plugin_data, assets_url)
+            self.__generate_htmls_for_threads(output_dir, temp_dir_name, assets_url, changed)
+            self.__generate_htmls_for_javacores(output_dir, temp_dir_name, assets_url, changed)
 
-    def __generate_htmls_for_threads(self, output_dir, temp_dir_name):
+    def __generate_htmls_for_threads(self, output_dir, temp_dir_name, assets_url=None, changed=None):
+        # Every page gets only its own data instead of the whole report.xml
+        threads, unchanged_pages = self.__get_changed_elements(self.threads, "thread", changed)
         _create_xml_xsl_for_collection(os.path.join(temp_dir_name, "threads"),
-                                       os.path.join(output_dir, "data", "xml", "threads"), "thread",
-                                       self.threads,
-                                       "thread")
-        self.generate_htmls_from_xmls_xsls(self.report_xml_file,
-                                           os.path.join(temp_dir_name, "threads"),
-                                           os.path.join(output_dir, "threads"))
-
-    def __generate_htmls_for_javacores(self, output_dir, temp_dir_name):
+                                       os.path.normpath(str(importlib_resources.files("javacore_analyser")
+                                                            / "data" / "xml" / "threads")), "thread",
+                                       threads,
+                                       "thread",
+                                       self.__write_thread_data)
+        self.generate_htmls_from_xmls_xsls(os.path.join(temp_dir_name, "threads"),
+                                           os.path.join(output_dir, "threads"), assets_url, unchanged_pages)
+
+    def __generate_htmls_for_javacores(self, output_dir, temp_dir_name, assets_url=None, changed=None):
+        javacores, unchanged_pages = self.__get_changed_elements(self.javacores, "", changed)
         _create_xml_xsl_for_collection(os.path.join(temp_dir_name, "javacores"),
-                                       os.path.join(output_dir, "data", "xml", "javacores"), "javacore",
-                                       self.javacores,
-                                       "")
-        self.generate_htmls_from_xmls_xsls(self.report_xml_file,
-                                           os.path.join(temp_dir_name, "javacores"),
-                                           os.path.join(output_dir, "javacores"))
+                                       os.path.normpath(str(importlib_resources.files("javacore_analyser")
+                                                            / "data" / "xml" / "javacores")), "javacore",
+                                       javacores,
+                                       "",
+                                       self.__write_javacore_data)
+        self.generate_htmls_from_xmls_xsls(os.path.join(temp_dir_name, "javacores"),
+                                           os.path.join(output_dir, "javacores"), assets_url, unchanged_pages)
+
+    @staticmethod
+    def __get_changed_elements(collection, output_file_prefix, changed):
+        """
+        Returns the elements of the collection which pages have to be generated and the names of the pages
+        of the other elements, which are kept from the previous generation of the report.
+        """
+        if changed is None:
+            return collection, []
+        elements = [element for element in collection if element in changed]
+        unchanged_pages = [_get_file_name(element, output_file_prefix, ".html")
+                           for element in collection if element not in changed]
+        return elements, unchanged_pages
+
+    def __write_thread_data(self, thread, file):
+        write_thread_data(self, thread, file)
+
+    def __write_javacore_data(self, javacore, file):
+        write_javacore_data(self, javacore, file)
 
     def populate_snapshot_collections(self):
         for javacore in self.javacores:
@@ -246,23 +311,30 @@ class JavacoreSet:
                 self.threads.add_snapshot(s)
                 self.stacks.add_snapshot(s)
     
-    def classify_threads(self):
+    def classify_threads(self, snapshots=None):
         """Classify all thread snapshots upfront in a single batch model.predict() call.
 
         Collecting every ThreadSnapshot into one numpy matrix and calling model.predict()
         once eliminates the per-call XGBoost overhead that caused ~18 ms × N slowness.
         After the batch run each Thread.classify() simply aggregates already-stored labels.
+        If snapshots is given, only these snapshots are classified and only their threads are aggregated again.
         """
         logging.info("Computing thread classifications")
 
         # Collect every snapshot across all Thread objects into a flat list
-        thread_list = list(self.threads)
+        if snapshots is None:
+            thread_list = list(self.threads)
+        else:
+            thread_list = list(dict.fromkeys(snapshot.thread for snapshot in snapshots))
         if not thread_list:
             logging.info("No threads to classify")
             return
 
         # Flatten: one list of every ThreadSnapshot across all Thread objects
-        all_snapshots = [s for thread in thread_list for s in thread.thread_snapshots]
+        if snapshots is None:
+            all_snapshots = [s for thread in thread_list for s in thread.thread_snapshots]
+        else:
+            all_snapshots = list(snapshots)
         if not all_snapshots:
             logging.info("No snapshots to classify")
             return
@@ -489,6 +561,127 @@ class JavacoreSet:
             self.javacores.append(javacore)
         self.javacores.sort(key=lambda x: x.timestamp)
 
+    def __add_javacore(self, javacore, stack_traces):
+        """
+        Adds the parsed javacore and its snapshots to the collections of the set.
+        The javacore has to be newer than the javacores already added.
+        """
+        javacore.file_reader = None
+        self.javacores.append(javacore)
+        snapshots_by_name = {}
+        for snapshot in javacore.snapshots:
+            snapshot.file_reader = None
+            snapshots_by_name.setdefault(snapshot.name, snapshot)
+            signature = StackTraceTable.get_signature(snapshot.stack_trace)
+            snapshot.stack_trace = stack_traces.setdefault(signature, snapshot.stack_trace)
+            self.threads.add_snapshot(snapshot)
+            self.stacks.add_snapshot(snapshot)
+            thread_snapshots = snapshot.thread.thread_snapshots
+            snapshot.set_previous_snapshot(thread_snapshots[-2] if len(thread_snapshots) > 1 else None)
+        for snapshot in javacore.snapshots:
+            if snapshot.blocker_name:
+                snapshot.blocker = snapshots_by_name.get(snapshot.blocker_name)
+            self.__add_blocked_snapshot(snapshot)
+
+    def append(self, path):
+        """
+        Adds the javacores, verbose gc and HAR files found in path to the analysed set. The javacores which are
+        already in the set (with the same file name) are skipped, so only the new files are parsed:
+        - the snapshots of the new javacores are added to the thread and code collections and the CPU usage
+          increment of the first new snapshot of every thread is computed from the previous last snapshot,
+        - only the new snapshots are classified if use_ml is on,
+        - only the tips generated from the added types of data are generated again.
+        The plugin data is not updated.
+
+        Args:
+            path (str): The directory with the files to add
+
+        Returns:
+            The set of the threads and javacores which drill-down pages changed, or None if all the pages changed,
+            e.g. if a new javacore is older than the last analysed one (see generate_report_files).
+        """
+        added = JavacoreSet(path)
+        added.populate_files_list()
+        all_pages_changed = len(self.javacores) < 2  # the pages look different for a single javacore
+        changed = set()
+        data_types = set()
+
+        analysed_files = {os.path.basename(file) for file in self.files}
+        files = [file for file in added.files if os.path.basename(file) not in analysed_files]
+        logging.info(f"Appending {len(files)} javacores, skipping {len(added.files) - len(files)} already analysed")
+        excluded_files = {excluded["file"] for excluded in self.excluded_javacores}
+        self.excluded_javacores.extend(excluded for excluded in added.excluded_javacores
+                                       if excluded["file"] not in excluded_files)
+        if files:
+            datetimes = {file: Javacore.read_datetime(file) for file in files}
+            files.sort(key=datetimes.get)
+            if self.javacores and datetimes[files[0]] < self.javacores[-1].datetime:
+                all_pages_changed = True
+            stack_traces = {}
+            new_snapshots = []
+            for filename in tqdm(files, "Appending javacore files", unit=" file"):
+                javacore = Javacore.create(filename, self)
+                self.__add_javacore(javacore, stack_traces)
+                new_snapshots.extend(javacore.snapshots)
+                changed.add(javacore)
+            changed.update(snapshot.thread for snapshot in new_snapshots)
+            self.files.extend(files)
+            self.files.sort()
+            if all_pages_changed:
+                # The snapshots were not added in time order
+                self.javacores.sort(key=lambda x: x.timestamp)
+                sorted_threads = changed.intersection(self.threads)
+                for thread in sorted_threads:
+                    thread.sort_snapshots()
+                    thread.reset_statistics()
+                    for snapshot in thread.thread_snapshots:
+                        snapshot.elapsed_time = None
+                        snapshot.cpu_usage_inc = None
+                # The CPU usage of the code is computed from the previous snapshots of the threads, which changed
+                for stack in self.stacks:
+                    if any(snapshot.thread in sorted_threads for snapshot in stack.thread_snapshots):
+                        stack.reset_statistics()
+            self.__sort_blocked_snapshots()
+            if self.use_ml:
+                if self.ml_classifier is None:
+                    self.ml_classifier = JavacoreClassifier.get_shared()
+                self.classify_threads(new_snapshots)
+            data_types.add('javacores')
+
+        gc_files = added.gc_parser.get_file_paths()
+        # The collects in the time range of the javacores are selected again when the javacores were added
+        if gc_files or (files and self.gc_parser.get_files()):
+            if self.javacores:
+                self.gc_parser.parse_added_files(gc_files, self.javacores[0].datetime, self.javacores[-1].datetime)
+            else:
+                self.gc_parser.parse_added_files(gc_files)
+            data_types.add('verbosegc')
+
+        har_files = {os.path.basename(har_file.path) for har_file in self.har_files}
+        new_har_files = [har_file for har_file in added.har_files if os.path.basename(har_file.path) not in har_files]
+        if new_har_files:
+            self.har_files.extend(new_har_files)
+            data_types.add('har')
+
+        self.data_types.update(data_types)
+        if data_types:
+            self.generate_tips(data_types)
+            if Properties.get_instance().get_property("use_ai", False):
+                self.add_ai()
+            self.export_analysis_store()
+        return None if all_pages_changed else changed
+
+    def export_analysis_store(self):
+        """
+        Writes the analysed data to the SQLite database set by the analysis_store property, so it can be queried
+        later with AnalysisStore. The database is only an export: the report and the tips are generated from
+        this set. Does nothing if the property is not set.
+        """
+        store_file = get_analysis_store_file()
+        if store_file:
+            with AnalysisStore(store_file) as store:
+                store.update(self)
+
     def parse_verbose_gc_files(self):
         if len(self.javacores) > 0:
             start = self.javacores[0].datetime
@@ -577,6 +770,9 @@ class JavacoreSet:
         report_info_node.appendChild(generation_time_node)
         generation_time_node.appendChild(self.doc.createTextNode(str(datetime.now().strftime(DATE_FORMAT))))
         doc_node.setAttribute("use_ml", str(self.use_ml))
+        # Rows of these tables are rendered in the browser from the data files written by write_virtual_tables
+        for table in get_virtual_tables(self):
+            doc_node.setAttribute("virtual_" + table, "True")
 
         # Only include javacore-specific data if javacores are present
         if 'javacores' in self.data_types and len(self.javacores) > 0:
@@ -648,8 +844,9 @@ class JavacoreSet:
         if len(self.har_files) > 0:
             har_files_node = self.doc.createElement("har_files")
             doc_node.appendChild(har_files_node)
-            for har in self.har_files:
-                har_files_node.appendChild(har.get_xml(self.doc))
+            for file_id, har in enumerate(self.har_files):
+                har_files_node.appendChild(har.get_xml(self.doc, file_id))
+            self.get_time_correlation().add_xml_attributes(har_files_node)
 
         # Only include system info if javacores are present
         if 'javacores' in self.data_types:
@@ -727,8 +924,9 @@ class JavacoreSet:
         # Only add javacore-dependent data if javacores are present
         if 'javacores' in self.data_types:
             doc_node.appendChild(self.get_blockers_xml())
-            doc_node.appendChild(self.threads.get_xml(self.doc))
-            doc_node.appendChild(self.stacks.get_xml(self.doc))
+            # Each unique stack is written once to <stack_traces>. Snapshots and code collections reference it by id.
+            # The threads and the code collections are written to the file one by one in __write_report_xml
+            doc_node.appendChild(self.doc.createElement(STREAMED_SECTIONS_NODE))
         
         doc_node.appendChild(self.gc_parser.get_xml(self.doc))
         
@@ -760,12 +958,34 @@ class JavacoreSet:
         self.doc.appendChild(doc_node)
 
         with open(output_file, 'w', encoding='utf-8') as stream:
-            self.doc.writexml(stream, indent="  ", addindent="  ", newl='\n', encoding="utf-8")
+            if 'javacores' in self.data_types:
+                self.__write_report_xml(stream)
+            else:
+                self.doc.writexml(stream, indent="  ", addindent="  ", newl='\n', encoding="utf-8")
         self.doc.unlink()
         self.report_xml_file = output_file
 
         logging.info("Finished generating report xml")
 
+    def __write_report_xml(self, stream):
+        """
+        Writes the report xml. The document holds everything except the threads and the code
+        collections, which are written in place of the placeholder element one collection at a time.
+        """
+        content = io.StringIO()
+        self.doc.writexml(content, indent="  ", addindent="  ", newl='\n', encoding="utf-8")
+        head, tail = content.getvalue().split("<" + STREAMED_SECTIONS_NODE + "/>", 1)
+        content.close()
+        stream.write(head)
+        stack_trace_table = StackTraceTable()
+        self.threads.write_xml(stream, stack_trace_table)
+        self.stacks.write_xml(stream, stack_trace_table)
+        doc = Document()
+        stack_trace_table.get_xml(doc).writexml(stream, addindent="  ", newl='\n')
+        doc.unlink()
+        logging.info(f"Written {stack_trace_table.size()} unique stack traces to report xml")
+        stream.write(tail)
+
     # Assisted by WCA@IBM
     # Latest GenAI contribution: ibm/granite-8b-code-instruct
     def get_javacore_set_in_xml(self):
@@ -969,7 +1189,7 @@ class JavacoreSet:
 
 
     @staticmethod
-    def __create_index_html(input_dir, output_dir, plugin_data=None):
+    def __create_index_html(input_dir, output_dir, plugin_data=None, assets_url=None):
 
         # Copy index.xml and report.xsl to temp - for index.html we don't need to generate anything. Copying is enough.
         # index_xml = validate_uncontrolled_data_used_in_path([output_dir, "data", "xml", "index.xml"])
@@ -1032,20 +1252,23 @@ class JavacoreSet:
         # This parser is configured to resolve XML entities during parsing
         source_parser = etree.XMLParser(resolve_entities=True)
         source_doc = etree.parse(input_dir + "/index.xml", source_parser)
-        output_doc = xslt_transformer(source_doc)
-
         output_html_file = output_dir + "/index.html"
+        output_doc = xslt_transformer(source_doc, **JavacoreSet.get_assets_xslt_params(assets_url),
+                                      **JavacoreSet.get_search_xslt_params(output_html_file, output_dir),
+                                      **JavacoreSet.get_stack_xslt_params())
+
         logging.info("Generating file " + output_html_file)
-        output_doc.write(output_html_file, pretty_print=True)
+        if is_search_index_enabled():
+            write_search_index(output_doc.getroot(), output_html_file, output_dir)
+        publish_html(output_doc, output_html_file)
 
     @staticmethod
-    def generate_htmls_from_xmls_xsls(report_xml_file, data_input_dir, output_dir):
+    def generate_htmls_from_xmls_xsls(data_input_dir, output_dir, assets_url=None, unchanged_pages=()):
 
         logging.info(f"Starting generating htmls from data from {data_input_dir}")
 
         if not os.path.exists(output_dir):
             os.mkdir(output_dir)
-        shutil.copy2(report_xml_file, data_input_dir)
 
         # https://docs.python.org/3.8/library/multiprocessing.html
         threads_no = JavacoreSet.get_number_of_parallel_threads()
@@ -1057,14 +1280,37 @@ class JavacoreSet:
         # Generating list of tuples. This is required attribute for p.map function executed few lines below.
         generate_html_from_xml_xsl_files_params = []
         for file in list_files:
-            generate_html_from_xml_xsl_files_params.append((file, data_input_dir, output_dir, progress_bar))
+            generate_html_from_xml_xsl_files_params.append((file, data_input_dir, output_dir, progress_bar,
+                                                            assets_url))
 
         with Pool(threads_no) as p:
             p.map(JavacoreSet.generate_html_from_xml_xsl_files, generate_html_from_xml_xsl_files_params)
 
         progress_bar.close()
+        # The pages which did not change are kept from the previous generation of the report
+        remove_stale_pages(output_dir, [file.replace("xsl", "html") for file in list_files if file.endswith(".xsl")] +
+                           list(unchanged_pages))
         logging.info(f"Generated html files in {output_dir}")
 
+    @staticmethod
+    def get_assets_xslt_params(assets_url):
+        # Without the parameter the xsl files use the data dir of the report
+        if not assets_url:
+            return {}
+        return {"assets_dir": etree.XSLT.strparam(assets_url)}
+
+    @staticmethod
+    def get_stack_xslt_params():
+        # The code collections are compared by the top lines of the stack, so only these lines are shown
+        return {"stack_comparison_depth": str(StackTrace.STACK_COMPARISON_DEPTH)}
+
+    @staticmethod
+    def get_search_xslt_params(html_file, report_dir):
+        # Without the parameter the page is searched without the prebuilt index
+        if not is_search_index_enabled():
+            return {}
+        return {"search_index": etree.XSLT.strparam(get_search_index_url(html_file, report_dir))}
+
     # Run with the same number of threads as you have processes but leave one thread for something else.
     @staticmethod
     def get_number_of_parallel_threads():
@@ -1073,7 +1319,7 @@ class JavacoreSet:
     @staticmethod
     def generate_html_from_xml_xsl_files(args):
 
-        collection_file, collection_input_dir, output_dir, progress_bar = args
+        collection_file, collection_input_dir, output_dir, progress_bar, assets_url = args
 
         if not collection_file.endswith(".xsl"): return
 
@@ -1089,16 +1335,19 @@ class JavacoreSet:
             logging.debug("Successfully parsed file {}".format(xml_file))
         except XMLSyntaxError as e:
             file_content = Path(xml_file).read_text()
-            is_report_xml_generated = os.path.isfile(collection_input_dir + "/" + "report.xml")
-            msg = ("Error parsing file {}. File content: {}. report.xml generated: {}"
-                   .format(xml_file, file_content, is_report_xml_generated))
+            msg = "Error parsing file {}. File content: {}".format(xml_file, file_content)
             logging.error(msg)
             raise XMLSyntaxError(msg) from e
 
-        output_doc = xslt_transformer(source_doc)
+        # The drill-down pages are in the subdirectories of the report
+        report_dir = os.path.dirname(os.path.normpath(output_dir))
+        output_doc = xslt_transformer(source_doc, **JavacoreSet.get_assets_xslt_params(assets_url),
+                                      **JavacoreSet.get_search_xslt_params(html_file, report_dir))
 
         logging.debug("Generating file " + html_file)
-        output_doc.write(html_file, pretty_print=True)
+        if is_search_index_enabled():
+            write_search_index(output_doc.getroot(), html_file, report_dir)
+        publish_html(output_doc, html_file)
 
         progress_bar.update(1)
 
@@ -1140,37 +1389,73 @@ class JavacoreSet:
     def __generate_blocked_snapshots_list(self):
         for javacore in self.javacores:
             for snapshot in javacore.snapshots:
-                blocker = snapshot.get_blocker()
-                if blocker:
-                    blocked = self.blocked_collection(blocker)
-                    if not blocked:
-                        blocked = SnapshotCollection()
-                        self.blocked_snapshots.append(blocked)
-                    blocked.add(snapshot)
-                    blocker.blocking.add(snapshot)
+                self.__add_blocked_snapshot(snapshot)
+        self.__sort_blocked_snapshots()
+
+    def __add_blocked_snapshot(self, snapshot):
+        blocker = snapshot.get_blocker()
+        if blocker:
+            blocked = self.blocked_collection(blocker)
+            if not blocked:
+                blocked = SnapshotCollection()
+                self.blocked_snapshots.append(blocked)
+            blocked.add(snapshot)
+            blocker.blocking.add(snapshot)
+
+    def __sort_blocked_snapshots(self):
         self.blocked_snapshots.sort(reverse=True, key=lambda collection: len(collection.get_threads_set()))
 
     def print_blockers(self):
         for blocked in self.blocked_snapshots:
             logging.debug(blocked.get(0).blocker.name + ": " + str(blocked.size()))
 
-    def generate_tips(self):
+    def get_time_correlation(self):
+        """
+        Returns the correlation of the HTTP calls with the GC pauses and the javacores (see time_correlation module),
+        shared by the tips and the report. It is computed again when the HAR files, the collects or the javacores
+        changed.
+        """
+        inputs = (len(self.har_files), self.gc_parser.get_timeline(), len(self.javacores),
+                  self.javacores[0] if self.javacores else None)
+        if self.__time_correlation is None or self.__time_correlation[0] != inputs:
+            self.__time_correlation = (inputs, TimeCorrelation(self))
+        return self.__time_correlation[1]
+
+    def generate_tips(self, data_types=None):
+        """
+        Generates the tips. If data_types is given, only the tips generated from these types of data
+        are generated again and the other tips are kept.
+        """
         for tip in tips.TIPS_LIST:
             tip_class = getattr(tips, tip)
-            self.tips.extend(tip_class.generate(self))
+            if data_types is None or tip not in self.tips_by_class or tip_class.DATA_TYPES & data_types:
+                self.tips_by_class[tip] = tip_class.generate(self)
+        self.tips = [tip for tip_name in tips.TIPS_LIST for tip in self.tips_by_class.get(tip_name, [])]
 
     def add_ai(self):
         """
         Initialize LLM backend and generate AI-powered performance recommendations.
 
         Supports 'huggingface' (local) or 'ollama' (server-based) methods configured via llm_method property.
-        Stores HTML-formatted recommendations in self.ai_tips.
+        Stores HTML-formatted recommendations in self.ai_tips. The backend is initialized on the first call
+        in the process and reused for the next javacore sets with the same LLM settings.
 
         Raises:
             ImportError: If LLM dependencies are not installed.
             InvalidLLMMethodError: If llm_method is invalid.
         """
-        llm_method: str = Properties.get_instance().get_property("llm_method")
+        with _llm_lock:
+            ai = self.__get_llm()
+            ai.javacore_set = self
+            self.ai_tips = ai.infuse_in_html(PerformanceRecommendationsPrompter(self))
+
+    def __get_llm(self):
+        properties = Properties.get_instance()
+        llm_method: str = properties.get_property("llm_method")
+        key = (llm_method.lower(), properties.get_property("llm"), properties.get_property("llm_temperature"),
+               properties.get_property("llm_max_tokens"))
+        if key in _llms:
+            return _llms[key]
         if llm_method.lower() == "huggingface":
             try:
                 from javacore_analyser.ai.huggingface_llm import HuggingFaceLLM
@@ -1200,5 +1485,5 @@ class JavacoreSet:
                 ) from e
         else:
             raise InvalidLLMMethodError(llm_method)
-            
-        self.ai_tips = ai.infuse_in_html(PerformanceRecommendationsPrompter(self))
+        _llms[key] = ai
+        return ai
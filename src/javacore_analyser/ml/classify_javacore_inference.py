@@ -31,6 +31,7 @@ Usage:
 
 # from javacore_analyser.javacore_set import JavacoreSet # If I import this one the model loading crashes
 import logging
+import threading
 import time
 import numpy as np
 from xgboost import XGBClassifier
@@ -68,6 +69,26 @@ class JavacoreClassifier:
     
     # Valid thread state values
     VALID_STATES = ['R', 'CW', 'S', 'Z', 'P', 'B']
+
+    # Significant digits of the CPU usage and allocated memory in the feature key of the batch classification
+    FEATURE_BUCKET_DIGITS = 2
+
+    # The classifier with the model from package resources shared by all the javacore sets analysed in the process
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def get_shared(cls) -> "JavacoreClassifier":
+        """
+        Return the classifier with the model from package resources, loading the model on the first call only.
+
+        Returns:
+            JavacoreClassifier: The classifier shared within the process
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
     
     def __init__(
         self,
@@ -436,6 +457,30 @@ class JavacoreClassifier:
         logging.debug(f"Predicted '{name[:40]}': {predicted_class} ({elapsed_ms:.1f}ms)")
         return predicted_class
 
+    def _bucket(self, value: float) -> float:
+        """
+        Round the value to FEATURE_BUCKET_DIGITS significant digits, so the snapshots with nearly the same
+        value share one feature row.
+        """
+        return float(f"{value:.{self.FEATURE_BUCKET_DIGITS}g}")
+
+    def _get_feature_key(self, snapshot: ThreadSnapshot) -> tuple:
+        """
+        Return the hashable key of the feature row of the snapshot.
+
+        The key holds the inputs the features are built from: the vocabulary words of the thread name
+        (so the thread number of a pool thread does not matter), the lines of the stack trace, the state,
+        the bucketed CPU usage and allocated memory and the number of the blocked threads.
+        Snapshots with the same key have the same feature row.
+        """
+        name = snapshot.name or ""
+        name_tokens = tuple(sorted(self._tn_combined.findall(name))) if self._tn_combined else ()
+        stack_trace = snapshot.stack_trace
+        stack_key = tuple((el.kind, el.line) for el in stack_trace) if stack_trace is not None else None
+        return (name_tokens, stack_key, snapshot.state,
+                self._bucket(self._normalize_cpu_usage(snapshot.cpu_usage)),
+                self._bucket(float(snapshot.allocated_mem)), len(snapshot.blocking))
+
     def predict_snapshots_batch(self, snapshots: List[ThreadSnapshot]) -> List[str]:
         """
         Classify a list of ThreadSnapshot objects in a single model.predict() call.
@@ -445,6 +490,11 @@ class JavacoreClassifier:
         thousands of times and lets XGBoost exploit its internal parallelism
         (n_jobs=-1) across the full batch.
 
+        Most snapshots of a thread pool have the same stack and the same name apart from the thread number,
+        so the snapshots are first deduplicated by their feature key (see _get_feature_key). The feature
+        vector is built and predicted once per unique key and the label is given to all its snapshots.
+        The CPU usage and allocated memory of the feature row are the bucketed values of the key.
+
         Args:
             snapshots: List of ThreadSnapshot objects to classify.
 
@@ -455,29 +505,43 @@ class JavacoreClassifier:
             return []
 
         t0 = time.perf_counter()
+        row_indexes = {}  # feature key -> row of the matrix
+        snapshot_rows = []
+        unique_rows = []  # (key, first snapshot with the key)
+        for snapshot in snapshots:
+            key = self._get_feature_key(snapshot)
+            row = row_indexes.get(key)
+            if row is None:
+                row = row_indexes[key] = len(unique_rows)
+                unique_rows.append((key, snapshot))
+            snapshot_rows.append(row)
+
         n_features = len(self.model_input_parameters)
-        matrix = np.zeros((len(snapshots), n_features), dtype=np.float64)
+        matrix = np.zeros((len(unique_rows), n_features), dtype=np.float64)
 
-        for i, snapshot in enumerate(snapshots):
+        for i, (key, snapshot) in enumerate(unique_rows):
             name = snapshot.name or ""
             stack_trace = snapshot.stack_trace
             if stack_trace is None:
                 stack_trace = ""
             else:
                 stack_trace = stack_trace.to_string().replace("\n", " ").replace("\r", " ")
+            _, _, state, cpu_usage, allocated_mem, blocking_threads = key
 
             matrix[i] = self._build_feature_vector(
                 name=name,
-                cpu_usage=snapshot.cpu_usage,
-                allocated_mem=snapshot.allocated_mem,
-                state=snapshot.state,
-                blocking_threads=len(snapshot.blocking),
+                cpu_usage=cpu_usage,
+                allocated_mem=allocated_mem,
+                state=state,
+                blocking_threads=blocking_threads,
                 stack_trace=stack_trace,
                 stack_trace_depth=snapshot.get_java_stack_depth()
             )
 
         predictions = self.model.predict(matrix)
-        results = [self.classes[p] for p in predictions]
+        labels = [self.classes[p] for p in predictions]
+        results = [labels[row] for row in snapshot_rows]
         elapsed_ms = (time.perf_counter() - t0) * 1000
-        logging.info(f"Batch classified {len(snapshots)} snapshots in {elapsed_ms:.1f}ms")
+        logging.info(f"Batch classified {len(snapshots)} snapshots as {len(unique_rows)} unique feature rows "
+                     f"(dedupe ratio {len(snapshots) / len(unique_rows):.1f}x) in {elapsed_ms:.1f}ms")
         return results
@@ -0,0 +1,118 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import logging
+import os
+import shutil
+from importlib import metadata
+
+import importlib_resources
+
+from javacore_analyser.properties import Properties
+
+ASSETS_COPY = "copy"
+ASSETS_HARDLINK = "hardlink"
+ASSETS_SYMLINK = "symlink"
+ASSETS_SHARED = "shared"
+ASSETS_STRATEGIES = (ASSETS_COPY, ASSETS_HARDLINK, ASSETS_SYMLINK, ASSETS_SHARED)
+
+# URL under which the web application serves the assets once for all reports
+ASSETS_URL_PREFIX = "/assets"
+
+# Static files referenced by the rendered report pages. The xsl, xml templates, prompts and source maps
+# from data/ are used only while the report is generated, so they are not materialised in the report.
+REPORT_ASSETS = (
+    "style.css",
+    "expand.js",
+    "jquery/jq.css",
+    "jquery/theme.blue.css",
+    "jquery/theme.default.min.css",
+    "jquery/jquery.min.js",
+    "jquery/jquery.tablesorter.min.js",
+    "jquery/jquery.tablesorter.widgets.min.js",
+    "jquery/tablesorter-init.js",
+    "jquery/virtual-table.js",
+    "jquery/jquery.mark.min.js",
+    "jquery/search.js",
+    "jquery/sorting.js",
+    "jquery/wait2scripts.js",
+    "jquery/chart.umd.min.js",
+    "jquery/chartjs-adapter-date-fns.bundle.min.js",
+    "jquery/chartjs-plugin-zoom.min.js",
+    "jquery/hammer.min.js",
+)
+
+
+def get_package_data_dir():
+    return os.path.normpath(str(importlib_resources.files("javacore_analyser") / "data"))
+
+
+def get_assets_version():
+    try:
+        return metadata.version("javacore_analyser")
+    except metadata.PackageNotFoundError:
+        return "dev"
+
+
+def get_assets_url():
+    """
+    Returns the versioned URL from which the web application serves the shared assets.
+    The version changes with every release, so the browsers can cache the assets forever.
+    """
+    return ASSETS_URL_PREFIX + "/" + get_assets_version()
+
+
+def get_assets_strategy(shared_allowed):
+    """
+    Returns the assets strategy from the properties.
+
+    Args:
+        shared_allowed (bool): whether the reports are served by the web application.
+            The shared strategy needs the web application, so it falls back to copy otherwise.
+
+    Returns:
+        str: one of ASSETS_STRATEGIES
+    """
+    strategy = str(Properties.get_instance().get_property("assets_strategy", ASSETS_COPY)).lower()
+    if strategy not in ASSETS_STRATEGIES:
+        logging.warning(f"Unknown assets strategy {strategy}. Using {ASSETS_COPY}")
+        return ASSETS_COPY
+    if strategy == ASSETS_SHARED and not shared_allowed:
+        logging.warning(f"Assets strategy {ASSETS_SHARED} is supported only by web application. Using {ASSETS_COPY}")
+        return ASSETS_COPY
+    return strategy
+
+
+def materialise_assets(data_output_dir, strategy=ASSETS_COPY):
+    """
+    Puts the report assets into data_output_dir using the given strategy.
+
+    Hardlinks and symlinks fall back to copying the file when the filesystem does not support them
+    (e.g. the report is on a different device than the package or symlinks require privileges on Windows).
+    Nothing is written for the shared strategy.
+
+    Args:
+        data_output_dir (str): the data directory of the report
+        strategy (str): one of ASSETS_STRATEGIES
+    """
+    if strategy == ASSETS_SHARED:
+        logging.info(f"Using shared assets from {get_assets_url()}")
+        return
+    data_dir = get_package_data_dir()
+    logging.info(f"Materialising {len(REPORT_ASSETS)} assets in {data_output_dir} using {strategy} strategy")
+    for asset in REPORT_ASSETS:
+        src = os.path.join(data_dir, asset)
+        dst = os.path.join(data_output_dir, asset)
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        try:
+            if strategy == ASSETS_HARDLINK:
+                os.link(src, dst)
+                continue
+            if strategy == ASSETS_SYMLINK:
+                os.symlink(src, dst)
+                continue
+        except OSError as e:
+            logging.debug(f"Cannot {strategy} {src} to {dst}: {e}. Copying the file")
+        shutil.copy2(src, dst)
@@ -0,0 +1,108 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import gzip
+import logging
+import os
+
+from javacore_analyser.properties import Properties
+
+GZIP = "gzip"
+BROTLI = "br"
+
+# Content-Encoding name -> sidecar file extension. The order is the preference when the client accepts both.
+SIDECAR_EXTENSIONS = {BROTLI: ".br", GZIP: ".gz"}
+
+# The report files are compressed while the report is generated, so the levels trade some ratio for speed
+GZIP_COMPRESS_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+def get_output_encodings():
+    """
+    Returns the list of encodings for which the sidecar files are written, read from the compression property
+    (comma separated list of gzip and br). Brotli is skipped with a warning if brotli package is not installed.
+    """
+    value = Properties.get_instance().get_property("compression", "")
+    if not value or value is False or str(value).lower() == "none":
+        return []
+    encodings = []
+    for encoding in str(value).lower().replace(" ", "").split(","):
+        if encoding not in SIDECAR_EXTENSIONS:
+            logging.warning(f"Unknown compression {encoding}. Supported values: {', '.join(SIDECAR_EXTENSIONS)}")
+            continue
+        if encoding == BROTLI:
+            try:
+                import brotli  # noqa: F401
+            except ImportError:
+                logging.warning("Brotli compression requires brotli package. "
+                                "Install with: pip install javacore_analyser[brotli]")
+                continue
+        if encoding not in encodings:
+            encodings.append(encoding)
+    return encodings
+
+
+def compress_data(data, encoding):
+    if encoding == GZIP:
+        # mtime is fixed, so the same html gives the same sidecar
+        return gzip.compress(data, compresslevel=GZIP_COMPRESS_LEVEL, mtime=0)
+    if encoding == BROTLI:
+        import brotli
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    raise ValueError(f"Unsupported encoding {encoding}")
+
+
+def compress_file(file, encodings, compressed_only=False):
+    """
+    Writes the compressed sidecar (e.g. index.html.gz) next to the file for every given encoding.
+
+    Args:
+        file (str): the file to compress
+        encodings (list): the encodings from get_output_encodings()
+        compressed_only (bool): remove the original file once the sidecars are written.
+            It is kept if there are no encodings or gzip is not one of them, because the web application can decompress
+            only gzip for clients which do not accept any compression.
+    """
+    if not encodings:
+        return
+    with open(file, "rb") as f:
+        data = f.read()
+    for encoding in encodings:
+        sidecar = file + SIDECAR_EXTENSIONS[encoding]
+        # Write to the temporary file first, so the web application never serves partially written sidecar
+        tmp_sidecar = sidecar + ".tmp"
+        with open(tmp_sidecar, "wb") as f:
+            f.write(compress_data(data, encoding))
+        os.replace(tmp_sidecar, sidecar)
+    if compressed_only and GZIP in encodings:
+        os.remove(file)
+
+
+def compress_report_file(file):
+    """
+    Compresses the file according to compression and compressed_only properties.
+    """
+    compress_file(file, get_output_encodings(), Properties.get_instance().get_property("compressed_only", False))
+
+
+def find_sidecar(file, accepted_encodings):
+    """
+    Returns the (sidecar file, encoding) to serve instead of the file, or (None, None) if the file should be served
+    as it is. The sidecar is not used if it is older than the file, e.g. when the page was regenerated
+    without compression.
+
+    Args:
+        file (str): the requested file
+        accepted_encodings (collection): the encodings accepted by the client
+    """
+    file_mtime = os.path.getmtime(file) if os.path.isfile(file) else None
+    for encoding, extension in SIDECAR_EXTENSIONS.items():
+        if encoding not in accepted_encodings:
+            continue
+        sidecar = file + extension
+        if os.path.isfile(sidecar) and (file_mtime is None or os.path.getmtime(sidecar) >= file_mtime):
+            return sidecar, encoding
+    return None, None
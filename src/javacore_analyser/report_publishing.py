@@ -0,0 +1,72 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""
+Atomic publishing of the report pages.
+
+Every page is rendered to a temporary file and renamed to its final name, so a page is either missing or complete.
+While the report is generated, the report directory contains the processing marker file and the web application
+serves the generic processing page for the pages which do not exist yet.
+"""
+
+import logging
+import os
+
+from javacore_analyser.properties import Properties
+from javacore_analyser.report_assets import get_package_data_dir
+from javacore_analyser.report_compression import SIDECAR_EXTENSIONS, compress_report_file
+
+TEMP_SUFFIX = ".tmp"
+PROCESSING_MARKER = ".processing"
+
+
+def is_index_published_last():
+    return Properties.get_instance().get_property("publish_index_last", False)
+
+
+def get_processing_page():
+    return os.path.join(get_package_data_dir(), "html", "processing_data.html")
+
+
+def publish_html(output_doc, html_file):
+    """
+    Writes the rendered page to the temporary file, renames it to html_file and compresses it.
+
+    Args:
+        output_doc: the result of the xsl transformation
+        html_file (str): the path of the page
+    """
+    tmp_file = html_file + TEMP_SUFFIX
+    output_doc.write(tmp_file, pretty_print=True)
+    os.replace(tmp_file, html_file)
+    compress_report_file(html_file)
+
+
+def remove_stale_pages(directory, page_names):
+    """
+    Removes the files left in the directory by the previous report generated in the same place:
+    the pages which are not in page_names, their compressed sidecars and the unfinished temporary files.
+    """
+    kept = set(page_names)
+    kept.update(name + extension for name in page_names for extension in SIDECAR_EXTENSIONS.values())
+    for name in os.listdir(directory):
+        file = os.path.join(directory, name)
+        if name not in kept and os.path.isfile(file):
+            logging.debug(f"Removing stale file {file}")
+            os.remove(file)
+
+
+def start_processing(report_dir):
+    open(os.path.join(report_dir, PROCESSING_MARKER), "w").close()
+
+
+def finish_processing(report_dir):
+    marker = os.path.join(report_dir, PROCESSING_MARKER)
+    if os.path.isfile(marker):
+        os.remove(marker)
+
+
+def is_processing(report_dir):
+    return os.path.isfile(os.path.join(report_dir, PROCESSING_MARKER))
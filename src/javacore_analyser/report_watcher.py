@@ -0,0 +1,228 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""
+Watch mode: the report is generated while the javacores are being collected, e.g. by javacoreCollector.sh.
+
+The watched directory is scanned for the javacores and verbose gc files. A file is analysed once it is complete:
+it was closed after writing (reported by inotify) or its size did not change for watch_settle_time seconds.
+The analysis is kept in memory. Every update adds at most watch_batch_size javacores to it (see JavacoreSet.append)
+and generates again only the pages which changed, so the work of an update does not grow with the number
+of the javacores collected before. The verbose gc file which grew is parsed from the last collect parsed
+before (see VerboseGcFile.parse_added_bytes), so the work does not grow with the size of the log either.
+The watcher waits for the changes in the directory with inotify if inotify_simple package is installed (Linux only).
+Otherwise, it scans the directory every watch_interval seconds.
+"""
+
+import fnmatch
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+from javacore_analyser.analysis_model import is_model_saved, save_model
+from javacore_analyser.javacore_analyser_batch import create_output_files_structure
+from javacore_analyser.javacore_set import JavacoreSet
+from javacore_analyser.properties import Properties
+from javacore_analyser.report_assets import ASSETS_SHARED, get_assets_strategy, get_assets_url
+from javacore_analyser.report_publishing import finish_processing, start_processing
+
+JAVACORE_PATTERN = "*javacore*.txt"
+VERBOSE_GC_PATTERN = "*verbosegc*"
+
+
+def get_watch_interval():
+    return float(Properties.get_instance().get_property("watch_interval", 2))
+
+
+def get_settle_time():
+    return float(Properties.get_instance().get_property("watch_settle_time", 2))
+
+
+def get_batch_size():
+    return max(1, int(Properties.get_instance().get_property("watch_batch_size", 1)))
+
+
+def is_javacore(file):
+    return fnmatch.fnmatch(os.path.basename(file), JAVACORE_PATTERN)
+
+
+class DirectoryEvents:
+    """
+    Waits for the changes in the directory with inotify. If inotify is not available, it just waits the interval.
+    """
+
+    def __init__(self, directory, interval):
+        self.interval = interval
+        self.inotify = None
+        self.flags = None
+        try:
+            from inotify_simple import INotify, flags
+            self.inotify = INotify()
+            self.flags = flags
+            self.inotify.add_watch(directory, flags.CREATE | flags.MODIFY | flags.CLOSE_WRITE | flags.MOVED_TO)
+            logging.info(f"Watching {directory} with inotify")
+        except (ImportError, OSError) as e:
+            logging.info(f"inotify is not available ({e}). Scanning {directory} every {interval} seconds")
+            self.close()
+
+    def wait(self):
+        """
+        Waits up to the interval for the changes in the directory.
+
+        Returns:
+            the set of the names of the files closed after writing
+        """
+        if self.inotify is None:
+            time.sleep(self.interval)
+            return set()
+        events = self.inotify.read(timeout=int(self.interval * 1000), read_delay=100)
+        return {event.name for event in events if event.mask & (self.flags.CLOSE_WRITE | self.flags.MOVED_TO)}
+
+    def close(self):
+        if self.inotify is not None:
+            self.inotify.close()
+            self.inotify = None
+
+
+class FileScanner:
+    """
+    Finds the javacores and verbose gc files in the directory which are complete and remembers which of them
+    were analysed. The verbose gc file is not analysed any more when it grew since.
+    """
+
+    def __init__(self, directory, settle_time):
+        self.directory = directory
+        self.settle_time = settle_time
+        self.sizes = {}  # path -> (size, time when the size was seen first)
+        self.analysed = {}  # path -> size when analysed
+
+    def get_complete_files(self, closed_files=()):
+        now = time.monotonic()
+        complete = []
+        for name in sorted(os.listdir(self.directory)):
+            if not (fnmatch.fnmatch(name, JAVACORE_PATTERN) or fnmatch.fnmatch(name, VERBOSE_GC_PATTERN)):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                continue  # the file was removed
+            seen = self.sizes.get(path)
+            if seen is None or seen[0] != size:
+                self.sizes[path] = seen = (size, now)
+            if name in closed_files or now - seen[1] >= self.settle_time:
+                complete.append(path)
+        return complete
+
+    def is_analysed(self, file):
+        return self.analysed.get(file) == self.sizes[file][0]
+
+    def mark_analysed(self, files):
+        for file in files:
+            self.analysed[file] = self.sizes[file][0]
+
+
+class ReportWatcher:
+    """
+    Updates the report in report_dir from the files appearing in input_dir.
+    """
+
+    def __init__(self, input_dir, report_dir, assets_strategy=None):
+        self.input_dir = os.path.normpath(input_dir)
+        self.report_dir = os.path.normpath(report_dir)
+        self.assets_strategy = assets_strategy or get_assets_strategy(shared_allowed=False)
+        self.scanner = FileScanner(self.input_dir, get_settle_time())
+        self.batch_size = get_batch_size()
+        self.javacore_set = None
+
+    def get_update_files(self, complete_files):
+        """
+        Returns the files to analyse in the next update: at most batch_size javacores, oldest first, and the
+        verbose gc files which grew since they were analysed. The javacores define the time range of the collects
+        in the report, so the verbose gc files are not analysed before the first javacore. The collects parsed
+        from the verbose gc files are kept and selected again for the time range of the javacores, so the file
+        is analysed again with the javacores only if its part in the time range was not parsed yet
+        (see VerboseGcParser.is_parsed).
+        """
+        javacores = [file for file in complete_files
+                     if is_javacore(file) and not self.scanner.is_analysed(file)][:self.batch_size]
+        if not javacores and self.javacore_set is None:
+            return []
+        return javacores + [file for file in complete_files if not is_javacore(file) and
+                            (not self.scanner.is_analysed(file) or not self.is_gc_file_parsed(file))]
+
+    def is_gc_file_parsed(self, file):
+        return self.javacore_set is None or self.javacore_set.gc_parser.is_parsed(os.path.basename(file))
+
+    def update(self, files):
+        """
+        Adds the files to the analysis and generates again the changed pages of the report.
+        """
+        logging.info(f"Updating report {self.report_dir} with {', '.join(map(os.path.basename, files))}")
+        input_temp_dir = tempfile.TemporaryDirectory()
+        try:
+            for file in files:
+                shutil.copy2(file, input_temp_dir.name)
+            if self.javacore_set is None:
+                create_output_files_structure(self.report_dir, self.assets_strategy)
+                self.javacore_set = JavacoreSet.process_javacores(input_temp_dir.name)
+                changed = None
+            else:
+                start_processing(self.report_dir)
+                changed = self.javacore_set.append(input_temp_dir.name)
+            assets_url = get_assets_url() if self.assets_strategy == ASSETS_SHARED else None
+            self.javacore_set.generate_report_files(self.report_dir, assets_url, changed)
+        finally:
+            input_temp_dir.cleanup()
+            finish_processing(self.report_dir)
+            # The files which failed are not analysed again
+            self.scanner.mark_analysed(files)
+
+    def update_once(self, closed_files=()):
+        """
+        Runs one update if any files are ready.
+
+        Returns:
+            the list of the files added to the report
+        """
+        files = self.get_update_files(self.scanner.get_complete_files(closed_files))
+        if files:
+            try:
+                self.update(files)
+            except Exception as ex:
+                logging.exception(ex)
+                logging.error(f"Updating the report with {', '.join(map(os.path.basename, files))} failed")
+        return files
+
+    def run(self, stop_event=None):
+        """
+        Watches the input directory until stop_event is set or the user interrupts the program.
+        The analysis model is saved with the report at the end if save_model property is set.
+        """
+        logging.info(f"Watching {self.input_dir} for javacores. Press Ctrl+C to stop")
+        events = DirectoryEvents(self.input_dir, get_watch_interval())
+        closed_files = set()
+        try:
+            while stop_event is None or not stop_event.is_set():
+                # The next update runs right away while there are more files ready
+                files = self.update_once(closed_files)
+                if files:
+                    closed_files.difference_update(os.path.basename(file) for file in files)
+                else:
+                    closed_files.update(events.wait())
+        except KeyboardInterrupt:
+            logging.info("Watching stopped")
+        finally:
+            events.close()
+            if self.javacore_set is not None and is_model_saved():
+                save_model(self.javacore_set, self.report_dir)
+
+
+def watch(input_dir, report_dir):
+    if not os.path.isdir(input_dir):
+        raise NotADirectoryError(f"{input_dir} is not a directory")
+    ReportWatcher(input_dir, report_dir).run()
@@ -0,0 +1,135 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""
+Prebuilt search index for the report pages with the search bar.
+
+The text of the page is split into units: the innermost block elements (table cells, paragraphs, list items, ...)
+holding the text. Every unit gets data-si attribute with its number and the index maps every token of the text
+to the units containing it. data/jquery/search.js resolves the search from the index and expands and highlights
+only the matching units instead of scanning the whole page.
+The index of each page is written to a separate file in the search directory of the report, so the main page
+does not load the data of the drill-down pages.
+"""
+
+import json
+import logging
+import os
+import re
+import shutil
+
+from javacore_analyser.properties import Properties
+from javacore_analyser.report_compression import compress_report_file
+
+SEARCH_INDEX_DIR = "search"
+UNIT_ATTRIBUTE = "data-si"
+
+# Elements which are the search units if they directly hold some text
+UNIT_TAGS = {"div", "p", "td", "th", "li", "dt", "dd", "pre", "caption", "h1", "h2", "h3", "h4", "h5", "h6"}
+# Elements which text is not searched
+SKIPPED_TAGS = {"script", "style"}
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def is_search_index_enabled():
+    return Properties.get_instance().get_property("search_index", True)
+
+
+def tokenize(text):
+    """
+    Returns the set of lowercase tokens (runs of letters, digits and underscores) of the text.
+    """
+    return set(TOKEN_PATTERN.findall(text.lower()))
+
+
+def get_search_index_path(page_file, output_dir):
+    """
+    Returns the path of the index file of the page, e.g. search/threads/thread_1.js for threads/thread_1.html
+    """
+    page = os.path.relpath(page_file, output_dir)
+    return os.path.join(output_dir, SEARCH_INDEX_DIR, os.path.splitext(page)[0] + ".js")
+
+
+def get_search_index_url(page_file, output_dir):
+    """
+    Returns the url of the index file of the page, relative to the page.
+    """
+    index_file = get_search_index_path(page_file, output_dir)
+    return os.path.relpath(index_file, os.path.dirname(page_file)).replace(os.sep, "/")
+
+
+def clear_search_index(output_dir):
+    # index files left by the previous report generated in the same directory
+    search_dir = os.path.join(output_dir, SEARCH_INDEX_DIR)
+    if os.path.isdir(search_dir):
+        shutil.rmtree(search_dir)
+
+
+def build_search_index(root):
+    """
+    Marks the search units of the content of the html page with data-si attribute and returns the index:
+    {"units": number of units, "tokens": sorted tokens, "postings": lists of units containing the tokens}.
+    The unit of a text is its nearest ancestor from UNIT_TAGS. The unit numbers in the postings are delta encoded
+    to keep the index file small.
+    """
+    unit_texts = {}
+    for content in root.iterfind(".//div[@class='content']"):
+        # the unit of every element, None for the elements which text is not searched
+        units = {content: content}
+        for element in content.iter():
+            if element is content:
+                unit = content
+            else:
+                parent_unit = units[element.getparent()]
+                if not isinstance(element.tag, str) or element.tag in SKIPPED_TAGS or parent_unit is None:
+                    unit = None
+                else:
+                    unit = element if element.tag in UNIT_TAGS else parent_unit
+                units[element] = unit
+                # the tail is the text after the element, so it belongs to the parent
+                if element.tail and element.tail.strip() and parent_unit is not None:
+                    unit_texts.setdefault(parent_unit, []).append(element.tail)
+            if unit is not None and element.text and element.text.strip():
+                unit_texts.setdefault(unit, []).append(element.text)
+    postings = {}
+    for unit_number, (unit, texts) in enumerate(unit_texts.items()):
+        unit.set(UNIT_ATTRIBUTE, str(unit_number))
+        for token in tokenize(" ".join(texts)):
+            postings.setdefault(token, []).append(unit_number)
+    tokens = sorted(postings)
+    encoded_postings = []
+    for token in tokens:
+        unit_numbers = postings[token]
+        encoded_postings.append([unit_numbers[0]] +
+                                [unit_numbers[i] - unit_numbers[i - 1] for i in range(1, len(unit_numbers))])
+    return {"units": len(unit_texts), "tokens": tokens, "postings": encoded_postings}
+
+
+def has_search_bar(root):
+    return root.find(".//input[@id='search-input']") is not None
+
+
+def write_search_index(root, page_file, output_dir):
+    """
+    Builds the index of the html page and writes it to the search directory of the report.
+    Pages without the search bar are not indexed.
+
+    Args:
+        root: the root element of the html page. The search units are marked in it, so it must be written after.
+        page_file (str): the path of the html page
+        output_dir (str): the directory of the report
+    """
+    if not has_search_bar(root):
+        return
+    index = build_search_index(root)
+    index_file = get_search_index_path(page_file, output_dir)
+    os.makedirs(os.path.dirname(index_file), exist_ok=True)
+    with open(index_file, "w", encoding="utf-8") as f:
+        f.write("window.searchIndex = ")
+        json.dump(index, f, separators=(",", ":"))
+        f.write(";\n")
+    compress_report_file(index_file)
+    logging.debug(f"Written search index of {page_file} with {index['units']} units to {index_file}")
@@ -1,7 +1,9 @@
 #
-# Copyright IBM Corp. 2024 - 2024
+# Copyright IBM Corp. 2024 - 2026
 # SPDX-License-Identifier: Apache-2.0
 #
+from xml.dom.minidom import Document
+
 from tqdm import tqdm
 
 
@@ -28,12 +30,25 @@ class SnapshotCollectionCollection:
     # def __next__(self):
     #    return self.snapshot_collections.__next__()
 
-    def get_xml(self, doc):
+    def get_xml(self, doc, stack_trace_table=None):
         info_node = doc.createElement(self.snapshot_collection_type.__name__)
 
         all_threads_node = doc.createElement('all_snapshot_collection')
         info_node.appendChild(all_threads_node)
         for collection in tqdm(self.snapshot_collections, desc=" Generating threads data", unit=" thread"):
-            all_threads_node.appendChild(collection.get_xml(doc))
+            all_threads_node.appendChild(collection.get_xml(doc, stack_trace_table))
 
         return info_node
+
+    def write_xml(self, stream, stack_trace_table=None):
+        """
+        Writes the same xml as get_xml directly to the stream. Only one collection at a time is kept
+        in the xml document, so the memory does not grow with the number of the collections.
+        """
+        name = self.snapshot_collection_type.__name__
+        stream.write("<" + name + "><all_snapshot_collection>\n")
+        for collection in tqdm(self.snapshot_collections, desc=" Writing threads data", unit=" thread"):
+            doc = Document()
+            collection.get_xml(doc, stack_trace_table).writexml(stream, addindent="  ", newl="\n")
+            doc.unlink()
+        stream.write("</all_snapshot_collection></" + name + ">\n")
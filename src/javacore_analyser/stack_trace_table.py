@@ -0,0 +1,93 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+
+from javacore_analyser.stack_trace import StackTrace
+
+STACK_TRACES_NODE = "stack_traces"
+STACK_TRACE_NODE = "stack_trace"
+STACK_ID = "stack_id"
+
+
+class StackTraceTable:
+    """
+    Dictionary of the unique stack traces written to report.xml.
+
+    A thread stuck in the same stack across many javacores used to have its stack written once per snapshot.
+    With the table each distinct stack is written once, in the top level <stack_traces> element,
+    and the snapshots and code collections reference it by the stack_id attribute.
+    The XSL files dereference the id with the stack_trace key.
+    """
+
+    def __init__(self):
+        self.__ids = {}
+        self.__stack_traces = []
+
+    @staticmethod
+    def get_signature(stack_trace):
+        """
+        Returns the hashable signature of the stack trace.
+        Two stack traces with the same frames (line and kind) have the same signature.
+        """
+        if not stack_trace:
+            return ()
+        return tuple((el.kind, el.get_line()) for el in stack_trace)
+
+    def get_index(self, stack_trace):
+        """
+        Returns the position of the given stack trace in the table, adding the stack trace if it is not there yet.
+        """
+        signature = StackTraceTable.get_signature(stack_trace)
+        index = self.__ids.get(signature)
+        if index is None:
+            index = len(self.__stack_traces)
+            self.__ids[signature] = index
+            self.__stack_traces.append(stack_trace)
+        return index
+
+    def get_id(self, stack_trace):
+        """
+        Returns the id of the given stack trace, adding the stack trace to the table if it is not there yet.
+        """
+        return "s" + str(self.get_index(stack_trace))
+
+    def size(self):
+        return len(self.__stack_traces)
+
+    def get_rows(self, max_depth):
+        """
+        Returns the stack traces as lists of [kind, line] pairs, truncated to max_depth lines,
+        together with the full depth of each stack: [[depth, [[kind, line], ...]], ...].
+        The empty stack has depth 0 and no lines.
+        """
+        rows = []
+        for stack_trace in self.__stack_traces:
+            if not stack_trace:
+                rows.append([0, []])
+                continue
+            elements = stack_trace.stack_trace_elements
+            rows.append([len(elements), [[el.get_kind_str(), el.get_line()] for el in elements[:max_depth]]])
+        return rows
+
+    def get_xml(self, doc):
+        stack_traces_node = doc.createElement(STACK_TRACES_NODE)
+        for i, stack_trace in enumerate(self.__stack_traces):
+            stack_trace_node = doc.createElement(STACK_TRACE_NODE)
+            stack_trace_node.setAttribute("id", "s" + str(i))
+            if not stack_trace:
+                stack_trace_node.setAttribute("depth", "0")
+                empty_stack_node = doc.createElement("line")
+                empty_stack_node.setAttribute("order", "none")
+                empty_stack_node.appendChild(doc.createTextNode(StackTrace.EMPTY_STACK))
+                stack_trace_node.appendChild(empty_stack_node)
+            else:
+                stack_trace_node.setAttribute("depth", str(len(stack_trace.stack_trace_elements)))
+                for order, el in enumerate(stack_trace):
+                    line_node = doc.createElement("line")
+                    line_node.setAttribute("order", str(order))
+                    line_node.setAttribute("kind", str(el.get_kind_str()))
+                    line_node.appendChild(doc.createTextNode(el.get_line()))
+                    stack_trace_node.appendChild(line_node)
+            stack_traces_node.appendChild(stack_trace_node)
+        return stack_traces_node
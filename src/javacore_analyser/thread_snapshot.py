@@ -11,6 +11,8 @@ from javacore_analyser.constants import *
 from javacore_analyser.stack_trace import StackTrace
 from javacore_analyser.stack_trace_element import StackTraceElement
 from javacore_analyser.stack_trace_kind import StackTraceKind
+from javacore_analyser.stack_trace_table import STACK_ID
+from javacore_analyser.xml_sanitizer import replace_soh
 
 
 class ThreadSnapshot:
@@ -34,6 +36,12 @@ class ThreadSnapshot:
         self.blocking = set()  # set of snapshots blocking by this thread
         self._ml_classification = None
 
+    def __getstate__(self):
+        # The reader is used only while the javacore is parsed, so it is not saved with the analysis model
+        state = self.__dict__.copy()
+        state["file_reader"] = None
+        return state
+
     @staticmethod
     def create(line, file_reader, javacore):
         snapshot = ThreadSnapshot()
@@ -78,7 +86,7 @@ class ThreadSnapshot:
 
         # fix for https://trello.com/c/W0tS9b4K/116-processing-javacores-fail-with-xmletreeelementtreeparseerror-not-
         # well-formed-invalid-token-line-1-column-13722
-        name = name.translate(str.maketrans({"\01": "[SOH]"}))
+        name = replace_soh(name)
         return name
 
     def get_thread_address(self, line):
@@ -211,9 +219,15 @@ class ThreadSnapshot:
         s = str.encode(s, self.javacore.get_encoding(), 'ignore').decode('utf-8', 'ignore')
         return s
 
-    def get_xml(self, doc, thread_snapshot_node):
+    def get_xml(self, doc, thread_snapshot_node, stack_trace_table=None):
+        """
+        Fills thread_snapshot_node with the snapshot data.
+
+        If stack_trace_table is given, the stack is not written inline. Instead, the node gets the stack_id
+        attribute referencing the stack in the table.
+        """
         file_name = ""
-        if self.file_reader:
+        if self.javacore and self.javacore.filename:
             file_name = self.javacore.filename.split(os.sep)[-1].strip()
         # CPU usage
         cpu_usage_node = doc.createElement("cpu_usage")
@@ -278,6 +292,9 @@ class ThreadSnapshot:
                 blocking_node.appendChild(blocking_thread_node)
             thread_snapshot_node.appendChild(blocking_node)
         # stack
+        if stack_trace_table is not None:
+            thread_snapshot_node.setAttribute(STACK_ID, stack_trace_table.get_id(self.stack_trace))
+            return thread_snapshot_node
         i = 0
         if not self.stack_trace:
             empty_stack_node = doc.createElement("line")
@@ -305,6 +322,18 @@ class ThreadSnapshot:
         if self.elapsed_time is None: self.compute_elapsed_time()
         return self.elapsed_time
 
+    def set_previous_snapshot(self, previous):
+        """
+        Computes the elapsed time and the CPU usage increment from the given previous snapshot of the thread,
+        without searching for it in the thread snapshots. Used when the javacores are processed in time order.
+        """
+        if previous is None:
+            self.elapsed_time = 0
+            self.cpu_usage_inc = 0
+        else:
+            self.elapsed_time = self.javacore.timestamp - previous.javacore.timestamp
+            self.cpu_usage_inc = self.cpu_usage - previous.cpu_usage
+
     def compute_cpu_usage_inc(self):
         # gets the CPU usage increment since last snapshot
         previous = self.get_previous_snapshot()
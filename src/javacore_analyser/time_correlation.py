@@ -0,0 +1,200 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""
+Correlation in time of the HTTP calls from the HAR files with the GC pauses and the javacores.
+
+The GC pauses are kept in a sorted interval index and the javacores in a sorted array of their times, so the pauses
+overlapping a call and the nearest javacore are found with binary search, in O(log n) per call.
+The times of the verbose gc logs and the javacores are the local times of the JVM, without the time zone.
+The start times of the HTTP calls have the time zone (browsers usually record them in UTC), so they are converted
+to the time zone of the JVM (jvm_time_zone property, the time zone of this machine by default) before comparing.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from javacore_analyser.constants import JAVACORE_CORRELATION_DISTANCE
+from javacore_analyser.properties import Properties
+
+UTC_OFFSET_PATTERN = re.compile(r"^([+-])(\d{1,2}):?(\d{2})?$")
+
+
+def get_jvm_time_zone():
+    """
+    Returns the time zone of the JVM from jvm_time_zone property, the UTC offset like +01:00 or -0530.
+    Returns None, the time zone of this machine, if the property is not set.
+
+    Raises:
+        ValueError: if the property is not a UTC offset
+    """
+    offset = str(Properties.get_instance().get_property("jvm_time_zone", "") or "").strip()
+    if not offset:
+        return None
+    if offset.upper() in ("Z", "UTC"):
+        return timezone.utc
+    match = UTC_OFFSET_PATTERN.match(offset)
+    if not match:
+        raise ValueError(f"jvm_time_zone property must be a UTC offset like +01:00, not {offset}")
+    sign, hours, minutes = match.groups()
+    delta = timedelta(hours=int(hours), minutes=int(minutes or 0))
+    return timezone(-delta if sign == "-" else delta)
+
+
+def _parse_start_time(start_time, time_zone=None):
+    """
+    Returns the start time of the HTTP call (see HttpCall.start_time) in milliseconds in the local time
+    of the time zone (the time zone of this machine if None), None if it is not known.
+    The start time without the time zone is taken as it is.
+    """
+    try:
+        start = datetime.fromisoformat(start_time)
+    except ValueError:
+        return None
+    if start.tzinfo is not None:
+        start = start.astimezone(time_zone).replace(tzinfo=None)
+    return int(np.datetime64(start, "ms").astype(np.int64))
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except ValueError:
+        return 0.0
+
+
+class IntervalIndex:
+    """
+    The intervals sorted by their start, for the queries of the intervals overlapping a given interval.
+
+    The running maximum of the ends is not decreasing, so the intervals before the first one whose running maximum
+    is after the start of the query end before the query, and binary search finds the range of the candidates.
+    The GC pauses do not overlap each other, so all the candidates overlap the query.
+    """
+
+    def __init__(self, starts, durations):
+        """
+        Args:
+            starts (numpy.ndarray): The starts of the intervals in milliseconds
+            durations (numpy.ndarray): The durations of the intervals in milliseconds
+        """
+        self.order = np.argsort(starts, kind="stable")
+        self.starts = np.asarray(starts, dtype=np.float64)[self.order]
+        self.ends = self.starts + np.asarray(durations, dtype=np.float64)[self.order]
+        self.max_ends = np.maximum.accumulate(self.ends) if len(self.ends) else self.ends
+
+    def __len__(self):
+        return len(self.starts)
+
+    def get_candidates(self, starts, ends):
+        """
+        Returns the ranges (first, last) of the sorted intervals which can overlap the intervals from starts to ends.
+        """
+        return (np.searchsorted(self.max_ends, starts, side="right"),
+                np.searchsorted(self.starts, ends, side="left"))
+
+    def get_overlapping(self, start, end, first, last):
+        """
+        Returns the indexes of the intervals overlapping the interval from start to end and the time of the overlaps.
+        first and last are the range of the candidates returned by get_candidates.
+        """
+        overlapping = self.ends[first:last] > start
+        overlap = (np.minimum(self.ends[first:last], end) - np.maximum(self.starts[first:last], start))[overlapping]
+        return self.order[first:last][overlapping], float(overlap.sum())
+
+
+class TimeCorrelation:
+    """
+    The HTTP calls of the HAR files correlated with the GC pauses and the javacores taken at the same time.
+
+    Attributes:
+        calls (list): The HTTP calls of all HAR files in the order of the files
+        starts (numpy.ndarray): The start times of the calls in milliseconds, NaN if not known
+        durations (numpy.ndarray): The durations of the calls in milliseconds
+        gc_pauses (numpy.ndarray): The number of the GC pauses overlapping each call, -1 if there is no GC data
+        gc_pause_times (numpy.ndarray): The time in milliseconds of each call spent in GC pauses
+        javacores (numpy.ndarray): The index of the javacore nearest to each call, -1 if there is none within
+            JAVACORE_CORRELATION_DISTANCE seconds
+        javacore_distances (numpy.ndarray): The distance in seconds of the javacore from each call
+        blocked_threads (list): The number of the blocked threads in each javacore
+    """
+
+    def __init__(self, javacore_set):
+        self.javacore_set = javacore_set
+        self.calls = [call for har_file in javacore_set.har_files for call in har_file.http_calls]
+        time_zone = get_jvm_time_zone()
+        starts = [_parse_start_time(call.start_time, time_zone) for call in self.calls]
+        self.starts = np.array([np.nan if start is None else start for start in starts], dtype=np.float64)
+        self.durations = np.array([_to_float(call.duration) for call in self.calls], dtype=np.float64)
+        self.blocked_threads = [sum(1 for snapshot in javacore.snapshots if snapshot.state == "B")
+                                for javacore in javacore_set.javacores]
+        self.__correlate_gc_pauses(javacore_set.gc_parser.get_timeline())
+        self.__correlate_javacores(javacore_set.javacores)
+
+    def __correlate_gc_pauses(self, timeline):
+        calls_count = len(self.calls)
+        self.gc_pauses = np.full(calls_count, -1, dtype=np.int64)
+        self.gc_pause_times = np.zeros(calls_count, dtype=np.float64)
+        valid = ~np.isnat(timeline.timestamps)
+        index = IntervalIndex(timeline.timestamps[valid].astype(np.int64), timeline.durations[valid])
+        if not len(index):
+            return
+        known = ~np.isnan(self.starts)
+        self.gc_pauses[known] = 0
+        ends = self.starts + self.durations
+        firsts, lasts = index.get_candidates(self.starts[known], ends[known])
+        for call, first, last in zip(np.flatnonzero(known), firsts, lasts):
+            if first < last:
+                pauses, pause_time = index.get_overlapping(self.starts[call], ends[call], first, last)
+                self.gc_pauses[call] = len(pauses)
+                self.gc_pause_times[call] = pause_time
+
+    def __correlate_javacores(self, javacores):
+        calls_count = len(self.calls)
+        self.javacores = np.full(calls_count, -1, dtype=np.int64)
+        self.javacore_distances = np.zeros(calls_count, dtype=np.float64)
+        if not javacores or not calls_count:
+            return
+        times = np.array([np.datetime64(javacore.datetime, "ms") for javacore in javacores]).astype(np.int64)
+        order = np.argsort(times, kind="stable")
+        times = times[order].astype(np.float64)
+        starts = self.starts
+        ends = starts + self.durations
+        after = np.searchsorted(times, starts, side="left")
+        before = after - 1
+        # The javacore taken during the call has distance 0
+        distance_before = np.where(before >= 0, starts - times[np.maximum(before, 0)], np.inf)
+        distance_after = np.where(after < len(times), np.maximum(times[np.minimum(after, len(times) - 1)] - ends, 0),
+                                  np.inf)
+        nearest = np.where(distance_after < distance_before, after, before)
+        distances = np.minimum(distance_before, distance_after) / 1000
+        correlated = distances <= JAVACORE_CORRELATION_DISTANCE  # False for unknown start times
+        self.javacores[correlated] = order[nearest[correlated]]
+        self.javacore_distances[correlated] = distances[correlated]
+
+    def get_slow_calls(self, threshold):
+        """
+        Returns the indexes of the calls at least threshold milliseconds long.
+        """
+        return np.flatnonzero(self.durations >= threshold)
+
+    def add_xml_attributes(self, har_files_node):
+        """
+        Adds the correlation attributes to the http_call elements of har_files element created from the HAR files
+        of the javacore set: the number of the GC pauses overlapping the call and their time in milliseconds,
+        and the nearest javacore with its distance in seconds and the number of its blocked threads.
+        """
+        for i, http_call_node in enumerate(har_files_node.getElementsByTagName("http_call")):
+            if self.gc_pauses[i] >= 0:
+                http_call_node.setAttribute("gc_pauses", str(self.gc_pauses[i]))
+                http_call_node.setAttribute("gc_pause_time", str(round(self.gc_pause_times[i])))
+            if self.javacores[i] >= 0:
+                javacore = self.javacore_set.javacores[self.javacores[i]]
+                http_call_node.setAttribute("javacore", javacore.basefilename())
+                http_call_node.setAttribute("javacore_id", javacore.get_id())
+                http_call_node.setAttribute("javacore_distance", str(round(self.javacore_distances[i])))
+                http_call_node.setAttribute("blocked_threads", str(self.blocked_threads[self.javacores[i]]))
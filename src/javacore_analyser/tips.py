@@ -5,15 +5,19 @@
 import logging
 import re
 
+import numpy as np
+
+from javacore_analyser.constants import GC_PAUSE_THRESHOLDS, JAVACORE_CORRELATION_DISTANCE, SLOW_HTTP_CALL_THRESHOLD
 from javacore_analyser.properties import Properties
 
 # This is a module containing list of the tips.
 # Each tip has to implement dynamic method generate(javacore_set)
+# and define DATA_TYPES, the types of data the tip is generated from (see JavacoreSet.data_types)
 
 # List of the tips on which run the tool
 TIPS_LIST = ["DifferentIssuesTip", "ExcludedJavacoresTip", "InvalidAccumulatedCpuTimeTip", "TooFewJavacoresTip",
              "OOMEGenerationTip", "BlockingThreadsTip", "HighCpuUsageTip", "LongGcPauseTip",
-             "SystemExitInMainThreadTip", "PermanentlyBlockedThreadsTip"]
+             "SystemExitInMainThreadTip", "PermanentlyBlockedThreadsTip", "TimeCorrelationTip"]
 
 
 def get_thread_link(javacore_set, thread_name):
@@ -127,6 +131,8 @@ def linkify_ai_response(javacore_set, text):
 class TestTip:
     # This is tip for testing purposes
 
+    DATA_TYPES = {"javacores"}
+
     @staticmethod
     def generate(javacore_set):
         logging.info(javacore_set)
@@ -136,6 +142,8 @@ class TestTip:
 class InvalidAccumulatedCpuTimeTip:
     # Usually the javacores should not have thread with accumulated CPU time < 0ms
 
+    DATA_TYPES = {"javacores"}
+
     ONE_BAD_THREAD_WARNING = '''[WARNING] The CPU usage data is invalid for thread {0}.
                               Probably one or more javacore files are corrupted.'''
 
@@ -163,6 +171,8 @@ class InvalidAccumulatedCpuTimeTip:
 class OOMEGenerationTip:
     # Tip generated when one of Javacores is generated on OOME, not by user
 
+    DATA_TYPES = {"javacores"}
+
     SIG_INFO_TEXT = '''[WARNING] The Javacore {0} is generated on OutOfMemoryError.
     The signal that triggered the javacore: <<<{1}>>>.
     You may need another tool, like Memory Analyzer Tool, to troubleshoot the issue'''
@@ -184,6 +194,8 @@ class DifferentIssuesTip:
     # Usually the javacores should be gathered in max 1-2 minute intervals.
     # If the interval is higher, then it is probably from different issue.
 
+    DATA_TYPES = {"javacores"}
+
     MAX_INTERVAL_FOR_JAVACORES = 330  # 330 seconds (5 minutes and a little more time)
     DIFFERENT_ISSUES_MESSAGE = """[WARNING] The time interval between javacore {0} and {1} is {2:.0f} seconds, while
     the recommended maximum interval between two javacores is 300 seconds (5 minutes). It is likely that these
@@ -216,6 +228,8 @@ class DifferentIssuesTip:
 class TooFewJavacoresTip:
     # Generates the tip if the number of Javacores is too small.
 
+    DATA_TYPES = {"javacores"}
+
     MIN_NUMBER_OF_JAVACORES = 10
 
     ONE_JAVACORE_WARNING = '''[WARNING] You generated this the report with only one javacore. 
@@ -244,6 +258,8 @@ class TooFewJavacoresTip:
 class ExcludedJavacoresTip:
     # Generates the tip if we excluded some javacores
 
+    DATA_TYPES = {"javacores"}
+
     SMALL_SIZE_JAVACORES = """[WARNING] The file {0} has very small size of {1} bytes. It is probably corrupted.
      It has been excluded from processing."""
 
@@ -258,6 +274,8 @@ class ExcludedJavacoresTip:
 class BlockingThreadsTip:
     # Generates the tip that one or more threads are blocking many another threads
 
+    DATA_TYPES = {"javacores"}
+
     BLOCKING_THREADS_TEXT = """[TIP] a thread {0} is blocking on average {1:.1f} another threads per javacore.
     This lock might cause performance degradation."""
 
@@ -287,6 +305,8 @@ class BlockingThreadsTip:
 class HighCpuUsageTip:
     # Generates the tip if the thread is using above x percent of CPU. Also informs, if this is verbose gc thread.
 
+    DATA_TYPES = {"javacores"}
+
     # Report as high cpu usage for the application using the cpu usage above this value
     CRITICAL_CPU_USAGE = 50
 
@@ -329,10 +349,11 @@ class HighCpuUsageTip:
 
 class LongGcPauseTip:
     # Generates a tip when GC pauses exceed configurable thresholds
+
+    DATA_TYPES = {"verbosegc"}
     
-    # Configurable thresholds in milliseconds
-    THRESHOLD_1 = 1000  # 1 second
-    THRESHOLD_2 = 2000  # 2 seconds
+    # Thresholds in milliseconds, the same as in the GC statistics (1 and 2 seconds)
+    THRESHOLD_1, THRESHOLD_2 = GC_PAUSE_THRESHOLDS
     
     LONG_GC_PAUSE_WARNING = """[WARNING] Detected {0} GC pause(s) longer than {1}ms and {2} GC pause(s) longer than {3}ms.
     The longest GC pause was {4:.0f}ms at {5}.
@@ -342,44 +363,20 @@ class LongGcPauseTip:
     
     @staticmethod
     def generate(javacore_set):
-        # Get all GC collections from the parser
-        collects = javacore_set.gc_parser.get_collects()
-        
-        if not collects:
-            return []  # No verbose GC data, return empty tip
-        
-        # Count pauses exceeding thresholds
-        pauses_over_threshold_1 = 0
-        pauses_over_threshold_2 = 0
-        longest_pause = 0.0
-        longest_pause_time = ""
-        
-        for collect in collects:
-            duration = collect.duration
-            
-            if duration > LongGcPauseTip.THRESHOLD_1:
-                pauses_over_threshold_1 += 1
-            
-            if duration > LongGcPauseTip.THRESHOLD_2:
-                pauses_over_threshold_2 += 1
-            
-            if duration > longest_pause:
-                longest_pause = duration
-                longest_pause_time = collect.start_time_str
-        
+        # The statistics of all GC collections computed once for the report, the tips and the AI prompts
+        statistics = javacore_set.gc_parser.get_summary()
+
         # Generate warning if any pauses exceed threshold 1
-        if pauses_over_threshold_1 > 0:
-            msg = LongGcPauseTip.LONG_GC_PAUSE_WARNING.format(
-                pauses_over_threshold_1,
-                LongGcPauseTip.THRESHOLD_1,
-                pauses_over_threshold_2,
-                LongGcPauseTip.THRESHOLD_2,
-                longest_pause,
-                longest_pause_time
-            )
-            return [msg]
-        
-        return []  # No long pauses detected
+        if not statistics or not statistics["counts"][0]:
+            return []
+        return [LongGcPauseTip.LONG_GC_PAUSE_WARNING.format(
+            statistics["counts"][0],
+            LongGcPauseTip.THRESHOLD_1,
+            statistics["counts"][1],
+            LongGcPauseTip.THRESHOLD_2,
+            statistics["longest"],
+            statistics["longest_start_time"]
+        )]
 
 
 class PermanentlyBlockedThreadsTip:
@@ -387,6 +384,8 @@ class PermanentlyBlockedThreadsTip:
     # A thread blocked 100% of the time never makes progress and is a strong indicator
     # of a deadlock or permanent starvation.
 
+    DATA_TYPES = {"javacores"}
+
     # Minimum number of javacores a thread must appear in before it is considered
     MIN_SNAPSHOTS = 3
 
@@ -420,6 +419,8 @@ class PermanentlyBlockedThreadsTip:
 class SystemExitInMainThreadTip:
     # Detects if any thread's stack trace contains System.exit call
 
+    DATA_TYPES = {"javacores"}
+
     SYSTEM_EXIT_WARNING = """[WARNING] Thread '{0}' in javacore {1} contains System.exit call.
     This indicates the application is shutting down."""
 
@@ -440,3 +441,54 @@ class SystemExitInMainThreadTip:
                         return [msg]
 
         return []  # No System.exit detected in any thread
+
+
+class TimeCorrelationTip:
+    # Detects the slow HTTP calls which were made during GC pauses or close to a javacore with many blocked threads
+
+    DATA_TYPES = {"har", "verbosegc", "javacores"}
+
+    HTTP_CALLS_IN_GC_PAUSES = """[TIP] {0} of {1} HTTP calls longer than {2}ms overlapped GC pauses, which took 
+    {3:.0f}% of their time. The call {4} started at {5} spent {6:.0f}ms of its {7:.0f}ms in GC pauses. 
+    Check the GC pauses in Garbage Collection Activity chart."""
+
+    HTTP_CALLS_NEAR_BLOCKED_THREADS = """[TIP] {0} HTTP call(s) longer than {1}ms were made at most {2} seconds from 
+    javacore {3} with {4} blocked threads, while the javacores have on average {5:.1f} blocked threads. 
+    Check what the threads in this javacore are blocked on."""
+
+    # The javacore has a spike of the blocked threads if it has this many times more blocked threads than average
+    BLOCKED_THREADS_SPIKE = 2
+
+    MAX_JAVACORE_TIPS = 3
+
+    @staticmethod
+    def generate(javacore_set):
+        if not javacore_set.har_files:
+            return []
+        correlation = javacore_set.get_time_correlation()
+        slow_calls = correlation.get_slow_calls(SLOW_HTTP_CALL_THRESHOLD)
+        if not len(slow_calls):
+            return []
+        result = []
+        in_gc_pauses = slow_calls[correlation.gc_pause_times[slow_calls] > 0]
+        if len(in_gc_pauses):
+            worst = in_gc_pauses[correlation.gc_pause_times[in_gc_pauses].argmax()]
+            result.append(TimeCorrelationTip.HTTP_CALLS_IN_GC_PAUSES.format(
+                len(in_gc_pauses), len(slow_calls), SLOW_HTTP_CALL_THRESHOLD,
+                100 * correlation.gc_pause_times[in_gc_pauses].sum() / correlation.durations[in_gc_pauses].sum(),
+                correlation.calls[worst].url, correlation.calls[worst].start_time,
+                correlation.gc_pause_times[worst], correlation.durations[worst]))
+        if correlation.blocked_threads:
+            average = sum(correlation.blocked_threads) / len(correlation.blocked_threads)
+            javacores = correlation.javacores[slow_calls]
+            javacores, counts = np.unique(javacores[javacores >= 0], return_counts=True)
+            spike = max(1, TimeCorrelationTip.BLOCKED_THREADS_SPIKE * average)
+            spikes = [(javacore, count) for javacore, count in zip(javacores, counts)
+                      if correlation.blocked_threads[javacore] >= spike]
+            spikes.sort(key=lambda spike: correlation.blocked_threads[spike[0]], reverse=True)
+            for javacore, count in spikes[:TimeCorrelationTip.MAX_JAVACORE_TIPS]:
+                javacore_link = get_javacore_link(javacore_set, javacore_set.javacores[javacore].basefilename())
+                result.append(TimeCorrelationTip.HTTP_CALLS_NEAR_BLOCKED_THREADS.format(
+                    count, SLOW_HTTP_CALL_THRESHOLD, JAVACORE_CORRELATION_DISTANCE, javacore_link,
+                    correlation.blocked_threads[javacore], average))
+        return result
@@ -3,16 +3,34 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+import contextlib
+import functools
+import heapq
 import logging
+import multiprocessing
 import ntpath
+import os
+import re
 from datetime import datetime
-from pathlib import Path
-from typing import cast
-from xml.dom.minidom import Element, parseString
 
+import numpy as np
+from lxml import etree
 from tqdm import tqdm
 
+from javacore_analyser import gc_analytics
+from javacore_analyser.common_utils import get_checksum
+from javacore_analyser.properties import Properties
+from javacore_analyser.xml_sanitizer import INVALID_CHARACTER_REFERENCE, replace_invalid_character_references
+
 ROOT_CLOSING_TAG = "</verbosegc>"
+# The size of the part of the file read at once
+CHUNK_SIZE = 1024 * 1024
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+# The timestamps in the log have milliseconds
+TIMESTAMP_LENGTH = len("2023-04-25T11:04:13.857")
+ROOT_START_PATTERN = re.compile(rb"<verbosegc\b[^>]*>")
+GC_START_TAG = b"<gc-start "
+GC_START_PATTERN = re.compile(rb'<gc-start [^>]*?\btimestamp="([^"]*)"')
 GC_START = "gc-start"
 GC_END = "gc-end"
 MEM_INFO = "mem-info"
@@ -36,12 +54,95 @@ TENURE_FREE_AFTER = "tenure-free-after"
 TENURE_TOTAL = "tenure-total"
 
 
+def get_gc_parallelism(files_count):
+    parallelism = int(Properties.get_instance().get_property("gc_parallelism", 0))
+    if parallelism <= 0:
+        parallelism = os.cpu_count() or 1
+    # The processes of a pool, e.g. in manifest or compare mode, cannot start their own pools
+    if multiprocessing.current_process().daemon:
+        parallelism = 1
+    return max(1, min(parallelism, files_count))
+
+
+def get_chart_collects():
+    return int(Properties.get_instance().get_property("gc_chart_collects", 3000))
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _to_datetime64(value):
+    try:
+        return np.datetime64(value, "ms")
+    except ValueError:
+        return np.datetime64("NaT", "ms")
+
+
+def _first_in_groups(groups, values):
+    """
+    Returns the index of the lowest value in every group. The groups are sorted.
+    """
+    order = np.lexsort((values, groups))
+    first = np.flatnonzero(np.r_[True, groups[order][1:] != groups[order][:-1]])
+    return order[first]
+
+
+class GcTimeline:
+    """
+    The collects in NumPy columns, for the statistics of all the collects (see gc_analytics module) and for the chart.
+    """
+
+    def __init__(self, collects):
+        try:
+            self.timestamps = np.array([collect.start_time_str for collect in collects], dtype="datetime64[ms]")
+        except ValueError:
+            self.timestamps = np.array([_to_datetime64(collect.start_time_str) for collect in collects],
+                                       dtype="datetime64[ms]")
+        self.durations = np.array([collect.duration for collect in collects], dtype=np.float64)
+        for column in ("free_before", "free_after", "nursery_free_before", "nursery_free_after", "nursery_total",
+                       "tenure_free_before", "tenure_free_after", "tenure_total"):
+            setattr(self, column, np.array([_to_int(getattr(collect, column)) for collect in collects],
+                                           dtype=np.int64))
+
+    def __len__(self):
+        return len(self.durations)
+
+    def downsample(self, max_collects):
+        """
+        Returns the indexes of at most max_collects collects, in the time order, to show in the chart.
+        The time of the collects is divided into the intervals and the collects with the highest heap usage before
+        the collect, the lowest heap usage after the collect and the longest pause are kept from every interval,
+        so the peaks of the chart are kept.
+        All collects are returned if there are not more than max_collects of them or max_collects is 0.
+        """
+        if max_collects <= 0 or len(self) <= max_collects:
+            return np.arange(len(self))
+        times = self.timestamps.astype(np.int64)
+        valid = ~np.isnat(self.timestamps)
+        times = np.where(valid, times, times[valid].min() if valid.any() else 0)
+        times = times - times.min()
+        intervals = max(1, max_collects // 3)
+        groups = times * intervals // max(1, int(times.max()) + 1)
+        kept = np.concatenate((_first_in_groups(groups, self.free_before),
+                               _first_in_groups(groups, -self.free_after),
+                               _first_in_groups(groups, -self.durations)))
+        return np.unique(kept)
+
+
 class VerboseGcParser:
 
     def __init__(self):
         self.__file_paths = []
         self.__files = []
         self.__collects = []
+        self.__timeline = None
+        self.__summary = None
+        # The start of the time range of the collects of the last parse
+        self.__start_time = None
 
     def get_file_paths(self):
         return self.__file_paths
@@ -52,35 +153,130 @@ class VerboseGcParser:
     def get_collects(self):
         return self.__collects
 
+    def get_timeline(self):
+        """
+        Returns the collects in columns. The columns are created again when the collects changed.
+        """
+        collects = self.get_collects()
+        if self.__timeline is None or self.__timeline[0] is not collects or len(self.__timeline[1]) != len(collects):
+            self.__timeline = (collects, GcTimeline(collects))
+        return self.__timeline[1]
+
+    def get_summary(self):
+        """
+        Returns the statistics of the collects (see gc_analytics.summarise), computed again when the collects changed.
+        """
+        timeline = self.get_timeline()
+        if self.__summary is None or self.__summary[0] is not timeline:
+            self.__summary = (timeline, gc_analytics.summarise(timeline))
+        return self.__summary[1]
+
     def add_file(self, file):
         self.__file_paths.append(file)
 
     def parse_files(self, start_time=None, stop_time=None):
+        """
+        Parses the files in gc_parallelism processes. The collects of every file are merged by their start time.
+        """
         logging.info("Started parsing GC files")
-        for file_path in tqdm(self.__file_paths, desc="Parsing verbose gc", unit=" file"):
+        self.__start_time = start_time
+        files_collects = []
+        parallelism = get_gc_parallelism(len(self.__file_paths))
+        with multiprocessing.Pool(parallelism) if parallelism > 1 else contextlib.nullcontext() as pool:
+            if pool is None:
+                parsing = [functools.partial(VerboseGcFile, file_path, start_time, stop_time)
+                           for file_path in self.__file_paths]
+            else:
+                parsing = [pool.apply_async(VerboseGcFile, (file_path, start_time, stop_time)).get
+                           for file_path in self.__file_paths]
+            for file_path, parse in tqdm(zip(self.__file_paths, parsing), total=len(parsing),
+                                         desc="Parsing verbose gc", unit=" file"):
+                try:
+                    file = parse()
+                    self.__files.append(file)
+                    files_collects.append(self.__select_collects(file, start_time, stop_time))
+                except GcVerboseProcessingException as ex:
+                    logging.warning(f"{file_path} was omitted due to error: {ex}")
+        self.__collects.extend(heapq.merge(*files_collects, key=GcCollection.get_start_time))
+        logging.info("Finished parsing GC files")
+
+    def parse_added_files(self, file_paths, start_time=None, stop_time=None):
+        """
+        Parses the verbose gc files added after the other files were parsed, e.g. with the javacores appended
+        to the analysis, and selects the collects in the time range again from all the files. A file with the same
+        name as already parsed file is the log which grew since, so only the part added to it is parsed
+        (see VerboseGcFile.parse_added_bytes) and the collects which were already parsed are not added twice.
+        """
+        self.__start_time = start_time
+        files = {file.get_file_name(): file for file in self.__files}
+        names = {ntpath.basename(file_path) for file_path in file_paths}
+        for file_path in file_paths:
+            file = files.get(ntpath.basename(file_path))
             try:
-                collects_from_time_range = 0
-                file = VerboseGcFile(file_path)
-                self.__files.append(file)
-                collects = file.get_collects()
-                for collect in collects:
-                    time = collect.get_start_time()
-                    # If no time constraints, include all collects
-                    if start_time is None or stop_time is None:
-                        self.__collects.append(collect)
-                        collects_from_time_range += 1
-                    elif start_time <= time <= stop_time:
-                        self.__collects.append(collect)
-                        collects_from_time_range += 1
-                file.set_number_of_collects(collects_from_time_range)
+                if file is None:
+                    file = VerboseGcFile(file_path, start_time, stop_time)
+                    files[file.get_file_name()] = file
+                else:
+                    file.parse_added_bytes(file_path, start_time)
             except GcVerboseProcessingException as ex:
                 logging.warning(f"{file_path} was omitted due to error: {ex}")
-        logging.info("Finished parsing GC files")
+        self.__files = list(files.values())
+        self.__file_paths = [path for path in self.__file_paths if ntpath.basename(path) not in names] + \
+            list(file_paths)
+        self.__collects = list(heapq.merge(*[self.__select_collects(file, start_time, stop_time)
+                                             for file in self.__files], key=GcCollection.get_start_time))
+
+    def is_parsed(self, file_name):
+        """
+        Returns False if the file with the name was parsed without its end or without the collects started
+        in the time range of the last parse_added_files call, so the file must be added again.
+        """
+        for file in self.__files:
+            if file.get_file_name() == file_name:
+                return file.get_parsed_size() is not None and file.is_parsed_from(self.__start_time)
+        return True
+
+    @staticmethod
+    def __select_collects(file, start_time, stop_time):
+        """
+        Returns the collects of the file started in the time range sorted by the start time
+        and sets their number in the file.
+        """
+        # If no time constraints, include all collects
+        if start_time is None or stop_time is None:
+            collects = list(file.get_collects())
+        else:
+            collects = [collect for collect in file.get_collects()
+                        if start_time <= collect.get_start_time() <= stop_time]
+        file.set_number_of_collects(len(collects))
+        collects.sort(key=GcCollection.get_start_time)
+        return collects
 
     def get_xml(self, doc):
+        """
+        Returns the element with the statistics of the pauses of all the collects and at most gc_chart_collects
+        collects for the chart (see GcTimeline.downsample).
+        """
         element = doc.createElement(GC_COLLECTIONS)
-        for gcc in self.__collects:
-            element.appendChild(gcc.get_xml(doc))
+        timeline = self.get_timeline()
+        summary = self.get_summary()
+        if summary:
+            element.setAttribute("count", str(summary["count"]))
+            element.setAttribute("total-pause", str(round(summary["total"], 3)))
+            element.setAttribute("longest-pause", str(summary["longest"]))
+            element.setAttribute("longest-pause-time", summary["longest_start_time"])
+            for percentile, value in summary["percentiles"].items():
+                element.setAttribute(f"p{percentile}-pause", str(round(value, 3)))
+            element.setAttribute("window", str(summary["window"]))
+            element.setAttribute("max-pause-share", str(round(summary["max_pause_share"], 4)))
+            element.setAttribute("allocation-rate", str(round(summary["mean_allocation_rate"])))
+            if summary["occupancy_trend"] is not None:
+                element.setAttribute("occupancy-trend", str(round(summary["occupancy_trend"])))
+        indexes = timeline.downsample(get_chart_collects())
+        element.setAttribute("charted", str(len(indexes)))
+        collects = self.get_collects()
+        for i in indexes:
+            element.appendChild(collects[i].get_xml(doc))
         return element
 
 
@@ -105,7 +301,7 @@ class GcCollection:
     def get_start_time(self):
         if not self.__start_time:
             # example format: 2023-04-25T11:04:13.857
-            self.__start_time = datetime.strptime(self.start_time_str, '%Y-%m-%dT%H:%M:%S.%f')
+            self.__start_time = datetime.strptime(self.start_time_str, TIMESTAMP_FORMAT)
         return self.__start_time
 
     def display(self):
@@ -129,32 +325,360 @@ class GcCollection:
 
 class VerboseGcFile:
 
-    def __init__(self, path):
+    def __init__(self, path, start_time=None, stop_time=None):
+        """
+        Parses the verbose gc file. If start_time is set, only the part of the log with the collects started
+        after start_time (and before stop_time if set) is parsed, the other collects are only counted.
+        """
         self.__path = path
-        self.__doc = None
-        self.__root = None
+        self.__collects = ()
         self.__number_of_collects = 0
-        self.__total_number_of_collects = -1
-        self.__parse()
-
-    def __parse(self):
+        self.__total_number_of_collects = 0
+        # The log which grows is parsed again from the first top level element not parsed (see parse_added_bytes)
+        self.__start_time = None  # the collects started before were not parsed
+        self.__header_end = None  # the end of the root start tag
+        self.__resume_offset = None  # the offset where the next parse starts, None if the log cannot be resumed
+        self.__resume_collects = 0  # the number of the collects parsed before the resume offset
+        self.__resume_total = 0  # the number of all collects before the resume offset
+        self.__parsed_size = None  # the size of the file when it was parsed to the end, None if the end was not parsed
+        # The size and the checksum of the file when it was parsed, as the file can be removed later
+        self.__size = None
+        self.__checksum = None
+        self.__parse(start_time, stop_time)
+
+    def __parse(self, start_time, stop_time):
+        """
+        Parses the file with the pull parser, so the file is never held in memory: the collects are created
+        from the top level elements as they are read and the elements are removed from the tree.
+        The log which was truncated before the closing tag of the root element is closed.
+        """
+        try:
+            size = os.path.getsize(self.__path)
+            checksum = get_checksum(self.__path, 0, size)
+            window = self.__find_window(start_time, stop_time) if start_time is not None else None
+            header_end = self.__find_header_end() if window is None else None
+        except OSError as ex:
+            raise GcVerboseProcessingException() from ex
+        if window is None:
+            window_start, window_end, skipped_before, skipped_after = 0, None, 0, 0
+        else:
+            header_end, window_start, window_end, skipped_before, skipped_after = window
+        self.__start_time = start_time if window is not None else None
+        self.__collects = ()
+        self.__total_number_of_collects = skipped_before + skipped_after
+        ranges = [(0, header_end), (window_start, window_end if window_end is not None else size)] \
+            if window is not None else [(0, size)]
+        self.__parse_ranges(ranges, window_end is None)
+        self.__header_end = header_end
+        if header_end is None:
+            self.__resume_offset = None
+        elif window_end is not None:
+            # The rest of the log after the time range is parsed when the log is resumed
+            self.__resume_offset = window_end
+            self.__resume_collects = len(self.__collects)
+            self.__resume_total = self.__total_number_of_collects - skipped_after
+        else:
+            self.__resume_offset = max(header_end, window_start)
+            self.__resume_collects = 0
+            self.__resume_total = skipped_before
+            self.__set_resume_offset(size)
+        self.__parsed_size = size if window_end is None else None
+        self.__size, self.__checksum = size, checksum
+
+    def parse_added_bytes(self, path, start_time=None):
+        """
+        Parses the part of the log added since the log was parsed, e.g. the log which grows while the javacores
+        are collected in watch mode. The parsing starts at the last collect, which can be incomplete, so the work
+        does not grow with the size of the log. The collects started after the time range of the first parse
+        are all kept, so the time range can be extended without parsing the log again (see VerboseGcParser).
+        The whole log is parsed again if it is shorter than the parsed part, e.g. it was rotated, or if start_time
+        is before the time range of the parsed part.
+
+        Args:
+            path (str): The path of the log, e.g. its new copy
+            start_time (datetime): The start of the time range of the collects
+        """
+        self.__path = path
+        try:
+            size = os.path.getsize(path)
+        except OSError as ex:
+            raise GcVerboseProcessingException() from ex
+        if self.__resume_offset is None or size < self.__resume_offset or \
+                (self.__start_time is not None and (start_time is None or start_time < self.__start_time)):
+            logging.debug(f"Parsing {self.get_file_name()} again")
+            self.__parse(start_time, None)
+            return
+        if size == self.__parsed_size:
+            return
         try:
-            file = Path(self.__path)
-            xml_text = file.read_text()
-            xml_text = xml_text.replace("&#x1;", "?")
-            if ROOT_CLOSING_TAG not in xml_text:
-                xml_text = xml_text + ROOT_CLOSING_TAG
+            # Only the added bytes are read, the log is expected to grow by appending
+            checksum = get_checksum(path, self.__size, size, self.__checksum)
+        except OSError as ex:
+            raise GcVerboseProcessingException() from ex
+        collects, total = self.__collects, self.__total_number_of_collects
+        self.__collects = collects[:self.__resume_collects]
+        self.__total_number_of_collects = self.__resume_total
+        try:
+            self.__parse_ranges([(0, self.__header_end), (self.__resume_offset, size)], True)
+        except GcVerboseProcessingException:
+            # The log is parsed from the same offset when it grows again
+            self.__collects, self.__total_number_of_collects = collects, total
+            self.__parsed_size = size
+            self.__size, self.__checksum = size, checksum
+            raise
+        self.__set_resume_offset(size)
+        self.__parsed_size = size
+        self.__size, self.__checksum = size, checksum
+
+    def __parse_ranges(self, ranges, to_end):
+        """
+        Parses the parts of the file and adds their collects. The first part must have the root start tag.
+        If to_end is True, the last part is the end of the log and its last collect is kept even if it has no end.
+        """
+        parser = etree.XMLPullParser(events=("start", "end"))
+        depth = 0
+        root_closed = False
+        pending_collect = None
+        collects = list(self.__collects)
+        try:
+            for chunk in (chunk for start, end in ranges for chunk in self.__read_chunks(start, end)):
+                parser.feed(chunk)
+                for event, element in parser.read_events():
+                    if event == "start":
+                        depth += 1
+                        continue
+                    depth -= 1
+                    if depth == 0:
+                        root_closed = True
+                    elif depth == 1:
+                        pending_collect = self.__add_element(element, pending_collect, collects)
+                        # The processed top level elements are not needed any more
+                        element.clear()
+                        while element.getprevious() is not None:
+                            del element.getparent()[0]
+            if not root_closed:
                 logging.debug("adding closing tag")
-
-            self.__doc = parseString(xml_text)
-            self.__root = self.__doc.documentElement
+                parser.feed(ROOT_CLOSING_TAG)
+            parser.close()
         except Exception as ex:
             raise GcVerboseProcessingException() from ex
+        # The collect of the truncated log can miss its end. The collect without the end before the next collect
+        # is corrupted, as in the whole log
+        if pending_collect is not None and to_end:
+            collects.append(pending_collect)
+        self.__collects = tuple(collects)
+
+    def __set_resume_offset(self, size):
+        """
+        Sets the offset where the next parse of the log starts to the start of the last collect parsed,
+        which can be incomplete yet. The collect is parsed again with the part of the log added later.
+        """
+        try:
+            last_start = self.__find_last_gc_start(self.__resume_offset, size)
+        except OSError:
+            last_start = None
+        if last_start is None:
+            return
+        offset, timestamp = last_start
+        collects = self.__collects
+        # The collect without the end is kept in the truncated log
+        resume_collects = len(collects) - 1 if collects and collects[-1].start_time_str == timestamp \
+            else len(collects)
+        self.__resume_offset = offset
+        self.__resume_collects = resume_collects
+        self.__resume_total = self.__total_number_of_collects - 1
+
+    def __find_last_gc_start(self, start, end):
+        """
+        Finds the last gc-start element between start and end reading the file backwards from the end.
+
+        Returns:
+            the offset of the element and its timestamp, or None if there is no gc-start element
+        """
+        with open(self.__path, "rb") as f:
+            position = end
+            overlap = b""
+            while position > start:
+                chunk_start = max(start, position - CHUNK_SIZE)
+                f.seek(chunk_start)
+                chunk = f.read(position - chunk_start) + overlap
+                index = chunk.rfind(GC_START_TAG)
+                if index >= 0:
+                    f.seek(chunk_start + index)
+                    match = GC_START_PATTERN.match(f.read(CHUNK_SIZE))
+                    # The timestamp of the element which is being written is not known yet
+                    return (chunk_start + index, match.group(1).decode()) if match else None
+                overlap = chunk[:len(GC_START_TAG) - 1]
+                position = chunk_start
+        return None
+
+    def __find_header_end(self):
+        """
+        Returns the end of the root start tag, or None if the root tag is not found.
+        """
+        offset = 0
+        for chunk in self.__read_tags():
+            root = ROOT_START_PATTERN.search(chunk)
+            if root is not None:
+                return offset + root.end()
+            offset += len(chunk)
+        return None
+
+    def __find_window(self, start_time, stop_time):
+        """
+        Finds the part of the log with the collects started in the time range without parsing the log.
+        The log is scanned for the timestamps of gc-start elements, which are compared as the strings.
+        The collects are logged in the time order, so only the last timestamp in the chunk is checked
+        if the whole chunk is before the time range.
+        The timestamps are compared with the precision of the log, so the part can have the collects
+        on the boundaries of the time range which are filtered out after parsing.
+        If stop_time is None, the part ends with the log.
+
+        Returns:
+            the end of the root start tag, the start and the end of the part (None if it is the end of the file)
+            and the number of the collects before and after the part, or None if the root tag is not found
+        """
+        start_key = start_time.strftime(TIMESTAMP_FORMAT)[:TIMESTAMP_LENGTH].encode()
+        stop_key = stop_time.strftime(TIMESTAMP_FORMAT)[:TIMESTAMP_LENGTH].encode() if stop_time else None
+        header_end = None
+        window_start = None
+        window_end = None
+        skipped_before = 0
+        skipped_after = 0
+        offset = 0
+        for chunk in self.__read_tags():
+            position = 0
+            if header_end is None:
+                root = ROOT_START_PATTERN.search(chunk)
+                if root is None:
+                    offset += len(chunk)
+                    continue
+                header_end = offset + root.end()
+                position = root.end()
+            if window_start is None:
+                last_start = GC_START_PATTERN.match(chunk, max(0, chunk.rfind(GC_START_TAG)))
+                if last_start is None or last_start.group(1) < start_key:
+                    skipped_before += chunk.count(GC_START_TAG, position)
+                    offset += len(chunk)
+                    continue
+                for gc_start in GC_START_PATTERN.finditer(chunk, position):
+                    if gc_start.group(1) >= start_key:
+                        window_start = offset + gc_start.start()
+                        position = gc_start.start()
+                        break
+                    skipped_before += 1
+            if stop_key is None:
+                break
+            if window_end is None:
+                for gc_start in GC_START_PATTERN.finditer(chunk, position):
+                    if gc_start.group(1) > stop_key:
+                        window_end = offset + gc_start.start()
+                        position = gc_start.start()
+                        break
+            if window_end is not None:
+                skipped_after += chunk.count(GC_START_TAG, position)
+            offset += len(chunk)
+        if header_end is None:
+            return None
+        if window_start is None:
+            window_start = offset
+        return header_end, window_start, window_end, skipped_before, skipped_after
+
+    def __read_tags(self):
+        """
+        Reads the file in chunks which end before the last tag in the chunk, so no tag is split between the chunks.
+        """
+        rest = b""
+        with open(self.__path, "rb") as f:
+            while chunk := f.read(CHUNK_SIZE):
+                chunk = rest + chunk
+                split = chunk.rfind(b"<")
+                if split == 0:
+                    # The tag is not complete yet
+                    rest = chunk
+                    continue
+                if split < 0:
+                    split = len(chunk)
+                rest = chunk[split:]
+                yield chunk[:split]
+        yield rest
+
+    def __read_chunks(self, start=0, end=None):
+        """
+        Reads the part of the file from start to end in chunks with the invalid character references replaced.
+        The end of the chunk which can be the beginning of the reference is read with the next chunk.
+        """
+        rest = b""
+        with open(self.__path, "rb") as f:
+            f.seek(start)
+            while chunk := f.read(CHUNK_SIZE if end is None else min(CHUNK_SIZE, end - f.tell())):
+                chunk = rest + chunk
+                split = chunk.find(b"&", max(0, len(chunk) - len(INVALID_CHARACTER_REFERENCE) + 1))
+                if split < 0:
+                    split = len(chunk)
+                rest = chunk[split:]
+                yield replace_invalid_character_references(chunk[:split])
+        yield replace_invalid_character_references(rest)
+
+    def __add_element(self, element, pending_collect, collects):
+        """
+        Adds the top level element of the log to the collects.
+
+        Returns:
+            the collect which was started and not ended yet
+        """
+        tag = etree.QName(element).localname
+        try:
+            if tag == GC_START:
+                if pending_collect is not None:
+                    # The collect started before the end of the previous one
+                    pending_collect = None
+                    raise GcVerboseCorruptedLogException()
+                self.__total_number_of_collects += 1
+                collect = GcCollection()
+                collect.start_time_str = element.get(TIMESTAMP, "")
+                mem_info = element.find(".//{*}" + MEM_INFO)
+                collect.free_before = mem_info.get(FREE, "")
+                nursery_mem = self.__get_mem_by_type(mem_info, NURSERY)
+                tenure_mem = self.__get_mem_by_type(mem_info, TENURE)
+                if nursery_mem is not None:
+                    collect.nursery_free_before = nursery_mem.get(FREE, "")
+                    collect.nursery_total = nursery_mem.get("total", "")
+                if tenure_mem is not None:
+                    collect.tenure_free_before = tenure_mem.get(FREE, "")
+                    collect.tenure_total = tenure_mem.get("total", "")
+                return collect
+            if tag == GC_END and pending_collect is not None:
+                collect = pending_collect
+                pending_collect = None
+                collect.duration = float(element.get(DURATION, ""))
+                mem_info = element.find(".//{*}" + MEM_INFO)
+                collect.free_after = mem_info.get(FREE, "")
+                nursery_mem = self.__get_mem_by_type(mem_info, NURSERY)
+                tenure_mem = self.__get_mem_by_type(mem_info, TENURE)
+                if nursery_mem is not None:
+                    collect.nursery_free_after = nursery_mem.get(FREE, "")
+                    if not collect.nursery_total:
+                        collect.nursery_total = nursery_mem.get("total", "")
+                if tenure_mem is not None:
+                    collect.tenure_free_after = tenure_mem.get(FREE, "")
+                    if not collect.tenure_total:
+                        collect.tenure_total = tenure_mem.get("total", "")
+                collects.append(collect)
+        except Exception as ex:
+            logging.error(ex)
+        return pending_collect
 
     def get_file_name(self):
         head, tail = ntpath.split(self.__path)
         return tail or ntpath.basename(head)
 
+    def get_fingerprint(self):
+        """
+        Returns the name, the size and the checksum of the file when it was parsed.
+        """
+        return [self.get_file_name(), self.__size, self.__checksum]
+
     '''
     gets the number of gc collections in this VerboseGcFile
     that occur in the time frame defined by the first and last javacore time.
@@ -171,76 +695,33 @@ class VerboseGcFile:
     regardless of the time when tey occurred with regards to the javacores
     '''
     def get_total_number_of_collects(self):
-        if self.__total_number_of_collects < 0:
-            self.get_collects()
-        if self.__total_number_of_collects < 0:
-            self.__total_number_of_collects = 0
         return self.__total_number_of_collects
 
-    def __get_mem_by_type(self, mem_info, mem_type):
-        for mem in mem_info.getElementsByTagName(MEM):
-            if mem.parentNode == mem_info and mem.getAttribute(TYPE) == mem_type:
+    def get_parsed_size(self):
+        """
+        Returns the size of the file when it was parsed to its end, None if the end was not parsed.
+        """
+        return self.__parsed_size
+
+    def is_parsed_from(self, start_time):
+        """
+        Returns True if all the collects started after start_time were parsed.
+        """
+        return self.__start_time is None or (start_time is not None and start_time >= self.__start_time)
+
+    @staticmethod
+    def __get_mem_by_type(mem_info, mem_type):
+        for mem in mem_info.iterchildren("{*}" + MEM):
+            if mem.get(TYPE) == mem_type:
                 return mem
         return None
 
     def get_collects(self):
-        collects = []
-        self.__total_number_of_collects = 0
-        if self.__root is None:
-            return collects
-
-        children = self.__root.childNodes
-        i = 0
-        while i < len(children):
-            child = children[i]
-            i += 1
-            if child.__class__ is not Element:
-                continue
-            child_element = cast(Element, child)
-            if child_element.tagName == GC_START:
-                try:
-                    self.__total_number_of_collects += 1
-                    start_tag = child_element
-                    collect = GcCollection()
-                    collect.start_time_str = start_tag.getAttribute(TIMESTAMP)
-                    mem_info = start_tag.getElementsByTagName(MEM_INFO)[0]
-                    collect.free_before = mem_info.getAttribute(FREE)
-                    nursery_mem = self.__get_mem_by_type(mem_info, NURSERY)
-                    tenure_mem = self.__get_mem_by_type(mem_info, TENURE)
-                    if nursery_mem is not None:
-                        collect.nursery_free_before = nursery_mem.getAttribute(FREE)
-                        collect.nursery_total = nursery_mem.getAttribute("total")
-                    if tenure_mem is not None:
-                        collect.tenure_free_before = tenure_mem.getAttribute(FREE)
-                        collect.tenure_total = tenure_mem.getAttribute("total")
-                    end_tag = None
-                    while end_tag is None and i < len(children):
-                        child = children[i]
-                        i += 1
-                        if child.__class__ is not Element:
-                            continue
-                        child_element = cast(Element, child)
-                        if child_element.tagName == GC_START:
-                            raise GcVerboseCorruptedLogException()
-                        if child_element.tagName == GC_END:
-                            end_tag = child_element
-                            collect.duration = float(end_tag.getAttribute(DURATION))
-                            mem_info = end_tag.getElementsByTagName(MEM_INFO)[0]
-                            collect.free_after = mem_info.getAttribute(FREE)
-                            nursery_mem = self.__get_mem_by_type(mem_info, NURSERY)
-                            tenure_mem = self.__get_mem_by_type(mem_info, TENURE)
-                            if nursery_mem is not None:
-                                collect.nursery_free_after = nursery_mem.getAttribute(FREE)
-                                if not collect.nursery_total:
-                                    collect.nursery_total = nursery_mem.getAttribute("total")
-                            if tenure_mem is not None:
-                                collect.tenure_free_after = tenure_mem.getAttribute(FREE)
-                                if not collect.tenure_total:
-                                    collect.tenure_total = tenure_mem.getAttribute("total")
-                    collects.append(collect)
-                except Exception as ex:
-                    logging.error(ex)
-        return collects
+        """
+        Returns the collects parsed once with the file. If the file was parsed for the time range, the collects
+        started within the same millisecond as the start or the stop time are included too.
+        """
+        return self.__collects
 
 
 class GcVerboseProcessingException(Exception):
@@ -0,0 +1,157 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""
+Data files for the virtualized tables of the main report page.
+
+When a table has more rows than virtual_table_threshold property, the xsl does not render its rows. Instead, the rows
+are written to a compact data file in the tables directory of the report and data/jquery/virtual-table.js renders
+only the current page of them. Sorting and filtering are done on the data arrays.
+The data files are javascript, not json, because browsers do not allow fetching files for the reports opened
+from the local disk.
+"""
+
+import json
+import logging
+import os
+import shutil
+from datetime import datetime
+
+from javacore_analyser.properties import Properties
+from javacore_analyser.report_compression import compress_report_file
+from javacore_analyser.stack_trace import StackTrace
+from javacore_analyser.stack_trace_table import StackTraceTable
+
+VIRTUAL_TABLES_DIR = "tables"
+ALL_THREADS = "all_threads"
+ALL_CODE = "all_code"
+STACK_TRACES = "stack_traces"
+
+DEFAULT_VIRTUAL_TABLE_THRESHOLD = 5000
+
+# Number of the digits after decimal point in the numbers stored in the data files
+PRECISION = 4
+
+
+def get_virtual_table_threshold():
+    return Properties.get_instance().get_property("virtual_table_threshold", DEFAULT_VIRTUAL_TABLE_THRESHOLD)
+
+
+def is_virtual_table(rows_count):
+    """
+    Returns True if the table with given number of rows should be virtualized.
+    Threshold 0 turns the virtualized tables off.
+    """
+    threshold = get_virtual_table_threshold()
+    if isinstance(threshold, bool) or not isinstance(threshold, int):
+        logging.warning(f"Invalid virtual_table_threshold {threshold}. "
+                        f"Using {DEFAULT_VIRTUAL_TABLE_THRESHOLD}")
+        threshold = DEFAULT_VIRTUAL_TABLE_THRESHOLD
+    return threshold > 0 and rows_count > threshold
+
+
+def write_table_data(output_dir, name, data):
+    """
+    Writes the data of the table to <output_dir>/tables/<name>.js.
+    """
+    tables_dir = os.path.join(output_dir, VIRTUAL_TABLES_DIR)
+    os.makedirs(tables_dir, exist_ok=True)
+    file = os.path.join(tables_dir, name + ".js")
+    with open(file, "w", encoding="utf-8") as f:
+        f.write("virtualTables.register(" + json.dumps(name) + ", ")
+        json.dump(data, f, separators=(",", ":"))
+        f.write(");\n")
+    compress_report_file(file)
+    logging.info(f"Written data of {name} table to {file}")
+
+
+def get_threads_rows(javacore_set, stack_trace_table):
+    """
+    Returns the rows of All Threads table. Each row is:
+    [name, hash, has drill down, thread address, total cpu, cpu percentage, average memory, average stack depth,
+     blocking threads, blocker threads, classification, snapshots]
+    where the threads are [id, hash, name] lists, classification is [value, occurrences] list and
+    snapshots are [javacore index, stack index] lists.
+    """
+    javacore_indexes = {id(javacore): i for i, javacore in enumerate(javacore_set.javacores)}
+    skip_boring = Properties.get_instance().skip_boring()
+    rows = []
+    for thread in javacore_set.threads:
+        classification = thread.get_classification() or {}
+        rows.append([
+            thread.name + " (" + str(thread.id) + ")",
+            thread.get_hash(),
+            thread.is_interesting() or not skip_boring,
+            thread.thread_address,
+            round(thread.get_total_cpu(), PRECISION),
+            round(thread.get_cpu_percentage_usage(), PRECISION),
+            round(thread.get_avg_mem(), PRECISION),
+            round(thread.avg_java_stack_trace_depth(), PRECISION),
+            [[t.id, t.get_hash(), t.name] for t in thread.get_blocking_threads()],
+            [[t.id, t.get_hash(), t.name] for t in thread.get_blocker_threads()],
+            [[key, value] for key, value in classification.items()],
+            [[javacore_indexes.get(id(s.javacore), -1), stack_trace_table.get_index(s.stack_trace)]
+             for s in thread.thread_snapshots]
+        ])
+    return rows
+
+
+def get_code_rows(javacore_set, stack_trace_table):
+    """
+    Returns the rows of All Code table. Each row is:
+    [stack index, total cpu, cpu percentage, average memory, threads]
+    where the threads are [id, hash, name] lists.
+    """
+    rows = []
+    for code in javacore_set.stacks:
+        rows.append([
+            stack_trace_table.get_index(code.get_stack_trace()),
+            round(code.get_total_cpu(), PRECISION),
+            round(code.get_cpu_percentage_usage(), PRECISION),
+            round(code.get_avg_mem(), PRECISION),
+            [[t.id, t.get_hash(), t.name] for t in code.get_threads()]
+        ])
+    return rows
+
+
+def get_virtual_tables(javacore_set):
+    """
+    Returns the names of the tables of the report which are virtualized.
+    """
+    tables = []
+    if 'javacores' not in javacore_set.data_types:
+        return tables
+    if is_virtual_table(len(javacore_set.threads.snapshot_collections)):
+        tables.append(ALL_THREADS)
+    if is_virtual_table(len(javacore_set.stacks.snapshot_collections)):
+        tables.append(ALL_CODE)
+    return tables
+
+
+def write_virtual_tables(javacore_set, output_dir):
+    """
+    Writes the data files of the virtualized tables and the stack traces they reference.
+    """
+    tables_dir = os.path.join(output_dir, VIRTUAL_TABLES_DIR)
+    if os.path.isdir(tables_dir):
+        shutil.rmtree(tables_dir)  # data files left by the previous report generated in the same directory
+    tables = get_virtual_tables(javacore_set)
+    if not tables:
+        return
+    stack_trace_table = StackTraceTable()
+    meta = {
+        "javacore_count": len(javacore_set.javacores),
+        "use_ml": bool(javacore_set.use_ml),
+        "stack_comparison_depth": StackTrace.STACK_COMPARISON_DEPTH,
+        "timestamps": [datetime.fromtimestamp(javacore.timestamp).strftime('%d-%m-%y %H:%M:%S')
+                       for javacore in javacore_set.javacores],
+    }
+    if ALL_THREADS in tables:
+        write_table_data(output_dir, ALL_THREADS,
+                         {"meta": meta, "rows": get_threads_rows(javacore_set, stack_trace_table)})
+    if ALL_CODE in tables:
+        write_table_data(output_dir, ALL_CODE,
+                         {"meta": meta, "rows": get_code_rows(javacore_set, stack_trace_table)})
+    write_table_data(output_dir, STACK_TRACES, {"rows": stack_trace_table.get_rows(StackTrace.TRUNCATION_DEPTH)})
@@ -0,0 +1,58 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""
+Removal of the characters which are not allowed in the report xml from the analysed data.
+
+The characters are removed in a single pass over the text. str.translate is the fastest for the ASCII text,
+for which CPython has a fast path, and the compiled regular expression for the other text. Both are much faster
+than str.replace called for each character on the large texts, e.g. the content of the HTTP calls.
+"""
+
+import re
+
+# The control characters other than tab, line feed and carriage return are not allowed in XML 1.0
+INVALID_XML_CHARACTERS = "".join(chr(code_point) for code_point in range(0x20) if code_point not in (0x09, 0x0A, 0x0D))
+# The start of heading character in the thread names is shown as text
+SOH = "\x01"
+SOH_TEXT = "[SOH]"
+# The character reference written by some JVMs to verbose gc logs. It is not allowed in XML 1.0
+INVALID_CHARACTER_REFERENCE = b"&#x1;"
+INVALID_CHARACTER_REFERENCE_REPLACEMENT = b"?"
+
+INVALID_XML_CHARACTERS_TABLE = str.maketrans(dict.fromkeys(INVALID_XML_CHARACTERS))
+INVALID_XML_CHARACTERS_PATTERN = re.compile("[" + re.escape(INVALID_XML_CHARACTERS) + "]")
+# SOH is allowed in the javacore text, as it is replaced in the thread names
+INVALID_JAVACORE_BYTES_PATTERN = re.compile(b"[" + re.escape(INVALID_XML_CHARACTERS.replace(SOH, "").encode()) + b"]")
+
+
+def remove_invalid_xml_characters(text):
+    """
+    Returns the text without the characters which are not allowed in XML.
+    """
+    if text.isascii():
+        return text.translate(INVALID_XML_CHARACTERS_TABLE)
+    return INVALID_XML_CHARACTERS_PATTERN.sub("", text)
+
+
+def has_invalid_javacore_bytes(data):
+    """
+    Returns True if the bytes of the javacore text contain a character which is not allowed in XML other than SOH.
+    """
+    return INVALID_JAVACORE_BYTES_PATTERN.search(data) is not None
+
+
+def replace_soh(thread_name):
+    """
+    Returns the thread name with SOH characters replaced by [SOH] text.
+    """
+    return thread_name.replace(SOH, SOH_TEXT)
+
+
+def replace_invalid_character_references(data):
+    """
+    Returns the bytes of the verbose gc log with the invalid character references replaced by question marks.
+    """
+    return data.replace(INVALID_CHARACTER_REFERENCE, INVALID_CHARACTER_REFERENCE_REPLACEMENT)
@@ -0,0 +1,67 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+import gzip
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+
+from javacore_analyser.analysis_model import MODEL_FORMAT_VERSION, get_model_file, load_model, save_model, \
+    update_model
+from javacore_analyser.exceptions import IncompatibleModelError
+from javacore_analyser.javacore_set import JavacoreSet
+from javacore_analyser.properties import Properties
+from javacore_analyser.report_assets import get_assets_version
+
+
+class TestAnalysisModel(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        javacores_path = os.getcwd() + os.sep + 'test' + os.sep + 'data' + os.sep + 'javacores'
+        cls.javacore_set = JavacoreSet.create(javacores_path)
+        cls.javacore_set.generate_tips()
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.dir = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_save_and_load_model(self):
+        save_model(self.javacore_set, self.dir)
+        self.assertEqual(os.listdir(self.dir), [os.path.basename(get_model_file(self.dir))])
+        header, javacore_set = load_model(self.dir)
+        self.assertEqual(header["format_version"], MODEL_FORMAT_VERSION)
+        self.assertEqual(header["tool_version"], get_assets_version())
+        self.assertEqual(javacore_set.files, self.javacore_set.files)
+        self.assertEqual(javacore_set.tips, self.javacore_set.tips)
+        self.assertEqual(len(list(javacore_set.threads)), len(list(self.javacore_set.threads)))
+        self.assertEqual(len(javacore_set.blocked_snapshots), len(self.javacore_set.blocked_snapshots))
+        self.assertEqual([vgc.get_total_number_of_collects() for vgc in javacore_set.gc_parser.get_files()],
+                         [vgc.get_total_number_of_collects() for vgc in self.javacore_set.gc_parser.get_files()])
+
+    def test_load_missing_model(self):
+        with self.assertRaises(FileNotFoundError):
+            load_model(self.dir)
+
+    def test_load_incompatible_model(self):
+        with gzip.open(get_model_file(self.dir), "wb") as f:
+            pickle.dump({"format_version": MODEL_FORMAT_VERSION + 1}, f)
+        with self.assertRaises(IncompatibleModelError):
+            load_model(self.dir)
+
+    def test_update_model(self):
+        save_model(self.javacore_set, self.dir)
+        header, javacore_set = load_model(self.dir)
+        javacore_set.ai_tips = "saved recommendations"
+        with mock.patch.dict(Properties.get_instance().properties, {"use_ml": False, "use_ai": False}):
+            self.assertEqual(update_model(javacore_set, header), [])
+            self.assertEqual(javacore_set.ai_tips, "")
+            header["tool_version"] = "0.0.0"
+            self.assertEqual(update_model(javacore_set, header), ["tips"])
+        self.assertEqual(javacore_set.tips, self.javacore_set.tips)
@@ -0,0 +1,133 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from javacore_analyser.analysis_store import AnalysisStore
+from javacore_analyser.javacore import Javacore
+from javacore_analyser.javacore_set import JavacoreSet
+from javacore_analyser.stack_trace import StackTrace
+from javacore_analyser.stack_trace_element import StackTraceElement
+from javacore_analyser.stack_trace_kind import StackTraceKind
+from javacore_analyser.thread_snapshot import ThreadSnapshot
+from javacore_analyser.verbose_gc import GcCollection
+
+START = datetime(2026, 1, 5, 10, 0, 0)
+SOCKET_READ = "java/net/SocketInputStream.read(SocketInputStream.java:127)"
+SYSTEM_EXIT = "java/lang/System.exit(System.java:380)"
+
+
+def create_stack(*lines):
+    stack_trace = StackTrace()
+    for line in lines:
+        element = StackTraceElement()
+        element.kind = StackTraceKind.JAVA
+        element.line = line + "\n"
+        stack_trace.append(element)
+    return stack_trace
+
+
+def create_snapshot(javacore, name, thread_id, state, stack_trace, blocker_name=None):
+    snapshot = ThreadSnapshot()
+    snapshot.javacore = javacore
+    snapshot.name = name
+    snapshot.thread_id = thread_id
+    snapshot.thread_address = "0x" + thread_id
+    snapshot.state = state
+    snapshot.stack_trace = stack_trace
+    snapshot.blocker_name = blocker_name
+    javacore.snapshots.append(snapshot)
+    return snapshot
+
+
+def create_collect(start_time, duration):
+    collect = GcCollection()
+    collect.start_time_str = start_time
+    collect.duration = duration
+    return collect
+
+
+def create_javacore_set():
+    javacore_set = JavacoreSet("")
+    for i in range(3):
+        javacore = Javacore()
+        javacore.javacore_set = javacore_set
+        javacore.filename = f"javacore.20260105.10000{i}.1.000{i}.txt"
+        javacore.datetime = START.replace(minute=i)
+        javacore.timestamp = javacore.datetime.timestamp()
+        javacore.number_of_cpus = "4"
+        create_snapshot(javacore, "Reader", "0x1", "R", create_stack(SOCKET_READ, "a/B.c(B.java:1)"))
+        create_snapshot(javacore, "Lock owner", "0x2", "R", create_stack("a/B.c(B.java:1)"))
+        create_snapshot(javacore, "Waiter", "0x3", "B", create_stack("a/B.d(B.java:2)"), "Lock owner")
+        if i == 2:
+            create_snapshot(javacore, "main", "0x4", "R", create_stack(SYSTEM_EXIT, "a/Main.main(Main.java:3)"))
+        javacore_set.javacores.append(javacore)
+    javacore_set.populate_snapshot_collections()
+    javacore_set.sort_snapshots()
+    return javacore_set
+
+
+class TestAnalysisStore(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.javacore_set = create_javacore_set()
+        self.collects = [create_collect("2026-01-05T10:00:30.000", 1500.0),
+                         create_collect("2026-01-05T10:01:30.000", 2500.0),
+                         create_collect("2026-01-05T10:01:40.000", 20.0)]
+        self.get_collects_patch = mock.patch.object(self.javacore_set.gc_parser, "get_collects",
+                                                    return_value=self.collects)
+        self.get_collects_patch.start()
+        self.store = AnalysisStore(os.path.join(self.temp_dir.name, "analysis.db"))
+        self.store.write(self.javacore_set)
+
+    def tearDown(self):
+        self.store.close()
+        self.get_collects_patch.stop()
+        self.temp_dir.cleanup()
+
+    def count(self, table):
+        return self.store.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def test_write(self):
+        self.assertEqual(self.count("javacores"), 3)
+        self.assertEqual(self.count("threads"), 4)
+        self.assertEqual(self.count("snapshots"), 10)
+        # the frames and the stacks are written once
+        self.assertEqual(self.count("frames"), 5)
+        self.assertEqual(self.count("stacks"), 4)
+        self.assertEqual(self.count("gc_collections"), 3)
+        snapshot = next(self.store.iter_snapshots(thread_name="Reader"))
+        self.assertEqual(self.store.get_stack(snapshot["stack_id"]), [("java", SOCKET_READ), ("java", "a/B.c(B.java:1)")])
+
+    def test_update(self):
+        self.assertTrue(self.store.is_current(self.javacore_set))
+        self.assertFalse(self.store.update(self.javacore_set))
+        self.javacore_set.use_ml = True
+        self.assertTrue(self.store.update(self.javacore_set))
+
+    def test_find_threads_in_frame(self):
+        threads = self.store.find_threads_in_frame("SocketInputStream.read")
+        self.assertEqual([(thread["name"], thread["snapshots"]) for thread in threads], [("Reader", 3)])
+        threads = self.store.find_threads_in_frame("B.c", START.replace(minute=1), START.replace(minute=2))
+        self.assertEqual([(thread["name"], thread["snapshots"]) for thread in threads],
+                         [("Reader", 2), ("Lock owner", 2)])
+        self.assertEqual(self.store.find_threads_in_frame("no/such/Frame"), [])
+
+    def test_iter_snapshots(self):
+        snapshots = list(self.store.iter_snapshots(state="B", start=START.replace(minute=1)))
+        self.assertEqual([snapshot["name"] for snapshot in snapshots], ["Waiter", "Waiter"])
+
+    def test_iter_blockers(self):
+        blockers = [(blocker["name"], blocker["blocked_threads"], blocker["blocked_snapshots"])
+                    for blocker in self.store.iter_blockers()]
+        self.assertEqual(blockers, [("Lock owner", 1, 3)])
+
+    def test_iter_gc_collections(self):
+        collects = list(self.store.iter_gc_collections(START.replace(minute=1), min_duration=100))
+        self.assertEqual([collect["duration"] for collect in collects], [2500.0])
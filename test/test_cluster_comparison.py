@@ -0,0 +1,100 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from javacore_analyser import cluster_comparison
+from javacore_analyser.properties import Properties
+from javacore_analyser.stack_trace import StackTrace
+from javacore_analyser.stack_trace_element import StackTraceElement
+
+
+def create_stack(*lines):
+    stack_trace = StackTrace()
+    for line in lines:
+        element = StackTraceElement()
+        element.line = line
+        stack_trace.append(element)
+    return stack_trace
+
+
+def create_summary(name, snapshots, stacks, pools, blocked_threads=0):
+    return {"name": name, "javacores": 2, "threads": 10, "snapshots": snapshots, "blocked_threads": blocked_threads,
+            "blockers": 0, "cpu": 1.0,
+            "stacks": {signature: {"frames": [signature], "snapshots": count, "threads": 1, "cpu": 0.0}
+                       for signature, count in stacks.items()},
+            "pools": {name: {"threads": 2, "snapshots": 4, "blocked": blocked, "cpu": 0.5}
+                      for name, blocked in pools.items()}}
+
+
+class TestClusterComparison(unittest.TestCase):
+
+    def test_stack_signature(self):
+        long_stack = ["a", "b", "c", "d", "e", "f"]
+        stacks = [create_stack(*long_stack), create_stack(*long_stack[:5], "other"), create_stack(*long_stack[:5]),
+                  create_stack("a", "b"), create_stack("a", "x"), create_stack()]
+        for first in stacks:
+            for second in stacks:
+                self.assertEqual(cluster_comparison.get_stack_signature(first) ==
+                                 cluster_comparison.get_stack_signature(second), first.equals(second))
+
+    def test_pool_name(self):
+        self.assertEqual(cluster_comparison.get_pool_name("WebContainer : 5"), "WebContainer")
+        self.assertEqual(cluster_comparison.get_pool_name("pool-1-thread-7"), "pool-1-thread")
+        self.assertEqual(cluster_comparison.get_pool_name("Default Executor-thread-12"), "Default Executor-thread")
+        self.assertEqual(cluster_comparison.get_pool_name("main"), "main")
+        self.assertEqual(cluster_comparison.get_pool_name("42"), "42")
+
+    def test_find_outlier(self):
+        self.assertEqual(cluster_comparison.find_outlier([1, 1, 9, 1]), 2)
+        self.assertIsNone(cluster_comparison.find_outlier([5, 4, 6, 5]))
+        self.assertIsNone(cluster_comparison.find_outlier([0, 0, 0]))
+        self.assertIsNone(cluster_comparison.find_outlier([0, 0.5, 0], 1))
+        self.assertIsNone(cluster_comparison.find_outlier([3]))
+
+    def test_merge_summaries(self):
+        summaries = [create_summary("jvm1", 100, {"s1": 10, "s2": 50}, {"WebContainer": 0}),
+                     create_summary("jvm2", 100, {"s1": 10, "s2": 50}, {"WebContainer": 0}),
+                     create_summary("jvm3", 200, {"s1": 20, "s2": 10, "hot": 120}, {"WebContainer": 6, "Other": 0})]
+        stacks, pools = cluster_comparison.merge_summaries(summaries)
+        self.assertEqual([stack["signature"] for stack in stacks], ["hot", "s2", "s1"])
+        self.assertEqual(stacks[0]["outlier"], 2)
+        self.assertIsNone(stacks[0]["members"][0])
+        self.assertEqual(stacks[0]["members"][2]["share"], 60)
+        self.assertIsNone(stacks[2]["outlier"])
+        self.assertEqual([(pool["name"], pool["outlier"]) for pool in pools], [("Other", None), ("WebContainer", 2)])
+
+    def test_member_name(self):
+        with mock.patch.dict(Properties.get_instance().properties, {"separator": ";"}):
+            self.assertEqual(cluster_comparison.get_member_name("cluster/jvm1/", set()), "jvm1")
+            self.assertEqual(cluster_comparison.get_member_name("cluster/jvm1.tar.gz", set()), "jvm1")
+            self.assertEqual(cluster_comparison.get_member_name("other/jvm1", {"jvm1"}), "jvm1_2")
+
+    def test_compare_collections(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        properties = {"use_ml": False, "use_ai": False, "analysis_store": "", "separator": ";",
+                      "comparison_parallelism": 1}
+        try:
+            with mock.patch.dict(Properties.get_instance().properties, properties):
+                inputs = []
+                for name in ("jvm1", "jvm2"):
+                    inputs.append(os.path.join(temp_dir.name, name))
+                    shutil.copytree(os.path.join("test", "data", "quotationMarks"), inputs[-1])
+                output_dir = os.path.join(temp_dir.name, "report")
+                summaries = cluster_comparison.compare_collections(inputs, output_dir)
+            self.assertEqual([(summary["name"], summary["javacores"]) for summary in summaries],
+                             [("jvm1", 2), ("jvm2", 2)])
+            self.assertEqual(summaries[0]["stacks"], summaries[1]["stacks"])
+            with open(os.path.join(output_dir, "index.html")) as f:
+                self.assertIn("Javacore Analyser Cluster Comparison", f.read())
+        finally:
+            temp_dir.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from javacore_analyser import collection_diff
+from javacore_analyser.analysis_model import save_model
+from javacore_analyser.javacore_analyser_batch import generate_javecore_set_data, get_input_files
+from javacore_analyser.properties import Properties
+
+
+def create_summary(name, snapshots, stacks, pools):
+    return {"name": name, "javacores": 2, "threads": 10, "snapshots": snapshots, "blocked_threads": 0,
+            "blockers": 0, "cpu": 1.0,
+            "stacks": {signature: {"frames": [signature], "snapshots": count, "threads": 1, "cpu": float(count)}
+                       for signature, count in stacks.items()},
+            "pools": {name: {"threads": threads, "snapshots": 4, "blocked": 0, "cpu": 0.5}
+                      for name, threads in pools.items()}}
+
+
+class TestCollectionDiff(unittest.TestCase):
+    QUOTATION_MARKS_PATH = os.path.join("test", "data", "quotationMarks")
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.properties_patch = mock.patch.dict(Properties.get_instance().properties,
+                                                {"use_ml": False, "use_ai": False,
+                                                 "analysis_store": "", "separator": ";",
+                                                 "comparison_parallelism": 1})
+        self.properties_patch.start()
+
+    def tearDown(self):
+        self.properties_patch.stop()
+        self.temp_dir.cleanup()
+
+    def test_diff_summaries(self):
+        before = create_summary("before", 10, {"same": 5, "gone": 3, "grew": 2}, {"WebContainer": 2, "Old": 1})
+        after = create_summary("after", 20, {"same": 10, "new": 2, "grew": 8}, {"WebContainer": 5})
+        stacks, pools = collection_diff.diff_summaries(before, after)
+        self.assertEqual([(stack["signature"], stack["status"], stack["share_delta"]) for stack in stacks],
+                         [("gone", collection_diff.GONE, -30), ("grew", collection_diff.CHANGED, 20),
+                          ("new", collection_diff.NEW, 10), ("same", collection_diff.CHANGED, 0)])
+        self.assertEqual(stacks[1]["cpu_delta"], 6)
+        self.assertEqual([(pool["name"], pool["status"], pool["threads_delta"]) for pool in pools],
+                         [("WebContainer", collection_diff.CHANGED, 3), ("Old", collection_diff.GONE, -1)])
+
+    def test_diff_collections(self):
+        # the before side is taken from the saved analysis model
+        report_dir = os.path.join(self.temp_dir.name, "before")
+        os.mkdir(report_dir)
+        save_model(generate_javecore_set_data(get_input_files(self.QUOTATION_MARKS_PATH)), report_dir)
+        output_dir = os.path.join(self.temp_dir.name, "diff")
+        with mock.patch.object(collection_diff, "generate_javecore_set_data",
+                               wraps=generate_javecore_set_data) as generate:
+            stacks, pools = collection_diff.diff_collections(report_dir, self.QUOTATION_MARKS_PATH, output_dir)
+        generate.assert_called_once()
+        self.assertTrue(stacks)
+        self.assertTrue(all(stack["status"] == collection_diff.CHANGED and stack["share_delta"] == 0
+                            for stack in stacks))
+        self.assertTrue(all(pool["threads_delta"] == 0 for pool in pools))
+        with open(os.path.join(output_dir, "index.html")) as f:
+            self.assertIn("Javacore Analyser Diff", f.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+import os
+import tempfile
+import unittest
+
+from lxml import etree
+
+from javacore_analyser.drill_down_data import write_javacore_data, write_thread_data
+from javacore_analyser.javacore_set import JavacoreSet
+
+
+class TestDrillDownData(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        javacores_path = os.path.join(os.getcwd(), 'test', 'data', 'quotationMarks')
+        cls.javacore_set = JavacoreSet.create(javacores_path)
+        cls.javacore_set.populate_snapshot_collections()
+        cls.javacore_set.sort_snapshots()
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file = os.path.join(self.temp_dir.name, "data.xml")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_write_thread_data(self):
+        thread = next(iter(self.javacore_set.threads))
+        write_thread_data(self.javacore_set, thread, self.file)
+        root = etree.parse(self.file).getroot()
+        self.assertEqual(root.findtext("doc/javacore_count"), "2")
+        collections = root.findall("doc/Thread/all_snapshot_collection/snapshot_collection")
+        self.assertEqual([collection.findtext("thread_hash") for collection in collections], [thread.get_hash()])
+        # every referenced stack trace is in the file
+        stack_ids = {stack.get("stack_id") for stack in collections[0].findall("stack")}
+        self.assertEqual(stack_ids, {stack_trace.get("id") for stack_trace in root.findall("doc/stack_traces/*")})
+
+    def test_write_javacore_data(self):
+        javacore = self.javacore_set.javacores[0]
+        write_javacore_data(self.javacore_set, javacore, self.file)
+        root = etree.parse(self.file).getroot()
+        stacks = root.findall("doc/Thread/all_snapshot_collection/snapshot_collection/stack")
+        self.assertEqual(len(stacks), len(javacore.snapshots))
+        self.assertEqual({stack.findtext("file_name") for stack in stacks}, {javacore.basefilename()})
+        thread_hashes = [thread.get_hash() for thread in self.javacore_set.threads]
+        hashes = [stack.getparent().findtext("thread_hash") for stack in stacks]
+        self.assertEqual(hashes, sorted(hashes, key=thread_hashes.index))
@@ -0,0 +1,68 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import unittest
+from datetime import datetime, timedelta
+
+from javacore_analyser import gc_analytics
+from javacore_analyser.verbose_gc import GcCollection, GcTimeline
+
+
+def create_collect(start_time, duration, free_before=0, free_after=0, total=0, tenure_free_after=0):
+    collect = GcCollection()
+    collect.start_time_str = (datetime(2023, 4, 25) + timedelta(seconds=start_time)).isoformat(timespec="milliseconds")
+    collect.duration = duration
+    collect.free_before = str(free_before)
+    collect.free_after = str(free_after)
+    collect.tenure_total = str(total)
+    collect.tenure_free_after = str(tenure_free_after)
+    return collect
+
+
+class TestGcAnalytics(unittest.TestCase):
+
+    def test_get_pause_statistics(self):
+        self.assertIsNone(gc_analytics.get_pause_statistics(GcTimeline([])))
+        timeline = GcTimeline([create_collect(i, duration) for i, duration in enumerate((500, 1200, 2500, 1500))])
+        statistics = gc_analytics.get_pause_statistics(timeline, (1000, 2000))
+        self.assertEqual(statistics["counts"], [3, 1])
+        self.assertEqual(statistics["longest"], 2500)
+        self.assertEqual(statistics["longest_start_time"], "2023-04-25T00:00:02.000")
+        self.assertEqual(statistics["count"], 4)
+        self.assertEqual(statistics["total"], 5700)
+        self.assertEqual(statistics["mean"], 1425)
+        self.assertEqual(statistics["shortest"], 500)
+        self.assertEqual(statistics["percentiles"][50], 1350)
+
+    def test_get_window_statistics(self):
+        timeline = GcTimeline([create_collect(0, 600, 100, 1000), create_collect(30, 600, 400, 1000),
+                               create_collect(90, 6000, 200, 900)])
+        windows = gc_analytics.get_window_statistics(timeline, 60)
+        self.assertEqual([str(start) for start in windows["start"]],
+                         ["2023-04-25T00:00:00.000", "2023-04-25T00:01:00.000"])
+        # the last window ends with the last collect
+        self.assertEqual(list(windows["pause_share"]), [1200 / 60000, 6000 / 36000])
+        self.assertEqual(list(windows["reclaimed"]), [1500, 700])
+        self.assertEqual(list(windows["allocation_rate"]), [600 / 60, 800 / 36])
+
+    def test_get_occupancy_trend(self):
+        self.assertIsNone(gc_analytics.get_occupancy_trend(GcTimeline([create_collect(i * 60, 10) for i in range(5)])))
+        timeline = GcTimeline([create_collect(i * 60, 10, 0, 0, 10000, 5000 - i * 100) for i in range(5)])
+        self.assertAlmostEqual(gc_analytics.get_occupancy_trend(timeline), 100)
+
+    def test_summarise(self):
+        self.assertIsNone(gc_analytics.summarise(GcTimeline([])))
+        timeline = GcTimeline([create_collect(i * 60, 600 * (i + 1), 1000, 2000) for i in range(3)])
+        summary = gc_analytics.summarise(timeline, 60)
+        self.assertEqual(summary["count"], 3)
+        self.assertEqual(summary["window"], 60)
+        self.assertEqual(summary["max_pause_share"], 1800 / 1800)
+        self.assertEqual(summary["mean_free_before"], 1000)
+        self.assertEqual(summary["reclaimed"], 3000)
+        self.assertIsNone(summary["occupancy_trend"])
+
+
+if __name__ == '__main__':
+    unittest.main()
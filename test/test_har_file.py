@@ -2,9 +2,14 @@
 # Copyright IBM Corp. 2024 - 2026
 # SPDX-License-Identifier: Apache-2.0
 #
+import json
+import os
+import tempfile
 import unittest
+from unittest import mock
 
-from javacore_analyser.har_file import HarFile
+from javacore_analyser.har_file import HTTP_CALLS_DIR, HarFile, write_http_call_details
+from javacore_analyser.properties import Properties
 from xml.dom.minidom import Element, parseString
 
 
@@ -42,6 +47,10 @@ class TestHarFile(unittest.TestCase):
         self.assertEqual(http_call_node.attributes["timing_send"].nodeValue, "400")
         self.assertEqual(http_call_node.attributes["timing_wait"].nodeValue, "500")
         self.assertEqual(http_call_node.attributes["timing_receive"].nodeValue, "0")
+        # the details are in the data file of the HAR file
+        self.assertEqual(element.attributes["id"].nodeValue, "0")
+        self.assertEqual(http_call_node.attributes["id"].nodeValue, "0")
+        self.assertFalse(http_call_node.hasAttribute("response_content"))
 
     def test_har_file_with_no_valid_pages(self):
         """Test that HAR files with no valid pages are handled gracefully (issue #271)"""
@@ -62,5 +71,47 @@ class TestHarFile(unittest.TestCase):
         # Verify no HTTP calls are present
         self.assertEqual(len(element.childNodes), 0, "Should have no HTTP calls")
 
+    def test_read_in_small_chunks(self):
+        expected = self.har_file.get_xml(self.doc).toxml()
+        with mock.patch("javacore_analyser.har_file.CHUNK_SIZE", 7):
+            self.assertEqual(HarFile(self.path).get_xml(self.doc).toxml(), expected)
 
+    def test_entries_order_and_content_limit(self):
+        def entry(url, started, pageref=None):
+            result = {"startedDateTime": started, "time": 10, "timings": {"send": 1, "wait": 9},
+                      "request": {"method": "GET", "url": url, "headers": [{"name": "Host", "value": "example.com"}],
+                                  "cookies": []},
+                      "response": {"status": 200, "bodySize": 10, "headers": [], "cookies": [],
+                                   "content": {"mimeType": "text/plain", "text": "0123456789"}}}
+            if pageref:
+                result["pageref"] = pageref
+            return result
+        # the pages are after the entries, as the order of the keys in json is not defined
+        har = {"log": {"version": "1.2", "browser": {"name": "Firefox"},
+                       "entries": [entry("late", "2025-01-03T11:07:48.000+01:00", "page_1"),
+                                   entry("no_page", "2025-01-03T11:07:49.000+01:00"),
+                                   entry("early", "2025-01-03T11:07:47.000+01:00", "page_1")],
+                       "pages": [{"id": "page_1"}]}}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "test.har")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(har, f)
+            with mock.patch.dict(Properties.get_instance().properties, {"har_content_limit": 4}):
+                har_file = HarFile(path)
+        self.assertEqual([call.url for call in har_file.http_calls], ["no_page", "early", "late"])
+        self.assertEqual(har_file.hostname, "example.com")
+        self.assertEqual(har_file.browser, "{'name': 'Firefox'}")
+        self.assertEqual(har_file.http_calls[0].response_content, "0123... (6 more characters)")
 
+    def test_write_http_call_details(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            with mock.patch.dict(Properties.get_instance().properties, {"compression": ""}):
+                write_http_call_details([HarFile("test/data/empty_pages.har"), self.har_file], output_dir)
+            with open(os.path.join(output_dir, HTTP_CALLS_DIR, "1.js"), encoding="utf-8") as f:
+                content = f.read()
+            self.assertTrue(content.startswith("httpCallDetails.register(1, "))
+            details = json.loads(content[len("httpCallDetails.register(1, "):-len(");\n")])
+            self.assertEqual(len(details), 55)
+            self.assertEqual(details[0], self.har_file.http_calls[0].get_details())
+            write_http_call_details([], output_dir)
+            self.assertFalse(os.path.exists(os.path.join(output_dir, HTTP_CALLS_DIR)))
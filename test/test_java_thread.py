@@ -71,6 +71,14 @@ class TestJavaThread(unittest.TestCase):
             self.thread.thread_snapshots[2].get_timestamp() <
             self.thread.thread_snapshots[3].get_timestamp(), True)
 
+    def test_get_hash(self):
+        # the page name of the thread does not depend on the process
+        self.assertEqual(self.thread.get_hash(), "d179da2e089e9aca")
+        other = Thread()
+        other.name = self.thread.name
+        other.id = self.thread.id
+        self.assertEqual(other.get_hash(), self.thread.get_hash())
+
     def test_compute_total_cpu(self):
         self.thread.compute_total_cpu()
         self.assertEqual(self.thread.total_cpu, 2.2463713620000005)
@@ -4,14 +4,17 @@
 #
 
 import io
+import json
 import logging
 import os.path
 import shutil
 import sys
+import tempfile
 import unittest
 from unittest.mock import patch
 
 from javacore_analyser import javacore_analyser_batch
+from javacore_analyser.properties import Properties
 
 
 def cleanup():
@@ -268,3 +271,53 @@ class TestJavacoreAnalyser(unittest.TestCase):
             handler.close()
 
         cleanup()
+
+
+class TestManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manifest_file = os.path.join(self.temp_dir.name, "manifest.json")
+        self.summary_dir = os.path.join(self.temp_dir.name, "summary")
+        self.properties_patch = patch.dict(Properties.get_instance().properties,
+                                           {"use_ml": False, "use_ai": False,
+                                            "analysis_store": "", "separator": ";"})
+        self.properties_patch.start()
+
+    def tearDown(self):
+        self.properties_patch.stop()
+        self.temp_dir.cleanup()
+
+    def write_manifest(self, reports):
+        with open(self.manifest_file, "w") as f:
+            json.dump(reports, f)
+
+    def test_read_manifest(self):
+        self.write_manifest([{"input": os.path.abspath("test/data/quotationMarks"), "output": "reports/jvm1"},
+                             {"name": "second", "input": "a.zip", "output": "reports/jvm2"}])
+        reports = javacore_analyser_batch.read_manifest(self.manifest_file)
+        self.assertEqual([report["name"] for report in reports], ["jvm1", "second"])
+        self.assertEqual(reports[0]["input"], [os.path.abspath("test/data/quotationMarks")])
+        self.assertEqual(reports[1]["input"], [os.path.join(self.temp_dir.name, "a.zip")])
+        self.assertEqual(reports[1]["output"], os.path.join(self.temp_dir.name, "reports", "jvm2"))
+        self.write_manifest([{"input": "a", "output": "reports"}, {"input": "b", "output": "reports"}])
+        self.assertRaises(ValueError, javacore_analyser_batch.read_manifest, self.manifest_file)
+        self.write_manifest([{"input": "a"}])
+        self.assertRaises(ValueError, javacore_analyser_batch.read_manifest, self.manifest_file)
+
+    def test_process_manifest(self):
+        self.write_manifest([{"input": os.path.abspath("test/data/quotationMarks"), "output": "reports/jvm1"},
+                             {"input": "missing", "output": "reports/jvm2"}])
+        for parallelism in (1, 2):
+            with self.subTest(parallelism=parallelism), \
+                    patch.dict(Properties.get_instance().properties, {"batch_parallelism": parallelism}):
+                summaries = javacore_analyser_batch.process_manifest(self.manifest_file, self.summary_dir)
+                self.assertEqual([(summary["name"], summary["status"], summary["javacores"]) for summary in summaries],
+                                 [("jvm1", "ok", 2), ("jvm2", "failed", None)])
+                self.assertTrue(os.path.isfile(os.path.join(self.temp_dir.name, "reports", "jvm1", "index.html")))
+                self.assertTrue(os.path.isfile(os.path.join(self.temp_dir.name, "reports", "jvm1",
+                                                            "wait2-debug.log")))
+                with open(os.path.join(self.summary_dir, "index.html")) as f:
+                    self.assertIn('<a href="../reports/jvm1/index.html">jvm1</a>', f.read())
+                with open(os.path.join(self.summary_dir, "summary.json")) as f:
+                    self.assertEqual(json.load(f), summaries)
@@ -9,8 +9,12 @@ Unit tests for JavacoreClassifier — correctness and performance.
 
 import time
 import unittest
+from unittest import mock
 
 from javacore_analyser.ml.classify_javacore_inference import JavacoreClassifier
+from javacore_analyser.stack_trace import StackTrace
+from javacore_analyser.stack_trace_element import StackTraceElement
+from javacore_analyser.thread_snapshot import ThreadSnapshot
 
 
 class TestJavacoreClassifier(unittest.TestCase):
@@ -39,6 +43,21 @@ class TestJavacoreClassifier(unittest.TestCase):
         defaults.update(kwargs)
         return self.classifier.predict(**defaults)
 
+    @staticmethod
+    def _snapshot(name, lines, cpu_usage=0.05, allocated_mem=1024000, state="R") -> ThreadSnapshot:
+        """Create a ThreadSnapshot with the given name and java stack lines."""
+        snapshot = ThreadSnapshot()
+        snapshot.name = name
+        snapshot.cpu_usage = cpu_usage
+        snapshot.allocated_mem = allocated_mem
+        snapshot.state = state
+        snapshot.stack_trace = StackTrace()
+        for line in lines:
+            element = StackTraceElement()
+            element.set_line("4XESTACKTRACE                at " + line)
+            snapshot.stack_trace.append(element)
+        return snapshot
+
     # ------------------------------------------------------------------
     # Correctness tests
     # ------------------------------------------------------------------
@@ -92,6 +111,35 @@ class TestJavacoreClassifier(unittest.TestCase):
             self.assertNotEqual(class_label.lower(), "nan", f"Class at index {idx} is 'nan'")
             self.assertGreater(len(class_label), 0, f"Class at index {idx} is empty")
 
+    # ------------------------------------------------------------------
+    # Batch classification
+    # ------------------------------------------------------------------
+
+    def test_predict_snapshots_batch_dedupes_feature_rows(self):
+        pool_stack = ["java.lang.Object.wait(Native Method)", "java.lang.Thread.run(Thread.java:748)"]
+        snapshots = [self._snapshot(f"WebContainer : {i}", pool_stack, cpu_usage=1 + i / 10000)
+                     for i in range(50)]
+        snapshots.append(self._snapshot("Finalizer thread", ["java.lang.ref.Finalizer.run(Finalizer.java:1)"],
+                                        cpu_usage=20, state="CW"))
+        with mock.patch.object(self.classifier.model, "predict", wraps=self.classifier.model.predict) as predict:
+            labels = self.classifier.predict_snapshots_batch(snapshots)
+        self.assertEqual(2, len(predict.call_args[0][0]))
+        self.assertEqual(len(snapshots), len(labels))
+        self.assertEqual({labels[0]}, set(labels[:50]))
+        # The CPU usage of these snapshots is not changed by the bucketing
+        for snapshot, label in ((snapshots[0], labels[0]), (snapshots[-1], labels[-1])):
+            self.assertEqual(self.classifier.predict_thread_snapshot(snapshot), label)
+
+    def test_predict_snapshots_batch_keeps_different_features(self):
+        stack = ["java.lang.Thread.run(Thread.java:748)"]
+        snapshots = [self._snapshot("WebContainer : 1", stack),
+                     self._snapshot("WebContainer : 2", stack, state="CW"),
+                     self._snapshot("WebContainer : 3", stack, cpu_usage=500),
+                     self._snapshot("WebContainer : 4", stack + ["java.lang.Object.wait(Native Method)"])]
+        keys = {self.classifier._get_feature_key(snapshot) for snapshot in snapshots}
+        self.assertEqual(len(snapshots), len(keys))
+        self.assertEqual([], self.classifier.predict_snapshots_batch([]))
+
     # ------------------------------------------------------------------
     # Performance test  (Fixes #305)
     # ------------------------------------------------------------------
@@ -3,11 +3,24 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+import io
 import os
+import shutil
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
+from xml.dom.minidom import Document
 
+import importlib_resources
+from lxml import etree
+
+from javacore_analyser.analysis_store import AnalysisStore
 from javacore_analyser.constants import UNKNOWN
 from javacore_analyser.javacore_set import JavacoreSet
+from javacore_analyser.properties import Properties
+from javacore_analyser.stack_trace import StackTrace
+from javacore_analyser.stack_trace_table import StackTraceTable
 
 
 class TestJavacoreSet(unittest.TestCase):
@@ -53,3 +66,164 @@ class TestJavacoreSet(unittest.TestCase):
         self.assertEqual(len(self.javacore_set_from_test_data.blocked_snapshots), 7,
                          "The javacores from test dir have different number of blocking threads")
         self.assertEqual(len(self.javacore_set_from_test_data.blocked_snapshots[0].get_threads_set()), 14)
+
+    def test_write_xml(self):
+        javacores_path = os.path.join(os.getcwd(), 'test', 'data', 'quotationMarks')
+        javacore_set = JavacoreSet.create(javacores_path)
+        javacore_set.populate_snapshot_collections()
+        stream = io.StringIO()
+        javacore_set.threads.write_xml(stream, StackTraceTable())
+        doc = Document()
+        expected = javacore_set.threads.get_xml(doc, StackTraceTable()).toxml()
+        parser = etree.XMLParser(remove_blank_text=True)
+        self.assertEqual(etree.tostring(etree.fromstring(stream.getvalue(), parser), method="c14n"),
+                         etree.tostring(etree.fromstring(expected, parser), method="c14n"))
+
+    def test_get_stack_xslt_params(self):
+        javacores_path = os.path.join(os.getcwd(), 'test', 'data', 'quotationMarks')
+        javacore_set = JavacoreSet.create(javacores_path)
+        javacore_set.populate_snapshot_collections()
+        doc = Document()
+        doc_node = doc.createElement("doc")
+        stack_trace_table = StackTraceTable()
+        doc_node.appendChild(javacore_set.stacks.get_xml(doc, stack_trace_table))
+        doc_node.appendChild(stack_trace_table.get_xml(doc))
+        all_code_xsl = importlib_resources.files("javacore_analyser") / "data" / "xml" / "sections" / "all_code.xsl"
+        xslt_transformer = etree.XSLT(etree.XML(f'''
+            <xsl:stylesheet version="1.0" xmlns:xsl="http://www.w3.org/1999/XSL/Transform">
+                <xsl:include href="{Path(str(all_code_xsl)).as_uri()}"/>
+                <xsl:key name="stack_trace" match="stack_traces/stack_trace" use="@id"/>
+                <xsl:template match="/"><div><xsl:call-template name="all_code"/></div></xsl:template>
+            </xsl:stylesheet>'''))
+        # the code collections show the lines of the stack they are compared by
+        with mock.patch.object(StackTrace, "STACK_COMPARISON_DEPTH", 3):
+            output_doc = xslt_transformer(etree.fromstring(doc_node.toxml()), **JavacoreSet.get_stack_xslt_params())
+        lines = [len(cell.findall("br")) for cell in output_doc.getroot().iterfind(".//tbody/tr/td[1]")]
+        self.assertEqual(len(lines), len(list(javacore_set.stacks)))
+        self.assertEqual(max(lines), 3)
+
+
+class TestJavacoreSetAppend(unittest.TestCase):
+    QUOTATION_MARKS_PATH = os.path.join(os.getcwd(), 'test', 'data', 'quotationMarks')
+    FIRST = "javacore.20230830.134339.30220.0001.txt"
+    SECOND = "javacore.20230830.134339.30220.0002.txt"
+    # The copy of the second javacore taken a few seconds later
+    THIRD = "javacore.20230830.134339.30220.0003.txt"
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.properties_patch = mock.patch.dict(Properties.get_instance().properties,
+                                                {"use_ml": False, "use_ai": False,
+                                                 "analysis_store": ""})
+        self.properties_patch.start()
+        with open(os.path.join(self.QUOTATION_MARKS_PATH, self.SECOND), "rb") as f:
+            self.third_content = f.read().replace(b"Date: 2023/08/30 at 13:43:39:520", b"Date: 2023/08/30 at 13:43:45:520")
+
+    def tearDown(self):
+        self.properties_patch.stop()
+        self.temp_dir.cleanup()
+
+    def create_dir(self, name, *javacores):
+        path = os.path.join(self.temp_dir.name, name)
+        os.mkdir(path)
+        for javacore in javacores:
+            if javacore == self.THIRD:
+                with open(os.path.join(path, javacore), "wb") as f:
+                    f.write(self.third_content)
+            else:
+                shutil.copy2(os.path.join(self.QUOTATION_MARKS_PATH, javacore), path)
+        return path
+
+    @staticmethod
+    def get_threads_data(javacore_set):
+        return sorted((t.name, t.id, [s.get_cpu_usage_inc() for s in t.thread_snapshots],
+                       [s.get_elapsed_time() for s in t.thread_snapshots], t.get_total_cpu())
+                      for t in javacore_set.threads)
+
+    def assert_same_analysis(self, javacore_set, expected):
+        self.assertEqual([jc.basefilename() for jc in javacore_set.javacores],
+                         [jc.basefilename() for jc in expected.javacores])
+        self.assertEqual(self.get_threads_data(javacore_set), self.get_threads_data(expected))
+        self.assertEqual(len(list(javacore_set.stacks)), len(list(expected.stacks)))
+        self.assertEqual(sorted(len(blocked.get_threads_set()) for blocked in javacore_set.blocked_snapshots),
+                         sorted(len(blocked.get_threads_set()) for blocked in expected.blocked_snapshots))
+        self.assertEqual(javacore_set.tips, expected.tips)
+
+    def test_append(self):
+        expected = JavacoreSet.process_javacores(self.create_dir("all", self.FIRST, self.SECOND, self.THIRD))
+        javacore_set = JavacoreSet.process_javacores(self.create_dir("base", self.FIRST, self.SECOND))
+        threads = list(javacore_set.threads)
+        changed = javacore_set.append(self.create_dir("new", self.SECOND, self.THIRD))
+        self.assert_same_analysis(javacore_set, expected)
+        # the second javacore is already analysed
+        self.assertEqual(len(javacore_set.files), 3)
+        self.assertIn(javacore_set.javacores[2], changed)
+        self.assertNotIn(javacore_set.javacores[1], changed)
+        self.assertEqual(changed - {javacore_set.javacores[2]},
+                         {snapshot.thread for snapshot in javacore_set.javacores[2].snapshots})
+        # the threads from the analysed javacores keep their page names
+        self.assertEqual([thread.get_hash() for thread in threads],
+                         [thread.get_hash() for thread in list(javacore_set.threads)[:len(threads)]])
+        self.assertEqual(javacore_set.append(self.create_dir("again", self.THIRD)), set())
+
+    def test_append_older_javacore(self):
+        expected = JavacoreSet.process_javacores(self.create_dir("all", self.FIRST, self.SECOND, self.THIRD))
+        javacore_set = JavacoreSet.process_javacores(self.create_dir("base", self.SECOND, self.THIRD))
+        self.assertIsNone(javacore_set.append(self.create_dir("new", self.FIRST)))
+        self.assert_same_analysis(javacore_set, expected)
+
+    def test_append_older_javacore_with_other_stack(self):
+        with open(os.path.join(self.QUOTATION_MARKS_PATH, self.FIRST), "rb") as f:
+            first_content = f.read().replace(b"Main.java:13", b"Main.java:12")
+        base_dir = self.create_dir("base", self.SECOND, self.THIRD)
+        javacore_set = JavacoreSet.process_javacores(base_dir)
+        # the statistics cached before the older javacore is added are computed again,
+        # also for the stacks which got no snapshot from it
+        for collection in list(javacore_set.threads) + list(javacore_set.stacks):
+            collection.total_cpu = collection.total_time = -1
+        new_dir = self.create_dir("new")
+        with open(os.path.join(new_dir, self.FIRST), "wb") as f:
+            f.write(first_content)
+        self.assertIsNone(javacore_set.append(new_dir))
+        shutil.copy2(os.path.join(new_dir, self.FIRST), base_dir)
+        expected = JavacoreSet.process_javacores(base_dir)
+        for collections, expected_collections in ((javacore_set.threads, expected.threads),
+                                                  (javacore_set.stacks, expected.stacks)):
+            self.assertEqual(sorted((c.get_total_cpu(), c.get_total_time()) for c in collections),
+                             sorted((c.get_total_cpu(), c.get_total_time()) for c in expected_collections))
+
+    def test_export_analysis_store(self):
+        store_file = os.path.join(self.temp_dir.name, "analysis.db")
+        with mock.patch.dict(Properties.get_instance().properties, {"analysis_store": store_file}):
+            javacore_set = JavacoreSet.process_javacores(self.create_dir("base", self.FIRST, self.SECOND))
+            # the analysed files are removed, as the temporary copies in watch mode
+            shutil.rmtree(os.path.join(self.temp_dir.name, "base"))
+            javacore_set.append(self.create_dir("new", self.THIRD))
+        # the store is written again with the appended javacore
+        with AnalysisStore(store_file) as store:
+            self.assertEqual([javacore["filename"] for javacore in store.get_javacores()],
+                             [self.FIRST, self.SECOND, self.THIRD])
+
+    def test_generate_tips_for_data_types(self):
+        javacore_set = JavacoreSet.process_javacores(self.create_dir("base", self.FIRST, self.SECOND))
+        javacore_set.tips_by_class["LongGcPauseTip"] = ["kept tip"]
+        javacore_set.tips_by_class["TooFewJavacoresTip"] = ["generated again"]
+        javacore_set.generate_tips({"javacores"})
+        self.assertIn("kept tip", javacore_set.tips)
+        self.assertNotIn("generated again", javacore_set.tips)
+
+    def test_generate_report_files_for_changed_pages(self):
+        output_dir = os.path.join(self.temp_dir.name, "report")
+        os.mkdir(output_dir)
+        with mock.patch.dict(Properties.get_instance().properties, {"skip_boring": False}):
+            javacore_set = JavacoreSet.process_javacores(self.create_dir("base", self.FIRST, self.SECOND))
+            javacore_set.generate_report_files(output_dir)
+            first_page = os.path.join(output_dir, "javacores", self.FIRST + ".html")
+            with open(first_page, "a") as f:
+                f.write("<!-- kept -->")
+            changed = javacore_set.append(self.create_dir("new", self.THIRD))
+            javacore_set.generate_report_files(output_dir, changed=changed)
+        with open(first_page) as f:
+            self.assertIn("<!-- kept -->", f.read())
+        self.assertTrue(os.path.isfile(os.path.join(output_dir, "javacores", self.THIRD + ".html")))
+        self.assertEqual(len(os.listdir(os.path.join(output_dir, "threads"))), len(list(javacore_set.threads)))
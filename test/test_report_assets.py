@@ -0,0 +1,75 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+import os
+import re
+import tempfile
+import unittest
+
+from javacore_analyser.properties import Properties
+from javacore_analyser.report_assets import REPORT_ASSETS, ASSETS_COPY, ASSETS_HARDLINK, ASSETS_SYMLINK, \
+    ASSETS_SHARED, materialise_assets, get_package_data_dir, get_assets_strategy, get_assets_url
+
+
+def list_files(directory):
+    return sorted(os.path.relpath(os.path.join(root, f), directory).replace(os.sep, "/")
+                  for root, dirs, files in os.walk(directory) for f in files)
+
+
+class TestReportAssets(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_dir = os.path.join(self.temp_dir.name, "data")
+        self.properties = Properties.get_instance().properties
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        self.properties.pop("assets_strategy", None)
+
+    def test_assets_referenced_by_xsl(self):
+        xml_dir = os.path.join(get_package_data_dir(), "xml")
+        referenced = set()
+        for root, dirs, files in os.walk(xml_dir):
+            for f in files:
+                if f.endswith(".xsl"):
+                    with open(os.path.join(root, f), encoding="utf-8") as xsl:
+                        referenced.update(re.findall(r'\{+\$assets_dir}+/([^"]+)"', xsl.read()))
+        self.assertTrue(referenced)
+        self.assertEqual(referenced, set(REPORT_ASSETS))
+        for asset in REPORT_ASSETS:
+            self.assertTrue(os.path.isfile(os.path.join(get_package_data_dir(), asset)), asset)
+
+    def test_materialise_copy(self):
+        materialise_assets(self.data_dir, ASSETS_COPY)
+        self.assertEqual(list_files(self.data_dir), sorted(REPORT_ASSETS))
+        self.assertFalse(os.path.islink(os.path.join(self.data_dir, "style.css")))
+
+    def test_materialise_hardlink(self):
+        materialise_assets(self.data_dir, ASSETS_HARDLINK)
+        self.assertEqual(list_files(self.data_dir), sorted(REPORT_ASSETS))
+
+    def test_materialise_symlink(self):
+        materialise_assets(self.data_dir, ASSETS_SYMLINK)
+        self.assertEqual(list_files(self.data_dir), sorted(REPORT_ASSETS))
+        with open(os.path.join(self.data_dir, "style.css"), "rb") as f:
+            with open(os.path.join(get_package_data_dir(), "style.css"), "rb") as expected:
+                self.assertEqual(f.read(), expected.read())
+
+    def test_materialise_shared(self):
+        materialise_assets(self.data_dir, ASSETS_SHARED)
+        self.assertFalse(os.path.exists(self.data_dir))
+
+    def test_get_assets_strategy(self):
+        self.assertEqual(get_assets_strategy(True), ASSETS_COPY)
+        self.properties["assets_strategy"] = "Symlink"
+        self.assertEqual(get_assets_strategy(False), ASSETS_SYMLINK)
+        self.properties["assets_strategy"] = "shared"
+        self.assertEqual(get_assets_strategy(True), ASSETS_SHARED)
+        self.assertEqual(get_assets_strategy(False), ASSETS_COPY)
+        self.properties["assets_strategy"] = "unknown"
+        self.assertEqual(get_assets_strategy(True), ASSETS_COPY)
+
+    def test_get_assets_url(self):
+        self.assertTrue(get_assets_url().startswith("/assets/"))
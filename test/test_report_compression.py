@@ -0,0 +1,74 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+import gzip
+import os
+import tempfile
+import time
+import unittest
+
+from javacore_analyser.properties import Properties
+from javacore_analyser.report_compression import GZIP, BROTLI, compress_file, find_sidecar, get_output_encodings
+
+CONTENT = b"<html><body>" + b"<tr><td>thread</td></tr>" * 1000 + b"</body></html>"
+
+
+class TestReportCompression(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file = os.path.join(self.temp_dir.name, "index.html")
+        with open(self.file, "wb") as f:
+            f.write(CONTENT)
+        self.properties = Properties.get_instance().properties
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        self.properties.pop("compression", None)
+
+    def test_get_output_encodings(self):
+        self.assertEqual(get_output_encodings(), [])
+        self.properties["compression"] = ""
+        self.assertEqual(get_output_encodings(), [])
+        self.properties["compression"] = "gzip"
+        self.assertEqual(get_output_encodings(), [GZIP])
+        self.properties["compression"] = "GZIP, gzip, unknown"
+        self.assertEqual(get_output_encodings(), [GZIP])
+
+    def test_compress_file(self):
+        compress_file(self.file, [GZIP])
+        self.assertTrue(os.path.isfile(self.file))
+        with open(self.file + ".gz", "rb") as f:
+            compressed = f.read()
+        self.assertLess(len(compressed), len(CONTENT) / 10)
+        self.assertEqual(gzip.decompress(compressed), CONTENT)
+        self.assertFalse(os.path.exists(self.file + ".gz.tmp"))
+
+    def test_compress_file_brotli(self):
+        try:
+            import brotli
+        except ImportError:
+            self.skipTest("brotli is not installed")
+        compress_file(self.file, [BROTLI])
+        with open(self.file + ".br", "rb") as f:
+            self.assertEqual(brotli.decompress(f.read()), CONTENT)
+
+    def test_compress_file_compressed_only(self):
+        compress_file(self.file, [], compressed_only=True)
+        self.assertTrue(os.path.isfile(self.file), "File without sidecars must not be removed")
+        compress_file(self.file, [GZIP], compressed_only=True)
+        self.assertFalse(os.path.exists(self.file))
+        self.assertTrue(os.path.isfile(self.file + ".gz"))
+
+    def test_find_sidecar(self):
+        self.assertEqual(find_sidecar(self.file, [GZIP, BROTLI]), (None, None))
+        compress_file(self.file, [GZIP])
+        self.assertEqual(find_sidecar(self.file, [GZIP, BROTLI]), (self.file + ".gz", GZIP))
+        self.assertEqual(find_sidecar(self.file, []), (None, None))
+        # the page regenerated after the sidecar was written
+        future = time.time() + 10
+        os.utime(self.file, (future, future))
+        self.assertEqual(find_sidecar(self.file, [GZIP]), (None, None))
+        os.remove(self.file)
+        self.assertEqual(find_sidecar(self.file, [GZIP]), (self.file + ".gz", GZIP))
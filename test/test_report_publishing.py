@@ -0,0 +1,50 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+import os
+import tempfile
+import unittest
+
+from lxml import etree
+
+from javacore_analyser.report_publishing import TEMP_SUFFIX, finish_processing, is_processing, publish_html, \
+    remove_stale_pages, start_processing
+
+
+def create_file(directory, name):
+    with open(os.path.join(directory, name), "w") as f:
+        f.write("old")
+
+
+class TestReportPublishing(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.dir = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_publish_html(self):
+        html_file = os.path.join(self.dir, "thread_1.html")
+        create_file(self.dir, "thread_1.html")
+        publish_html(etree.ElementTree(etree.fromstring("<html><body>new</body></html>")), html_file)
+        with open(html_file) as f:
+            self.assertIn("new", f.read())
+        self.assertEqual(os.listdir(self.dir), ["thread_1.html"])
+
+    def test_remove_stale_pages(self):
+        for name in ("thread_1.html", "thread_1.html.gz", "thread_2.html", "thread_2.html.br",
+                     "thread_3.html" + TEMP_SUFFIX):
+            create_file(self.dir, name)
+        remove_stale_pages(self.dir, ["thread_1.html"])
+        self.assertEqual(sorted(os.listdir(self.dir)), ["thread_1.html", "thread_1.html.gz"])
+
+    def test_processing(self):
+        self.assertFalse(is_processing(self.dir))
+        start_processing(self.dir)
+        self.assertTrue(is_processing(self.dir))
+        finish_processing(self.dir)
+        self.assertFalse(is_processing(self.dir))
+        finish_processing(self.dir)
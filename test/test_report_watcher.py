@@ -0,0 +1,125 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from javacore_analyser.properties import Properties
+from javacore_analyser.report_watcher import DirectoryEvents, FileScanner, ReportWatcher
+
+
+class TestReportWatcher(unittest.TestCase):
+    QUOTATION_MARKS_PATH = os.path.join(os.getcwd(), 'test', 'data', 'quotationMarks')
+    VERBOSE_GC_PATH = os.path.join(os.getcwd(), 'test', 'data', 'verboseGc')
+    FIRST = "javacore.20230830.134339.30220.0001.txt"
+    SECOND = "javacore.20230830.134339.30220.0002.txt"
+    # The copy of the second javacore taken a few seconds later
+    THIRD = "javacore.20230830.134339.30220.0003.txt"
+    VERBOSE_GC = "verbosegc.230105.19308.log"
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.input_dir = os.path.join(self.temp_dir.name, "input")
+        self.report_dir = os.path.join(self.temp_dir.name, "report")
+        os.mkdir(self.input_dir)
+        self.properties_patch = mock.patch.dict(Properties.get_instance().properties,
+                                                {"use_ml": False, "use_ai": False,
+                                                 "analysis_store": "", "skip_boring": False,
+                                                 "watch_settle_time": 0, "watch_batch_size": 1})
+        self.properties_patch.start()
+
+    def tearDown(self):
+        self.properties_patch.stop()
+        self.temp_dir.cleanup()
+
+    def add_file(self, directory, name):
+        shutil.copy2(os.path.join(directory, name), self.input_dir)
+        return os.path.join(self.input_dir, name)
+
+    def test_scanner_waits_until_file_stops_growing(self):
+        scanner = FileScanner(self.input_dir, 60)
+        javacore = self.add_file(self.QUOTATION_MARKS_PATH, self.FIRST)
+        with open(os.path.join(self.input_dir, "other.txt"), "w") as f:
+            f.write("not a javacore")
+        self.assertEqual(scanner.get_complete_files(), [])
+        self.assertEqual(scanner.get_complete_files({self.FIRST}), [javacore])
+        scanner.settle_time = 0
+        self.assertEqual(scanner.get_complete_files(), [javacore])
+        scanner.mark_analysed([javacore])
+        self.assertTrue(scanner.is_analysed(javacore))
+        with open(javacore, "a") as f:
+            f.write("more data")
+        scanner.get_complete_files()
+        self.assertFalse(scanner.is_analysed(javacore))
+
+    def test_get_update_files(self):
+        watcher = ReportWatcher(self.input_dir, self.report_dir)
+        verbose_gc = self.add_file(self.VERBOSE_GC_PATH, self.VERBOSE_GC)
+        # the verbose gc files wait for the first javacore
+        self.assertEqual(watcher.get_update_files(watcher.scanner.get_complete_files()), [])
+        first = self.add_file(self.QUOTATION_MARKS_PATH, self.FIRST)
+        self.add_file(self.QUOTATION_MARKS_PATH, self.SECOND)
+        self.assertEqual(watcher.get_update_files(watcher.scanner.get_complete_files()), [first, verbose_gc])
+
+    def test_update_once(self):
+        watcher = ReportWatcher(self.input_dir, self.report_dir)
+        self.assertEqual(watcher.update_once(), [])
+        self.add_file(self.QUOTATION_MARKS_PATH, self.FIRST)
+        self.add_file(self.QUOTATION_MARKS_PATH, self.SECOND)
+        self.assertEqual(len(watcher.update_once()), 1)
+        self.assertTrue(os.path.isfile(os.path.join(self.report_dir, "index.html")))
+        self.assertEqual(len(watcher.update_once()), 1)
+        first_page = os.path.join(self.report_dir, "javacores", self.FIRST + ".html")
+        with open(first_page, "a") as f:
+            f.write("<!-- kept -->")
+        with open(os.path.join(self.QUOTATION_MARKS_PATH, self.SECOND), "rb") as f:
+            content = f.read().replace(b"Date: 2023/08/30 at 13:43:39:520", b"Date: 2023/08/30 at 13:43:45:520")
+        with open(os.path.join(self.input_dir, self.THIRD), "wb") as f:
+            f.write(content)
+        self.assertEqual(len(watcher.update_once()), 1)
+        self.assertEqual(len(watcher.javacore_set.javacores), 3)
+        self.assertTrue(os.path.isfile(os.path.join(self.report_dir, "javacores", self.THIRD + ".html")))
+        # the page of the first javacore is not generated again
+        with open(first_page) as f:
+            self.assertIn("<!-- kept -->", f.read())
+        self.assertEqual(watcher.update_once(), [])
+
+    def test_verbose_gc_analysed_again_when_grown(self):
+        watcher = ReportWatcher(self.input_dir, self.report_dir)
+        verbose_gc = self.add_file(self.VERBOSE_GC_PATH, self.VERBOSE_GC)
+        first = self.add_file(self.QUOTATION_MARKS_PATH, self.FIRST)
+        second = self.add_file(self.QUOTATION_MARKS_PATH, self.SECOND)
+        self.assertEqual(watcher.update_once(), [first, verbose_gc])
+        # the verbose gc file which did not change is not analysed again with the next javacore
+        self.assertEqual(watcher.update_once(), [second])
+        with open(verbose_gc, "a") as f:
+            f.write("\n")
+        self.assertEqual(watcher.update_once(), [verbose_gc])
+        self.assertEqual(watcher.update_once(), [])
+        self.assertEqual([file.get_file_name() for file in watcher.javacore_set.gc_parser.get_files()],
+                         [self.VERBOSE_GC])
+
+    def test_run(self):
+        self.add_file(self.QUOTATION_MARKS_PATH, self.FIRST)
+        watcher = ReportWatcher(self.input_dir, self.report_dir)
+        stop_event = threading.Event()
+        with mock.patch.object(DirectoryEvents, "wait", side_effect=lambda: stop_event.set() or set()):
+            watcher.run(stop_event)
+        self.assertEqual(len(watcher.javacore_set.javacores), 1)
+
+    def test_directory_events_without_inotify(self):
+        with mock.patch.dict(sys.modules, {"inotify_simple": None}):
+            events = DirectoryEvents(self.input_dir, 0)
+        self.assertIsNone(events.inotify)
+        self.assertEqual(events.wait(), set())
+        events.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+import json
+import os
+import tempfile
+import unittest
+
+from lxml import etree
+
+from javacore_analyser.search_index import SEARCH_INDEX_DIR, UNIT_ATTRIBUTE, build_search_index, \
+    get_search_index_url, tokenize, write_search_index
+
+PAGE = '''<html><head><script>var x = "hidden";</script></head>
+<body><div class="searchbar"><input id="search-input" type="search"/></div>
+<div class="content">
+    <h2>Wait Report for thread: <b>Worker-0</b></h2>
+    <table><tr><td>Thread <a href="x">0x1D</a> details
+        <div><p class="stacktrace"><span class="java">com/ibm/jvm/Dump.triggerDumpsImpl(Native Method)</span><br/></p>
+        </div></td></tr></table>
+</div></body></html>'''
+
+
+def decode_postings(index, token):
+    units = []
+    unit = 0
+    for delta in index["postings"][index["tokens"].index(token)]:
+        unit += delta
+        units.append(unit)
+    return units
+
+
+class TestSearchIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.root = etree.fromstring(PAGE)
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize("com/ibm/jvm/Dump.triggerDumpsImpl(Native Method)"),
+                         {"com", "ibm", "jvm", "dump", "triggerdumpsimpl", "native", "method"})
+
+    def test_build_search_index(self):
+        index = build_search_index(self.root)
+        h2 = self.root.find(".//h2")
+        td = self.root.find(".//td")
+        p = self.root.find(".//p")
+        self.assertEqual(index["units"], 3)
+        self.assertEqual(len(index["tokens"]), len(index["postings"]))
+        # the text of inline elements belongs to the nearest block element
+        self.assertEqual(decode_postings(index, "worker"), [int(h2.get(UNIT_ATTRIBUTE))])
+        self.assertEqual(decode_postings(index, "0x1d"), [int(td.get(UNIT_ATTRIBUTE))])
+        self.assertEqual(decode_postings(index, "triggerdumpsimpl"), [int(p.get(UNIT_ATTRIBUTE))])
+        # the div holds only the nested paragraph, the search bar and the scripts are not indexed
+        self.assertIsNone(p.getparent().get(UNIT_ATTRIBUTE))
+        self.assertNotIn("hidden", index["tokens"])
+        self.assertNotIn("search", index["tokens"])
+
+    def test_write_search_index(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            page_file = os.path.join(output_dir, "threads", "thread_1.html")
+            write_search_index(self.root, page_file, output_dir)
+            with open(os.path.join(output_dir, SEARCH_INDEX_DIR, "threads", "thread_1.js"), encoding="utf-8") as f:
+                content = f.read()
+            prefix = "window.searchIndex = "
+            self.assertTrue(content.startswith(prefix))
+            self.assertEqual(json.loads(content[len(prefix):-2])["units"], 3)
+            self.assertEqual(get_search_index_url(page_file, output_dir), "../search/threads/thread_1.js")
+            self.assertEqual(get_search_index_url(os.path.join(output_dir, "index.html"), output_dir),
+                             "search/index.js")
+
+    def test_write_search_index_without_search_bar(self):
+        self.root.find(".//input").set("id", "other")
+        with tempfile.TemporaryDirectory() as output_dir:
+            write_search_index(self.root, os.path.join(output_dir, "index.html"), output_dir)
+            self.assertFalse(os.path.exists(os.path.join(output_dir, SEARCH_INDEX_DIR)))
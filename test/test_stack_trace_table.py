@@ -0,0 +1,72 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import unittest
+from xml.dom.minidom import parseString
+
+from javacore_analyser.stack_trace import StackTrace
+from javacore_analyser.stack_trace_element import StackTraceElement
+from javacore_analyser.stack_trace_table import StackTraceTable, STACK_TRACES_NODE, STACK_TRACE_NODE
+
+
+def create_stack_trace(lines):
+    stack_trace = StackTrace()
+    for line in lines:
+        stack_trace_element = StackTraceElement()
+        stack_trace_element.set_line(line)
+        stack_trace.append(stack_trace_element)
+    return stack_trace
+
+
+class TestStackTraceTable(unittest.TestCase):
+
+    def setUp(self):
+        self.doc = parseString('''<?xml version="1.0" encoding="UTF-8" ?>
+                                <?xml-stylesheet type="text/xsl" href="data/report.xsl"?><doc/>''')
+        self.lines = ['4XESTACKTRACE                at com/ibm/jvm/Dump.triggerDumpsImpl(Native Method)',
+                      '4XESTACKTRACE                at com/ibm/jvm/Dump.triggerDump(Dump.java:570)',
+                      '4XENATIVESTACK               setup_native_thread+0x18a (omrintrospect.c:305)']
+
+    def test_get_id_deduplicates_equal_stacks(self):
+        table = StackTraceTable()
+        id1 = table.get_id(create_stack_trace(self.lines))
+        id2 = table.get_id(create_stack_trace(self.lines))
+        id3 = table.get_id(create_stack_trace(self.lines[:2]))
+        self.assertEqual(id1, id2)
+        self.assertNotEqual(id1, id3)
+        self.assertEqual(table.size(), 2)
+
+    def test_get_id_empty_stack(self):
+        table = StackTraceTable()
+        self.assertEqual(table.get_id(None), table.get_id(None))
+        self.assertEqual(table.size(), 1)
+
+    def test_get_rows(self):
+        table = StackTraceTable()
+        self.assertEqual(table.get_index(create_stack_trace(self.lines)), 0)
+        self.assertEqual(table.get_index(None), 1)
+        rows = table.get_rows(2)
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0][0], 3)
+        self.assertEqual(rows[0][1], [["java", "com/ibm/jvm/Dump.triggerDumpsImpl(Native Method)"],
+                                      ["java", "com/ibm/jvm/Dump.triggerDump(Dump.java:570)"]])
+        self.assertEqual(rows[1], [0, []])
+
+    def test_get_xml(self):
+        table = StackTraceTable()
+        stack_id = table.get_id(create_stack_trace(self.lines))
+        table.get_id(None)
+        element = table.get_xml(self.doc)
+        self.assertEqual(element.tagName, STACK_TRACES_NODE)
+        stack_traces = element.getElementsByTagName(STACK_TRACE_NODE)
+        self.assertEqual(len(stack_traces), 2)
+        self.assertEqual(stack_traces[0].getAttribute("id"), stack_id)
+        self.assertEqual(stack_traces[0].getAttribute("depth"), "3")
+        lines = stack_traces[0].getElementsByTagName("line")
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[2].getAttribute("kind"), "native")
+        self.assertEqual(lines[0].firstChild.nodeValue, "com/ibm/jvm/Dump.triggerDumpsImpl(Native Method)")
+        self.assertEqual(stack_traces[1].getAttribute("depth"), "0")
+        self.assertEqual(stack_traces[1].getElementsByTagName("line")[0].firstChild.nodeValue, StackTrace.EMPTY_STACK)
@@ -13,6 +13,7 @@ from javacore_analyser.javacore import Javacore
 from javacore_analyser.javacore_set import JavacoreSet
 from javacore_analyser.stack_trace import StackTrace
 from javacore_analyser.stack_trace_element import StackTraceElement
+from javacore_analyser.stack_trace_table import StackTraceTable
 from javacore_analyser.thread_snapshot import ThreadSnapshot
 
 
@@ -109,6 +110,21 @@ class TestThreadSnapshot(unittest.TestCase):
         line_element = line_elements[0]
         assert(line_element.getAttribute("kind") == "java")
 
+    def test_get_xml_with_stack_trace_table(self):
+        self.snapshot.stack_trace = StackTrace()
+        stack_trace_element = StackTraceElement()
+        stack_trace_element.line = "at com.ibm.wait2.test.test_get_xml"
+        self.snapshot.stack_trace.append(stack_trace_element)
+        self.snapshot.name = "test name"
+        self.snapshot.javacore = Javacore()
+        self.snapshot.javacore.javacore_set = JavacoreSet("")
+        self.snapshot.javacore.timestamp = time.time()
+        stack_trace_table = StackTraceTable()
+        element = self.snapshot.get_xml(self.doc, self.doc.createElement("snapshot"), stack_trace_table)
+        self.assertEqual(len(element.getElementsByTagName("line")), 0, "Stack should not be written inline")
+        self.assertEqual(element.getAttribute("stack_id"), stack_trace_table.get_id(self.snapshot.stack_trace))
+        self.assertEqual(stack_trace_table.size(), 1)
+
     def test_get_thread_name(self):
         snap = ThreadSnapshot()
         snap.javacore = Javacore()
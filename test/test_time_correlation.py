@@ -0,0 +1,189 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest import mock
+from xml.dom.minidom import Document
+
+import numpy as np
+
+from javacore_analyser import tips
+from javacore_analyser.javacore import Javacore
+from javacore_analyser.javacore_set import JavacoreSet
+from javacore_analyser.properties import Properties
+from javacore_analyser.thread_snapshot import ThreadSnapshot
+from javacore_analyser.time_correlation import IntervalIndex, TimeCorrelation, get_jvm_time_zone
+from javacore_analyser.verbose_gc import GcCollection
+
+START = datetime(2025, 1, 3, 11, 0, 0)
+
+
+def patch_jvm_time_zone(test_case):
+    # The time zone of the JVM in the tests
+    patcher = mock.patch.dict(Properties.get_instance().properties, {"jvm_time_zone": "+01:00"})
+    patcher.start()
+    test_case.addCleanup(patcher.stop)
+
+
+def create_call(url, start_seconds, duration):
+    # The start time of the call is formatted as in HttpCall, with the time zone of the browser
+    start_time = str(START + timedelta(seconds=start_seconds)) + "+01:00"
+    return SimpleNamespace(url=url, start_time=start_time, duration=str(duration))
+
+
+def create_collect(start_seconds, duration):
+    collect = GcCollection()
+    collect.start_time_str = (START + timedelta(seconds=start_seconds)).isoformat(timespec="milliseconds")
+    collect.duration = duration
+    return collect
+
+
+def create_javacore(filename, start_seconds, states):
+    javacore = Javacore()
+    javacore.filename = filename
+    javacore.datetime = START + timedelta(seconds=start_seconds)
+    for state in states:
+        snapshot = ThreadSnapshot()
+        snapshot.state = state
+        javacore.snapshots.append(snapshot)
+    return javacore
+
+
+def create_javacore_set(calls, collects=(), javacores=()):
+    javacore_set = JavacoreSet("")
+    javacore_set.har_files.append(SimpleNamespace(http_calls=list(calls)))
+    javacore_set.gc_parser._VerboseGcParser__collects = list(collects)
+    javacore_set.javacores.extend(javacores)
+    return javacore_set
+
+
+class TestIntervalIndex(unittest.TestCase):
+
+    def test_get_overlapping(self):
+        index = IntervalIndex(np.array([300, 0, 100]), np.array([50, 10, 100]))
+        firsts, lasts = index.get_candidates(np.array([5, 150, 260, 400]), np.array([120, 320, 290, 500]))
+        results = [index.get_overlapping(start, end, first, last)
+                   for start, end, first, last in zip([5, 150, 260, 400], [120, 320, 290, 500], firsts, lasts)]
+        self.assertEqual([list(pauses) for pauses, time in results], [[1, 2], [2, 0], [], []])
+        self.assertEqual([time for pauses, time in results], [25, 70, 0, 0])
+
+    def test_get_overlapping_intervals_overlapping_each_other(self):
+        index = IntervalIndex(np.array([0, 10, 20]), np.array([100, 5, 5]))
+        first, last = index.get_candidates(np.array([50]), np.array([60]))
+        pauses, time = index.get_overlapping(50, 60, first[0], last[0])
+        self.assertEqual(list(pauses), [0])
+        self.assertEqual(time, 10)
+
+
+class TestTimeCorrelation(unittest.TestCase):
+
+    def setUp(self):
+        patch_jvm_time_zone(self)
+
+    def test_correlate(self):
+        calls = [create_call("in_gc", 10, 2000), create_call("no_gc", 20, 100), create_call("far", 500, 100),
+                 SimpleNamespace(url="unknown_time", start_time="None", duration="100")]
+        collects = [create_collect(9, 1500), create_collect(11, 500), create_collect(15, 100)]
+        javacores = [create_javacore("javacore.2.txt", 30, ["B", "R"]), create_javacore("javacore.1.txt", 0, ["R"])]
+        correlation = TimeCorrelation(create_javacore_set(calls, collects, javacores))
+        self.assertEqual(list(correlation.gc_pauses), [2, 0, 0, -1])
+        self.assertEqual(list(correlation.gc_pause_times), [1000, 0, 0, 0])
+        self.assertEqual(list(correlation.javacores), [1, 0, -1, -1])
+        self.assertEqual(list(correlation.javacore_distances), [10, 9.9, 0, 0])
+        self.assertEqual(correlation.blocked_threads, [1, 0])
+        self.assertEqual(list(correlation.get_slow_calls(1000)), [0])
+
+    def test_call_during_javacore(self):
+        correlation = TimeCorrelation(create_javacore_set([create_call("during", 10, 5000)], (),
+                                                          [create_javacore("javacore.1.txt", 12, [])]))
+        self.assertEqual(list(correlation.gc_pauses), [-1])
+        self.assertEqual(list(correlation.javacores), [0])
+        self.assertEqual(list(correlation.javacore_distances), [0])
+
+    def test_start_times_converted_to_jvm_time_zone(self):
+        # The browser recorded the start time in UTC, one hour behind the time of the JVM
+        utc_start_time = str((START + timedelta(seconds=10) - timedelta(hours=1)).replace(tzinfo=timezone.utc))
+        call = SimpleNamespace(url="in_gc", start_time=utc_start_time, duration="2000")
+        correlation = TimeCorrelation(create_javacore_set([call], [create_collect(9, 1500)]))
+        self.assertEqual(list(correlation.gc_pauses), [1])
+        self.assertEqual(list(correlation.gc_pause_times), [500])
+
+    def test_get_jvm_time_zone(self):
+        for offset, expected in (("+01:00", timedelta(hours=1)), ("-0530", -timedelta(hours=5, minutes=30)),
+                                 ("+2", timedelta(hours=2)), ("Z", timedelta(0))):
+            with mock.patch.dict(Properties.get_instance().properties, {"jvm_time_zone": offset}):
+                self.assertEqual(get_jvm_time_zone().utcoffset(None), expected)
+        with mock.patch.dict(Properties.get_instance().properties, {"jvm_time_zone": ""}):
+            self.assertIsNone(get_jvm_time_zone())
+        with mock.patch.dict(Properties.get_instance().properties, {"jvm_time_zone": "Europe/Paris"}):
+            self.assertRaises(ValueError, get_jvm_time_zone)
+
+    def test_get_time_correlation_computed_once(self):
+        javacore_set = create_javacore_set([create_call("slow", 10, 2000)], [create_collect(9, 1500)])
+        correlation = javacore_set.get_time_correlation()
+        self.assertIs(javacore_set.get_time_correlation(), correlation)
+        javacore_set.javacores.append(create_javacore("javacore.1.txt", 0, []))
+        self.assertIsNot(javacore_set.get_time_correlation(), correlation)
+
+    def test_add_xml_attributes(self):
+        javacore_set = create_javacore_set([create_call("in_gc", 10, 2000), create_call("far", 500, 100)],
+                                           [create_collect(9, 1500)],
+                                           [create_javacore("javacore.1.txt", 0, ["B"])])
+        doc = Document()
+        har_files_node = doc.createElement("har_files")
+        for i in range(2):
+            har_files_node.appendChild(doc.createElement("http_call"))
+        TimeCorrelation(javacore_set).add_xml_attributes(har_files_node)
+        first, second = har_files_node.childNodes
+        self.assertEqual(first.getAttribute("gc_pauses"), "1")
+        self.assertEqual(first.getAttribute("gc_pause_time"), "500")
+        self.assertEqual(first.getAttribute("javacore"), "javacore.1.txt")
+        self.assertEqual(first.getAttribute("javacore_distance"), "10")
+        self.assertEqual(first.getAttribute("blocked_threads"), "1")
+        self.assertEqual(second.getAttribute("gc_pause_time"), "0")
+        self.assertFalse(second.hasAttribute("javacore"))
+
+
+
+class TestTimeCorrelationTip(unittest.TestCase):
+
+    def setUp(self):
+        patch_jvm_time_zone(self)
+
+    def test_no_har_files(self):
+        self.assertEqual([], tips.TimeCorrelationTip.generate(JavacoreSet("")))
+
+    def test_no_slow_calls_in_gc_pauses(self):
+        javacore_set = create_javacore_set([create_call("fast", 10, 100), create_call("slow", 100, 1500)],
+                                           [create_collect(10, 50)])
+        self.assertEqual([], tips.TimeCorrelationTip.generate(javacore_set))
+
+    def test_slow_calls_in_gc_pauses(self):
+        javacore_set = create_javacore_set([create_call("slow", 10, 2000), create_call("slower", 100, 4000)],
+                                           [create_collect(9, 1500), create_collect(101, 1000)])
+        result = tips.TimeCorrelationTip.generate(javacore_set)
+        self.assertEqual(1, len(result))
+        self.assertIn("2 of 2 HTTP calls longer than 1000ms overlapped GC pauses", result[0])
+        self.assertIn("25% of their time", result[0])
+        self.assertIn("The call slower started at 2025-01-03 11:01:40+01:00 spent 1000ms of its 4000ms", result[0])
+
+    def test_slow_calls_near_blocked_threads(self):
+        javacores = [create_javacore("javacore.1.txt", 0, ["R", "R"]),
+                     create_javacore("javacore.2.txt", 60, ["B", "B"]),
+                     create_javacore("javacore.3.txt", 120, ["R", "B"]),
+                     create_javacore("javacore.4.txt", 180, ["R"])]
+        javacore_set = create_javacore_set([create_call("slow", 58, 1500), create_call("slower", 62, 3000),
+                                            create_call("fast", 0, 100)], (), javacores)
+        result = tips.TimeCorrelationTip.generate(javacore_set)
+        self.assertEqual(1, len(result))
+        self.assertIn("2 HTTP call(s) longer than 1000ms", result[0])
+        self.assertIn('<a href="javacores/javacore.2.txt.html">javacore.2.txt</a> with 2 blocked threads', result[0])
+        self.assertIn("on average 0.8 blocked threads", result[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
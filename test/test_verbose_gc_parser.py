@@ -1,14 +1,21 @@
 #
-# Copyright IBM Corp. 2024 - 2024
+# Copyright IBM Corp. 2024 - 2026
 # SPDX-License-Identifier: Apache-2.0
 #
 
 import os
+import tempfile
+import time
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta
+from unittest import mock
 from xml.dom.minidom import parseString
 
-from javacore_analyser.verbose_gc import VerboseGcParser, GC_COLLECTIONS, GC_COLLECTION
+from javacore_analyser import verbose_gc
+from javacore_analyser.common_utils import get_checksum
+from javacore_analyser.properties import Properties
+from javacore_analyser.verbose_gc import VerboseGcParser, GC_COLLECTIONS, GC_COLLECTION, VerboseGcFile, \
+    GcVerboseProcessingException, GcCollection, GcTimeline
 
 
 class TestVerboseGcParser(unittest.TestCase):
@@ -60,3 +67,210 @@ class TestVerboseGcParser(unittest.TestCase):
         parser.parse_files(start, stop)
         element = parser.get_xml(self.doc)
         self.assertEqual(len(element.getElementsByTagName(GC_COLLECTION)), 39, "Wrong number of GC collects in XML")
+
+    def test_parse_added_files(self):
+        parser = VerboseGcParser()
+        parser.add_file("test/data/verboseGc/verbosegc.230105.19308.log")
+        parser.add_file("test/data/verboseGc/verbosegc.230413.19984.txt.001")
+        parser.parse_files()
+        collects_number = len(parser.get_collects())
+        # the file parsed again replaces the parsed one and its collects are not added twice
+        parser.parse_added_files(["test/data/verboseGc/verbosegc.230413.19984.txt.001",
+                                  "test/data/verboseGc/verbosegc.230420.33424.txt.001"])
+        self.assertEqual(len(parser.get_collects()), 39, "Wrong number of GC collections")
+        self.assertEqual(len(parser.get_files()), 3)
+        self.assertEqual(len(parser.get_file_paths()), 3)
+        self.assertLess(collects_number, 39)
+        start_times = [collect.get_start_time() for collect in parser.get_collects()]
+        self.assertEqual(start_times, sorted(start_times))
+
+    def test_parse_files_in_parallel(self):
+        results = []
+        for parallelism in (1, 2):
+            parser = VerboseGcParser()
+            parser.add_file("test/data/verboseGc/verbosegc.230420.33424.txt.001")
+            parser.add_file("test/data/verboseGc/missing.log")
+            parser.add_file("test/data/verboseGc/verbosegc.230105.19308.log")
+            with mock.patch.dict(Properties.get_instance().properties, {"gc_parallelism": parallelism}):
+                with self.assertLogs(level="WARNING") as logs:
+                    parser.parse_files()
+            self.assertIn("missing.log was omitted", logs.output[0])
+            self.assertEqual([file.get_file_name() for file in parser.get_files()],
+                             ["verbosegc.230420.33424.txt.001", "verbosegc.230105.19308.log"])
+            self.assertEqual([file.get_number_of_collects() for file in parser.get_files()], [39, 0])
+            start_times = [collect.get_start_time() for collect in parser.get_collects()]
+            self.assertEqual(start_times, sorted(start_times))
+            results.append([collect.start_time_str for collect in parser.get_collects()])
+        self.assertEqual(results[0], results[1])
+
+
+class TestVerboseGcFile(unittest.TestCase):
+    VERBOSE_GC = "test/data/verboseGc/verbosegc.230420.33424.txt.001"
+
+    def setUp(self):
+        with open(self.VERBOSE_GC) as f:
+            self.log = f.read()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def create_file(self, text):
+        path = os.path.join(self.temp_dir.name, "verbosegc.txt")
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+
+    def get_start_times(self, path):
+        return [collect.start_time_str for collect in VerboseGcFile(path).get_collects()]
+
+    def test_truncated_log(self):
+        start_times = self.get_start_times(self.VERBOSE_GC)
+        self.assertEqual(len(start_times), 39)
+        self.assertEqual(self.get_start_times(self.create_file(self.log.replace("</verbosegc>", ""))), start_times)
+        # the last collect without its end is kept
+        truncated = self.log[:self.log.rindex("<gc-end")]
+        self.assertEqual(self.get_start_times(self.create_file(truncated)), start_times)
+        with self.assertRaises(GcVerboseProcessingException):
+            VerboseGcFile(self.create_file(truncated[:-10]))
+
+    def test_invalid_character_reference(self):
+        path = self.create_file(self.log.replace('version="08b0594_CMPRSS"', 'version="08b0594&#x1;CMPRSS"'))
+        # the reference is split between the chunks in every possible way
+        for chunk_size in range(1, 7):
+            with mock.patch.object(verbose_gc, "CHUNK_SIZE", chunk_size):
+                self.assertEqual(len(VerboseGcFile(path).get_collects()), 39)
+
+    def test_corrupted_log(self):
+        first_end = self.log.index("<gc-end")
+        corrupted = self.log[:first_end] + self.log[self.log.index("</gc-end>", first_end) + len("</gc-end>"):]
+        file = VerboseGcFile(self.create_file(corrupted))
+        self.assertEqual(len(file.get_collects()), 37)
+        self.assertEqual(file.get_total_number_of_collects(), 38)
+
+    def test_collects_are_cached(self):
+        file = VerboseGcFile(self.VERBOSE_GC)
+        collects = file.get_collects()
+        self.assertIsInstance(collects, tuple)
+        self.assertIs(file.get_collects(), collects)
+        self.assertEqual(file.get_total_number_of_collects(), len(collects))
+
+    def test_parse_performance(self):
+        """Parsing all bundled verbose gc logs must take under a second.
+
+        The single pass over the file runs ~5 ms on typical hardware. This guard catches regressions back toward
+        the minidom document walked again for every call of get_collects (~40 ms).
+        """
+        file_paths = [os.path.join("test", "data", "verboseGc", name)
+                      for name in sorted(os.listdir(os.path.join("test", "data", "verboseGc")))]
+        start = time.perf_counter()
+        for _ in range(10):
+            for file_path in file_paths:
+                file = VerboseGcFile(file_path)
+                file.get_collects()
+                file.get_total_number_of_collects()
+        elapsed = (time.perf_counter() - start) / 10
+        self.assertLess(elapsed, 1.0, f"parsing took {elapsed:.3f}s — performance regression detected")
+
+    def test_time_window(self):
+        start = datetime.strptime('2023-04-25T11:04:18.149', '%Y-%m-%dT%H:%M:%S.%f')
+        stop = datetime.strptime('2023-04-25T11:06:00', '%Y-%m-%dT%H:%M:%S')
+        collects = [collect.start_time_str for collect in VerboseGcFile(self.VERBOSE_GC).get_collects()
+                    if start <= collect.get_start_time() <= stop]
+        for chunk_size in (50, verbose_gc.CHUNK_SIZE):
+            with mock.patch.object(verbose_gc, "CHUNK_SIZE", chunk_size):
+                file = VerboseGcFile(self.VERBOSE_GC, start, stop)
+            self.assertEqual([collect.start_time_str for collect in file.get_collects()], collects)
+            self.assertEqual(file.get_total_number_of_collects(), 39)
+        # the part of the log out of the time window is not parsed
+        file = VerboseGcFile(self.create_file(self.log.replace("<af-end", "<af-end <", 1)), start, start)
+        self.assertEqual(len(file.get_collects()), 1)
+        self.assertEqual(file.get_total_number_of_collects(), 39)
+        file = VerboseGcFile(self.VERBOSE_GC, stop.replace(year=2024), stop.replace(year=2024))
+        self.assertEqual(file.get_collects(), ())
+        self.assertEqual(file.get_total_number_of_collects(), 39)
+
+    def test_parse_added_bytes(self):
+        full = VerboseGcFile(self.VERBOSE_GC)
+        start_times = [collect.start_time_str for collect in full.get_collects()]
+        # the log is copied while its collect is being written
+        last_start = self.log.index("<gc-start", len(self.log) // 2)
+        path = self.create_file(self.log[:self.log.index("<gc-end", last_start)])
+        file = VerboseGcFile(path)
+        self.assertEqual(file.get_parsed_size(), os.path.getsize(path))
+        path = self.create_file(self.log)
+        read_chunks = VerboseGcFile._VerboseGcFile__read_chunks
+        with mock.patch.object(VerboseGcFile, "_VerboseGcFile__read_chunks", autospec=True,
+                               side_effect=read_chunks) as read:
+            file.parse_added_bytes(path)
+        # only the root start tag and the log from the incomplete collect are parsed again
+        self.assertEqual([call.args[1:] for call in read.call_args_list],
+                         [(0, verbose_gc.ROOT_START_PATTERN.search(self.log.encode()).end()),
+                          (last_start, os.path.getsize(path))])
+        self.assertEqual([collect.start_time_str for collect in file.get_collects()], start_times)
+        self.assertEqual(file.get_total_number_of_collects(), full.get_total_number_of_collects())
+        self.assertEqual(file.get_parsed_size(), os.path.getsize(path))
+        # the checksum of the whole log is computed from the added bytes
+        self.assertEqual(file.get_fingerprint(), [os.path.basename(path), os.path.getsize(path), get_checksum(path)])
+        # the log which did not change is not parsed
+        with mock.patch.object(VerboseGcFile, "_VerboseGcFile__read_chunks") as read:
+            file.parse_added_bytes(path)
+        read.assert_not_called()
+
+    def test_parse_added_bytes_after_time_window(self):
+        start_times = [collect.get_start_time() for collect in VerboseGcFile(self.VERBOSE_GC).get_collects()]
+        start, stop = start_times[10], start_times[20]
+        file = VerboseGcFile(self.VERBOSE_GC, start, stop)
+        self.assertIsNone(file.get_parsed_size())
+        self.assertEqual(len(file.get_collects()), 11)
+        file.parse_added_bytes(self.VERBOSE_GC, start)
+        self.assertEqual([collect.get_start_time() for collect in file.get_collects()], start_times[10:])
+        self.assertEqual(file.get_total_number_of_collects(), 39)
+        self.assertTrue(file.is_parsed_from(start))
+        self.assertFalse(file.is_parsed_from(start_times[5]))
+        # the collects before the time range are not parsed yet, so the log is parsed again
+        file.parse_added_bytes(self.VERBOSE_GC, start_times[5])
+        self.assertEqual([collect.get_start_time() for collect in file.get_collects()], start_times[5:])
+        self.assertEqual(file.get_total_number_of_collects(), 39)
+
+
+def create_collect(start_time, duration, free_before=1000, free_after=2000):
+    collect = GcCollection()
+    collect.start_time_str = (datetime(2023, 4, 25) + timedelta(seconds=start_time)).isoformat(timespec="milliseconds")
+    collect.duration = duration
+    collect.free_before = str(free_before)
+    collect.free_after = str(free_after)
+    return collect
+
+
+class TestGcTimeline(unittest.TestCase):
+
+    def test_downsample(self):
+        collects = [create_collect(i, 10) for i in range(10000)]
+        collects[1234].free_before = "10"  # the highest heap usage
+        collects[5678].free_after = "5000"  # the lowest heap usage
+        collects[9000].duration = 900  # the longest pause
+        collects[9001].start_time_str = ""
+        timeline = GcTimeline(collects)
+        indexes = timeline.downsample(300)
+        self.assertLessEqual(len(indexes), 300)
+        self.assertEqual(list(indexes), sorted(indexes))
+        for index in (1234, 5678, 9000):
+            self.assertIn(index, indexes)
+        self.assertEqual(len(timeline.downsample(0)), 10000)
+        self.assertEqual(len(timeline.downsample(10000)), 10000)
+
+    def test_get_xml(self):
+        parser = VerboseGcParser()
+        parser._VerboseGcParser__collects = [create_collect(i, i) for i in range(100)]
+        doc = parseString("<doc/>")
+        with mock.patch.dict(Properties.get_instance().properties, {"gc_chart_collects": 30}):
+            element = parser.get_xml(doc)
+        self.assertEqual(element.getAttribute("count"), "100")
+        self.assertEqual(element.getAttribute("longest-pause"), "99.0")
+        self.assertEqual(element.getAttribute("p95-pause"), "94.05")
+        self.assertLessEqual(len(element.getElementsByTagName(GC_COLLECTION)), 30)
+        self.assertEqual(element.getAttribute("charted"), str(len(element.getElementsByTagName(GC_COLLECTION))))
+        # the columns are created again for the changed collects
+        parser.get_collects().append(create_collect(100, 1000))
+        self.assertEqual(parser.get_summary()["longest"], 1000)
@@ -0,0 +1,44 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+import json
+import os
+import tempfile
+import unittest
+
+from javacore_analyser.properties import Properties
+from javacore_analyser.virtual_tables import DEFAULT_VIRTUAL_TABLE_THRESHOLD, VIRTUAL_TABLES_DIR, is_virtual_table, \
+    write_table_data
+
+
+class TestVirtualTables(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.properties = Properties.get_instance().properties
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        self.properties.pop("virtual_table_threshold", None)
+
+    def test_is_virtual_table(self):
+        self.assertFalse(is_virtual_table(DEFAULT_VIRTUAL_TABLE_THRESHOLD))
+        self.assertTrue(is_virtual_table(DEFAULT_VIRTUAL_TABLE_THRESHOLD + 1))
+        self.properties["virtual_table_threshold"] = 10
+        self.assertFalse(is_virtual_table(10))
+        self.assertTrue(is_virtual_table(11))
+        self.properties["virtual_table_threshold"] = 0
+        self.assertFalse(is_virtual_table(1000000))
+        self.properties["virtual_table_threshold"] = "many"
+        self.assertTrue(is_virtual_table(DEFAULT_VIRTUAL_TABLE_THRESHOLD + 1))
+
+    def test_write_table_data(self):
+        data = {"meta": {"javacore_count": 2}, "rows": [["main (0x1)", 1.5, [[0, 1]]]]}
+        write_table_data(self.temp_dir.name, "all_threads", data)
+        with open(os.path.join(self.temp_dir.name, VIRTUAL_TABLES_DIR, "all_threads.js"), encoding="utf-8") as f:
+            content = f.read()
+        prefix = 'virtualTables.register("all_threads", '
+        self.assertTrue(content.startswith(prefix))
+        self.assertTrue(content.endswith(");\n"))
+        self.assertEqual(json.loads(content[len(prefix):-3]), data)
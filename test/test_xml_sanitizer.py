@@ -0,0 +1,61 @@
+#
+# Copyright IBM Corp. 2026 - 2026
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import json
+import time
+import unittest
+
+from javacore_analyser.xml_sanitizer import INVALID_XML_CHARACTERS, has_invalid_javacore_bytes, \
+    remove_invalid_xml_characters, replace_invalid_character_references, replace_soh
+
+
+def remove_each_character(text):
+    # The sanitization done before, one pass for every invalid character
+    for character in INVALID_XML_CHARACTERS:
+        text = text.replace(character, "")
+    return text
+
+
+def create_har_content(calls, text):
+    entries = [{"request": {"url": f"https://example.com/api/{i}?q=\x02",
+                            "headers": [{"name": "Host", "value": "example.com"}]},
+                "response": {"content": {"mimeType": "application/javascript", "text": text}}}
+               for i in range(calls)]
+    return json.dumps({"log": {"entries": entries}}, ensure_ascii=False)
+
+
+class TestXmlSanitizer(unittest.TestCase):
+
+    def test_remove_invalid_xml_characters(self):
+        self.assertEqual(remove_invalid_xml_characters("a\x00b\x01c\td\ne\rf\x1fg"), "abc\td\ne\rfg")
+        self.assertEqual(remove_invalid_xml_characters("zażółć\x0b gęślą\x1f"), "zażółć gęślą")
+        self.assertEqual(remove_invalid_xml_characters(""), "")
+
+    def test_has_invalid_javacore_bytes(self):
+        self.assertFalse(has_invalid_javacore_bytes(b"thread\x01name\t\r\n"))
+        self.assertTrue(has_invalid_javacore_bytes(b"thread\x02name"))
+        self.assertTrue(has_invalid_javacore_bytes(b"\x00"))
+
+    def test_replace_soh(self):
+        self.assertEqual(replace_soh("thread\x01name"), "thread[SOH]name")
+
+    def test_replace_invalid_character_references(self):
+        self.assertEqual(replace_invalid_character_references(b'<a b="&#x1;&#x10;"/>'), b'<a b="?&#x10;"/>')
+
+    def test_sanitize_performance(self):
+        for text in ("var a = 1;\n" * 20000, "var ąę = 'zażółć';\n" * 10000):
+            content = create_har_content(100, text)
+            start = time.perf_counter()
+            expected = remove_each_character(content)
+            replace_time = time.perf_counter() - start
+            start = time.perf_counter()
+            sanitized = remove_invalid_xml_characters(content)
+            sanitize_time = time.perf_counter() - start
+            self.assertEqual(sanitized, expected)
+            self.assertLess(sanitize_time, replace_time)
+
+
+if __name__ == '__main__':
+    unittest.main()